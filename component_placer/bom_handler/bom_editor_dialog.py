@@ -1,6 +1,7 @@
 from typing import List, Dict
 import os
 from constants import FUNCTIONS_REF_PATH
+from objects.name_registry import fold
 from PyQt5.QtWidgets import (
     QDialog, QTableWidget, QTableWidgetItem, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QComboBox, QMessageBox, QLineEdit
@@ -29,7 +30,9 @@ class BOMEditorDialog(QDialog):
     def __init__(self, bom_handler, board_component_names, parent=None):
         super().__init__(parent)
         self.bom_handler = bom_handler
-        self.board_set = board_component_names  # a set of board component names
+        # A set of board component names, or None to use the mismatch sets
+        # BOMHandler keeps against the attached board
+        self.board_set = board_component_names
         self.setWindowTitle("BOM Editor - Mismatch Fix")
         # Make the dialog larger by default
         self.resize(800, 600)
@@ -51,7 +54,9 @@ class BOMEditorDialog(QDialog):
         filter_layout = QHBoxLayout()
         filter_label = QLabel("Filter:")
         self.filter_combo = QComboBox()
-        self.filter_combo.addItems(["All", "Extra", "Missing", "Errors"])
+        for option in ("All", "Extra", "Missing", "Errors"):
+            self.filter_combo.addItem(option, option.lower())
+        self._update_badges()
         self.filter_combo.currentIndexChanged.connect(self.populate_table)
         filter_layout.addWidget(filter_label)
         filter_layout.addWidget(self.filter_combo)
@@ -145,11 +150,27 @@ class BOMEditorDialog(QDialog):
         missing: components on board but not in BOM.
         extra: components in BOM but not on board.
         """
+        if self.board_set is None:
+            return self.bom_handler.check_mismatch()
         bom_set = set(self.bom_handler.bom.keys())
         missing = self.board_set - bom_set
         extra = bom_set - self.board_set
         return missing, extra
 
+    def _update_badges(self):
+        """Show the mismatch counts next to the filter options."""
+        counts = {
+            "extra": len(self.extra_set),
+            "missing": len(self.missing_set),
+            "errors": len(self.extra_set) + len(self.missing_set),
+        }
+        for i in range(self.filter_combo.count()):
+            option = self.filter_combo.itemData(i)
+            label = option.capitalize()
+            if counts.get(option):
+                label += f" ({counts[option]})"
+            self.filter_combo.setItemText(i, label)
+
     def _build_all_rows(self):
         """
         Build the complete list of rows.
@@ -181,7 +202,7 @@ class BOMEditorDialog(QDialog):
         """
         Repopulate the table based on the current filter selection.
         """
-        filter_option = self.filter_combo.currentText().strip().lower()
+        filter_option = self.filter_combo.currentData() or "all"
         if filter_option == "all":
             rows_to_show = self.all_rows
         elif filter_option == "extra":
@@ -320,8 +341,7 @@ class BOMEditorDialog(QDialog):
         # ---- duplicate check (case-insensitive) ----
         name_map = {}
         for entry in collected:
-            lname = entry["new"].lower()
-            name_map.setdefault(lname, []).append(entry["row"])
+            name_map.setdefault(fold(entry["new"]), []).append(entry["row"])
         dup_rows = [rows for rows in name_map.values() if len(rows) > 1]
         if any(dup_rows):
             for rows in dup_rows:
@@ -392,17 +412,29 @@ class BOMEditorDialog(QDialog):
         if reply != QMessageBox.Yes:
             return
 
-        # Update BOMHandler's BOM
-        self.bom_handler.bom = new_bom
-
+        object_library = None
         if self.parent() and hasattr(self.parent(), "object_library"):
             object_library = self.parent().object_library
-            rename_lookup = {old.lower(): new for old, new in renamed_components.items()}
-            for obj in object_library.get_all_objects():
-                original = obj.component_name
-                new_name = rename_lookup.get(original.lower())
-                if new_name:
-                    obj.component_name = new_name
+
+        if object_library is None:
+            # Update BOMHandler's BOM
+            self.bom_handler.bom = new_bom
+        else:
+            # BOM replacement and pad renames are one undo step / one render.
+            # Pads follow the rename whatever their capitalisation.
+            components = object_library.components
+            pad_renames = {
+                spelling: new
+                for old, new in renamed_components.items()
+                for spelling in components.folded.spellings(old)
+            }
+            with object_library.transaction("BOM Editor"):
+                object_library.checkpoint()
+                object_library.rename_components(pad_renames)
+
+                # Update BOMHandler's BOM
+                self.bom_handler.bom = new_bom
+
             for old_name, new_name in renamed_components.items():
                 self.bom_handler.log.info(
                     f"Renamed component '{old_name}' to '{new_name}' in ObjectLibrary.",
@@ -1,21 +1,18 @@
 # ─── component_placer/bom_handler/bom_handler.py ───────────────────────────
 from io import StringIO
+import importlib.util
 from utils.file_ops import safe_write, rotate_backups   # ← NEW
 import csv
 import os
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set
 from logs.log_handler import LogHandler
-
-try:
-    import openpyxl
-    from openpyxl import Workbook
-    from openpyxl.styles import PatternFill
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
-
+from objects.name_registry import NameRegistry, fold
 from PyQt5.QtWidgets import QMessageBox
 
+# openpyxl is only probed here; the XLSX code paths import it on demand so
+# the package is not loaded at application start-up.
+OPENPYXL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
+
 class BOMHandler:
     """
     Handles the Bill-of-Materials (BOM) for the PCB digitization project.
@@ -24,27 +21,85 @@ class BOMHandler:
     """
 
     def __init__(self):
+        self.log = LogHandler()
+        # Board components (objects.component_registry.ComponentRegistry) the
+        # missing/extra sets are kept against; None until attach_board().
+        self.board = None
+        self.missing: Set[str] = set()  # on the board, not in the BOM
+        self.extra: Set[str] = set()  # in the BOM, not on the board
         # Internal dictionary mapping component names to their attributes.
         # Example: "R1": {"function": "RESISTOR", "value": "10k", "package": "0805", "part_number": "XYZ123"}
         self.bom: Dict[str, Dict[str, str]] = {}
-        self.log = LogHandler()
         self.log.info("BOMHandler initialized.", module="BOMHandler", func="__init__")
 
-        # 1) Provide check_mismatch(...) exactly as you have
-    def check_mismatch(self, board_components: List[str]) -> (Set[str], Set[str]):
-        """Returns (missing, extra)."""
-        # Missing = On board, not in BOM
-        # Extra   = In BOM, not on board
-        board_set = set(board_components)
-        bom_set   = set(self.bom.keys())
-        missing = board_set - bom_set
-        extra   = bom_set - board_set
-        return (missing, extra)
+    # --------------------------------------------------------------------------
+    #  Live mismatch tracking
+    # --------------------------------------------------------------------------
+    @property
+    def bom(self) -> Dict[str, Dict[str, str]]:
+        return self._bom
 
+    @bom.setter
+    def bom(self, value: Dict[str, Dict[str, str]]) -> None:
+        # Replacing the whole BOM (load, undo, editor) re-derives the sets once
+        self._bom = value
+        self._refresh_mismatch()
 
-    def check_and_fix_mismatch(self, board_components: List[str], main_window, official_csv_path: str):
+    def attach_board(self, registry) -> None:
+        """
+        Keep ``missing``/``extra`` up to date against *registry* (usually
+        ObjectLibrary.components): it reports components that appear or
+        vanish, BOM edits update the sets directly.
+        """
+        if self.board is not None:
+            self.board.unsubscribe(self._on_board_changed)
+        self.board = registry
+        registry.subscribe(self._on_board_changed)
+        self._refresh_mismatch()
+
+    def detach_board(self) -> None:
+        if self.board is not None:
+            self.board.unsubscribe(self._on_board_changed)
+        self.board = None
+        self._refresh_mismatch()
+
+    def _refresh_mismatch(self) -> None:
+        if self.board is None:
+            self.missing, self.extra = set(), set()
+            return
+        board_set = self.board.names()
+        self.missing = board_set - self._bom.keys()
+        self.extra = self._bom.keys() - board_set
+
+    def _on_board_changed(self, appeared: Set[str], vanished: Set[str]) -> None:
+        for name in appeared:
+            if name in self._bom:
+                self.extra.discard(name)
+            else:
+                self.missing.add(name)
+        for name in vanished:
+            self.missing.discard(name)
+            if name in self._bom:
+                self.extra.add(name)
+
+    def _bom_added(self, name: str) -> None:
+        if self.board is not None:
+            self.missing.discard(name)
+            if name not in self.board:
+                self.extra.add(name)
+
+    def _bom_removed(self, name: str) -> None:
+        if self.board is not None:
+            self.extra.discard(name)
+            if name in self.board:
+                self.missing.add(name)
+
+    def check_and_fix_mismatch(
+        self, board_components: Optional[List[str]], main_window, official_csv_path: str
+    ):
         """
-        Given a list of board component names, compares these to the current BOM.
+        Given a list of board component names (None: the attached board),
+        compares these to the current BOM.
         Extra components (in the BOM but not on the board) are removed immediately
         and the updated BOM is saved to the official CSV path.
         If any missing components (on the board but not in the BOM) remain,
@@ -73,7 +128,7 @@ class BOMHandler:
             self.log.log("info", "Missing components found => launching BOMEditorDialog for missing entries.",
                          module="BOMHandler", func="check_and_fix_mismatch")
             from component_placer.bom_handler.bom_editor_dialog import BOMEditorDialog
-            board_set = set(board_components)
+            board_set = set(board_components) if board_components is not None else None
             dialog = BOMEditorDialog(
                 bom_handler=self,
                 board_component_names=board_set,
@@ -107,6 +162,7 @@ class BOMHandler:
             "package": package,
             "part_number": part_number
         }
+        self._bom_added(component_name)
 
     def update_component(self, component_name: str, **kwargs) -> None:
         """
@@ -131,6 +187,7 @@ class BOMHandler:
         """
         if component_name in self.bom:
             del self.bom[component_name]
+            self._bom_removed(component_name)
             self.log.info(f"Removed component '{component_name}' from BOM.",
                           module="BOMHandler", func="remove_component")
             self.log.debug(f"Current BOM state: {self.bom}",
@@ -209,16 +266,17 @@ class BOMHandler:
         try:
             with open(file_path, "r", newline="") as csvfile:
                 reader = csv.DictReader(csvfile)
-                self.bom = {}  # Clear existing BOM.
+                bom = {}
                 for row in reader:
                     comp_name = row.get("component_name", "").strip()
                     if comp_name:
-                        self.bom[comp_name] = {
+                        bom[comp_name] = {
                             "function": row.get("function", "").strip(),
                             "value": row.get("value", "").strip(),
                             "package": row.get("package", "").strip(),
                             "part_number": row.get("part_number", "").strip()
                         }
+                self.bom = bom  # Replaces the existing BOM.
             self.log.info(f"BOM loaded successfully from '{file_path}'.",
                           module="BOMHandler", func="load_bom")
             self.log.debug(f"Loaded BOM state: {self.bom}",
@@ -232,13 +290,22 @@ class BOMHandler:
     # --------------------------------------------------------------------------
     #                           Mismatch Checking
     # --------------------------------------------------------------------------
-    def check_mismatch(self, board_component_names: List[str]) -> (Set[str], Set[str]):
+    def check_mismatch(
+        self, board_component_names: Optional[List[str]] = None
+    ) -> (Set[str], Set[str]):
         """
         Given a list of component names from the board (ObjectLibrary),
         returns a tuple: (missing, extra)
           - missing: components on the board that aren't in the BOM
           - extra: components in the BOM that aren't on the board
+        Without a list, the live sets kept against the attached board are
+        returned (copies; cost is the size of the answer).
         """
+        if board_component_names is None:
+            if self.board is None:
+                board_component_names = ()
+            else:
+                return set(self.missing), set(self.extra)
         board_set = set(board_component_names)
         bom_set = set(self.bom.keys())
 
@@ -415,37 +482,37 @@ class BOMHandler:
         """Ensure component names are unique (case-insensitive).
 
         If duplicates are found, later occurrences are renamed with a trailing
-        ``_A``. Renamed board objects in ``object_library`` are also updated.
+        ``_A`` (then ``_B``, ...), avoiding every name already used in the BOM
+        or on the board. The pads of each renamed component in
+        ``object_library`` are renamed in one undoable step.
 
         Returns a list of tuples ``(old_name, new_name)`` for any renames made.
         """
-        seen = {}
+        taken = NameRegistry(self._bom)
+        if not taken.collisions():
+            return []
+        board = object_library.components.folded if object_library else ()
+
+        seen = set()
         renames = []
-        for name in list(self.bom.keys()):
-            key = name.lower()
+        new_bom = {}
+        for name, data in self._bom.items():
+            key = fold(name)
             if key in seen:
-                new_name = name + "_A"
-                existing_lower = {n.lower() for n in self.bom.keys()}
-                while new_name.lower() in existing_lower:
-                    new_name += "A"
-                self.bom[new_name] = self.bom.pop(name)
+                new_name = taken.unique_name(name, board)
                 renames.append((name, new_name))
-                seen[new_name.lower()] = new_name
-            else:
-                seen[key] = name
-
-        if renames and object_library:
-            lookup = {old.lower(): new for old, new in renames}
-            for obj in object_library.get_all_objects():
-                original = obj.component_name
-                new_name = lookup.get(original.lower())
-                if new_name:
-                    obj.component_name = new_name
-
-        if renames:
-            self.log.warning(
-                f"Duplicate component names fixed: {renames}",
-                module="BOMHandler",
-                func="fix_duplicate_names",
-            )
+                name = new_name
+                key = fold(name)
+            seen.add(key)
+            new_bom[name] = data
+        self.bom = new_bom
+
+        if object_library:
+            object_library.rename_components(dict(renames))
+
+        self.log.warning(
+            f"Duplicate component names fixed: {renames}",
+            module="BOMHandler",
+            func="fix_duplicate_names",
+        )
         return renames
@@ -160,6 +160,14 @@ class ComponentInputDialog(QDialog):
             lambda idx: self.create_prefix_checkbox.setEnabled(idx in (1, 2))
         )
 
+        # depopulation: missing balls by name and a centre void (BGA)
+        self.missing_balls_edit = QLineEdit()
+        self.missing_balls_edit.setPlaceholderText("e.g. A1 C3 H8")
+        self.void_x_edit = QSpinBox()
+        self.void_x_edit.setRange(0, 1000)
+        self.void_y_edit = QSpinBox()
+        self.void_y_edit.setRange(0, 1000)
+
         # other combo boxes
         self.side_combo = QComboBox()
         self.side_combo.addItems(["Top", "Bottom", "Both"])
@@ -210,6 +218,9 @@ class ComponentInputDialog(QDialog):
         self.form_layout.addRow("Pins in Y:", self.y_pins_edit)
         self.form_layout.addRow("Pin Numbering:", self.numbering_combo)
         self.form_layout.addRow("", self.create_prefix_checkbox)
+        self.form_layout.addRow("Missing Balls:", self.missing_balls_edit)
+        self.form_layout.addRow("Centre Void X:", self.void_x_edit)
+        self.form_layout.addRow("Centre Void Y:", self.void_y_edit)
         self.form_layout.addRow("Pad Side:", self.side_combo)
         self.form_layout.addRow("Testability:", self.testability_combo)
         self.form_layout.addRow("Technology:", self.tech_combo)
@@ -229,6 +240,9 @@ class ComponentInputDialog(QDialog):
             self.y_pins_edit,
             self.numbering_combo,
             self.create_prefix_checkbox,
+            self.missing_balls_edit,
+            self.void_x_edit,
+            self.void_y_edit,
             self.side_combo,
             self.testability_combo,
             self.tech_combo,
@@ -453,6 +467,8 @@ class ComponentInputDialog(QDialog):
 
         self.x_pins_edit.interpretText()
         self.y_pins_edit.interpretText()
+        self.void_x_edit.interpretText()
+        self.void_y_edit.interpretText()
 
         return {
             "component_name": self.name_edit.text().strip(),
@@ -471,6 +487,8 @@ class ComponentInputDialog(QDialog):
             "height": self._safe_float(self.height_edit.text()),
             "hole": self._safe_float(self.hole_edit.text()),
             "create_prefix": self.create_prefix_checkbox.isChecked(),
+            "missing_balls": self.missing_balls_edit.text().strip(),
+            "center_void": (int(self.void_y_edit.value()), int(self.void_x_edit.value())),
         }
 
     def set_quick_params(self, params: dict) -> None:
@@ -498,6 +516,10 @@ class ComponentInputDialog(QDialog):
         self.height_edit.setText(str(float(params.get("height", 0.5))))
         self.hole_edit.setText(str(float(params.get("hole", 0.0))))
         self.create_prefix_checkbox.setChecked(bool(params.get("create_prefix", False)))
+        self.missing_balls_edit.setText(params.get("missing_balls", ""))
+        void_rows, void_cols = params.get("center_void") or (0, 0)
+        self.void_y_edit.setValue(int(void_rows))
+        self.void_x_edit.setValue(int(void_cols))
 
         # Ensure auto-prefix/numbering reflected in the name field
         self.update_component_name()
@@ -7,7 +7,15 @@ import copy
 from logs.log_handler import LogHandler
 from objects.board_object import BoardObject
 from objects.nod_file import BoardNodFile
+from objects.object_library import library_transaction
 from component_placer.normalizer import normalize_footprint
+from component_placer.pad_clipboard import PadPayload, clipboard
+from component_placer.quick_grid import (
+    DEFAULT_PREFIX_TABLE,
+    SCHEME_ROWS,
+    QuickGrid,
+    snake_order,
+)
 from edit_pads import actions
 from math import radians, sin, cos
 import os
@@ -15,25 +23,6 @@ from component_placer.component_input_dialog import ComponentInputDialog
 from constants.constants import Constants
 
 
-class Clipboard:
-    def __init__(self):
-        self.copied_objects = []
-
-    def copy(self, objects: List[BoardObject]):
-        self.copied_objects = copy.deepcopy(objects)
-        LogHandler().info(
-            f"Clipboard: Copied {len(self.copied_objects)} objects.",
-            module="Clipboard",
-            func="copy",
-        )
-
-    def paste(self) -> List[Dict[str, Any]]:
-        return copy.deepcopy(self.copied_objects) if self.copied_objects else []
-
-
-clipboard = Clipboard()
-
-
 class ComponentPlacer(QObject):
     component_placed = pyqtSignal(str)
 
@@ -61,6 +50,7 @@ class ComponentPlacer(QObject):
         self.project_manager = project_manager
         self.quick_anchors = {"A": None, "B": None}
         self.quick_params = None
+        self._quick_grid = QuickGrid()
         # Use the shared BOMHandler if provided; otherwise (should not happen) create a new one.
         if bom_handler is None:
             from component_placer.bom_handler import BOMHandler
@@ -108,6 +98,14 @@ class ComponentPlacer(QObject):
             f"Loaded clipboard footprint with {len(self.footprint['pads'])} pads.",
         )
 
+    def load_footprint_from_payload(self, payload: PadPayload) -> None:
+        """Load pads decoded from the system clipboard (see pad_clipboard)."""
+        self.footprint = payload.footprint()
+        self.log.log(
+            "info",
+            f"Loaded clipboard footprint with {len(self.footprint['pads'])} pads.",
+        )
+
     def set_nod_file(self, nod_file: BoardNodFile) -> None:
         self.nod_file = nod_file
         self.log.log("info", f"ComponentPlacer: nod_file set to {nod_file.nod_path}")
@@ -448,7 +446,9 @@ class ComponentPlacer(QObject):
 
             # Push the mutations through the partial-render path
             if updates:
-                self.object_library.bulk_update_objects(updates, {})
+                label = f"Move {len(updates)} pads"
+                with library_transaction(self.object_library, label):
+                    self.object_library.bulk_update_objects(updates, {})
                 self.log.log(
                     "info",
                     f"Move mode: updated {len(updates)} pads and synchronised "
@@ -499,29 +499,31 @@ class ComponentPlacer(QObject):
                 f"bulk_add: creating {len(new_objects)} new pads for component '{comp_name}'.",
             )
 
-            # PARTIAL RENDER: no big re-render
-            self.object_library.bulk_add(new_objects, skip_render=False)
-
-            # Update BOM only after successful placement and according to the
-            # user's decision above.
-            if self.bom_handler:
-                if existing_bom_entry:
-                    if bom_update_choice:
-                        self.bom_handler.update_component(
+            # Pads + BOM entry are committed as one undo step / one render
+            with library_transaction(self.object_library, f"Place {comp_name}"):
+                # PARTIAL RENDER: no big re-render
+                self.object_library.bulk_add(new_objects, skip_render=False)
+
+                # Update BOM only after successful placement and according to the
+                # user's decision above.
+                if self.bom_handler:
+                    if existing_bom_entry:
+                        if bom_update_choice:
+                            self.bom_handler.update_component(
+                                comp_name,
+                                function=input_data.get("function", ""),
+                                value=input_data.get("value", ""),
+                                package=input_data.get("package", ""),
+                                part_number=input_data.get("part_number", ""),
+                            )
+                    else:
+                        self.bom_handler.add_component(
                             comp_name,
-                            function=input_data.get("function", ""),
-                            value=input_data.get("value", ""),
-                            package=input_data.get("package", ""),
-                            part_number=input_data.get("part_number", ""),
+                            input_data.get("function", ""),
+                            input_data.get("value", ""),
+                            input_data.get("package", ""),
+                            input_data.get("part_number", ""),
                         )
-                else:
-                    self.bom_handler.add_component(
-                        comp_name,
-                        input_data.get("function", ""),
-                        input_data.get("value", ""),
-                        input_data.get("package", ""),
-                        input_data.get("part_number", ""),
-                    )
 
         """
         # Attempt saving to the project file, if present
@@ -582,9 +584,10 @@ class ComponentPlacer(QObject):
           - highest_pin: the highest pin number currently in use,
           - missing_pins: a sorted list of missing pin numbers (if any; otherwise None).
         """
-        existing_objs = self.object_library.get_all_objects()
+        objects = self.object_library.objects
         same_name_objs = [
-            o for o in existing_objs if o.component_name.lower() == comp_name.lower()
+            objects[ch]
+            for ch in self.object_library.components.channels(comp_name, ignore_case=True)
         ]
         if not same_name_objs:
             # No existing component with this name.
@@ -911,19 +914,17 @@ class ComponentPlacer(QObject):
         # ------------------------------------------------------------------
         # 4)  Add to library + BOM + UI niceties
         # ------------------------------------------------------------------
-        if hasattr(self.object_library, "bulk_add"):
-            self.object_library.bulk_add(new_objs, skip_render=False)
-        else:
-            self.object_library.objects.extend(new_objs)
-
-        if self.bom_handler:
-            self.bom_handler.add_component(
-                self.quick_params.get("component_name", ""),
-                self.quick_params.get("function", ""),
-                self.quick_params.get("value", ""),
-                self.quick_params.get("package", ""),
-                self.quick_params.get("part_number", ""),
-            )
+        with library_transaction(self.object_library, f"Quick-create {comp_name}"):
+            self._push_pads_to_library(new_objs)
+
+            if self.bom_handler:
+                self.bom_handler.add_component(
+                    self.quick_params.get("component_name", ""),
+                    self.quick_params.get("function", ""),
+                    self.quick_params.get("value", ""),
+                    self.quick_params.get("package", ""),
+                    self.quick_params.get("part_number", ""),
+                )
 
         if hasattr(self.board_view, "select_objects"):
             self.board_view.select_objects(new_objs)
@@ -965,32 +966,8 @@ class ComponentPlacer(QObject):
 
         Returns a flat list of (row, col) indices in the desired visitation order.
         """
-        order: list[tuple[int, int]] = []
-
-        if rows >= cols:
-            # Vertical‐major snake: go down column 0, up column 1, down column 2, …
-            for c in range(cols):
-                if (c % 2) == 0:
-                    # even column: top → bottom
-                    for r in range(rows):
-                        order.append((r, c))
-                else:
-                    # odd column: bottom → top
-                    for r in reversed(range(rows)):
-                        order.append((r, c))
-        else:
-            # Horizontal‐major snake: go left → right on row 0, then right → left on row 1, …
-            for r in range(rows):
-                if (r % 2) == 0:
-                    # even row: left → right
-                    for c in range(cols):
-                        order.append((r, c))
-                else:
-                    # odd row: right → left
-                    for c in reversed(range(cols)):
-                        order.append((r, c))
-
-        return order
+        order = snake_order(cols, rows)
+        return [(int(i) // cols, int(i) % cols) for i in order]
 
     # ------------------------------------------------------------------
     #  Build footprint respecting the selected numbering scheme
@@ -999,116 +976,23 @@ class ComponentPlacer(QObject):
         """
         Generate a rectangular pad grid and renumber it so that:
         - The chosen scheme (0=circular, 1=rows, 2=columns) is respected.
-        - On the bottom side we mirror only the X axis.
-        - Pin 1 is always the pad under Anchor A.
+        - Depopulated balls ("missing_balls", "center_void") are left out.
+        - Pin 1 is always the pad under Anchor A (grid cell 0,0).
+        The layout is cached by QuickGrid; when only the anchors moved just
+        the pad positions are recomputed.
         """
         if None in self.quick_anchors.values() or not params:
             return {"pads": []}
 
-        rows = max(int(params["y_pins"]), 1)
-        cols = max(int(params["x_pins"]), 1)
-        fp = self._build_grid_footprint(self.quick_anchors, params)
-
-        # Build a 2D grid for lookup
-        pad_grid = [[None] * cols for _ in range(rows)]
-        for i, pad in enumerate(fp["pads"]):
-            r, c = divmod(i, cols)
-            pad_grid[r][c] = pad
-
-        scheme = int(params.get("number_scheme", 0))
-
-        # Find Anchor-A’s position in the grid
-        ax, ay = self.quick_anchors["A"]
-        a_r = min(range(rows), key=lambda r: abs(pad_grid[r][0]["y_coord_mm"] - ay))
-        a_c = min(range(cols), key=lambda c: abs(pad_grid[0][c]["x_coord_mm"] - ax))
-
-        # Build the index list according to the numbering scheme
-        if scheme == 0:
-            # Circular / IC‐snake
-            idx_list = self.snake_circular(cols, rows)
-            # rotate so Anchor-A is first
-            start = next(
-                i for i, (r, c) in enumerate(idx_list) if r == a_r and c == a_c
-            )
-            idx = idx_list[start:] + idx_list[:start]
-
-        elif scheme == 1:
-            # By rows: natural row order, mirror X only
-            row_vis = list(range(rows))
-            col_vis = list(range(cols))
-
-            # rotate rows so Anchor-A’s row leads
-            r0 = row_vis.index(a_r)
-            row_vis = row_vis[r0:] + row_vis[:r0]
-            # rotate columns so Anchor-A’s column leads
-            c0 = col_vis.index(a_c)
-            col_vis = col_vis[c0:] + col_vis[:c0]
-
-            idx = [(r, c) for r in row_vis for c in col_vis]
-
-        else:  # scheme == 2
-            # By columns: natural row order, mirror X only
-            col_vis = list(range(cols))
-            row_vis = list(range(rows))
-
-            # rotate columns so Anchor-A’s column leads
-            c0 = col_vis.index(a_c)
-            col_vis = col_vis[c0:] + col_vis[:c0]
-
-            idx = [(r, c) for c in col_vis for r in row_vis]
-
-        # Renumber and rebuild pad list
-        create_prefix = bool(params.get("create_prefix"))
-        prefix_table = self.constants.get(
-            "quick_prefix_table",
-            [
-                "A",
-                "B",
-                "C",
-                "D",
-                "E",
-                "F",
-                "G",
-                "H",
-                "J",
-                "K",
-                "L",
-                "M",
-                "N",
-                "P",
-                "R",
-                "T",
-                "U",
-                "V",
-                "W",
-                "Y",
-                "AA",
-                "AB",
-                "AC",
-                "AD",
-                "AE",
-                "AF",
-                "AG",
-                "AH",
-            ],
-        )
+        prefix_table = self.constants.get("quick_prefix_table", DEFAULT_PREFIX_TABLE)
+        fp = self._quick_grid.footprint(self.quick_anchors, params, prefix_table)
 
-        ordered = []
-        for r, c in idx:
-            pad = pad_grid[r][c]
-            pad["pin"] = len(ordered) + 1
-            if create_prefix and scheme in (1, 2):
-                if scheme == 1:
-                    prefix_idx = row_vis.index(r)
-                    number_idx = col_vis.index(c) + 1
-                else:
-                    prefix_idx = col_vis.index(c)
-                    number_idx = row_vis.index(r) + 1
-                letter = prefix_table[prefix_idx % len(prefix_table)]
-                pad["prefix"] = f"{letter}{number_idx}"
-            ordered.append(pad)
-
-        fp["pads"] = ordered
+        LogHandler().debug(
+            f"[QC] built_fp rows={self._quick_grid.rows} cols={self._quick_grid.cols} "
+            f"pads={len(fp['pads'])} scheme={params.get('number_scheme', 0)}",
+            module="QuickCreate",
+            func="_generate_quick_footprint",
+        )
         return fp
 
     # ------------------------------------------------------------------
@@ -1151,81 +1035,45 @@ class ComponentPlacer(QObject):
     #  QUICK-CREATION ─ (re)build rectangular grid footprint from anchors
     # -------------------------------------------------------------------------
     def _build_grid_footprint(self, anchors: dict, p: dict) -> dict:
-        """Create canonical pad list for ghost + final commit."""
-        ax, ay = anchors["A"]
-        bx, by = anchors["B"]
-
-        cols = max(int(p.get("x_pins", 1)), 1)
-        rows = max(int(p.get("y_pins", 1)), 1)
-
-        width = float(p.get("width", 0.5))
-        height = float(p.get("height", 0.5))
-        hole = float(p.get("hole", 0.0))
-
-        gui_shape = p.get("shape", "Round").lower()
-        shape_map = {
-            "round": "Round",
-            "ellipse": "Ellipse",
-            "square/rectangle": "Square/rectangle",
-            "square/rectangle with hole": "Square/rectangle with Hole",
-            "hole": "Hole",
-        }
-        shape_type = shape_map.get(gui_shape, "Square/rectangle")
-
-        test_pos = p.get("test_side", "top").lower()  # always lower-case
-        testab = p.get("testability", "Force")
-        tech = p.get("technology", "SMD")
-
-        dx = (bx - ax) / (cols - 1) if cols > 1 else 0.0
-        dy = (by - ay) / (rows - 1) if rows > 1 else 0.0
-
-        pads, pin = [], 1
-        for r in range(rows):
-            for c in range(cols):
-                pads.append(
-                    {
-                        "pin": pin,
-                        "x_coord_mm": ax + c * dx,
-                        "y_coord_mm": ay + r * dy,
-                        "width_mm": width,
-                        "height_mm": height,
-                        "hole_mm": hole,
-                        "shape_type": shape_type,
-                        "test_position": test_pos,
-                        "testability": testab,
-                        "technology": tech,
-                        "angle_deg": 0.0,
-                    }
-                )
-                pin += 1
-
-        LogHandler().debug(
-            f"[QC] built_fp rows={rows} cols={cols} pads={len(pads)} "
-            f"shape_type={shape_type} "
-            f"w={width:.2f} h={height:.2f} hole={hole:.2f}",
-            module="QuickCreate",
-            func="_build_grid_fp",
-        )
-
-        return {"center_x": (ax + bx) / 2.0, "center_y": (ay + by) / 2.0, "pads": pads}
+        """Canonical row-major pad list (pins 1..N, no depopulation)."""
+        grid = QuickGrid()
+        params = dict(p, number_scheme=SCHEME_ROWS, create_prefix=False)
+        params.pop("missing_balls", None)
+        params.pop("center_void", None)
+        return grid.footprint(anchors, params)
 
     # ------------------------------------------------------------------
     #  generic adaptor: pushes one pad into ObjectLibrary no matter
     #  which actual helper names the project uses.
     # ------------------------------------------------------------------
     def _push_pad_to_library(self, pad_obj):
+        """Register a single BoardObject pad (see _push_pads_to_library)."""
+        self._push_pads_to_library([pad_obj])
+
+    def _push_pads_to_library(self, pad_objs):
         """
-        Try every known API variation to register a BoardObject pad
-        in the ObjectLibrary instance.  Add here if you discover more.
+        Register BoardObject pads in the ObjectLibrary as one operation.
+        Uses bulk_add when available; otherwise tries every known per-pad API
+        variation inside a single transaction so the pads still produce one
+        undo entry and one render pass.
         """
         lib = self.object_library
-        for fn in ("add_pad", "add_object", "add_board_object", "add"):
-            if hasattr(lib, fn):
-                getattr(lib, fn)(pad_obj)
-                return
-        # last resort: list append (but still keeps undo/redo out)
-        if hasattr(lib, "objects"):
-            lib.objects.append(pad_obj)
+        if not pad_objs:
+            return
+        if hasattr(lib, "bulk_add"):
+            lib.bulk_add(pad_objs, skip_render=False)
+            return
+        with library_transaction(self.object_library, f"Add {len(pad_objs)} pads"):
+            for fn in ("add_pad", "add_object", "add_board_object", "add"):
+                if hasattr(lib, fn):
+                    adder = getattr(lib, fn)
+                    for pad_obj in pad_objs:
+                        adder(pad_obj)
+                    return
+            # last resort: store directly (keeps undo/redo out)
+            if hasattr(lib, "objects"):
+                for pad_obj in pad_objs:
+                    lib.objects[pad_obj.channel] = pad_obj
 
     # ── helper: should the ghost be flipped? ──────────────────────────────
     def _should_flip(self) -> bool:
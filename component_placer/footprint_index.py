@@ -0,0 +1,404 @@
+# component_placer/footprint_index.py
+
+import copy
+import json
+import math
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from logs.log_handler import LogHandler
+from objects.alf_file import parse_alf_file
+from objects.board_object import BoardObject
+from objects.nod_diff import read_nod_rows
+from objects.nod_file import get_footprint_for_placer
+
+INDEX_VERSION = 1
+# Quantiles of the three distance distributions that make up a signature
+RADIAL_Q = np.linspace(0.0, 1.0, 16)  # pad distance to the centroid
+PITCH_Q = np.linspace(0.0, 1.0, 8)  # nearest-neighbour distance (pitch histogram)
+PAIR_Q = np.linspace(0.0, 1.0, 16)  # pairwise distances
+MAX_PAIR_PADS = 256  # pairwise distances use an even subsample above this
+SHORTLIST = 12  # library footprints whose pose is fitted per query
+MAX_ANCHORS = 64  # rotation hypotheses per mirror state
+
+
+# ----------------------------------------------------------------------
+#  Signatures
+# ----------------------------------------------------------------------
+def _nearest_distances(points: np.ndarray) -> np.ndarray:
+    """Distance from every point to its nearest neighbour (brute force, chunked)."""
+    n = len(points)
+    if n < 2:
+        return np.zeros(n)
+    out = np.empty(n)
+    step = max(1, 4_000_000 // n)
+    for start in range(0, n, step):
+        block = points[start : start + step]
+        d = np.hypot(*(block[:, None, :] - points[None, :, :]).transpose(2, 0, 1))
+        d[np.arange(len(block)), np.arange(start, start + len(block))] = np.inf
+        out[start : start + step] = d.min(axis=1)
+    return out
+
+
+def signature(points) -> np.ndarray:
+    """
+    Rotation- and mirror-invariant descriptor of a pad pattern (board mm):
+    quantiles of the radial, nearest-neighbour and pairwise distances. Two
+    footprints that differ only by a rigid motion or a mirror have the
+    same signature; it is not scale invariant (pads have real sizes).
+    """
+    pts = np.asarray(points, dtype=float).reshape(-1, 2)
+    centred = pts - pts.mean(axis=0)
+    radial = np.hypot(centred[:, 0], centred[:, 1])
+    pitch = _nearest_distances(pts)
+    sample = pts
+    if len(pts) > MAX_PAIR_PADS:
+        sample = pts[np.linspace(0, len(pts) - 1, MAX_PAIR_PADS).astype(int)]
+    i, j = np.triu_indices(len(sample), k=1)
+    pairs = np.hypot(*(sample[i] - sample[j]).T) if len(i) else np.zeros(1)
+    return np.concatenate(
+        [
+            np.quantile(radial, RADIAL_Q),
+            np.quantile(pitch, PITCH_Q),
+            np.quantile(pairs, PAIR_Q),
+        ]
+    )
+
+
+# ----------------------------------------------------------------------
+#  Pose fit
+# ----------------------------------------------------------------------
+class Pose:
+    """
+    Rigid placement of a library footprint on the board:
+    board = R(angle) @ M @ (library - library_centre) + board_centre, with
+    M mirroring x when *mirrored*. ``rms_mm`` is the residual and
+    ``assignment[i]`` the board point nearest to library pad i.
+    """
+
+    __slots__ = (
+        "angle_deg", "mirrored", "lib_centre", "board_centre", "rms_mm", "assignment"
+    )
+
+    def __init__(self, angle_deg, mirrored, lib_centre, board_centre, rms_mm, assignment):
+        self.angle_deg = angle_deg
+        self.mirrored = mirrored
+        self.lib_centre = lib_centre
+        self.board_centre = board_centre
+        self.rms_mm = rms_mm
+        self.assignment = assignment
+
+    def apply(self, points) -> np.ndarray:
+        pts = np.asarray(points, dtype=float).reshape(-1, 2) - self.lib_centre
+        if self.mirrored:
+            pts = pts * (-1.0, 1.0)
+        a = math.radians(self.angle_deg)
+        c, s = math.cos(a), math.sin(a)
+        return pts @ np.array([[c, s], [-s, c]]) + self.board_centre
+
+    def pad_angle(self, angle_deg: float) -> float:
+        """Pad rotation on the board for a library pad rotated *angle_deg*."""
+        base = (180.0 - angle_deg) if self.mirrored else angle_deg
+        return round((base + self.angle_deg) % 360.0, 6)
+
+
+def _rotate(pts: np.ndarray, angle: float) -> np.ndarray:
+    c, s = math.cos(angle), math.sin(angle)
+    return pts @ np.array([[c, s], [-s, c]])
+
+
+def _nearest(src: np.ndarray, dst: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Index of and distance to the nearest *dst* point for every *src* point."""
+    d2 = ((src[:, None, :] - dst[None, :, :]) ** 2).sum(axis=2)
+    idx = d2.argmin(axis=1)
+    return idx, np.sqrt(d2[np.arange(len(src)), idx])
+
+
+def fit_pose(board_points, library_points, board_pins=None, library_pins=None) -> Pose:
+    """
+    Best rigid pose (rotation, optional mirror, translation) of
+    *library_points* onto *board_points*, correspondence unknown.
+
+    Rotation hypotheses pair the library pad farthest from the centre with
+    every board pad at about the same radius. Symmetric footprints fit
+    equally well in several poses; among those, the one that puts most
+    library pins onto board pads with the same pin number wins when the
+    pins are given. The pose is then refined with a least-squares (Kabsch)
+    fit on its nearest-neighbour pairs.
+    """
+    q = np.asarray(board_points, dtype=float).reshape(-1, 2)
+    lib = np.asarray(library_points, dtype=float).reshape(-1, 2)
+    q_centre, l_centre = q.mean(axis=0), lib.mean(axis=0)
+    qc, lc = q - q_centre, lib - l_centre
+    q_r = np.hypot(qc[:, 0], qc[:, 1])
+    anchor = int(np.hypot(lc[:, 0], lc[:, 1]).argmax())
+    a_r = math.hypot(*lc[anchor])
+    candidates = np.argsort(np.abs(q_r - a_r))[:MAX_ANCHORS]
+
+    hypotheses = []  # (mean nearest distance, mirrored, angle, nearest board pad)
+    for mirrored in (False, True):
+        src = lc * (-1.0, 1.0) if mirrored else lc
+        a_ang = math.atan2(src[anchor, 1], src[anchor, 0])
+        for k in candidates:
+            angle = math.atan2(qc[k, 1], qc[k, 0]) - a_ang
+            idx, dist = _nearest(_rotate(src, angle), qc)
+            score = float(dist.mean()) if len(dist) else 0.0
+            hypotheses.append((score, mirrored, angle, idx))
+    best = min(hypotheses, key=lambda h: h[0])
+    if board_pins is not None and library_pins is not None:
+        pitch = float(np.median(_nearest_distances(lib))) if len(lib) > 1 else 0.0
+        good = [h for h in hypotheses if h[0] <= best[0] + 0.25 * pitch]
+        board_pins = np.asarray([str(p) for p in board_pins])
+        library_pins = np.asarray([str(p) for p in library_pins])
+        best = max(
+            good, key=lambda h: (int((board_pins[h[3]] == library_pins).sum()), -h[0])
+        )
+
+    _, mirrored, angle, idx = best
+    src = lc * (-1.0, 1.0) if mirrored else lc
+    # Kabsch (rotation only; the mirror is fixed above)
+    h = src.T @ qc[idx]
+    angle = math.atan2(h[0, 1] - h[1, 0], h[0, 0] + h[1, 1])
+    placed = _rotate(src, angle)
+    # Translation: centre the matched board pads on the placed pattern
+    shift = (qc[idx] - placed).mean(axis=0)
+    idx, dist = _nearest(placed + shift, qc)
+    rms = float(np.sqrt((dist**2).mean())) if len(dist) else 0.0
+    return Pose(
+        math.degrees(angle) % 360.0, mirrored, l_centre, q_centre + shift, rms, idx
+    )
+
+
+# ----------------------------------------------------------------------
+#  Index
+# ----------------------------------------------------------------------
+class FootprintMatch:
+    """One ranked candidate returned by FootprintIndex.query()."""
+
+    __slots__ = ("path", "name", "pose", "score")
+
+    def __init__(self, path: str, name: str, pose: Pose, score: float):
+        self.path = path
+        self.name = name
+        self.pose = pose
+        self.score = score
+
+    def __repr__(self):
+        return (
+            f"FootprintMatch({self.name}, rms={self.pose.rms_mm:.3f} mm, "
+            f"angle={self.pose.angle_deg:.1f}, mirrored={self.pose.mirrored})"
+        )
+
+
+class FootprintIndex:
+    """
+    Signature index of every .nod footprint under *root*
+    (component_libraries), bucketed by pad count.
+
+    refresh() is incremental: files are re-read only when their size or
+    mtime changed, deleted files are dropped. With *cache_path* the index
+    is kept on disk between sessions. query() compares the signature of
+    the selected pads with the bucket as one numpy operation and fits the
+    pose of a short list only.
+    """
+
+    def __init__(self, root: str, cache_path: Optional[str] = None, logger=None):
+        self.root = root
+        self.cache_path = cache_path
+        self.log = logger or LogHandler()
+        # path -> {"stamp": [size, mtime_ns], "points": [[x, y], ...], "sig": [...]}
+        self.entries: Dict[str, dict] = {}
+        self._buckets: Optional[Dict[int, Tuple[List[str], np.ndarray]]] = None
+        self._load_cache()
+
+    # -- persistence ---------------------------------------------------
+    def _load_cache(self) -> None:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
+            if data.get("version") == INDEX_VERSION:
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError) as e:
+            self.log.log("warning", f"Footprint index cache ignored: {e}")
+
+    def _save_cache(self) -> None:
+        if not self.cache_path:
+            return
+        tmp = self.cache_path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump({"version": INDEX_VERSION, "entries": self.entries}, fh)
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            self.log.log("warning", f"Footprint index cache not written: {e}")
+
+    # -- building ------------------------------------------------------
+    def _scan(self) -> Dict[str, List[int]]:
+        found = {}
+        stack = [self.root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.lower().endswith(".nod"):
+                            st = entry.stat()
+                            found[entry.path] = [st.st_size, st.st_mtime_ns]
+            except OSError:
+                continue
+        return found
+
+    def refresh(self) -> int:
+        """Re-index new and changed files, drop deleted ones; returns files re-read."""
+        found = self._scan()
+        stale = [p for p in self.entries if p not in found]
+        for path in stale:
+            del self.entries[path]
+        changed = [
+            p for p, stamp in found.items() if self.entries.get(p, {}).get("stamp") != stamp
+        ]
+        for path in changed:
+            points = [(row[4], row[5]) for row in read_nod_rows(path)]
+            if not points:
+                self.entries.pop(path, None)
+                continue
+            self.entries[path] = {
+                "stamp": found[path],
+                "points": points,
+                "sig": signature(points).round(6).tolist(),
+            }
+        if changed or stale or self._buckets is None:
+            self._buckets = None
+            if changed or stale:
+                self._save_cache()
+                self.log.log(
+                    "info",
+                    f"Footprint index: {len(changed)} re-read, {len(stale)} dropped, "
+                    f"{len(self.entries)} footprints.",
+                    module="FootprintIndex",
+                    func="refresh",
+                )
+        return len(changed)
+
+    def _bucket(self, count: int) -> Optional[Tuple[List[str], np.ndarray]]:
+        if self._buckets is None:
+            grouped: Dict[int, List[str]] = {}
+            for path, entry in self.entries.items():
+                grouped.setdefault(len(entry["points"]), []).append(path)
+            self._buckets = {
+                n: (paths, np.array([self.entries[p]["sig"] for p in paths]))
+                for n, paths in grouped.items()
+            }
+        return self._buckets.get(count)
+
+    # -- lookup --------------------------------------------------------
+    def query(
+        self, points: Sequence[Tuple[float, float]], top: int = 5
+    ) -> List[FootprintMatch]:
+        """Library footprints with as many pads as *points*, best fit first."""
+        pts = np.asarray(points, dtype=float).reshape(-1, 2)
+        bucket = self._bucket(len(pts))
+        if bucket is None:
+            return []
+        paths, sigs = bucket
+        score = np.abs(sigs - signature(pts)).mean(axis=1)
+        order = np.argsort(score)[:SHORTLIST]
+        matches = []
+        for k in order:
+            path = paths[k]
+            pose = fit_pose(pts, self.entries[path]["points"])
+            name = os.path.splitext(os.path.basename(path))[0]
+            matches.append(FootprintMatch(path, name, pose, float(score[k])))
+        matches.sort(key=lambda m: (round(m.pose.rms_mm, 4), m.score))
+        return matches[:top]
+
+
+# ----------------------------------------------------------------------
+#  Replacing hand-drawn pads
+# ----------------------------------------------------------------------
+def _alf_prefixes(nod_path: str) -> Dict[str, str]:
+    """pin -> prefix from the .alf next to *nod_path* (any extension case)."""
+    folder = os.path.dirname(nod_path)
+    base = os.path.splitext(os.path.basename(nod_path))[0].lower()
+    try:
+        names = os.listdir(folder or ".")
+    except OSError:
+        return {}
+    for name in names:
+        stem, ext = os.path.splitext(name)
+        if stem.lower() == base and ext.lower() == ".alf":
+            relationships = parse_alf_file(os.path.join(folder, name)) or []
+            return {str(rel["pin"]): rel["prefix"] for rel in relationships}
+    return {}
+
+
+def replace_with_footprint(object_library, pads, nod_path: str) -> Optional[Pose]:
+    """
+    Replace the hand-drawn *pads* (BoardObjects of one component) by the
+    library footprint *nod_path* in its best-fit pose, in one undo step.
+
+    Geometry, pin numbers and .alf prefixes come from the library; every
+    library pad takes over the channel, signal, testability and side of
+    the hand-drawn pad it lands on, so nets and test settings survive.
+    Returns the pose used, or None if the footprint could not be read.
+    """
+    footprint = get_footprint_for_placer(nod_path)
+    if not footprint or not pads:
+        return None
+    lib_pads = footprint["pads"]
+    board = [
+        (
+            getattr(p, "x_coord_mm_original", p.x_coord_mm),
+            getattr(p, "y_coord_mm_original", p.y_coord_mm),
+        )
+        for p in pads
+    ]
+    pose = fit_pose(
+        board,
+        [(p["x_coord_mm"], p["y_coord_mm"]) for p in lib_pads],
+        board_pins=[p.pin for p in pads],
+        library_pins=[p["pin"] for p in lib_pads],
+    )
+    placed = pose.apply([(p["x_coord_mm"], p["y_coord_mm"]) for p in lib_pads])
+    prefixes = _alf_prefixes(nod_path)
+    names = [p.component_name for p in pads]
+    comp_name = max(set(names), key=names.count)
+
+    updated, added, taken = [], [], set()
+    for lib_pad, (x, y), target in zip(lib_pads, placed.tolist(), pose.assignment.tolist()):
+        x, y = round(x, 4), round(y, 4)
+        pin = str(lib_pad["pin"])
+        if target in taken:
+            obj = BoardObject(
+                component_name=comp_name,
+                pin=pin,
+                channel=None,
+                test_position=pads[0].test_position,
+                testability=lib_pad.get("testability", "Not Testable"),
+            )
+            added.append(obj)
+        else:
+            taken.add(target)
+            obj = copy.copy(pads[target])
+            obj.component_name = comp_name
+            obj.pin = pin
+            updated.append(obj)
+        obj.x_coord_mm = obj.x_coord_mm_original = x
+        obj.y_coord_mm = obj.y_coord_mm_original = y
+        obj.shape_type = lib_pad["shape_type"]
+        obj.width_mm = lib_pad["width_mm"]
+        obj.height_mm = lib_pad["height_mm"]
+        obj.hole_mm = lib_pad["hole_mm"]
+        obj.technology = lib_pad["technology"]
+        obj.angle_deg = pose.pad_angle(lib_pad.get("angle_deg", 0.0))
+        obj.prefix = prefixes.get(pin, lib_pad.get("prefix", "")) or ""
+    deleted = [p for i, p in enumerate(pads) if i not in taken]
+
+    with object_library.transaction(f"Replace {comp_name} by {os.path.basename(nod_path)}"):
+        object_library.modify_objects(added=added, updated=updated, deleted=deleted)
+    return pose
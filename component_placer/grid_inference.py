@@ -0,0 +1,294 @@
+# component_placer/grid_inference.py
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from component_placer.quick_grid import (
+    SCHEME_CIRCULAR,
+    SCHEME_COLUMNS,
+    SCHEME_ROWS,
+    scheme_order,
+)
+from objects.board_object import BoardObject
+
+NEIGHBOURS = 4  # nearest neighbours per pad used for the pitch statistics
+NEIGHBOUR_RATIO = 1.3  # neighbours farther than this x the nearest one are ignored
+AXIS_SLOPE = 0.35  # |across| / |along| below which a neighbour lies on an axis
+MIN_AXIS_SHARE = 0.1  # share of the neighbour offsets an axis needs for its pitch
+SNAP_FRACTION = 0.3  # pads farther than this x pitch from their cell are off the lattice
+GROW_START = 8.0  # first fit uses the pads within this many pitches of the centre
+GROW_FACTOR = 3.0  # the fitted region grows by this factor per pass
+REFINE_PASSES = 2  # passes once every pad is inside the fitted region
+
+
+class Lattice:
+    """
+    Regular pad grid fitted to a selection (board mm):
+    pad(row, col) = origin + col * col_vec + row * row_vec.
+
+    ``cells[i]`` is the (row, col) of selected pad i, counted from the
+    lowest row/column in the selection; ``on_lattice[i]`` is False for pads
+    farther than SNAP_FRACTION x pitch from their cell (ignored by the
+    fit). ``row_vec`` is zero for a single row of pads.
+    """
+
+    __slots__ = ("origin", "col_vec", "row_vec", "cells", "on_lattice", "rms_mm")
+
+    def __init__(self, origin, col_vec, row_vec, cells, on_lattice, rms_mm):
+        self.origin = origin
+        self.col_vec = col_vec
+        self.row_vec = row_vec
+        self.cells = cells
+        self.on_lattice = on_lattice
+        self.rms_mm = rms_mm
+
+    @property
+    def col_pitch(self) -> float:
+        return float(np.hypot(*self.col_vec))
+
+    @property
+    def row_pitch(self) -> float:
+        return float(np.hypot(*self.row_vec))
+
+    @property
+    def angle_deg(self) -> float:
+        """Direction of the columns axis (the row direction of the pads)."""
+        return math.degrees(math.atan2(self.col_vec[1], self.col_vec[0]))
+
+    @property
+    def rows(self) -> int:
+        return int(self.cells[self.on_lattice, 0].max()) + 1
+
+    @property
+    def cols(self) -> int:
+        return int(self.cells[self.on_lattice, 1].max()) + 1
+
+    def positions(self, cells) -> np.ndarray:
+        """Pad centres (mm) of the (row, col) *cells*."""
+        cells = np.asarray(cells, dtype=float).reshape(-1, 2)
+        return self.origin + cells[:, 1:2] * self.col_vec + cells[:, 0:1] * self.row_vec
+
+    def __repr__(self):
+        return (
+            f"Lattice({self.rows}x{self.cols}, pitch {self.row_pitch:.3f} x "
+            f"{self.col_pitch:.3f} mm, {self.angle_deg:.2f} deg, rms={self.rms_mm:.3f} mm)"
+        )
+
+
+# ----------------------------------------------------------------------
+#  Inference
+# ----------------------------------------------------------------------
+def _neighbour_vectors(points: np.ndarray, k: int = NEIGHBOURS) -> np.ndarray:
+    """
+    Offsets from every point to its *k* nearest neighbours that are not
+    much farther than the nearest one, as an (m, 2) array (chunked).
+    """
+    n = len(points)
+    k = min(k, n - 1)
+    out = []
+    step = max(1, 4_000_000 // n)
+    for start in range(0, n, step):
+        block = points[start : start + step]
+        d2 = ((block[:, None, :] - points[None, :, :]) ** 2).sum(axis=2)
+        d2[np.arange(len(block)), np.arange(start, start + len(block))] = np.inf
+        idx = np.argpartition(d2, k - 1, axis=1)[:, :k]
+        near = np.take_along_axis(d2, idx, axis=1)
+        keep = near <= (NEIGHBOUR_RATIO**2) * near.min(axis=1, keepdims=True)
+        out.append((points[idx] - block[:, None, :])[keep])
+    return np.concatenate(out)
+
+
+def _axis_pitch(along: np.ndarray, across: np.ndarray) -> float:
+    """
+    Median neighbour distance along one axis; 0 if (next to) no neighbour
+    lies on it, e.g. the few offsets to a stray pad beside a single row.
+    """
+    on_axis = np.abs(across) < AXIS_SLOPE * np.abs(along)
+    if on_axis.sum() < max(2, MIN_AXIS_SHARE * len(along)):
+        return 0.0
+    return float(np.median(np.abs(along[on_axis])))
+
+
+def _cluster_pitch(coords: np.ndarray, pitch: float) -> float:
+    """
+    Pitch between lines of pads along one axis from the gaps between
+    their coordinate clusters, for lines too far apart to be neighbours
+    of pads *pitch* apart; 0 for a single line (or stray pads beside it).
+    """
+    tolerance = SNAP_FRACTION * pitch
+    ordered = np.sort(coords)
+    breaks = np.flatnonzero(np.diff(ordered) > tolerance) + 1
+    if not len(breaks):
+        return 0.0
+    centres = np.array([part.mean() for part in np.split(ordered, breaks)])
+    gaps = np.diff(centres)
+    # Missing lines show up as multiples of the pitch
+    line_pitch = float(np.median(gaps / np.maximum(np.round(gaps / gaps.min()), 1.0)))
+    return line_pitch if line_pitch >= pitch else 0.0
+
+
+def infer_lattice(points: Sequence[Tuple[float, float]]) -> Optional[Lattice]:
+    """
+    Fit a lattice to a (noisy, partial) selection of pad centres.
+
+    The orientation is the 4-fold circular mean of the nearest-neighbour
+    directions, the pitches the median neighbour distance along each axis
+    (cluster gaps for rows that are not neighbours). Origin and the two
+    lattice vectors are then refined by least squares on the pads' cells,
+    which also absorbs small angle and pitch errors over long rows.
+    Returns None for fewer than two pads.
+    """
+    pts = np.asarray(points, dtype=float).reshape(-1, 2)
+    if len(pts) < 2:
+        return None
+    vecs = _neighbour_vectors(pts)
+    angles = np.arctan2(vecs[:, 1], vecs[:, 0])
+    theta = float(np.angle(np.exp(4j * angles).mean())) / 4.0
+    c, s = math.cos(theta), math.sin(theta)
+    u_axis, v_axis = np.array([c, s]), np.array([-s, c])
+
+    du, dv = vecs @ u_axis, vecs @ v_axis
+    u, v = pts @ u_axis, pts @ v_axis
+    pitch_u, pitch_v = _axis_pitch(du, dv), _axis_pitch(dv, du)
+    if not pitch_u:
+        pitch_u = _cluster_pitch(u, pitch_v)
+    if not pitch_v:
+        pitch_v = _cluster_pitch(v, pitch_u)
+    if not pitch_u and not pitch_v:
+        return None
+    if not pitch_u:  # a single column: make its pads the lattice's row
+        u_axis, v_axis = v_axis, -u_axis
+        u, v, pitch_u, pitch_v = v, -u, pitch_v, 0.0
+
+    ref = int(np.argmin(np.hypot(u - np.median(u), v - np.median(v))))
+    origin = pts[ref]
+    col_vec, row_vec = u_axis * pitch_u, v_axis * pitch_v
+    # Grow the fitted region from the central pad outwards so that small
+    # pitch/angle errors never add up to a wrong cell far from the centre
+    distance = np.hypot(*(pts - origin).T)
+    radius = GROW_START * max(pitch_u, pitch_v)
+    passes = 0
+    while passes < REFINE_PASSES:
+        near = distance <= radius
+        cells, err = _snap(pts, origin, col_vec, row_vec)
+        keep = near & (err <= SNAP_FRACTION * min(p for p in (pitch_u, pitch_v) if p))
+        if keep.sum() < 2:
+            return None
+        origin, col_vec, row_vec = _fit(pts[keep], cells[keep], bool(pitch_v))
+        pitch_u, pitch_v = np.hypot(*col_vec), np.hypot(*row_vec)
+        area = col_vec[0] * row_vec[1] - col_vec[1] * row_vec[0]
+        if pitch_v and abs(area) < 0.5 * pitch_u * pitch_v:
+            return None  # rows and columns (nearly) parallel: not a grid
+        if near.all():
+            passes += 1
+        radius *= GROW_FACTOR
+
+    cells, err = _snap(pts, origin, col_vec, row_vec)
+    keep = err <= SNAP_FRACTION * min(p for p in (pitch_u, pitch_v) if p)
+    low = cells[keep].min(axis=0)
+    origin = origin + low[1] * col_vec + low[0] * row_vec
+    rms = float(np.sqrt((err[keep] ** 2).mean()))
+    return Lattice(origin, col_vec, row_vec, cells - low, keep, rms)
+
+
+def _snap(pts, origin, col_vec, row_vec) -> Tuple[np.ndarray, np.ndarray]:
+    """Nearest (row, col) cell of every point and the distance to it."""
+    rel = pts - origin
+    if np.any(row_vec):
+        basis = np.column_stack([row_vec, col_vec])
+        cells = np.round(np.linalg.solve(basis, rel.T).T).astype(np.int64)
+    else:
+        col = np.round(rel @ col_vec / (col_vec @ col_vec)).astype(np.int64)
+        cells = np.column_stack([np.zeros_like(col), col])
+    fitted = origin + cells[:, 1:2] * col_vec + cells[:, 0:1] * row_vec
+    return cells, np.hypot(*(pts - fitted).T)
+
+
+def _fit(pts, cells, two_d: bool):
+    """Least-squares origin and lattice vectors for known cells."""
+    design = [np.ones(len(pts)), cells[:, 1]]
+    if two_d:
+        design.append(cells[:, 0])
+    coef = np.linalg.lstsq(np.column_stack(design), pts, rcond=None)[0]
+    row_vec = coef[2] if two_d else np.zeros(2)
+    return coef[0], coef[1], row_vec
+
+
+# ----------------------------------------------------------------------
+#  Completion
+# ----------------------------------------------------------------------
+def _numbering(rows: int, cols: int, cells: np.ndarray, pins) -> Optional[np.ndarray]:
+    """
+    (rows, cols) grid of pin numbers in the Quick-Creation scheme (either
+    direction) that the selected pads already follow, None if none fits.
+    """
+    try:
+        pins = np.array([int(p) for p in pins])
+    except (TypeError, ValueError):
+        return None
+    for scheme in (SCHEME_ROWS, SCHEME_COLUMNS, SCHEME_CIRCULAR):
+        number = np.empty(rows * cols, dtype=np.int64)
+        number[scheme_order(scheme, cols, rows)] = np.arange(1, rows * cols + 1)
+        grid = number.reshape(rows, cols)
+        for flipped in (grid, grid[::-1], grid[:, ::-1], grid[::-1, ::-1]):
+            if np.array_equal(flipped[cells[:, 0], cells[:, 1]], pins):
+                return flipped
+    return None
+
+
+def complete_lattice(
+    pads: List[BoardObject],
+    lattice: Lattice,
+    rows: Optional[int] = None,
+    cols: Optional[int] = None,
+) -> List[BoardObject]:
+    """
+    New BoardObjects for the empty cells of a *rows* x *cols* lattice
+    (default: the selection's extent), copied from the selected pad
+    nearest to the lattice origin. If the selected pins already follow a
+    Quick-Creation numbering scheme the new pads get their pins from it,
+    otherwise they continue after the highest pin, in row order.
+    """
+    rows = max(rows or lattice.rows, 1)
+    cols = max(cols or lattice.cols, 1)
+    cells = lattice.cells[lattice.on_lattice]
+    inside = (cells[:, 0] < rows) & (cells[:, 1] < cols)
+    selected = [p for p, on in zip(pads, lattice.on_lattice) if on]
+    occupied = np.zeros((rows, cols), dtype=bool)
+    occupied[cells[inside, 0], cells[inside, 1]] = True
+    empty = np.argwhere(~occupied)
+    if not len(empty):
+        return []
+
+    numbers = _numbering(
+        rows, cols, cells[inside], [p.pin for p, i in zip(selected, inside) if i]
+    )
+    if numbers is not None:
+        new_pins = numbers[empty[:, 0], empty[:, 1]].tolist()
+    else:
+        numeric = [int(p.pin) for p in pads if str(p.pin).isdigit()]
+        first = max(numeric, default=0) + 1
+        new_pins = list(range(first, first + len(empty)))
+
+    template = selected[int(np.argmin(cells.sum(axis=1)))]
+    names = [p.component_name for p in selected]
+    comp_name = max(set(names), key=names.count)
+    return [
+        BoardObject(
+            component_name=comp_name,
+            pin=pin,
+            test_position=template.test_position,
+            testability=template.testability,
+            x_coord_mm=x,
+            y_coord_mm=y,
+            technology=template.technology,
+            shape_type=template.shape_type,
+            width_mm=template.width_mm,
+            height_mm=template.height_mm,
+            hole_mm=template.hole_mm,
+            angle_deg=template.angle_deg,
+        )
+        for (x, y), pin in zip(lattice.positions(empty).round(4).tolist(), new_pins)
+    ]
@@ -0,0 +1,308 @@
+# component_placer/pad_clipboard.py
+
+import struct
+import zlib
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from PyQt5.QtCore import QMimeData
+from PyQt5.QtWidgets import QApplication
+
+from logs.log_handler import LogHandler
+from objects.nod_diff import parse_nod_line
+from objects.nod_file import (
+    POSITION_CODES,
+    TECHNOLOGY_CODES,
+    TESTABILITY_CODES,
+    get_pad_code,
+    mils_to_mm,
+    mm_to_mils,
+    parse_pad,
+)
+
+PAD_MIME = "application/x-digitation-pads"
+PAYLOAD_VERSION = 1
+_MAGIC = b"DGPADS"
+_HEADER = struct.Struct("<6sHIB")  # magic, version, pad count, flags
+_INT_PINS = 1  # flag: every pin was an int
+
+# Columns of the payload, in storage order
+NUMERIC_FIELDS = (
+    "x_coord_mm", "y_coord_mm", "angle_deg", "width_mm", "height_mm", "hole_mm",
+)
+TEXT_FIELDS = ("pin", "shape_type", "testability", "technology", "prefix")
+
+_TESTABILITY_NAMES = {code: name for name, code in TESTABILITY_CODES.items()}
+_TECHNOLOGY_NAMES = {code: name for name, code in TECHNOLOGY_CODES.items()}
+
+
+class PadPayload:
+    """
+    Copied pads as columns: ``numbers`` is a (len(NUMERIC_FIELDS), n)
+    float64 array, ``text[field]`` a list per TEXT_FIELDS entry. Pad dicts
+    (what the ComponentPlacer ghost consumes) are only built by pads() /
+    footprint(), i.e. when a paste actually happens.
+    """
+
+    __slots__ = ("numbers", "text")
+
+    def __init__(self, numbers: np.ndarray, text: Dict[str, List[Any]]):
+        self.numbers = numbers
+        self.text = text
+
+    def __len__(self) -> int:
+        return self.numbers.shape[1]
+
+    @classmethod
+    def from_pads(cls, pads: List[Dict[str, Any]]) -> "PadPayload":
+        numbers = np.array(
+            [[float(p.get(f) or 0.0) for p in pads] for f in NUMERIC_FIELDS],
+            dtype=np.float64,
+        ).reshape(len(NUMERIC_FIELDS), len(pads))
+        text = {f: [p.get(f) for p in pads] for f in TEXT_FIELDS}
+        return cls(numbers, text)
+
+    def pads(self) -> List[Dict[str, Any]]:
+        """Pad dicts in copy order (with their "order" key)."""
+        columns = [self.numbers[i].tolist() for i in range(len(NUMERIC_FIELDS))]
+        columns += [self.text[f] for f in TEXT_FIELDS]
+        names = NUMERIC_FIELDS + TEXT_FIELDS
+        return [
+            dict(zip(names, values), order=i) for i, values in enumerate(zip(*columns))
+        ]
+
+    def footprint(self) -> Dict[str, Any]:
+        """Footprint dict as normalize_footprint() would return it."""
+        if not len(self):
+            return {"pads": [], "center_x": 0.0, "center_y": 0.0}
+        xs, ys = self.numbers[0], self.numbers[1]
+        return {
+            "pads": self.pads(),
+            "center_x": float(xs.min() + xs.max()) / 2.0,
+            "center_y": float(ys.min() + ys.max()) / 2.0,
+        }
+
+
+# ----------------------------------------------------------------------
+#  Binary codec
+# ----------------------------------------------------------------------
+def encode_pads(payload: PadPayload) -> bytes:
+    """
+    Header + zlib-compressed body: the numeric columns as float64, the text
+    columns as int32 indices into one table of unique strings (-1 = None).
+    """
+    table: Dict[str, int] = {}
+    indices = np.empty((len(TEXT_FIELDS), len(payload)), dtype=np.int32)
+    flags = 0
+    for row, field in enumerate(TEXT_FIELDS):
+        values = payload.text[field]
+        if field == "pin" and values and all(type(v) is int for v in values):
+            flags |= _INT_PINS
+        indices[row] = [
+            -1 if v is None else table.setdefault(str(v), len(table)) for v in values
+        ]
+    strings = "\x00".join(table).encode("utf-8")
+    body = b"".join(
+        (
+            struct.pack("<I", len(table)),
+            np.ascontiguousarray(payload.numbers, dtype="<f8").tobytes(),
+            indices.astype("<i4").tobytes(),
+            strings,
+        )
+    )
+    header = _HEADER.pack(_MAGIC, PAYLOAD_VERSION, len(payload), flags)
+    return header + zlib.compress(body, 1)
+
+
+def payload_size(data: bytes) -> Optional[int]:
+    """Pad count from the header of *data*, None if it is not a pad payload."""
+    if len(data) < _HEADER.size:
+        return None
+    magic, version, count, _flags = _HEADER.unpack_from(data)
+    return count if magic == _MAGIC and version == PAYLOAD_VERSION else None
+
+
+def decode_pads(data: bytes) -> Optional[PadPayload]:
+    """PadPayload of encode_pads() output, None for foreign or damaged data."""
+    count = payload_size(data)
+    if count is None:
+        return None
+    flags = _HEADER.unpack_from(data)[3]
+    try:
+        body = zlib.decompress(data[_HEADER.size :])
+        (n_strings,) = struct.unpack_from("<I", body)
+        offset = 4
+        numbers = np.frombuffer(
+            body, dtype="<f8", count=len(NUMERIC_FIELDS) * count, offset=offset
+        ).reshape(len(NUMERIC_FIELDS), count)
+        offset += numbers.nbytes
+        indices = np.frombuffer(
+            body, dtype="<i4", count=len(TEXT_FIELDS) * count, offset=offset
+        ).reshape(len(TEXT_FIELDS), count)
+        offset += indices.nbytes
+        strings = body[offset:].decode("utf-8").split("\x00") if n_strings else []
+    except (zlib.error, struct.error, ValueError, UnicodeDecodeError):
+        return None
+    if len(strings) != n_strings:
+        return None
+    lookup = strings + [None]  # index -1 -> None
+    text = {}
+    for row, field in enumerate(TEXT_FIELDS):
+        values = [lookup[i] for i in indices[row].tolist()]
+        if field == "pin" and flags & _INT_PINS:
+            values = [int(v) for v in values]
+        text[field] = values
+    return PadPayload(numbers.astype(np.float64), text)
+
+
+# ----------------------------------------------------------------------
+#  Plain-text (.nod lines) fallback
+# ----------------------------------------------------------------------
+def nod_text(payload: PadPayload, component_name: str = "CLIPBOARD") -> str:
+    """The pads as .nod lines, for pasting into editors or other tools."""
+    codes: Dict[tuple, str] = {}
+    lines = ["* SIGNAL COMPONENT PIN X Y PAD POS TECN TEST CHANNEL USER"]
+    x, y, angle, width, height, hole = (col.tolist() for col in payload.numbers)
+    text = payload.text
+    for i, pin in enumerate(text["pin"]):
+        key = (text["shape_type"][i], width[i], height[i], hole[i], angle[i])
+        pad = codes.get(key)
+        if pad is None:
+            pad = codes[key] = get_pad_code(
+                key[0], mm_to_mils(key[1]), mm_to_mils(key[2]), mm_to_mils(key[3]), key[4]
+            )
+        lines.append(
+            f'"S0" "{component_name}" {pin} {x[i]:.3f} {y[i]:.3f} {pad} '
+            f'{POSITION_CODES["top"]} {TECHNOLOGY_CODES.get(text["technology"][i], "S")} '
+            f'{TESTABILITY_CODES.get(text["testability"][i], "N")} 0'
+        )
+    return "\n".join(lines) + "\n"
+
+
+def decode_nod_text(text: str) -> Optional[PadPayload]:
+    """PadPayload of .nod lines (e.g. copied from a .nod file), None if there are none."""
+    pads = []
+    for line in text.splitlines():
+        row = parse_nod_line(line)
+        if row is None:
+            continue
+        shape, width, height, hole, angle = parse_pad(row[6])
+        pads.append(
+            {
+                "pin": int(row[2]) if row[2].isdigit() else row[2],
+                "x_coord_mm": row[4],
+                "y_coord_mm": row[5],
+                "angle_deg": angle,
+                "shape_type": shape,
+                "width_mm": mils_to_mm(width),
+                "height_mm": mils_to_mm(height),
+                "hole_mm": mils_to_mm(hole),
+                "testability": _TESTABILITY_NAMES.get(row[9], "Not Testable"),
+                "technology": _TECHNOLOGY_NAMES.get(row[8], "SMD"),
+                "prefix": None,
+            }
+        )
+    return PadPayload.from_pads(pads) if pads else None
+
+
+# ----------------------------------------------------------------------
+#  System clipboard
+# ----------------------------------------------------------------------
+class PadMimeData(QMimeData):
+    """
+    QMimeData carrying a PadPayload: PAD_MIME bytes are encoded once, the
+    plain-text .nod fallback only when another application asks for it.
+    """
+
+    def __init__(self, payload: PadPayload):
+        super().__init__()
+        self.payload = payload
+        self._text: Optional[str] = None
+        self.setData(PAD_MIME, encode_pads(payload))
+
+    def formats(self):
+        return [PAD_MIME, "text/plain"]
+
+    def retrieveData(self, mime_type, preferred_type):
+        if mime_type == "text/plain":
+            if self._text is None:
+                self._text = nod_text(self.payload)
+            return self._text
+        return super().retrieveData(mime_type, preferred_type)
+
+
+class Clipboard:
+    """
+    Copy/paste of pads through the system clipboard, so that pads can be
+    pasted into another running instance or a later session.
+
+    copy() puts a PadMimeData on the clipboard. payload() decodes whatever
+    is on the clipboard only when asked: pads copied by this process are
+    returned as they are, a PAD_MIME payload of another instance is
+    decoded, and plain .nod text is parsed as a fallback. Without a
+    QApplication the clipboard is process-local.
+    """
+
+    def __init__(self):
+        self.log = LogHandler()
+        self._payload: Optional[PadPayload] = None
+        self._decoded: Optional[tuple] = None  # (raw bytes, PadPayload) of the last decode
+
+    @staticmethod
+    def _system():
+        app = QApplication.instance()
+        return app.clipboard() if app is not None else None
+
+    def copy(self, pads: List[Any]) -> PadPayload:
+        """Put pad dicts (or BoardObjects) on the clipboard."""
+        pads = [p if isinstance(p, dict) else vars(p) for p in pads]
+        self._payload = PadPayload.from_pads(pads)
+        system = self._system()
+        if system is not None:
+            system.setMimeData(PadMimeData(self._payload))
+        self.log.info(
+            f"Clipboard: Copied {len(pads)} pads.", module="Clipboard", func="copy"
+        )
+        return self._payload
+
+    def payload(self) -> Optional[PadPayload]:
+        """The pads on the clipboard, decoded now; None if there are none."""
+        system = self._system()
+        if system is None:
+            return self._payload
+        mime = system.mimeData()
+        if mime is None:
+            return None
+        if isinstance(mime, PadMimeData):
+            return mime.payload
+        if mime.hasFormat(PAD_MIME):
+            data = bytes(mime.data(PAD_MIME))
+            if self._decoded is None or self._decoded[0] != data:
+                self._decoded = (data, decode_pads(data))
+            return self._decoded[1]
+        if mime.hasText():
+            return decode_nod_text(mime.text())
+        return None
+
+    def has_pads(self) -> bool:
+        """Cheap check (no decoding) whether a paste would find pads."""
+        system = self._system()
+        if system is None:
+            return bool(self._payload)
+        mime = system.mimeData()
+        if mime is None:
+            return False
+        if isinstance(mime, PadMimeData):
+            return bool(len(mime.payload))
+        if mime.hasFormat(PAD_MIME):
+            return bool(payload_size(bytes(mime.data(PAD_MIME))))
+        return mime.hasText() and any(
+            parse_nod_line(line) for line in mime.text().splitlines()[:50]
+        )
+
+    def paste(self) -> List[Dict[str, Any]]:
+        payload = self.payload()
+        return payload.pads() if payload else []
+
+
+clipboard = Clipboard()
@@ -0,0 +1,285 @@
+# component_placer/pad_detector.py
+
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from objects.board_object import BoardObject
+
+# Shape acceptance (fill = blob area / bounding-box area)
+RECT_MIN_FILL = 0.85  # rectangles fill their box
+ROUND_FILL = math.pi / 4  # circles / ellipses fill pi/4 of it
+ROUND_FILL_TOL = 0.08
+ROUND_MAX_ASPECT = 1.25  # beyond this a round blob is an ellipse
+
+SHAPE_RECT = "Square/rectangle"
+SHAPE_ROUND = "Round"
+SHAPE_ELLIPSE = "Ellipse"
+
+
+class PadCandidate:
+    """A pad proposed by detect_pads(), in board mm and image pixels."""
+
+    __slots__ = (
+        "x_mm", "y_mm", "width_mm", "height_mm", "shape_type",
+        "x_px", "y_px", "w_px", "h_px", "fill",
+    )
+
+    def __init__(
+        self, x_mm, y_mm, width_mm, height_mm, shape_type, x_px, y_px, w_px, h_px, fill
+    ):
+        self.x_mm = x_mm
+        self.y_mm = y_mm
+        self.width_mm = width_mm
+        self.height_mm = height_mm
+        self.shape_type = shape_type
+        self.x_px = x_px
+        self.y_px = y_px
+        self.w_px = w_px
+        self.h_px = h_px
+        self.fill = fill
+
+    def to_board_object(self, component_name: str, pin: int, side: str = "top") -> BoardObject:
+        return BoardObject(
+            component_name=component_name,
+            pin=pin,
+            test_position=side.capitalize(),
+            x_coord_mm=self.x_mm,
+            y_coord_mm=self.y_mm,
+            shape_type=self.shape_type,
+            width_mm=self.width_mm,
+            height_mm=self.height_mm,
+        )
+
+    def __repr__(self):
+        return (
+            f"PadCandidate({self.shape_type}, x={self.x_mm:.3f}, y={self.y_mm:.3f}, "
+            f"{self.width_mm:.3f}x{self.height_mm:.3f} mm)"
+        )
+
+
+# ----------------------------------------------------------------------
+#  Image input
+# ----------------------------------------------------------------------
+def qimage_to_gray(image) -> np.ndarray:
+    """8-bit grayscale copy of a QImage (or QPixmap) as an (H, W) array."""
+    from PyQt5.QtGui import QImage, QPixmap
+
+    if isinstance(image, QPixmap):
+        image = image.toImage()
+    gray = image.convertToFormat(QImage.Format_Grayscale8)
+    h, w = gray.height(), gray.width()
+    ptr = gray.constBits()
+    ptr.setsize(gray.bytesPerLine() * h)
+    rows = np.frombuffer(ptr, dtype=np.uint8).reshape(h, gray.bytesPerLine())
+    return rows[:, :w].copy()
+
+
+def otsu_threshold(gray: np.ndarray, sample_step: int = 4) -> int:
+    """Otsu's threshold of *gray*, estimated on every *sample_step*-th pixel."""
+    hist = np.bincount(gray[::sample_step, ::sample_step].ravel(), minlength=256)
+    hist = hist.astype(float)
+    levels = np.arange(256)
+    w0 = np.cumsum(hist)
+    w1 = w0[-1] - w0
+    m0 = np.cumsum(hist * levels)
+    mean0 = m0 / np.maximum(w0, 1)
+    mean1 = (m0[-1] - m0) / np.maximum(w1, 1)
+    between = w0 * w1 * (mean0 - mean1) ** 2
+    return int(np.argmax(between))
+
+
+# ----------------------------------------------------------------------
+#  Connected components (run-length based, NumPy only)
+# ----------------------------------------------------------------------
+def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Horizontal runs of True in row-major order: (row, first col, end col)."""
+    h, w = mask.shape
+    padded = np.zeros((h, w + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    rows, c0 = np.nonzero(edges == 1)
+    _, c1 = np.nonzero(edges == -1)
+    return rows, c0, c1
+
+
+def _label_runs(rows, c0, c1, width: int) -> np.ndarray:
+    """
+    Component id (0..n-1) of every run; runs on adjacent rows that overlap
+    are 4-connected. Overlaps are found with two searchsorted() calls and
+    merged by hook-and-compress union-find on arrays.
+    """
+    n = len(rows)
+    stride = width + 2
+    start_key = rows * stride + c0
+    end_key = rows * stride + c1
+    below = (rows + 1) * stride
+    lo = np.searchsorted(end_key, below + c0, side="right")
+    hi = np.searchsorted(start_key, below + c1, side="left")
+    counts = np.maximum(hi - lo, 0)
+    src = np.repeat(np.arange(n), counts)
+    first = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+    dst = np.arange(len(src)) + first
+
+    parent = np.arange(n)
+    while len(src):
+        ps, pd = parent[src], parent[dst]
+        np.minimum.at(parent, np.maximum(ps, pd), np.minimum(ps, pd))
+        while True:
+            grand = parent[parent]
+            if np.array_equal(grand, parent):
+                break
+            parent = grand
+        merged = parent[src] == parent[dst]
+        src, dst = src[~merged], dst[~merged]
+    return np.unique(parent, return_inverse=True)[1]
+
+
+def find_blobs(mask: np.ndarray) -> np.ndarray:
+    """
+    Connected components of a boolean mask as an (N, 7) float array:
+    area, centre x, centre y (pixel centres at +0.5), x0, y0, x1, y1
+    (bounding box, end-exclusive).
+    """
+    rows, c0, c1 = _runs(mask)
+    if not len(rows):
+        return np.empty((0, 7))
+    labels = _label_runs(rows, c0, c1, mask.shape[1])
+    count = labels.max() + 1
+    length = (c1 - c0).astype(float)
+    area = np.bincount(labels, length, count)
+    sum_x = np.bincount(labels, (c0 + c1) * length / 2.0, count)
+    sum_y = np.bincount(labels, (rows + 0.5) * length, count)
+    x0 = np.full(count, mask.shape[1])
+    y0 = np.full(count, mask.shape[0])
+    x1 = np.zeros(count, dtype=int)
+    y1 = np.zeros(count, dtype=int)
+    np.minimum.at(x0, labels, c0)
+    np.minimum.at(y0, labels, rows)
+    np.maximum.at(x1, labels, c1)
+    np.maximum.at(y1, labels, rows + 1)
+    return np.column_stack((area, sum_x / area, sum_y / area, x0, y0, x1, y1))
+
+
+def classify_blobs(blobs: np.ndarray, min_size_px: float, max_size_px: float):
+    """
+    Shape fit of find_blobs() rows: returns (keep mask, width, height, shape
+    code, fill) with shape code 0 = rectangle, 1 = round, 2 = ellipse.
+    """
+    w = blobs[:, 5] - blobs[:, 3]
+    h = blobs[:, 6] - blobs[:, 4]
+    fill = blobs[:, 0] / (w * h)
+    aspect = np.maximum(w, h) / np.minimum(w, h)
+    rect = fill >= RECT_MIN_FILL
+    roundish = np.abs(fill - ROUND_FILL) <= ROUND_FILL_TOL
+    shape = np.where(rect, 0, np.where(aspect <= ROUND_MAX_ASPECT, 1, 2))
+    keep = (
+        (rect | roundish)
+        & (np.minimum(w, h) >= min_size_px)
+        & (np.maximum(w, h) <= max_size_px)
+    )
+    return keep, w, h, shape, fill
+
+
+# ----------------------------------------------------------------------
+#  Tiled detection
+# ----------------------------------------------------------------------
+def _detect_tile(gray, threshold, bright, tile, margin, min_px, max_px):
+    """
+    Pad rows (cx, cy, w, h, shape code, fill) in image pixels for the blobs
+    whose centre lies in *tile* (top, left, size). The tile is labelled with
+    a *margin* so that pads crossing its edge are seen whole.
+    """
+    ty, tx, size = tile
+    h, w = gray.shape
+    y0, x0 = max(ty - margin, 0), max(tx - margin, 0)
+    y1, x1 = min(ty + size + margin, h), min(tx + size + margin, w)
+    window = gray[y0:y1, x0:x1]
+    mask = window > threshold if bright else window < threshold
+    blobs = find_blobs(mask)
+    if not len(blobs):
+        return np.empty((0, 6))
+
+    keep, bw, bh, shape, fill = classify_blobs(blobs, min_px, max_px)
+    # Blobs cut by the window edge belong to (and are whole in) a neighbour
+    touches = (
+        ((blobs[:, 3] == 0) & (x0 > 0))
+        | ((blobs[:, 4] == 0) & (y0 > 0))
+        | ((blobs[:, 5] == x1 - x0) & (x1 < w))
+        | ((blobs[:, 6] == y1 - y0) & (y1 < h))
+    )
+    cx = blobs[:, 1] + x0
+    cy = blobs[:, 2] + y0
+    owned = (cx >= tx) & (cx < tx + size) & (cy >= ty) & (cy < ty + size)
+    keep &= owned & ~touches
+    return np.column_stack((cx, cy, bw, bh, shape, fill))[keep]
+
+
+def detect_pads(
+    gray: np.ndarray,
+    converter,
+    side: str = "top",
+    threshold: Optional[int] = None,
+    bright: bool = True,
+    min_size_mm: float = 0.2,
+    max_size_mm: float = 5.0,
+    tile_px: int = 2048,
+    workers: Optional[int] = None,
+) -> List[PadCandidate]:
+    """
+    Propose pads on a board image: threshold (Otsu by default; pads
+    brighter than the board unless *bright* is False), label connected
+    components and keep the blobs that fit a rectangle, circle or ellipse
+    of plausible size. The image is processed in tiles on a thread pool
+    (the NumPy kernels release the GIL). Positions are converted to board mm
+    for *side* with *converter* (a CoordinateConverter).
+    """
+    side = side.lower()
+    scale = converter.mm_per_pixels_top if side == "top" else converter.mm_per_pixels_bot
+    min_px = min_size_mm / scale
+    max_px = max_size_mm / scale
+    if threshold is None:
+        threshold = otsu_threshold(gray)
+    margin = int(math.ceil(max_px)) + 2
+
+    h, w = gray.shape
+    tiles = [(ty, tx, tile_px) for ty in range(0, h, tile_px) for tx in range(0, w, tile_px)]
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(
+            pool.map(
+                lambda t: _detect_tile(gray, threshold, bright, t, margin, min_px, max_px),
+                tiles,
+            )
+        )
+    found = np.concatenate(parts) if parts else np.empty((0, 6))
+    if not len(found):
+        return []
+
+    centres_mm = converter.pixels_to_mm_array(found[:, :2], side)
+    shapes = (SHAPE_RECT, SHAPE_ROUND, SHAPE_ELLIPSE)
+    candidates = []
+    for (x_px, y_px, w_px, h_px, code, fill), (x_mm, y_mm) in zip(
+        found.tolist(), centres_mm.tolist()
+    ):
+        shape = shapes[int(code)]
+        if shape == SHAPE_ROUND:
+            w_px = h_px = (w_px + h_px) / 2.0
+        candidates.append(
+            PadCandidate(
+                x_mm, y_mm, w_px * scale, h_px * scale, shape,
+                x_px, y_px, w_px, h_px, fill,
+            )
+        )
+    return candidates
+
+
+def candidates_to_objects(
+    candidates: List[PadCandidate], component_name: str, side: str = "top"
+) -> List[BoardObject]:
+    """BoardObjects for accepted candidates, pins numbered top-left first."""
+    ordered = sorted(candidates, key=lambda c: (-round(c.y_mm, 3), c.x_mm))
+    return [c.to_board_object(component_name, pin, side) for pin, c in enumerate(ordered, 1)]
@@ -0,0 +1,229 @@
+# component_placer/quick_grid.py
+
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+# Numbering schemes of the Quick-Creation dialog
+SCHEME_CIRCULAR = 0  # IC-style snake
+SCHEME_ROWS = 1  # row by row, prefixes "<row letter><column>"
+SCHEME_COLUMNS = 2  # column by column, prefixes "<column letter><row>"
+
+DEFAULT_PREFIX_TABLE = (
+    "A", "B", "C", "D", "E", "F", "G", "H", "J", "K", "L", "M", "N", "P",
+    "R", "T", "U", "V", "W", "Y", "AA", "AB", "AC", "AD", "AE", "AF", "AG", "AH",
+)
+
+SHAPE_MAP = {
+    "round": "Round",
+    "ellipse": "Ellipse",
+    "square/rectangle": "Square/rectangle",
+    "square/rectangle with hole": "Square/rectangle with Hole",
+    "hole": "Hole",
+}
+
+_BALL_RE = re.compile(r"^([A-Za-z]+)(\d+)$")
+
+
+def snake_order(cols: int, rows: int) -> np.ndarray:
+    """
+    Flat (row-major) grid indices in IC-style snake order: down/up the
+    columns when rows >= cols, else across/back along the rows.
+    """
+    grid = np.arange(rows * cols).reshape(rows, cols)
+    lanes = grid.T.copy() if rows >= cols else grid.copy()
+    lanes[1::2] = lanes[1::2, ::-1]
+    return lanes.ravel()
+
+
+def scheme_order(scheme: int, cols: int, rows: int) -> np.ndarray:
+    """Flat grid indices in the visiting order of numbering *scheme*."""
+    if scheme == SCHEME_CIRCULAR:
+        return snake_order(cols, rows)
+    grid = np.arange(rows * cols).reshape(rows, cols)
+    return (grid.T if scheme == SCHEME_COLUMNS else grid).ravel()
+
+
+def parse_ball_names(
+    text: str, prefix_table: Sequence[str], letter_is_column: bool = False
+) -> Set[Tuple[int, int]]:
+    """
+    Grid cells (row, col), 0-based, named by *text* – ball names such as
+    ``"A1 C3, H8"`` in the same letter+number form the prefixes use.
+    The letter picks the row (the column when *letter_is_column*).
+    Tokens that do not name a ball (e.g. half-typed ones) are skipped.
+    """
+    letters = {letter.upper(): i for i, letter in enumerate(prefix_table)}
+    cells = set()
+    for token in re.split(r"[\s,;]+", text or ""):
+        match = _BALL_RE.match(token)
+        if not match or match.group(1).upper() not in letters or int(match.group(2)) < 1:
+            continue
+        lane, number = letters[match.group(1).upper()], int(match.group(2)) - 1
+        cells.add((number, lane) if letter_is_column else (lane, number))
+    return cells
+
+
+class QuickGrid:
+    """
+    Array-backed pad grid for Quick Creation (BGA-sized footprints).
+
+    The layout – which balls exist, their visiting order, pin numbers and
+    prefixes – is computed once per set of dialog parameters as numpy
+    arrays. Moving anchor A or B only recomputes the pad positions, which
+    are written into the cached pad dicts in place.
+
+    Depopulation is read from the params:
+      "missing_balls" – ball names (see parse_ball_names())
+      "center_void"   – (rows, cols) of balls left out around the centre
+
+    Pins run 1..N over the populated balls in scheme order; prefixes keep
+    the grid names, so a missing ball leaves a gap in them.
+    """
+
+    def __init__(self):
+        self._layout_key = None
+        self._pads_key = None
+        self._anchors = None
+        self.rows = 0
+        self.cols = 0
+        self.rc = np.zeros((2, 0), dtype=np.int64)  # (rows, cols) in pin order
+        self.pin_grid = np.zeros((0, 0), dtype=np.int64)  # pin per cell, 0 = missing
+        self.prefixes: List[Optional[str]] = []
+        self._pin_of_prefix: Dict[str, int] = {}
+        self._pads: List[Dict] = []
+
+    # ------------------------------------------------------------------
+    #  Layout (numbering + depopulation)
+    # ------------------------------------------------------------------
+    def _layout(self, params: Dict, prefix_table: Sequence[str]) -> bool:
+        """(Re)compute the layout arrays; returns True if they changed."""
+        rows = max(int(params.get("y_pins", 1)), 1)
+        cols = max(int(params.get("x_pins", 1)), 1)
+        scheme = int(params.get("number_scheme", SCHEME_CIRCULAR))
+        create_prefix = bool(params.get("create_prefix")) and scheme in (
+            SCHEME_ROWS,
+            SCHEME_COLUMNS,
+        )
+        void = tuple(int(v) for v in (params.get("center_void") or (0, 0)))
+        key = (
+            rows, cols, scheme, create_prefix, tuple(prefix_table),
+            params.get("missing_balls") or "", void,
+        )
+        if key == self._layout_key:
+            return False
+
+        present = np.ones((rows, cols), dtype=bool)
+        void_rows, void_cols = min(max(void[0], 0), rows), min(max(void[1], 0), cols)
+        if void_rows and void_cols:
+            r0, c0 = (rows - void_rows) // 2, (cols - void_cols) // 2
+            present[r0 : r0 + void_rows, c0 : c0 + void_cols] = False
+        for r, c in parse_ball_names(
+            params.get("missing_balls"), prefix_table, scheme == SCHEME_COLUMNS
+        ):
+            if r < rows and c < cols:
+                present[r, c] = False
+
+        order = scheme_order(scheme, cols, rows)
+        order = order[present.ravel()[order]]
+        self.rc = np.stack(np.divmod(order, cols))
+        self.pin_grid = np.zeros((rows, cols), dtype=np.int64)
+        self.pin_grid[self.rc[0], self.rc[1]] = np.arange(1, order.size + 1)
+
+        if create_prefix and order.size:
+            lanes, numbers = (
+                (self.rc[0], self.rc[1]) if scheme == SCHEME_ROWS else (self.rc[1], self.rc[0])
+            )
+            table = list(prefix_table) or list(DEFAULT_PREFIX_TABLE)
+            letters = [table[i % len(table)] for i in range(int(lanes.max()) + 1)]
+            self.prefixes = [
+                f"{letters[lane]}{number + 1}"
+                for lane, number in zip(lanes.tolist(), numbers.tolist())
+            ]
+        else:
+            self.prefixes = [None] * order.size
+        self._pin_of_prefix = {p: i + 1 for i, p in enumerate(self.prefixes) if p}
+
+        self.rows, self.cols = rows, cols
+        self._layout_key = key
+        return True
+
+    # ------------------------------------------------------------------
+    #  Lookups
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self.rc.shape[1]
+
+    def pin_at(self, row: int, col: int) -> int:
+        """Pin number of grid cell (row, col), 0 if the ball is missing."""
+        return int(self.pin_grid[row, col])
+
+    def cell_of(self, pin: int) -> Tuple[int, int]:
+        """Grid cell (row, col) of *pin* (1-based)."""
+        return int(self.rc[0, pin - 1]), int(self.rc[1, pin - 1])
+
+    def pin_of_prefix(self, prefix: str) -> int:
+        """Pin number of ball *prefix* (e.g. "C3"), 0 if unknown."""
+        return self._pin_of_prefix.get(prefix, 0)
+
+    # ------------------------------------------------------------------
+    #  Footprint
+    # ------------------------------------------------------------------
+    def positions(self, anchors: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """Pad centres (mm) in pin order; A is cell (0, 0), B the far corner."""
+        ax, ay = anchors["A"]
+        bx, by = anchors["B"]
+        dx = (bx - ax) / (self.cols - 1) if self.cols > 1 else 0.0
+        dy = (by - ay) / (self.rows - 1) if self.rows > 1 else 0.0
+        return ax + self.rc[1] * dx, ay + self.rc[0] * dy
+
+    def footprint(
+        self, anchors: Dict, params: Dict, prefix_table: Sequence[str] = DEFAULT_PREFIX_TABLE
+    ) -> Dict:
+        """
+        Footprint dict for the ghost and place_quick(): pads in pin order.
+        The pad dicts are reused between calls while the params stay the same.
+        """
+        layout_changed = self._layout(params, prefix_table)
+        template = self.pad_template(params)
+        pads_key = tuple(sorted(template.items()))
+        if layout_changed or pads_key != self._pads_key:
+            self._pads = [
+                dict(template, pin=i + 1, prefix=prefix) if prefix else dict(template, pin=i + 1)
+                for i, prefix in enumerate(self.prefixes)
+            ]
+            self._pads_key = pads_key
+            self._anchors = None
+
+        anchor_key = (tuple(anchors["A"]), tuple(anchors["B"]))
+        if anchor_key != self._anchors:
+            xs, ys = self.positions(anchors)
+            for pad, x, y in zip(self._pads, xs.tolist(), ys.tolist()):
+                pad["x_coord_mm"] = x
+                pad["y_coord_mm"] = y
+            self._anchors = anchor_key
+
+        (ax, ay), (bx, by) = anchor_key
+        return {
+            "center_x": (ax + bx) / 2.0,
+            "center_y": (ay + by) / 2.0,
+            "pads": list(self._pads),
+        }
+
+    @staticmethod
+    def pad_template(params: Dict) -> Dict:
+        """Attributes shared by every pad of the grid."""
+        return {
+            "width_mm": float(params.get("width", 0.5)),
+            "height_mm": float(params.get("height", 0.5)),
+            "hole_mm": float(params.get("hole", 0.0)),
+            "shape_type": SHAPE_MAP.get(
+                str(params.get("shape", "Round")).lower(), "Square/rectangle"
+            ),
+            "test_position": str(params.get("test_side", "top")).lower(),
+            "testability": params.get("testability", "Force"),
+            "technology": params.get("technology", "SMD"),
+            "angle_deg": 0.0,
+        }
+
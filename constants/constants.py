@@ -1,19 +1,73 @@
 # constants/constants.py
 
+import atexit
 import json
 import os
+import threading
+from collections import ChainMap
 
 # Avoid circular import by delaying LogHandler import
-from typing import Optional, Any
+from typing import Any, Dict, Optional
+
+# Settings layers, lowest priority first
+DEFAULTS = "defaults"  # DEFAULT_VALUES below, never written
+GLOBAL = "global"  # constants.txt next to this module
+USER = "user"  # USER_SETTINGS_PATH, what the UI changes
+PROJECT = "project"  # the open project (project_settings.json, see project_settings)
+LAYERS = (DEFAULTS, GLOBAL, USER, PROJECT)
+
+USER_SETTINGS_PATH = os.path.join(os.path.expanduser("~"), ".digitation", "settings.json")
+FLUSH_DELAY_S = 1.0  # save() calls within this window are written once
+
+DEFAULT_VALUES: Dict[str, Any] = {
+    "log_file": "logs/program.txt",
+    "log_max_size": 5_000_000,
+    "log_backup_count": 5,
+    "debug_mode": False,
+    "zoom_center_mode": "marker",
+    "z_value_image": 0,
+    "z_value_cutouts": 0.5,
+    "z_value_pads": 1,
+    "z_value_marker": 2,
+    "z_value_ghost": 3,
+    "max_undo_steps": 10,
+    "pins_font_size": 18,
+    "toolbar_font_size": 10,
+    "statusbar_font_size": 12,
+    "tab_font_size": 10,
+    "properties_dock_height": 127,
+    "max_backups": 5,
+    "anchor_nudge_step_mm": 0.2,
+    "ghost_rotation_step_deg": 15,
+    "max_zoom": 10.0,
+}
 
 
 class Constants:
-    """Singleton wrapper around a JSON dictionary of persistent settings."""
+    """
+    Layered store of persistent settings: get() looks a key up in the
+    project, user, global and default layers (in that order), from memory.
+
+    set() changes the project layer for keys the open project defines and
+    the user layer otherwise (the global layer if there is no user file). save() only schedules a background flush of
+    the changed file-backed layers (global, user); every save() within
+    FLUSH_DELAY_S ends up in one write. flush() writes immediately. The
+    project layer is persisted by project_settings.save_settings().
+
+    Constants() is the process-wide default instance; passing *file_path*
+    or ``shared=False`` gives an independent instance (e.g. per board).
+    """
 
     _instance: Optional["Constants"] = None
 
-    def __new__(cls, file_path: Optional[str] = None, logger: Optional[Any] = None):
-        if file_path is None:
+    def __new__(
+        cls,
+        file_path: Optional[str] = None,
+        logger: Optional[Any] = None,
+        shared: bool = True,
+        user_path: Optional[str] = None,
+    ):
+        if file_path is None and shared:
             if cls._instance is None:
                 cls._instance = super().__new__(cls)
                 cls._instance._initialized = False
@@ -22,53 +76,160 @@ class Constants:
         inst._initialized = False
         return inst
 
-    def __init__(self, file_path: Optional[str] = None, logger: Optional[Any] = None):
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        logger: Optional[Any] = None,
+        shared: bool = True,
+        user_path: Optional[str] = None,
+    ):
         if getattr(self, "_initialized", False):
             return
         self._initialized = True
+        default_files = file_path is None
         if file_path is None:
             current_dir = os.path.dirname(os.path.abspath(__file__))
             file_path = os.path.join(current_dir, "constants.txt")
+        if user_path is None and default_files:
+            user_path = USER_SETTINGS_PATH
 
         self.file_path = file_path
-        self.data: dict[str, Any] = {}
+        self.user_path = user_path
         if logger is None:
             from logs.log_handler import LogHandler
 
             logger = LogHandler()
         self.log = logger
+        self.flush_delay_s = FLUSH_DELAY_S
+        self.writes = 0  # files written so far
+        self._paths = {GLOBAL: file_path, USER: user_path}
+        self._readonly = set()  # layers whose file could not be parsed
+        self._dirty = set()
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # one flush writes at a time
+        self._timer: Optional[threading.Timer] = None
+        self.layers: Dict[str, Dict[str, Any]] = {
+            DEFAULTS: dict(DEFAULT_VALUES),
+            GLOBAL: self._read(GLOBAL),
+            USER: self._read(USER),
+            PROJECT: {},
+        }
+        # Read-only merged view, highest priority first
+        self.data = ChainMap(*(self.layers[layer] for layer in reversed(LAYERS)))
+        if default_files and shared:
+            atexit.register(self.flush)
+
+    def _read(self, layer: str) -> Dict[str, Any]:
+        path = self._paths[layer]
+        if not path:
+            return {}
         try:
-            with open(self.file_path, "r") as file:
-                self.data = json.load(file)
+            with open(path, "r") as file:
+                return json.load(file)
         except FileNotFoundError:
-            self.log.warning(
-                f"Constants file not found at '{self.file_path}'. Using default values."
-            )
+            if layer == GLOBAL:
+                self.log.warning(
+                    f"Constants file not found at '{path}'. Using default values."
+                )
         except json.JSONDecodeError:
-            self.log.error(
-                f"Malformed constants file at '{self.file_path}'. Using default values."
-            )
+            # Never overwrite a file we could not read (e.g. a hand edit gone wrong)
+            self._readonly.add(layer)
+            self.log.error(f"Malformed constants file at '{path}'. Using default values.")
+        return {}
 
     def get(self, key, default=None):
         return self.data.get(key, default)
 
-    def set(self, key, value):
+    def layer_of(self, key) -> Optional[str]:
+        """The layer the current value of *key* comes from (None if unset)."""
+        for layer in reversed(LAYERS):
+            if key in self.layers[layer]:
+                return layer
+        return None
+
+    def set(self, key, value, layer: Optional[str] = None):
         """
         Sets the value for a given key in the constants.
 
         :param key: The key to set.
         :param value: The value to assign to the key.
+        :param layer: The layer to change; by default the project layer if
+            it defines *key*, else the user layer (global without a user file).
         """
-        self.data[key] = value
-        self.log.debug(f"Constants updated: {key} = {value}")
+        with self._lock:
+            if layer is None:
+                if key in self.layers[PROJECT]:
+                    layer = PROJECT
+                else:
+                    layer = USER if self._paths[USER] else GLOBAL
+            self.layers[layer][key] = value
+            if self._paths.get(layer):
+                self._dirty.add(layer)
+        self.log.debug(f"Constants updated: {key} = {value} ({layer})")
+
+    def clear_layer(self, layer: str = PROJECT) -> None:
+        """Drop every value of *layer* (e.g. the project's when another one opens)."""
+        with self._lock:
+            self.layers[layer].clear()
+            if self._paths.get(layer):
+                self._dirty.add(layer)
 
     def save(self):
         """
-        Saves the current constants back to the constants.txt file.
+        Schedules writing the changed layers back to their files; the write
+        happens on a background thread once per FLUSH_DELAY_S burst.
+        """
+        with self._lock:
+            if not self._dirty or self._timer is not None:
+                return
+            self._timer = threading.Timer(self.flush_delay_s, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> int:
         """
+        Writes the changed layers now; returns the number of files written.
+        A flush already writing (e.g. on the timer thread) is waited for.
+        """
+        with self._write_lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> int:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending = {
+                layer: dict(self.layers[layer])
+                for layer in self._dirty
+                if layer not in self._readonly
+            }
+            for layer in self._dirty & self._readonly:
+                self.log.warning(
+                    f"Constants not saved: '{self._paths[layer]}' is malformed."
+                )
+            self._dirty.clear()
+        written = 0
+        for layer, values in pending.items():
+            if self._write(self._paths[layer], values):
+                written += 1
+            else:
+                with self._lock:
+                    self._dirty.add(layer)  # retried by the next save()
+        self.writes += written
+        return written
+
+    def _write(self, path: str, values: Dict[str, Any]) -> bool:
+        tmp = path + ".tmp"
         try:
-            with open(self.file_path, "w") as file:
-                json.dump(self.data, file, indent=4)
-            self.log.info(f"Constants saved to '{self.file_path}'.")
+            folder = os.path.dirname(path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            with open(tmp, "w") as file:
+                json.dump(values, file, indent=4)
+            os.replace(tmp, path)
+            self.log.info(f"Constants saved to '{path}'.")
+            return True
         except Exception as e:
             self.log.error(f"Error saving constants: {e}")
+            return False
@@ -0,0 +1,91 @@
+# display/candidate_layer.py
+
+from typing import List, Optional
+
+from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QColor, QPainterPath, QPen
+from PyQt5.QtWidgets import QGraphicsPathItem
+
+from component_placer.pad_detector import SHAPE_RECT, PadCandidate, candidates_to_objects
+from logs.log_handler import LogHandler
+
+CANDIDATE_PEN = QPen(QColor(255, 0, 255), 2.0, Qt.DashLine)
+CANDIDATE_PEN.setCosmetic(True)
+
+
+class CandidateLayer:
+    """
+    Review overlay for detected pad candidates: all outlines are drawn by one
+    QGraphicsPathItem above the pads. Candidates can be dropped by area and
+    the rest accepted into the ObjectLibrary in one undoable bulk_add().
+    """
+
+    def __init__(self, scene, z_value: float = 5.0):
+        self.scene = scene
+        self.z_value = z_value
+        self.log = LogHandler()
+        self.candidates: List[PadCandidate] = []
+        self.side = "top"
+        self._item: Optional[QGraphicsPathItem] = None
+
+    def set_candidates(self, candidates: List[PadCandidate], side: str) -> None:
+        self.candidates = list(candidates)
+        self.side = side.lower()
+        self._redraw()
+
+    def clear(self) -> None:
+        self.candidates = []
+        if self._item is not None:
+            self.scene.removeItem(self._item)
+            self._item = None
+
+    def _redraw(self) -> None:
+        if not self.candidates:
+            self.clear()
+            return
+        if self._item is None:
+            self._item = QGraphicsPathItem()
+            self._item.setPen(CANDIDATE_PEN)
+            self._item.setZValue(self.z_value)
+            self.scene.addItem(self._item)
+        path = QPainterPath()
+        for c in self.candidates:
+            rect = QRectF(c.x_px - c.w_px / 2, c.y_px - c.h_px / 2, c.w_px, c.h_px)
+            if c.shape_type == SHAPE_RECT:
+                path.addRect(rect)
+            else:
+                path.addEllipse(rect)
+        self._item.setPath(path)
+
+    def _inside(self, scene_rect: Optional[QRectF]) -> List[PadCandidate]:
+        if scene_rect is None:
+            return list(self.candidates)
+        return [c for c in self.candidates if scene_rect.contains(c.x_px, c.y_px)]
+
+    def discard(self, scene_rect: Optional[QRectF] = None) -> int:
+        """Drop the candidates in *scene_rect* (all if None); returns the count."""
+        dropped = {id(c) for c in self._inside(scene_rect)}
+        self.candidates = [c for c in self.candidates if id(c) not in dropped]
+        self._redraw()
+        return len(dropped)
+
+    def accept(
+        self, object_library, component_name: str, scene_rect: Optional[QRectF] = None
+    ) -> int:
+        """
+        Add the candidates in *scene_rect* (all if None) as pads of
+        *component_name* in one undo step; they leave the overlay.
+        """
+        chosen = self._inside(scene_rect)
+        if not chosen:
+            return 0
+        objects = candidates_to_objects(chosen, component_name, self.side)
+        object_library.bulk_add(objects)
+        self.discard(scene_rect)
+        self.log.log(
+            "info",
+            f"Accepted {len(objects)} pad candidates as '{component_name}'.",
+            module="CandidateLayer",
+            func="accept",
+        )
+        return len(objects)
@@ -1,5 +1,8 @@
 # coord_converter.py
 
+import numpy as np
+from PyQt5.QtGui import QTransform
+
 from constants.constants import Constants
 from utils.flag_manager import FlagManager
 from logs.log_handler import LogHandler
@@ -12,22 +15,29 @@ class CoordinateConverter:
       - mm_per_pixels_bot
     """
 
-    def __init__(self, image_size=(0, 0)):
+    def __init__(self, image_size=(0, 0), constants=None, flags=None, log=None):
         """
         Initialize the converter with the scaling factor and image dimensions.
 
         :param image_size: The dimensions of the PCB image (width, height) in pixels.
+        :param constants, flags, log: the board's own services (see
+            BoardContext); the process-wide defaults when omitted.
         """
-        self.constants = Constants()  # Reads JSON, which includes mm_per_pixels_top / mm_per_pixels_bot
+        # Reads JSON, which includes mm_per_pixels_top / mm_per_pixels_bot
+        self.constants = constants if constants is not None else Constants()
         self.mm_per_pixels_top = self.constants.get("mm_per_pixels_top", 0.0333)
         self.mm_per_pixels_bot = self.constants.get("mm_per_pixels_bot", 0.0333)
 
-        self.flags = FlagManager()
+        self.flags = flags if flags is not None else FlagManager()
         self.image_width = image_size[0]
         self.image_height = image_size[1]
-        self.log = LogHandler()
+        self.log = log if log is not None else LogHandler()
         self.origin_top = (0.0, 0.0)
         self.origin_bottom = (0.0, 0.0)
+        self._transforms = {}  # side -> (affine params, QTransform)
+        # Fitted mm → pixel affines (see display/registration.py); when set
+        # they replace the scale/origin model of that side
+        self.registration = {"top": None, "bottom": None}
 
     def set_origin_mm(self, x0: float, y0: float, side: str = "top"):
         """Store a board-origin (mm) for the given side."""
@@ -61,16 +71,65 @@ class CoordinateConverter:
             self.log.log("info", f"CoordinateConverter: mm_per_pixels_bot updated to {new_value}")
 
 
+    def set_registration(self, side: str, matrix=None):
+        """
+        Use the affine *matrix* (a, b, c, d, tx, ty) as the mm → pixel map of
+        *side*: x_px = a*x + c*y + tx, y_px = b*x + d*y + ty. None restores
+        the scale/origin model.
+        """
+        side = side.lower()
+        self.registration[side] = tuple(float(v) for v in matrix) if matrix else None
+        if self.log:
+            self.log.log(
+                "info",
+                f"CoordinateConverter: registration for {side} set to {self.registration[side]}",
+            )
+
+    # ------------------------------------------------------------------
+    #  Side parameters
+    # ------------------------------------------------------------------
+    def _side(self, side=None) -> str:
+        """Explicit *side*, or the global 'side' flag when None."""
+        if side is None:
+            side = self.flags.get_flag("side", "top")
+        return side.lower()
+
+    def _affine(self, side: str) -> tuple:
+        """
+        (a, b, c, d, tx, ty) of the mm → pixel map on *side*:
+        x_px = a * x_mm + c * y_mm + tx, y_px = b * x_mm + d * y_mm + ty.
+        """
+        registered = self.registration.get(side)
+        if registered is not None:
+            return registered
+        if side == "top":
+            scale = self.mm_per_pixels_top
+            ox, oy = self.origin_top
+            sx = 1.0 / scale
+            tx = -ox * sx
+        else:  # bottom side is mirrored in x
+            scale = self.mm_per_pixels_bot
+            ox, oy = self.origin_bottom
+            sx = -1.0 / scale
+            tx = self.image_width - ox * sx
+        sy = -1.0 / scale
+        ty = self.image_height - oy * sy
+        return sx, 0.0, 0.0, sy, tx, ty
+
     # ------------------------------------------------------------------
     #  PIXELS ⇄ MM  (now origin–aware + side–aware)
     # ------------------------------------------------------------------
-    def pixels_to_mm(self, x_px: float, y_px: float) -> tuple[float, float]:
+    def pixels_to_mm(self, x_px: float, y_px: float, side: str = None) -> tuple[float, float]:
         """
-        Scene-pixel  →  board-mm, honouring current side and any non-zero origin.
-        The stored origin for the active side is added so the values
+        Scene-pixel  →  board-mm, honouring the side (default: the current
+        'side' flag) and any non-zero origin.
+        The stored origin for the side is added so the values
         returned are already expressed in the user-defined coordinate system.
         """
-        side = self.flags.get_flag("side", "top").lower()
+        side = self._side(side)
+        if self.registration.get(side) is not None:
+            x_mm, y_mm = self.pixels_to_mm_array((x_px, y_px), side)[0]
+            return float(x_mm), float(y_mm)
 
         if side == "top":
             x_mm = x_px * self.mm_per_pixels_top
@@ -84,14 +143,19 @@ class CoordinateConverter:
         return x_mm + ox, y_mm + oy
 
 
-    def mm_to_pixels(self, x_mm: float, y_mm: float) -> tuple[float, float]:
+    def mm_to_pixels(self, x_mm: float, y_mm: float, side: str = None) -> tuple[float, float]:
         """
-        Board-mm  →  scene-pixel, honouring current side and origin.
+        Board-mm  →  scene-pixel, honouring the side (default: the current
+        'side' flag) and origin.
         The incoming mm coordinates are assumed to be in the *user* system,
         so we first translate them back to the internal (image-anchored) system
         by subtracting the stored origin.
         """
-        side = self.flags.get_flag("side", "top").lower()
+        side = self._side(side)
+        registered = self.registration.get(side)
+        if registered is not None:
+            a, b, c, d, tx, ty = registered
+            return a * x_mm + c * y_mm + tx, b * x_mm + d * y_mm + ty
 
         if side == "top":
             ox, oy = self.origin_top
@@ -109,3 +173,40 @@ class CoordinateConverter:
             y_px = self.image_height - (y_loc / self.mm_per_pixels_bot)
 
         return x_px, y_px
+
+    # ------------------------------------------------------------------
+    #  Batches: (N, 2) arrays in, (N, 2) float arrays out
+    # ------------------------------------------------------------------
+    def mm_to_pixels_array(self, points_mm, side: str = None) -> np.ndarray:
+        """mm_to_pixels() for every row of an (N, 2) array-like of (x, y) mm."""
+        a, b, c, d, tx, ty = self._affine(self._side(side))
+        pts = np.asarray(points_mm, dtype=float).reshape(-1, 2)
+        return pts @ np.array([[a, b], [c, d]]) + (tx, ty)
+
+    def pixels_to_mm_array(self, points_px, side: str = None) -> np.ndarray:
+        """pixels_to_mm() for every row of an (N, 2) array-like of (x, y) pixels."""
+        a, b, c, d, tx, ty = self._affine(self._side(side))
+        pts = np.asarray(points_px, dtype=float).reshape(-1, 2)
+        return (pts - (tx, ty)) @ np.linalg.inv(np.array([[a, b], [c, d]]))
+
+    # ------------------------------------------------------------------
+    #  QTransform for scene items (mm → scene pixels)
+    # ------------------------------------------------------------------
+    def mm_to_scene_transform(self, side: str = None) -> QTransform:
+        """
+        mm_to_pixels() on *side* as a QTransform, e.g. for an item whose
+        geometry is drawn in board mm. Cached per side and rebuilt only when
+        the scale, origin, image size or registration changed.
+        """
+        side = self._side(side)
+        affine = self._affine(side)
+        cached = self._transforms.get(side)
+        if cached is None or cached[0] != affine:
+            cached = (affine, QTransform(*affine))
+            self._transforms[side] = cached
+        return cached[1]
+
+    def scene_to_mm_transform(self, side: str = None) -> QTransform:
+        """Inverse of mm_to_scene_transform()."""
+        inverse, _ = self.mm_to_scene_transform(side).inverted()
+        return inverse
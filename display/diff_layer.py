@@ -0,0 +1,86 @@
+# display/diff_layer.py
+
+from typing import Dict, Optional
+
+from PyQt5.QtCore import QPointF, QRectF, Qt
+from PyQt5.QtGui import QColor, QPainterPath, QPen
+from PyQt5.QtWidgets import QGraphicsPathItem
+
+from objects.nod_diff import (
+    ADDED,
+    KINDS,
+    MOVED,
+    REMOVED,
+    RENAMED,
+    RESIGNALLED,
+    RESIZED,
+    RETESTED,
+    NodDiff,
+)
+
+DIFF_COLOURS = {
+    ADDED: QColor(0, 200, 0),
+    REMOVED: QColor(255, 0, 0),
+    MOVED: QColor(255, 140, 0),
+    RESIZED: QColor(0, 170, 255),
+    RESIGNALLED: QColor(200, 0, 255),
+    RETESTED: QColor(255, 220, 0),
+    RENAMED: QColor(255, 255, 255),
+}
+MARKER_MM = 0.6  # marker radius around a changed pad
+SIDE_CODES = {"top": ("T", "O"), "bottom": ("B", "O")}
+
+
+class DiffLayer:
+    """
+    Temporary overlay of a NodDiff: one QGraphicsPathItem per kind of
+    change, colour-coded (DIFF_COLOURS), drawn in board mm through the
+    converter's mm -> scene transform. Removed pads are marked where they
+    were, moved pads get a line from the old to the new position.
+    """
+
+    def __init__(self, scene, z_value: float = 6.0, marker_mm: float = MARKER_MM):
+        self.scene = scene
+        self.z_value = z_value
+        self.marker_mm = marker_mm
+        self.diff: Optional[NodDiff] = None
+        self._items: Dict[str, QGraphicsPathItem] = {}
+
+    def set_diff(self, diff: NodDiff, converter, side: str) -> None:
+        self.clear()
+        self.diff = diff
+        side = side.lower()
+        codes = SIDE_CODES.get(side, SIDE_CODES["top"])
+        transform = converter.mm_to_scene_transform(side)
+        r = self.marker_mm
+        for kind in KINDS:
+            path = QPainterPath()
+            for old, new in diff.changes[kind]:
+                row = old if new is None else new
+                if row[7] not in codes:
+                    continue
+                path.addEllipse(QRectF(row[4] - r, row[5] - r, 2 * r, 2 * r))
+                if kind == MOVED:
+                    path.moveTo(QPointF(old[4], old[5]))
+                    path.lineTo(QPointF(new[4], new[5]))
+            if path.isEmpty():
+                continue
+            style = Qt.DashLine if kind == REMOVED else Qt.SolidLine
+            pen = QPen(DIFF_COLOURS[kind], 2.0, style)
+            pen.setCosmetic(True)
+            item = QGraphicsPathItem(path)
+            item.setPen(pen)
+            item.setTransform(transform)
+            item.setZValue(self.z_value)
+            item.setToolTip(kind)
+            self.scene.addItem(item)
+            self._items[kind] = item
+
+    def kinds_shown(self):
+        return list(self._items)
+
+    def clear(self) -> None:
+        self.diff = None
+        for item in self._items.values():
+            self.scene.removeItem(item)
+        self._items = {}
@@ -1,24 +1,45 @@
 # display/display_library.py
 
-from typing import List
-from PyQt5.QtCore import Qt, QObject
-from PyQt5.QtGui import QColor, QPen, QBrush, QPainterPath
-from PyQt5.QtWidgets import QGraphicsObject, QGraphicsItemGroup
+from typing import Dict, List
+from PyQt5.QtCore import Qt, QObject, QPointF, QRectF, QTimer
+from PyQt5.QtGui import QColor, QPen, QBrush, QPainter, QPainterPath, QPicture, QTransform
+from PyQt5.QtWidgets import QGraphicsItem, QGraphicsObject
 from objects.board_object import BoardObject
 from logs.log_handler import LogHandler
 from constants.constants import Constants
 from utils.flag_manager import FlagManager
 from display.pad_shapes import build_pad_path  # Helper to create QPainterPath for a pad
+from display.pad_lod import LOD, PadGroupItem, view_scale
+
+
+# Dirty classes used by the render scheduler (bit flags)
+DIRTY_STYLE = 0x1  # colour only (testability) -> pen/brush mutated in place
+DIRTY_GEOMETRY = 0x2  # position / rotation / size / shape -> cached path swapped
+DIRTY_VISIBILITY = 0x4  # visible / side / technology -> items (re)created or dropped
+
+# Pens shared by every pad item (QPen is implicitly shared, so setPen() with
+# these does not allocate)
+NORMAL_PEN = QPen(Qt.black, 1.0, Qt.SolidLine)
+SELECTED_PEN = QPen(Qt.blue, 2.5, Qt.DashLine)
+LABEL_PEN = QPen(Qt.white)
 
 
 class SelectablePadItem(QGraphicsObject):
     """
     A custom QGraphicsObject that is selectable.
+
+    How much is painted depends on the pad's size on screen (see
+    display.pad_lod.LodSettings): tiny pads are left to the PadGroupItem
+    batch, small ones are a plain fill of *solid_path* (the shape without
+    its hole) and only large ones get the outline, hole and pin number.
     """
 
-    def __init__(self, path, board_object, log_handler, parent=None):
+    def __init__(self, path, board_object, log_handler, parent=None, solid_path=None):
         super().__init__(parent)
         self.path = path
+        self.solid_path = solid_path if solid_path is not None else path
+        rect = path.boundingRect()
+        self.extent = max(rect.width(), rect.height())
         self.board_object = board_object
         self.log = log_handler
 
@@ -33,20 +54,28 @@ class SelectablePadItem(QGraphicsObject):
         self.setAcceptedMouseButtons(Qt.RightButton | Qt.LeftButton | Qt.MiddleButton)
 
         # Store normal pen/brush for reference
-        self._normal_pen = QPen(Qt.black, 1.0, Qt.SolidLine)
-        self._pen = self._normal_pen
+        self._normal_pen = NORMAL_PEN
         self._brush = QBrush(Qt.NoBrush)
 
-    def setPath(self, new_path: QPainterPath):
+    def setPath(self, new_path: QPainterPath, solid_path: QPainterPath = None):
         # Let the scene know geometry is about to change.
         self.prepareGeometryChange()
         self.path = new_path
+        self.solid_path = solid_path if solid_path is not None else new_path
+        rect = new_path.boundingRect()
+        self.extent = max(rect.width(), rect.height())
         self.update()
 
     def setPen(self, pen: QPen):
-        self._pen = pen
+        self._normal_pen = pen
         self.update()
 
+    @property
+    def _pen(self) -> QPen:
+        # Selection highlight (dashed blue) is decided at paint time, so no
+        # itemChange() override: PyQt would call it for every flag change
+        return SELECTED_PEN if self.isSelected() else self._normal_pen
+
     def setBrush(self, brush: QBrush):
         self._brush = brush
         self.update()
@@ -55,22 +84,43 @@ class SelectablePadItem(QGraphicsObject):
         return self.path.boundingRect()
 
     def paint(self, painter, option, widget):
+        if not LOD.enabled:
+            painter.setPen(self._pen)
+            painter.setBrush(self._brush)
+            painter.drawPath(self.path)
+            return
+
+        extent = self.extent * view_scale(painter)
+        if extent < LOD.detail_px:
+            if extent < LOD.point_px and not self.isSelected():
+                return  # drawn in the PadGroupItem batch
+            painter.setRenderHint(QPainter.Antialiasing, False)
+            painter.setPen(SELECTED_PEN if self.isSelected() else Qt.NoPen)
+            painter.setBrush(self._brush)
+            painter.drawPath(self.solid_path)
+            return
+
         painter.setPen(self._pen)
         painter.setBrush(self._brush)
         painter.drawPath(self.path)
-
-    def itemChange(self, change, value):
-        """
-        React to item selection changes (e.g., highlight in dashed blue).
-        """
-        if change == QGraphicsObject.ItemSelectedChange:
-            is_selected = bool(value)
-            if is_selected:
-                sel_pen = QPen(Qt.blue, 2.5, Qt.DashLine)
-                self.setPen(sel_pen)
-            else:
-                self.setPen(self._normal_pen)
-        return super().itemChange(change, value)
+        if extent >= LOD.label_px and self.board_object is not None:
+            self._paint_label(painter)
+
+    def _paint_label(self, painter):
+        """Pin number centred on the pad, upright and at a fixed pixel size."""
+        rect = self.path.boundingRect()
+        side = min(rect.width(), rect.height()) * view_scale(painter)
+        centre = painter.worldTransform().map(QPointF(0.0, 0.0))
+        painter.save()
+        painter.resetTransform()
+        painter.setFont(LOD.font)
+        painter.setPen(LABEL_PEN)
+        painter.drawText(
+            QRectF(centre.x() - side / 2, centre.y() - side / 2, side, side),
+            Qt.AlignCenter,
+            str(self.board_object.pin),
+        )
+        painter.restore()
 
     def mousePressEvent(self, event):
         """
@@ -84,6 +134,29 @@ class SelectablePadItem(QGraphicsObject):
             super().mousePressEvent(event)
 
 
+class PanelCopyItem(QGraphicsItem):
+    """
+    One board copy of a panel: the master board's picture (shared by all
+    copies) drawn under the copy's transform. Not selectable; edits are made
+    on the master.
+    """
+
+    def __init__(self, picture: QPicture, parent=None):
+        super().__init__(parent)
+        self._picture = picture
+
+    def set_picture(self, picture: QPicture) -> None:
+        self.prepareGeometryChange()
+        self._picture = picture
+        self.update()
+
+    def boundingRect(self):
+        return QRectF(self._picture.boundingRect())
+
+    def paint(self, painter, option, widget):
+        self._picture.play(painter)
+
+
 class DisplayLibrary(QObject):
     """
     Manages the rendering of BoardObjects in the scene, with partial updates.
@@ -100,12 +173,37 @@ class DisplayLibrary(QObject):
         self.log = LogHandler(output="both")
 
         self.z_value_pads = self.constants.get("z_value_pads", 1)
-        self.group = QGraphicsItemGroup()
+        # Keep references to displayed QGraphicsObject items by channel
+        self.displayed_objects = {}
+
+        # Pad group: also draws the pads that are too small on screen to be
+        # painted one by one
+        LOD.configure(self.constants)
+        self.group = PadGroupItem(self.displayed_objects)
         self.group.setZValue(self.z_value_pads)
         self.scene.addItem(self.group)
 
-        # Keep references to displayed QGraphicsObject items by channel
-        self.displayed_objects = {}
+        # Optional SelectionModel (set by BoardView); re-created items pick
+        # their highlight from it
+        self.selection_model = None
+
+        # Panel copies: one PanelCopyItem per copy, all playing one picture
+        self._panel_items: List[PanelCopyItem] = []
+        self._panel_drawn = None  # the panel the copies show
+
+        # ---- render scheduler ----------------------------------------------
+        # Partial updates are collected here and applied once per event-loop
+        # tick by _flush_timer (zero-delay, single-shot).
+        self._pending: Dict[int, BoardObject] = {}  # channel -> latest object
+        self._pending_removed = set()
+        # channel -> (visibility_key, geometry_key, style_key) last rendered
+        self._render_keys: Dict[int, tuple] = {}
+        self._path_cache: Dict[tuple, QPainterPath] = {}
+        self._brush_cache: Dict[str, QBrush] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self.flush_pending)
 
         # Optionally connect single-object signals if you still want those
         if hasattr(self.object_library, "object_added"):
@@ -115,7 +213,9 @@ class DisplayLibrary(QObject):
         if hasattr(self.object_library, "object_updated"):
             self.object_library.object_updated.connect(self.on_object_updated)
 
-        FlagManager().set_flag("side", self.current_side)
+        # The converter carries the board's flags (the global ones by default)
+        flags = getattr(converter, "flags", None) or FlagManager()
+        flags.set_flag("side", self.current_side)
 
         self.log.log(
             "info",
@@ -134,6 +234,8 @@ class DisplayLibrary(QObject):
         """
         Renders every object from the ObjectLibrary once, e.g. on program start or file load.
         """
+        # A full render supersedes anything still queued
+        self._drop_pending()
         all_objects = self.object_library.get_all_objects()
         self.log.log(
             "info",
@@ -141,10 +243,17 @@ class DisplayLibrary(QObject):
             module="DisplayLibrary",
             func="render_initial_objects",
         )
+        # Scene positions of every pad in one batched conversion
+        positions = self.converter.mm_to_pixels_array(
+            [(obj.x_coord_mm, obj.y_coord_mm) for obj in all_objects],
+            self.current_side,
+        ).tolist()
         rendered_count = 0
-        for obj in all_objects:
-            if self.render_object(obj):
+        for obj, pos in zip(all_objects, positions):
+            if self.render_object(obj, pos):
                 rendered_count += 1
+        self.group.rebuild()
+        self.refresh_panel()
         self.log.log(
             "info",
             f"Rendered {rendered_count} object(s) for side '{self.current_side}'. "
@@ -168,13 +277,7 @@ class DisplayLibrary(QObject):
             module="DisplayLibrary",
             func="on_object_added",
         )
-        self.render_object(board_obj)
-        self.log.log(
-            "info",
-            f"Display now has {len(self.displayed_objects)} objects after addition.",
-            module="DisplayLibrary",
-            func="on_object_added",
-        )
+        self.add_rendered_objects([board_obj])
 
     def on_object_removed(self, board_obj: BoardObject):
         """
@@ -187,18 +290,12 @@ class DisplayLibrary(QObject):
             module="DisplayLibrary",
             func="on_object_removed",
         )
-        self.remove_rendered_object(board_obj.channel)
-        self.log.log(
-            "info",
-            f"Display now has {len(self.displayed_objects)} objects after removal.",
-            module="DisplayLibrary",
-            func="on_object_removed",
-        )
+        self.remove_rendered_objects([board_obj.channel])
 
     def on_object_updated(self, board_obj: BoardObject):
         """
         Called automatically if object_library emits 'object_updated' for a single BoardObject.
-        Removes and re-renders that object.
+        Schedules an in-place refresh of that object.
         """
         self.log.log(
             "info",
@@ -206,24 +303,18 @@ class DisplayLibrary(QObject):
             module="DisplayLibrary",
             func="on_object_updated",
         )
-        self.remove_rendered_object(board_obj.channel)
-        self.render_object(board_obj)
-        self.log.log(
-            "info",
-            f"Display now has {len(self.displayed_objects)} objects after update.",
-            module="DisplayLibrary",
-            func="on_object_updated",
-        )
+        self.update_rendered_objects_for_updates([board_obj])
 
     # --------------------------------------------------------------------------
     #  RENDERING SINGLE OBJECT
     # --------------------------------------------------------------------------
-    def render_object(self, board_obj: BoardObject) -> bool:
+    def render_object(self, board_obj: BoardObject, pos=None) -> bool:
         """
         Creates and displays a QGraphicsItem for the BoardObject if:
           - board_obj.visible == True
           - board_obj.test_position matches or is 'both' for the current side
           - for through-hole objects, also create a "secondary" pad on the opposite side
+        *pos* is the pad's scene position when already converted by the caller.
         Returns True if something was created, False otherwise.
         """
         # Skip if not visible
@@ -243,15 +334,15 @@ class DisplayLibrary(QObject):
 
         # 1) Primary pad
         if tp in (current, "both"):
-            code = self.testability_to_code(board_obj.testability)
-            color = self.get_pad_color(code)
-            pen = QPen(Qt.black, 1.0, Qt.SolidLine)
-            brush = QBrush(color)
-            primary_item = self.create_pad_item(board_obj, pen, brush)
+            brush = self._brush_for(board_obj.testability)
+            primary_item = self.create_pad_item(board_obj, NORMAL_PEN, brush, pos)
             if primary_item:
                 self.scene.addItem(primary_item)
                 self.displayed_objects[board_obj.channel] = primary_item
                 created_anything = True
+                selection = self.selection_model
+                if selection is not None and board_obj.channel in selection:
+                    self._set_items_selected([primary_item], True)
             else:
                 self.log.log(
                     "warning",
@@ -262,9 +353,8 @@ class DisplayLibrary(QObject):
 
         # 2) Secondary pad for through-hole if on opposite side
         if tech == "through hole" and tp not in (current, "both"):
-            s_pen = QPen(Qt.black, 1.0, Qt.SolidLine)
             s_brush = QBrush(QColor(0, 255, 0))  # green or any color for secondary
-            secondary_item = self.create_pad_item(board_obj, s_pen, s_brush)
+            secondary_item = self.create_pad_item(board_obj, NORMAL_PEN, s_brush, pos)
             if secondary_item:
                 # Non-selectable
                 secondary_item.setFlag(QGraphicsObject.ItemIsSelectable, False)
@@ -273,10 +363,12 @@ class DisplayLibrary(QObject):
                 self.displayed_objects[key] = secondary_item
                 created_anything = True
 
+        if created_anything:
+            self._render_keys[board_obj.channel] = self._keys_for(board_obj)
         return created_anything
 
     def create_pad_item(
-        self, pad: BoardObject, pen: QPen, brush: QBrush
+        self, pad: BoardObject, pen: QPen, brush: QBrush, pos=None
     ) -> QGraphicsObject:
         """
         Builds the QPainterPath for the pad, then creates a SelectablePadItem,
@@ -288,31 +380,55 @@ class DisplayLibrary(QObject):
         if not path:
             return None
 
-        x_scene, y_scene = self.converter.mm_to_pixels(pad.x_coord_mm, pad.y_coord_mm)
-        item = SelectablePadItem(path, pad, self.log)
+        solid = self._build_pad_path(pad.width_mm, pad.height_mm, 0.0, pad.shape_type)
+        item = SelectablePadItem(path, pad, self.log, solid_path=solid)
         item.setPen(pen)
         item.setBrush(brush)
-        item.setPos(x_scene, y_scene)
+        self._place_item(item, pad, pos)
+        item.setZValue(self.z_value_pads)
+        return item
+
+    def _place_item(self, item, pad: BoardObject, pos=None) -> None:
+        """Position and rotate *item* for *pad* on the current side."""
+        if pos is None:
+            pos = self.converter.mm_to_pixels(
+                pad.x_coord_mm, pad.y_coord_mm, self.current_side
+            )
+        item.setPos(*pos)
 
         angle = pad.angle_deg
         if self.current_side == "bottom":
             angle = (180 - angle) % 360
         # Rotate counter-clockwise for positive angles
         item.setRotation(-angle)
-        item.setZValue(self.z_value_pads)
-        return item
 
     def _build_pad_path(self, width_mm, height_mm, hole_mm, shape_type):
         """
         Creates a QPainterPath for the pad using your 'build_pad_path' helper,
         passing the correct mm-per-pixel factor depending on top/bottom side.
+        Paths are cached per (size, shape, scale): QPainterPath is implicitly
+        shared, so identical pads reuse the same path data.
         """
         if self.current_side == "top":
             mm_per_pixel = self.converter.mm_per_pixels_top
         else:
             mm_per_pixel = self.converter.mm_per_pixels_bot
 
-        return build_pad_path(width_mm, height_mm, hole_mm, shape_type, mm_per_pixel)
+        key = (width_mm, height_mm, hole_mm, shape_type, mm_per_pixel)
+        path = self._path_cache.get(key)
+        if path is None:
+            path = build_pad_path(width_mm, height_mm, hole_mm, shape_type, mm_per_pixel)
+            self._path_cache[key] = path
+        return path
+
+    def _brush_for(self, testability: str) -> QBrush:
+        """Shared brush for a testability value."""
+        code = self.testability_to_code(testability)
+        brush = self._brush_cache.get(code)
+        if brush is None:
+            brush = QBrush(self.get_pad_color(code))
+            self._brush_cache[code] = brush
+        return brush
 
     # --------------------------------------------------------------------------
     #  REMOVING / CLEARING
@@ -321,25 +437,38 @@ class DisplayLibrary(QObject):
         """
         Removes the QGraphicsItem for 'channel' and the associated secondary key, if any.
         """
-        item = self.displayed_objects.pop(channel, None)
-        if item:
-            self.group.removeFromGroup(item)
-            self.scene.removeItem(item)
-
-        secondary_key = f"{channel}_secondary"
-        secondary_item = self.displayed_objects.pop(secondary_key, None)
-        if secondary_item:
-            self.group.removeFromGroup(secondary_item)
-            self.scene.removeItem(secondary_item)
+        self._render_keys.pop(channel, None)
+        items = [
+            self.displayed_objects.pop(key, None)
+            for key in (channel, f"{channel}_secondary")
+        ]
+        self._remove_items([item for item in items if item])
+
+    def _remove_items(self, items) -> None:
+        """
+        Take pad items out of the scene. A selected item leaving is not a
+        selection change (the SelectionModel keeps its channel), so the
+        scene's selectionChanged is not emitted for it.
+        """
+        if not items:
+            return
+        blocked = self.scene.blockSignals(True)
+        try:
+            for item in items:
+                self.group.removeFromGroup(item)
+                self.scene.removeItem(item)
+        finally:
+            self.scene.blockSignals(blocked)
 
     def clear_all_rendered_objects(self):
         """
         Removes every item from the scene and clears 'displayed_objects'.
         """
-        for itm in list(self.displayed_objects.values()):
-            self.group.removeFromGroup(itm)
-            self.scene.removeItem(itm)
+        self._drop_pending()
+        self._remove_items(list(self.displayed_objects.values()))
         self.displayed_objects.clear()
+        self._render_keys.clear()
+        self.group.rebuild()
         self.log.log(
             "info",
             "All rendered objects cleared.",
@@ -349,31 +478,233 @@ class DisplayLibrary(QObject):
 
     # --------------------------------------------------------------------------
     #  PARTIAL UPDATE METHODS (for bulk operations)
+    #  All three calls only mark channels dirty; the scene is touched once per
+    #  event-loop tick in flush_pending(). Call flush_pending() directly when
+    #  the items are needed immediately (e.g. to select freshly added pads).
     # --------------------------------------------------------------------------
     def add_rendered_objects(self, board_objects: List[BoardObject]) -> None:
         """
         Renders each BoardObject without clearing others. (Bulk-add partial update)
         """
         for obj in board_objects:
-            if obj.visible:
-                self.render_object(obj)
+            self._pending[obj.channel] = obj
+        self._schedule_flush()
 
     def remove_rendered_objects(self, channels: List[int]) -> None:
         """
         Removes each channel from the scene. (Bulk-delete partial update)
         """
         for ch in channels:
-            self.remove_rendered_object(ch)
+            self._pending.pop(ch, None)
+            self._pending_removed.add(ch)
+        self._schedule_flush()
 
     def update_rendered_objects_for_updates(self, updates: List[BoardObject]):
         """Refresh just the changed pads without a full scene redraw."""
         for obj in updates:
-            # remove any existing graphics for this channel (primary or secondary)
-            self.remove_rendered_object(obj.channel)
+            self._pending[obj.channel] = obj
+        self._schedule_flush()
 
-            # if still visible after the edit, re-render it using current logic
-            if obj.visible:
-                self.render_object(obj)
+    def has_pending_updates(self) -> bool:
+        return bool(self._pending or self._pending_removed)
+
+    def flush_pending(self) -> None:
+        """
+        Apply every queued add/update/remove in one pass:
+          - removed channels drop their items,
+          - style-only changes swap the brush of the existing item,
+          - geometry changes swap in a cached path and re-position the item,
+          - visibility changes (visible/side/technology) rebuild the item.
+        """
+        self._flush_timer.stop()
+        if not self.has_pending_updates():
+            return
+
+        removed = self._pending_removed
+        pending = self._pending
+        self._pending_removed = set()
+        self._pending = {}
+
+        for ch in removed:
+            self.remove_rendered_object(ch)
+
+        counts = {"style": 0, "geometry": 0, "visibility": 0}
+        for ch, obj in pending.items():
+            dirty = self.classify_change(obj)
+            if dirty & DIRTY_VISIBILITY:
+                self.remove_rendered_object(ch)
+                if obj.visible:
+                    self.render_object(obj)
+                counts["visibility"] += 1
+                continue
+
+            items = self._items_for(ch)
+            for item in items:
+                item.board_object = obj
+            if dirty & DIRTY_GEOMETRY:
+                path = self._build_pad_path(
+                    obj.width_mm, obj.height_mm, obj.hole_mm, obj.shape_type
+                )
+                solid = self._build_pad_path(obj.width_mm, obj.height_mm, 0.0, obj.shape_type)
+                for item in items:
+                    item.setPath(path, solid)
+                    self._place_item(item, obj)
+                counts["geometry"] += 1
+            if dirty & DIRTY_STYLE:
+                primary = self.displayed_objects.get(ch)
+                if primary is not None:
+                    primary.setBrush(self._brush_for(obj.testability))
+                counts["style"] += 1
+            self._render_keys[ch] = self._keys_for(obj)
+
+        changed = removed | pending.keys()
+        self.group.refresh(
+            [key for ch in changed for key in (ch, f"{ch}_secondary")]
+        )
+        # The copies replay the master pads only: other edits leave them as they are
+        panel = getattr(self.object_library, "panel", None)
+        if panel is not self._panel_drawn or (
+            panel is not None and not changed.isdisjoint(panel.master_channels)
+        ):
+            self.refresh_panel()
+        self.log.log(
+            "debug",
+            f"Render flush: removed={len(removed)}, updated={len(pending)} "
+            f"(style={counts['style']}, geometry={counts['geometry']}, "
+            f"visibility={counts['visibility']}).",
+            module="DisplayLibrary",
+            func="flush_pending",
+        )
+
+    def classify_change(self, obj: BoardObject) -> int:
+        """
+        Compare *obj* with what is currently rendered for its channel and
+        return a DIRTY_* bit mask. Unrendered channels count as visibility.
+        """
+        old = self._render_keys.get(obj.channel)
+        if old is None:
+            return DIRTY_VISIBILITY
+        new = self._keys_for(obj)
+        dirty = 0
+        if old[0] != new[0]:
+            dirty |= DIRTY_VISIBILITY
+        if old[1] != new[1]:
+            dirty |= DIRTY_GEOMETRY
+        if old[2] != new[2]:
+            dirty |= DIRTY_STYLE
+        return dirty
+
+    @staticmethod
+    def _keys_for(obj: BoardObject) -> tuple:
+        visibility = (
+            obj.visible,
+            obj.test_position.lower(),
+            obj.technology.lower(),
+        )
+        geometry = (
+            obj.x_coord_mm,
+            obj.y_coord_mm,
+            obj.angle_deg,
+            obj.width_mm,
+            obj.height_mm,
+            obj.hole_mm,
+            obj.shape_type,
+        )
+        return visibility, geometry, obj.testability
+
+    def _items_for(self, channel: int) -> list:
+        items = []
+        for key in (channel, f"{channel}_secondary"):
+            item = self.displayed_objects.get(key)
+            if item is not None:
+                items.append(item)
+        return items
+
+    def _schedule_flush(self) -> None:
+        if self.has_pending_updates() and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _drop_pending(self) -> None:
+        self._flush_timer.stop()
+        self._pending.clear()
+        self._pending_removed.clear()
+
+    # --------------------------------------------------------------------------
+    #  PANEL COPIES (instanced drawing)
+    # --------------------------------------------------------------------------
+    def refresh_panel(self) -> None:
+        """
+        Redraw the copies of ``object_library.panel``: the displayed master
+        pads are recorded once into a QPicture, and each copy is a single
+        item replaying it under its step transform, so the scene holds one
+        item per copy instead of one per copied pad.
+        """
+        panel = self._panel_drawn = getattr(self.object_library, "panel", None)
+        if panel is None or not panel.steps:
+            for item in self._panel_items:
+                self.scene.removeItem(item)
+            self._panel_items = []
+            return
+
+        picture = QPicture()
+        painter = QPainter(picture)
+        for ch in panel.master_channels:
+            for item in self._items_for(ch):
+                painter.setTransform(item.sceneTransform())
+                painter.setPen(NORMAL_PEN)
+                painter.setBrush(item._brush)
+                painter.drawPath(item.path)
+        painter.end()
+
+        while len(self._panel_items) > len(panel.steps):
+            self.scene.removeItem(self._panel_items.pop())
+        while len(self._panel_items) < len(panel.steps):
+            item = PanelCopyItem(picture)
+            item.setZValue(self.z_value_pads)
+            self.scene.addItem(item)
+            self._panel_items.append(item)
+
+        to_scene = self.converter.mm_to_scene_transform(self.current_side)
+        from_scene = self.converter.scene_to_mm_transform(self.current_side)
+        for copy_index, item in enumerate(self._panel_items, start=1):
+            step = QTransform(*panel.step_matrix(copy_index))
+            item.set_picture(picture)
+            item.setTransform(from_scene * step * to_scene)
+
+    # --------------------------------------------------------------------------
+    #  LEVEL OF DETAIL
+    # --------------------------------------------------------------------------
+    def set_view_scale(self, scale: float) -> None:
+        """
+        The board view's device pixels per scene unit: pads too small to be
+        drawn one by one at this scale are left to the pad group's batch.
+        """
+        self.group.set_view_scale(scale)
+
+    # --------------------------------------------------------------------------
+    #  SELECTION HIGHLIGHT (driven by the SelectionModel)
+    # --------------------------------------------------------------------------
+    def apply_selection(self, added, removed) -> None:
+        """
+        Mirror a SelectionModel change onto the pad items in one batch.
+        Only the items of the changed channels are touched, and the scene's
+        selectionChanged is not re-emitted for each of them.
+        """
+        displayed = self.displayed_objects
+        self._set_items_selected(
+            [displayed[ch] for ch in removed if ch in displayed], False
+        )
+        self._set_items_selected([displayed[ch] for ch in added if ch in displayed], True)
+
+    def _set_items_selected(self, items, selected: bool) -> None:
+        if not items:
+            return
+        blocked = self.scene.blockSignals(True)
+        try:
+            for item in items:
+                item.setSelected(selected)
+        finally:
+            self.scene.blockSignals(blocked)
 
     # --------------------------------------------------------------------------
     #  SIDE-SWITCHING
@@ -0,0 +1,191 @@
+# display/pad_lod.py
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Set, Tuple
+
+from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QBrush, QColor, QFont, QPainter, QPainterPath
+from PyQt5.QtWidgets import QGraphicsItem, QGraphicsItemGroup, QStyleOptionGraphicsItem
+
+
+class LodSettings:
+    """
+    On-screen size thresholds (device pixels, largest pad side) that decide
+    how much of a pad is drawn:
+
+      extent < point_px   -> not drawn by the pad; PadGroupItem fills its
+                             box in one batch per colour
+      extent < detail_px  -> filled outer shape only (no outline, no hole,
+                             no antialiasing)
+      extent >= detail_px -> full path with outline and hole
+      extent >= label_px  -> plus the pin number in ``font``
+                             (pins_font_size pixels)
+    """
+
+    def __init__(self):
+        self.enabled = True
+        self.point_px = 4.0
+        self.detail_px = 12.0
+        self.label_px = 40.0
+        self.font = QFont()
+        self.font.setPixelSize(14)
+
+    def configure(self, constants) -> None:
+        self.enabled = bool(constants.get("lod_enabled", True))
+        self.point_px = float(constants.get("lod_point_px", 4.0))
+        self.detail_px = float(constants.get("lod_detail_px", 12.0))
+        self.label_px = float(constants.get("lod_label_px", 40.0))
+        self.set_font_size(constants.get("pins_font_size", 14))
+
+    def set_font_size(self, size) -> None:
+        self.font.setPixelSize(max(1, int(size)))
+
+
+# Shared by every pad item and the pad group
+LOD = LodSettings()
+
+
+def view_scale(painter: QPainter) -> float:
+    """Device pixels per scene unit of the painter's current transform."""
+    return QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+
+
+class PadGroupItem(QGraphicsItemGroup):
+    """
+    Coarse pad layer. Pads smaller than ``LOD.point_px`` on screen are not
+    painted one by one; this item fills their scene boxes instead, with one
+    drawRects() call per pad colour.
+
+    The board view reports its scale through set_view_scale(): the pads
+    below the threshold at that scale get ``ItemHasNoContents`` so Qt does
+    not even call their paint() (they stay selectable and clickable, and
+    this item outlines the selected ones).
+    Entries are kept sorted by size, so a zoom step only touches the pads
+    whose size crosses the threshold. DisplayLibrary reports changed items
+    through refresh(). The item has no shape, so it never takes clicks or
+    itemAt() hits.
+    """
+
+    def __init__(self, displayed_objects: Dict, parent=None):
+        super().__init__(parent)
+        self._displayed = displayed_objects
+        # display key -> (rgba, extent, scene box)
+        self._entries: Dict[object, Tuple[int, float, QRectF]] = {}
+        self._bounds = QRectF()
+        self._min_extent = float("inf")
+        # rgba -> (extents ascending, scene boxes in the same order); None = stale
+        self._batches = None
+        # (extents ascending, keys in the same order); None = stale
+        self._sorted = None
+        # Scene extent below which pads leave their drawing to this item at
+        # the board view's scale (0 = every pad paints itself)
+        self._limit = 0.0
+        self._coarse: Set = set()  # keys currently flagged ItemHasNoContents
+
+    def rebuild(self) -> None:
+        """Re-read every displayed item (after a full render)."""
+        self.prepareGeometryChange()
+        self._entries.clear()
+        self._coarse.clear()
+        self._bounds = QRectF()
+        self._min_extent = float("inf")
+        self.refresh(list(self._displayed))
+
+    def refresh(self, keys: Iterable) -> None:
+        """Re-read the displayed items under *keys* (gone items are dropped)."""
+        bounds = self._bounds
+        for key in keys:
+            item = self._displayed.get(key)
+            if item is None or not item.isVisible():
+                self._entries.pop(key, None)
+                self._coarse.discard(key)
+                continue
+            extent = item.extent
+            rect = item.sceneBoundingRect()
+            self._entries[key] = (item._brush.color().rgba(), extent, rect)
+            bounds = bounds.united(rect)
+            self._min_extent = min(self._min_extent, extent)
+            self._set_coarse(key, item, extent < self._limit)
+        if bounds != self._bounds:
+            self.prepareGeometryChange()
+            self._bounds = bounds
+        self._batches = None
+        self._sorted = None
+        self.update()
+
+    def _set_coarse(self, key, item, coarse: bool) -> None:
+        if coarse == (key in self._coarse):
+            return
+        item.setFlag(QGraphicsItem.ItemHasNoContents, coarse)
+        if coarse:
+            self._coarse.add(key)
+        else:
+            self._coarse.discard(key)
+
+    def set_view_scale(self, scale: float) -> None:
+        """
+        Device pixels per scene unit of the board view. Only the pads whose
+        size lies between the old and the new threshold are touched.
+        """
+        limit = LOD.point_px / scale if LOD.enabled and scale > 0 else 0.0
+        if limit == self._limit:
+            return
+        if self._sorted is None:
+            order = sorted(self._entries.items(), key=lambda kv: kv[1][1])
+            self._sorted = ([e for _, (_, e, _) in order], [k for k, _ in order])
+        extents, keys = self._sorted
+        lo = bisect_left(extents, min(limit, self._limit))
+        hi = bisect_left(extents, max(limit, self._limit))
+        self._limit = limit
+        for i in range(lo, hi):
+            item = self._displayed.get(keys[i])
+            if item is not None:
+                self._set_coarse(keys[i], item, extents[i] < limit)
+
+    def _sort_batches(self) -> None:
+        groups: Dict[int, List[Tuple[float, QRectF]]] = {}
+        for rgba, extent, rect in self._entries.values():
+            groups.setdefault(rgba, []).append((extent, rect))
+        self._batches = {}
+        for rgba, entries in groups.items():
+            entries.sort(key=lambda e: e[0])
+            self._batches[rgba] = ([e for e, _ in entries], [r for _, r in entries])
+
+    def boundingRect(self):
+        return self._bounds
+
+    def shape(self):
+        return QPainterPath()
+
+    def paint(self, painter, option, widget):
+        if not LOD.enabled:
+            return
+        scale = view_scale(painter)
+        if scale <= 0:
+            return
+        # Pads below the painter's threshold skip their paint(); those
+        # flagged for the board view's scale are not painted at all
+        limit = max(LOD.point_px / scale, self._limit)
+        if limit <= self._min_extent:
+            return  # every pad draws itself at this zoom
+        if self._batches is None:
+            self._sort_batches()
+        painter.setPen(Qt.NoPen)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        for rgba, (extents, rects) in self._batches.items():
+            count = bisect_left(extents, limit)
+            if count:
+                painter.setBrush(QBrush(QColor.fromRgba(rgba)))
+                painter.drawRects(rects[:count])
+
+        # Selected pads that Qt does not paint still need their highlight
+        if self._coarse:
+            scene = self.scene()
+            for item in scene.selectedItems() if scene is not None else ():
+                if item.flags() & QGraphicsItem.ItemHasNoContents and hasattr(item, "solid_path"):
+                    painter.save()
+                    painter.setTransform(item.sceneTransform(), True)
+                    painter.setPen(item._pen)
+                    painter.setBrush(item._brush)
+                    painter.drawPath(item.solid_path)
+                    painter.restore()
@@ -0,0 +1,68 @@
+# display/proposal_layer.py
+
+from typing import List, Optional
+
+from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtGui import QColor, QPainterPath, QPen
+from PyQt5.QtWidgets import QGraphicsPathItem
+
+from logs.log_handler import LogHandler
+from objects.board_object import BoardObject
+
+PROPOSAL_PEN = QPen(QColor(0, 255, 255), 2.0, Qt.DashLine)
+PROPOSAL_PEN.setCosmetic(True)
+
+
+class ProposalLayer:
+    """
+    Ghost of pads that are proposed but not yet in the ObjectLibrary (e.g.
+    the missing pads of an inferred grid): one QGraphicsPathItem in board
+    mm, mapped through the converter's mm -> scene transform. accept()
+    adds them in one undoable bulk_add().
+    """
+
+    def __init__(self, scene, z_value: float = 5.0):
+        self.scene = scene
+        self.z_value = z_value
+        self.log = LogHandler()
+        self.objects: List[BoardObject] = []
+        self._item: Optional[QGraphicsPathItem] = None
+
+    def set_objects(self, objects: List[BoardObject], converter, side: str) -> None:
+        self.clear()
+        self.objects = list(objects)
+        if not self.objects:
+            return
+        path = QPainterPath()
+        for obj in self.objects:
+            w, h = obj.width_mm, obj.height_mm
+            rect = QRectF(obj.x_coord_mm - w / 2, obj.y_coord_mm - h / 2, w, h)
+            if obj.shape_type in ("Round", "Ellipse"):
+                path.addEllipse(rect)
+            else:
+                path.addRect(rect)
+        self._item = QGraphicsPathItem(path)
+        self._item.setPen(PROPOSAL_PEN)
+        self._item.setTransform(converter.mm_to_scene_transform(side.lower()))
+        self._item.setZValue(self.z_value)
+        self.scene.addItem(self._item)
+
+    def clear(self) -> None:
+        self.objects = []
+        if self._item is not None:
+            self.scene.removeItem(self._item)
+            self._item = None
+
+    def accept(self, object_library) -> int:
+        """Add the proposed pads in one undo step; the ghost is cleared."""
+        objects = self.objects
+        if objects:
+            object_library.bulk_add(objects)
+            self.log.log(
+                "info",
+                f"Accepted {len(objects)} proposed pads.",
+                module="ProposalLayer",
+                func="accept",
+            )
+        self.clear()
+        return len(objects)
@@ -0,0 +1,211 @@
+# display/registration.py
+
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from objects.board_object import BoardObject
+
+Affine = Tuple[float, float, float, float, float, float]  # a, b, c, d, tx, ty
+
+
+def fit_affine(src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """
+    Least-squares affine (a, b, c, d, tx, ty) mapping (N, 2) *src* onto
+    *dst*: x' = a*x + c*y + tx, y' = b*x + d*y + ty. Needs N >= 3 points
+    that are not collinear.
+    """
+    design = np.column_stack((src, np.ones(len(src))))
+    params, *_ = np.linalg.lstsq(design, dst, rcond=None)
+    (a, b), (c, d), (tx, ty) = params
+    return np.array([a, b, c, d, tx, ty])
+
+
+def apply_affine(matrix, points: np.ndarray) -> np.ndarray:
+    a, b, c, d, tx, ty = matrix
+    return points @ np.array([[a, b], [c, d]]) + (tx, ty)
+
+
+def _batch_affines(src: np.ndarray, dst: np.ndarray, samples: np.ndarray):
+    """
+    Exact affines through the point triples in *samples* (K, 3), solved as
+    one batched 3x3 system. Returns (K, 6) params and a mask of the
+    non-degenerate triples.
+    """
+    design = np.concatenate((src[samples], np.ones(samples.shape + (1,))), axis=2)
+    det = np.linalg.det(design)
+    ok = np.abs(det) > 1e-9
+    params = np.zeros((len(samples), 3, 2))
+    params[ok] = np.linalg.solve(design[ok], dst[samples[ok]])
+    # Rows of each (3, 2) solution are (a, b), (c, d), (tx, ty)
+    return params.reshape(-1, 6), ok
+
+
+class RegistrationResult:
+    """Outcome of register_points(): the fitted affine and per-point residuals."""
+
+    def __init__(self, matrix, residuals: np.ndarray, inliers: np.ndarray, keys: List):
+        self.matrix: Affine = tuple(float(v) for v in matrix)
+        self.residuals = residuals  # pixels, for every correspondence
+        self.inliers = inliers  # bool mask
+        self.keys = keys  # caller's id per correspondence (e.g. channel)
+
+    @property
+    def rms(self) -> float:
+        r = self.residuals[self.inliers]
+        return float(np.sqrt(np.mean(r * r))) if len(r) else float("nan")
+
+    @property
+    def scale(self) -> float:
+        """Mean pixels per mm of the fitted map."""
+        a, b, c, d, _, _ = self.matrix
+        return math.sqrt(abs(a * d - b * c))
+
+    @property
+    def rotation_deg(self) -> float:
+        a, b, _, _, _, _ = self.matrix
+        return math.degrees(math.atan2(b, a))
+
+    @property
+    def mirrored(self) -> bool:
+        """
+        True for a board seen from below. Image y points down, so the top
+        side map flips orientation (negative determinant) and a mirrored
+        side keeps it.
+        """
+        a, b, c, d, _, _ = self.matrix
+        return a * d - b * c > 0
+
+    def residuals_by_key(self) -> Dict:
+        return dict(zip(self.keys, self.residuals.tolist()))
+
+    def summary(self, worst: int = 10) -> str:
+        lines = [
+            f"Correspondences: {len(self.keys)}, inliers: {int(self.inliers.sum())}",
+            f"RMS residual (inliers): {self.rms:.2f} px",
+            f"Scale: {1.0 / self.scale:.6g} mm/px, rotation: {self.rotation_deg:.3f}°, "
+            f"mirrored: {'yes' if self.mirrored else 'no'}",
+        ]
+        order = np.argsort(self.residuals)[::-1][:worst]
+        if len(order):
+            lines.append("Largest residuals:")
+            for i in order:
+                flag = "" if self.inliers[i] else "  (outlier)"
+                lines.append(f"  {self.keys[i]}: {self.residuals[i]:.2f} px{flag}")
+        return "\n".join(lines)
+
+
+def register_points(
+    src: np.ndarray,
+    dst: np.ndarray,
+    keys: Optional[List] = None,
+    threshold: float = 3.0,
+    iterations: int = 500,
+    seed: Optional[int] = 0,
+) -> Optional[RegistrationResult]:
+    """
+    Robust affine from *src* to *dst* ((N, 2) arrays): RANSAC over random
+    point triples (all hypotheses solved and scored as arrays), then a
+    least-squares refit on the inliers of the best hypothesis. Points whose
+    residual exceeds *threshold* are outliers. Returns None with fewer than
+    three usable points.
+    """
+    src = np.asarray(src, dtype=float).reshape(-1, 2)
+    dst = np.asarray(dst, dtype=float).reshape(-1, 2)
+    n = len(src)
+    keys = list(range(n)) if keys is None else list(keys)
+    if n < 3:
+        return None
+
+    rng = np.random.default_rng(seed)
+    # Triples with a repeated point are degenerate and dropped by the solver
+    samples = rng.integers(0, n, size=(iterations, 3))
+    hypotheses, ok = _batch_affines(src, dst, samples)
+    if not ok.any():
+        return None
+    hypotheses = hypotheses[ok]
+
+    # Score every hypothesis at once: (K, N) residuals, chunked to bound memory
+    best, best_count = None, -1
+    chunk = max(1, 4_000_000 // max(n, 1))
+    for start in range(0, len(hypotheses), chunk):
+        h = hypotheses[start : start + chunk]
+        px = src[:, 0] * h[:, :1] + src[:, 1] * h[:, 2:3] + h[:, 4:5]
+        py = src[:, 0] * h[:, 1:2] + src[:, 1] * h[:, 3:4] + h[:, 5:6]
+        counts = ((px - dst[:, 0]) ** 2 + (py - dst[:, 1]) ** 2 <= threshold**2).sum(axis=1)
+        i = int(np.argmax(counts))
+        if counts[i] > best_count:
+            best, best_count = h[i], int(counts[i])
+
+    matrix = best
+    inliers = np.zeros(n, dtype=bool)
+    for _ in range(3):  # refit until the inlier set settles
+        residuals = np.linalg.norm(apply_affine(matrix, src) - dst, axis=1)
+        new_inliers = residuals <= threshold
+        if new_inliers.sum() < 3 or np.array_equal(new_inliers, inliers):
+            break
+        inliers = new_inliers
+        matrix = fit_affine(src[inliers], dst[inliers])
+    residuals = np.linalg.norm(apply_affine(matrix, src) - dst, axis=1)
+    return RegistrationResult(matrix, residuals, residuals <= threshold, keys)
+
+
+def match_to_candidates(
+    predicted: np.ndarray, observed: np.ndarray, max_dist: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest *observed* point for each *predicted* point, within *max_dist*.
+    Returns (indices into predicted, indices into observed).
+    """
+    predicted = np.asarray(predicted, dtype=float).reshape(-1, 2)
+    observed = np.asarray(observed, dtype=float).reshape(-1, 2)
+    if not len(predicted) or not len(observed):
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+    nearest = np.empty(len(predicted), dtype=int)
+    dist = np.empty(len(predicted))
+    step = max(1, 2_000_000 // len(observed))
+    for start in range(0, len(predicted), step):
+        block = predicted[start : start + step]
+        d2 = ((block[:, None, :] - observed[None, :, :]) ** 2).sum(axis=2)
+        nearest[start : start + step] = np.argmin(d2, axis=1)
+        dist[start : start + step] = np.sqrt(d2.min(axis=1))
+    keep = np.nonzero(dist <= max_dist)[0]
+    return keep, nearest[keep]
+
+
+def through_hole_points(objects: Iterable[BoardObject]) -> Tuple[List[int], np.ndarray]:
+    """Channels and (N, 2) mm positions of the visible through-hole pads."""
+    pads = [
+        o
+        for o in objects
+        if o.technology.lower() == "through hole" and getattr(o, "visible", True)
+    ]
+    return [o.channel for o in pads], np.array(
+        [(o.x_coord_mm, o.y_coord_mm) for o in pads], dtype=float
+    ).reshape(-1, 2)
+
+
+def register_side(
+    objects: Iterable[BoardObject],
+    converter,
+    observed_px: np.ndarray,
+    side: str = "bottom",
+    max_dist_px: float = 50.0,
+    threshold_px: float = 3.0,
+) -> Optional[RegistrationResult]:
+    """
+    Fit the mm → pixel affine of *side* from the through-hole pads: each pad
+    is projected with the converter's current map, paired with the nearest
+    pad seen on that side's image (*observed_px*, e.g. detected candidates)
+    and the pairs are registered with register_points().
+    """
+    channels, mm = through_hole_points(objects)
+    predicted = converter.mm_to_pixels_array(mm, side)
+    pad_idx, obs_idx = match_to_candidates(predicted, observed_px, max_dist_px)
+    return register_points(
+        mm[pad_idx],
+        np.asarray(observed_px, dtype=float).reshape(-1, 2)[obs_idx],
+        keys=[channels[i] for i in pad_idx],
+        threshold=threshold_px,
+    )
@@ -1,6 +1,8 @@
 from PyQt5.QtWidgets import QMessageBox
 from PyQt5.QtCore import Qt, QTimer
 from logs.log_handler import LogHandler
+from objects.board_object import BoardObject
+from objects.object_library import library_transaction
 from edit_pads.pad_editor_dialog import PadEditorDialog
 from component_placer.component_placer import clipboard
 from statistics import mean
@@ -31,20 +33,39 @@ def _ensure_clipboard_has_data():
     Checks if there is valid data in the clipboard.
     Displays a warning and returns False if empty.
     """
-    copied_data = clipboard.paste()  # Clipboard.paste() returns the current data.
-    if not copied_data:
+    if not clipboard.has_pads():
         QMessageBox.warning(None, "Paste Pads", "No valid pads in clipboard.")
         return False
     return True
 
 
-def _get_valid_pads(action_title, pad_items):
+def _selected_objects(object_library, selection):
     """
-    Filters the provided pad_items to include only those that have a board_object attribute.
+    Resolves a selection to BoardObjects. Entries may be channels (what the
+    SelectionModel holds), BoardObjects, or pad items with a ``board_object``.
+    Channels that are no longer in the library are dropped.
+    """
+    objects = getattr(object_library, "objects", {})
+    resolved = []
+    for entry in selection:
+        if isinstance(entry, int):
+            obj = objects.get(entry)
+        elif isinstance(entry, BoardObject):
+            obj = entry
+        else:
+            obj = getattr(entry, "board_object", None)
+        if obj is not None:
+            resolved.append(obj)
+    return resolved
+
+
+def _get_valid_pads(action_title, object_library, selection):
+    """
+    Resolves the selection to BoardObjects (see _selected_objects).
     If none are valid, a warning is displayed.
-    Returns the filtered list.
+    Returns the resolved list.
     """
-    valid_pads = [pad for pad in pad_items if hasattr(pad, "board_object")]
+    valid_pads = _selected_objects(object_library, selection)
     if not valid_pads:
         QMessageBox.warning(
             None, action_title, f"No valid pads selected for {action_title.lower()}."
@@ -52,15 +73,13 @@ def _get_valid_pads(action_title, pad_items):
     return valid_pads
 
 
-def _extract_pad_data(pad, current_side, board_view):
+def _extract_pad_data(obj, current_side, board_view):
     """
-    Extracts pad data from a pad item (which must have a board_object attribute).
+    Extracts pad data from a BoardObject.
     - Uses original coordinates if available.
     - If the current board side is 'bottom', flips the x-coordinate using the board width in mm.
     - Returns a dictionary with the pad’s parameters.
     """
-    obj = pad.board_object
-
     # Get the "original" mm coords if they exist, otherwise the current coords
     x_mm = getattr(obj, "x_coord_mm_original", obj.x_coord_mm)
     y_mm = getattr(obj, "y_coord_mm_original", obj.y_coord_mm)
@@ -93,6 +112,32 @@ def _extract_pad_data(pad, current_side, board_view):
     return pad_data
 
 
+def _net_members(object_library, signal):
+    """
+    Returns the pads using *signal*. Uses the library's net index (O(k)) and
+    falls back to a scan for library stand-ins without one.
+    """
+    if hasattr(object_library, "pads_in_net"):
+        return object_library.pads_in_net(signal)
+    return [obj for obj in object_library.objects.values() if obj.signal == signal]
+
+
+def _board_view_of(selection, board_view=None):
+    """
+    *board_view* if given, else the first QGraphicsView showing one of the pad
+    items in *selection* (channels and detached pads are skipped).
+    """
+    if board_view is not None:
+        return board_view
+    for pad in selection:
+        scene = pad.scene() if hasattr(pad, "scene") else None
+        if scene is not None:
+            views = scene.views()
+            if views:
+                return views[0]
+    return None
+
+
 def _update_scene(board_view):
     """
     Forces the board view to update its scene.
@@ -109,23 +154,26 @@ def _update_scene(board_view):
 # --------------------
 # Actions
 # --------------------
-def copy_pads(object_library, pad_items):
+def copy_pads(object_library, selection, board_view=None):
     """
-    Copies the selected pads into the clipboard.
+    Copies the selected pads (channels or pad items) to the system clipboard
+    (see component_placer.pad_clipboard), so they can be pasted in another instance.
     The copied pad data are normalized so that they are expressed in a top‑oriented coordinate system.
     If the current board side is 'bottom', the x‑coordinate is flipped using the board width.
     Pin numbers are preserved by default and the pad's prefix is copied. If the
     selected pins have numeric gaps (e.g. 1, 3 or 1, 2, 4), the user is asked
     whether to keep the numbering or renumber sequentially starting at 1.
     """
-    if not _ensure_selection("Copy Pads", pad_items):
+    if not _ensure_selection("Copy Pads", selection):
         return
 
-    valid_pad_items = _get_valid_pads("Copy Pads", pad_items)
-    if not valid_pad_items:
+    valid_pads = _get_valid_pads("Copy Pads", object_library, selection)
+    if not valid_pads:
         return
 
-    board_view = valid_pad_items[0].scene().views()[0]
+    board_view = _board_view_of(selection, board_view)
+    if board_view is None:
+        return
     current_side = board_view.flags.get_flag("side", "top").lower()
 
     log = board_view.log
@@ -137,9 +185,7 @@ def copy_pads(object_library, pad_items):
     )
 
     try:
-        sorted_pad_items = sorted(
-            valid_pad_items, key=lambda pad: int(pad.board_object.pin)
-        )
+        sorted_pads = sorted(valid_pads, key=lambda obj: int(obj.pin))
     except Exception as e:
         log.log(
             "warning",
@@ -147,12 +193,12 @@ def copy_pads(object_library, pad_items):
             module="copy_pads",
             func="start",
         )
-        sorted_pad_items = valid_pad_items
+        sorted_pads = valid_pads
 
     preserve_numbers = True
     numeric_pins = []
-    for pad in sorted_pad_items:
-        pin_str = str(pad.board_object.pin)
+    for obj in sorted_pads:
+        pin_str = str(obj.pin)
         if pin_str.isdigit():
             numeric_pins.append(int(pin_str))
         else:
@@ -174,35 +220,20 @@ def copy_pads(object_library, pad_items):
             preserve_numbers = reply == QMessageBox.Yes
 
     pads_data = []
-    for idx, pad in enumerate(sorted_pad_items):
-        pad_data = _extract_pad_data(pad, current_side, board_view)
+    for idx, obj in enumerate(sorted_pads):
+        pad_data = _extract_pad_data(obj, current_side, board_view)
         pad_data["order"] = idx
         if not preserve_numbers:
             pad_data["pin"] = str(idx + 1)
         pads_data.append(pad_data)
 
-        log.log(
-            "debug",
-            f"Copied pad: pin={pad.board_object.pin}, x={pad_data['x_coord_mm']:.2f} mm, y={pad_data['y_coord_mm']:.2f} mm, "
-            f"angle={pad_data['angle_deg']:.2f}°, shape={pad_data['shape_type']}, width={pad_data['width_mm']:.2f}, "
-            f"height={pad_data['height_mm']:.2f}, hole={pad_data['hole_mm']:.2f}, prefix='{pad_data['prefix']}'",
-            module="copy_pads",
-            func="for-loop",
-        )
-
-    if pads_data:
-        xs = [pad["x_coord_mm"] for pad in pads_data]
-        ys = [pad["y_coord_mm"] for pad in pads_data]
-        center_x = (min(xs) + max(xs)) / 2.0
-        center_y = (min(ys) + max(ys)) / 2.0
-    else:
-        center_x, center_y = 0.0, 0.0
-
     clipboard.copy(pads_data)
-    clipboard.center_x = center_x
-    clipboard.center_y = center_y
-
-    QMessageBox.information(None, "Copy Pads", f"Copied {len(pads_data)} pads.")
+    log.log(
+        "info",
+        f"Copied {len(pads_data)} pads to the clipboard.",
+        module="copy_pads",
+        func="end",
+    )
 
 
 def paste_pads(object_library, component_placer):
@@ -214,8 +245,11 @@ def paste_pads(object_library, component_placer):
     if not _ensure_clipboard_has_data():
         return
 
-    copied_data = clipboard.paste()  # Returns list of copied pad dictionaries
-    log.log("info", f"Pasting {len(copied_data)} pads.")
+    payload = clipboard.payload()  # decoded only now, straight into the ghost
+    if not payload:
+        QMessageBox.warning(None, "Paste Pads", "No valid pads in clipboard.")
+        return
+    log.log("info", f"Pasting {len(payload)} pads.")
 
     if component_placer.ghost_component is None:
         from component_placer.ghost import GhostComponent
@@ -227,7 +261,7 @@ def paste_pads(object_library, component_placer):
         "debug", f"ComponentPlacer ghost_component: {component_placer.ghost_component}"
     )
 
-    component_placer.load_footprint_from_clipboard(copied_data)
+    component_placer.load_footprint_from_payload(payload)
     component_placer.activate_placement()
 
     # Delay focus enforcement as before.
@@ -245,33 +279,29 @@ def paste_pads(object_library, component_placer):
     log.log("info", "ComponentPlacer activated for pasting.")
 
 
-def delete_pads(object_library, pad_items, display_library=None):
+def delete_pads(object_library, selection, display_library=None, board_view=None):
     """
-    Deletes the selected pads from the object library as a bulk operation.
+    Deletes the selected pads (channels or pad items) from the object library as a bulk operation.
     After deletion, the scene is updated.
-    If display_library is not provided, it is obtained from the first valid pad's view.
+    If display_library is not provided, it is obtained from the board view.
     Additionally, if deletion completely removes a component, the BOM is updated.
     """
-    if not _ensure_selection("Delete Pads", pad_items):
+    if not _ensure_selection("Delete Pads", selection):
         return
 
-    valid_pad_items = _get_valid_pads("Delete Pads", pad_items)
-    if not valid_pad_items:
+    valid_pads = _get_valid_pads("Delete Pads", object_library, selection)
+    if not valid_pads:
         return
 
     if display_library is None:
-        board_view = valid_pad_items[0].scene().views()[0]
-        try:
-            display_library = board_view.display_library
-        except AttributeError:
+        display_library = getattr(
+            _board_view_of(selection, board_view), "display_library", None
+        )
+        if display_library is None:
             QMessageBox.warning(None, "Delete Pads", "Display library not available.")
             return
 
-    channels = [
-        pad.board_object.channel
-        for pad in valid_pad_items
-        if pad.board_object.channel is not None
-    ]
+    channels = [obj.channel for obj in valid_pads if obj.channel is not None]
 
     reply = QMessageBox.question(
         None,
@@ -282,23 +312,25 @@ def delete_pads(object_library, pad_items, display_library=None):
     )
 
     if reply == QMessageBox.Yes:
-        object_library.bulk_delete(channels)
-
-        # Update BOM: remove components that no longer exist in the object library.
-        if hasattr(object_library, "bom_handler"):
-            current_components = {
-                obj.component_name for obj in object_library.get_all_objects()
-            }
-            # Iterate over a copy of the BOM keys to allow safe deletion.
-            for comp in list(object_library.bom_handler.bom.keys()):
-                if comp not in current_components:
-                    object_library.bom_handler.remove_component(comp)
-                    display_library.log.log(
-                        "info",
-                        f"Removed component '{comp}' from BOM because it no longer exists.",
-                        module="delete_pads",
-                        func="delete_pads",
-                    )
+        # Pads and the BOM clean-up below form a single undo step.
+        with library_transaction(object_library, f"Delete {len(channels)} pads"):
+            object_library.bulk_delete(channels)
+
+            # Update BOM: remove components that no longer exist in the object library.
+            if hasattr(object_library, "bom_handler"):
+                current_components = {
+                    obj.component_name for obj in object_library.get_all_objects()
+                }
+                # Iterate over a copy of the BOM keys to allow safe deletion.
+                for comp in list(object_library.bom_handler.bom.keys()):
+                    if comp not in current_components:
+                        object_library.bom_handler.remove_component(comp)
+                        display_library.log.log(
+                            "info",
+                            f"Removed component '{comp}' from BOM because it no longer exists.",
+                            module="delete_pads",
+                            func="delete_pads",
+                        )
 
         display_library.log.log(
             "info",
@@ -313,26 +345,22 @@ def delete_pads(object_library, pad_items, display_library=None):
         )
 
 
-def edit_pads(object_library, pad_items):
+def edit_pads(object_library, selection, board_view=None):
     """
     Opens the PadEditorDialog to modify the selected pads' properties.
     After any edits, the scene is refreshed by calling board_view.update_scene().
     """
-    if not _ensure_selection("Edit Pads", pad_items):
+    if not _ensure_selection("Edit Pads", selection):
         return
 
-    valid_pad_items = _get_valid_pads("Edit Pads", pad_items)
-    if not valid_pad_items:
+    valid_pads = _get_valid_pads("Edit Pads", object_library, selection)
+    if not valid_pads:
         return
 
-    selected_channels = [pad.board_object.channel for pad in valid_pad_items]
-    board_objects = [
-        object_library.objects[ch]
-        for ch in selected_channels
-        if ch in object_library.objects
+    selected_channels = [
+        obj.channel for obj in valid_pads if obj.channel in object_library.objects
     ]
-
-    if not board_objects:
+    if not selected_channels:
         QMessageBox.warning(None, "Edit Pads", "No valid pads found to edit.")
         return
 
@@ -343,12 +371,11 @@ def edit_pads(object_library, pad_items):
         func="edit_pads",
     )
 
-    # Retrieve the current board_view from the first pad item.
-    # This ensures we have the correct QGraphicsView instance to refresh the scene.
-    board_view = valid_pad_items[0].scene().views()[0] if valid_pad_items else None
+    # The board view is needed by the dialog to refresh the scene.
+    board_view = _board_view_of(selection, board_view)
 
     dialog = PadEditorDialog(
-        selected_pads=board_objects,
+        selected_channels=selected_channels,
         object_library=object_library,
         board_view=board_view,  # <-- Pass the board_view to the dialog
     )
@@ -360,39 +387,38 @@ def edit_pads(object_library, pad_items):
         log.log("info", "Pad edit canceled.", module="edit_pads", func="edit_pads")
 
 
-def cut_pads(object_library, pad_items):
+def cut_pads(object_library, selection, board_view=None):
     """
     Copies the selected pads into the clipboard and then deletes them.
     The copied pad data are normalized (and flipped if needed) in the same way as the copy and move operations.
     After deletion, the scene is updated.
     """
-    if not _ensure_selection("Cut Pads", pad_items):
+    if not _ensure_selection("Cut Pads", selection):
         return
 
-    valid_pad_items = _get_valid_pads("Cut Pads", pad_items)
-    if not valid_pad_items:
+    valid_pads = _get_valid_pads("Cut Pads", object_library, selection)
+    if not valid_pads:
         return
 
-    board_view = valid_pad_items[0].scene().views()[0]
+    board_view = _board_view_of(selection, board_view)
+    if board_view is None:
+        return
     current_side = board_view.flags.get_flag("side", "top").lower()
 
     copied_data = []
-    for pad in valid_pad_items:
-        pad_data = _extract_pad_data(pad, current_side, board_view)
+    for obj in valid_pads:
+        pad_data = _extract_pad_data(obj, current_side, board_view)
         copied_data.append(pad_data)
     clipboard.copy(copied_data)
 
-    channels = [
-        pad.board_object.channel
-        for pad in valid_pad_items
-        if pad.board_object.channel is not None
-    ]
-    object_library.bulk_delete(channels)
+    channels = [obj.channel for obj in valid_pads if obj.channel is not None]
+    with library_transaction(object_library, f"Cut {len(channels)} pads"):
+        object_library.bulk_delete(channels)
 
     QMessageBox.information(None, "Cut Pads", f"Cut {len(copied_data)} pads.")
 
 
-def move_pads(object_library, pad_items, component_placer):
+def move_pads(object_library, selection, component_placer, board_view=None):
     """
     Initiates a move of the selected pads.
     The selected pads are loaded into the ghost component (allowing the user to place them at a new location),
@@ -401,21 +427,20 @@ def move_pads(object_library, pad_items, component_placer):
     The moved pads will retain the same component name, pin numbers, channel, signal, and also their prefix.
     After activation, the scene is updated.
     """
-    if not _ensure_selection("Move Pads", pad_items):
+    if not _ensure_selection("Move Pads", selection):
         return
 
-    valid_pad_items = _get_valid_pads("Move Pads", pad_items)
-    if not valid_pad_items:
+    valid_pads = _get_valid_pads("Move Pads", object_library, selection)
+    if not valid_pads:
         return
 
-    board_view = valid_pad_items[0].scene().views()[0]
+    board_view = _board_view_of(selection, board_view or component_placer.board_view)
     current_side = board_view.flags.get_flag("side", "top").lower()
 
     pads_data = []
-    for pad in valid_pad_items:
-        pad_data = _extract_pad_data(pad, current_side, board_view)
+    for obj in valid_pads:
+        pad_data = _extract_pad_data(obj, current_side, board_view)
         # Add extra fields needed for move.
-        obj = pad.board_object
         pad_data["component_name"] = obj.component_name
         pad_data["channel"] = obj.channel
         pad_data["signal"] = getattr(obj, "signal", None)
@@ -433,12 +458,10 @@ def move_pads(object_library, pad_items, component_placer):
 
     component_placer.load_footprint_from_clipboard(pads_data)
     component_placer.activate_placement()
-    component_placer._move_channels = [
-        pad.board_object.channel for pad in valid_pad_items
-    ]
+    component_placer._move_channels = [obj.channel for obj in valid_pads]
 
 
-def connect_pads(object_library, pad_items):
+def connect_pads(object_library, selection, board_view=None):
     """Connects multiple selected pads to share the same signal.
 
     The signal from the pad with the largest area (``width_mm * height_mm``)
@@ -448,38 +471,35 @@ def connect_pads(object_library, pad_items):
     set to ``"Terminal"``. If multiple pads share the largest area, the first
     encountered is used.
     """
-    if not _ensure_selection("Connect Pads", pad_items):
+    if not _ensure_selection("Connect Pads", selection):
         return
 
-    valid_pad_items = _get_valid_pads("Connect Pads", pad_items)
-    if len(valid_pad_items) < 2:
+    valid_pads = _get_valid_pads("Connect Pads", object_library, selection)
+    if len(valid_pads) < 2:
         QMessageBox.warning(
             None, "Connect Pads", "Select at least two pads to connect."
         )
         return
 
     # Determine which pad's signal will be used based on the largest area
-    forced_candidate = max(
-        (pad.board_object for pad in valid_pad_items),
-        key=lambda obj: obj.width_mm * obj.height_mm,
-    )
+    forced_candidate = max(valid_pads, key=lambda obj: obj.width_mm * obj.height_mm)
     signal_to_use = getattr(forced_candidate, "signal", f"S{forced_candidate.channel}")
 
     # Prepare updated copies for the selected pads
     selected_channels = set()
     selected_updates = []
-    for pad in valid_pad_items:
-        obj = pad.board_object
+    for obj in valid_pads:
         selected_channels.add(obj.channel)
         updated = copy.deepcopy(obj)
         updated.signal = signal_to_use
         selected_updates.append(updated)
 
     # Gather existing pads already using this signal (excluding selected ones)
-    existing_updates = []
-    for obj in object_library.objects.values():
-        if obj.signal == signal_to_use and obj.channel not in selected_channels:
-            existing_updates.append(copy.deepcopy(obj))
+    existing_updates = [
+        copy.deepcopy(obj)
+        for obj in _net_members(object_library, signal_to_use)
+        if obj.channel not in selected_channels
+    ]
 
     all_updates = selected_updates + existing_updates
     if not all_updates:
@@ -490,27 +510,86 @@ def connect_pads(object_library, pad_items):
     for obj in all_updates:
         obj.testability = "Forced" if obj.channel == forced_obj.channel else "Terminal"
 
-    object_library.bulk_update_objects(all_updates, {})
+    with library_transaction(object_library, f"Connect {len(all_updates)} pads"):
+        object_library.bulk_update_objects(all_updates, {})
 
     # Update the scene using the first pad item that still belongs to a scene.
-    # Some pad items might be detached (their ``scene()`` returns ``None``),
-    # which would previously raise an ``AttributeError`` when trying to access
-    # ``views()``. Iterate over the valid pad items until one with a scene and
-    # view is found.
-    board_view = None
-    for pad in valid_pad_items:
-        scene = pad.scene() if hasattr(pad, "scene") else None
-        if scene is not None:
-            views = scene.views()
-            if views:
-                board_view = views[0]
-                break
+    # Some pad items might be detached (their ``scene()`` returns ``None``).
+    board_view = _board_view_of(selection, board_view)
+    if board_view is not None:
+        _update_scene(board_view)
+
+
+def disconnect_pads(object_library, selection, board_view=None):
+    """Moves each selected pad to a net of its own.
+
+    A disconnected pad gets its default net name ``S<channel>`` (or the next
+    free ``S<k>`` if other pads still use that name) and becomes ``Forced``.
+    If a net the pads left no longer has a Forced pad, its largest remaining
+    pad is promoted. Only the pads of the affected nets are touched.
+    """
+    if not _ensure_selection("Disconnect Pads", selection):
+        return
+
+    valid_pads = _get_valid_pads("Disconnect Pads", object_library, selection)
+    if not valid_pads:
+        return
 
+    selected = {obj.channel: obj for obj in valid_pads}
+    channels = getattr(object_library, "channels", None)
+    taken = set()
+    next_k = channels.peek() if channels is not None else None
+
+    updates = []
+    left_nets = set()
+    for ch, obj in sorted(selected.items()):
+        others = [
+            o for o in _net_members(object_library, obj.signal) if o.channel not in selected
+        ]
+        if not others:
+            continue  # already alone on its net
+        left_nets.add(obj.signal)
+
+        name = f"S{ch}"
+        if channels is not None and (
+            name in taken
+            or any(o.channel not in selected for o in _net_members(object_library, name))
+        ):
+            # Default name still used by other pads: take the lowest free S<k>
+            while next_k in channels or f"S{next_k}" in taken:
+                next_k += 1
+            name = f"S{next_k}"
+        taken.add(name)
+
+        updated = copy.deepcopy(obj)
+        updated.signal = name
+        updated.testability = "Forced"
+        updates.append(updated)
+
+    if not updates:
+        return
+
+    # Keep one Forced pad on every net the selection left
+    for signal in left_nets:
+        remaining = [
+            o for o in _net_members(object_library, signal) if o.channel not in selected
+        ]
+        if remaining and not any(o.testability == "Forced" for o in remaining):
+            promoted = copy.deepcopy(
+                max(remaining, key=lambda obj: obj.width_mm * obj.height_mm)
+            )
+            promoted.testability = "Forced"
+            updates.append(promoted)
+
+    with library_transaction(object_library, f"Disconnect {len(selected)} pads"):
+        object_library.bulk_update_objects(updates, {})
+
+    board_view = _board_view_of(selection, board_view)
     if board_view is not None:
         _update_scene(board_view)
 
 
-def align_selected_pads(object_library, selected_pads, component_placer):
+def align_selected_pads(object_library, selection, component_placer, board_view=None):
     """
     Initiates an align operation based on the selected pads.
 
@@ -522,14 +601,14 @@ def align_selected_pads(object_library, selected_pads, component_placer):
     After the user moves the ghost to the desired location, the ghost’s final center (in mm)
     will be used to call align_pads() to update all pads.
     """
-    if not _ensure_selection("Align Pads", selected_pads):
+    if not _ensure_selection("Align Pads", selection):
         return
 
-    valid_pad_items = _get_valid_pads("Align Pads", selected_pads)
-    if not valid_pad_items:
+    valid_pads = _get_valid_pads("Align Pads", object_library, selection)
+    if not valid_pads:
         return
 
-    board_view = valid_pad_items[0].scene().views()[0]
+    board_view = _board_view_of(selection, board_view or component_placer.board_view)
     current_side = board_view.flags.get_flag("side", "top").lower()
     board_width_mm = None
     if current_side == "bottom":
@@ -538,8 +617,7 @@ def align_selected_pads(object_library, selected_pads, component_placer):
         )
 
     pads_data = []
-    for pad in valid_pad_items:
-        obj = pad.board_object
+    for obj in valid_pads:
         x = getattr(obj, "x_coord_mm_original", obj.x_coord_mm)
         if current_side == "bottom" and board_width_mm is not None:
             x = board_width_mm - x
@@ -1,6 +1,6 @@
 import time
 import copy
-from typing import List
+from typing import List, Optional
 from PyQt5.QtWidgets import (
     QDialog,
     QTableWidget,
@@ -20,7 +20,6 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5 import QtCore
 from PyQt5.QtCore import Qt, pyqtSignal
-import pandas as pd  # New import for Excel export
 
 from objects.board_object import BoardObject
 from logs.log_handler import LogHandler
@@ -40,19 +39,27 @@ class PadEditorDialog(QDialog):
 
     def __init__(
         self,
-        selected_pads: List[BoardObject],
+        selected_pads: Optional[List[BoardObject]] = None,
         object_library=None,
         board_view=None,  # <-- NEW: pass in BoardView here
         parent=None,
+        selected_channels: Optional[List[int]] = None,
     ):
         super().__init__(parent)
 
         self.setWindowTitle("Pad Editor")
         self.log = LogHandler(output="both")
         self.object_library = object_library
+        self.board_view = board_view
+
+        # Pads are normally given as channels (the board view's selection
+        # model) and looked up in the ObjectLibrary.
+        if selected_channels is not None and object_library is not None:
+            objects = object_library.objects
+            selected_pads = [objects[ch] for ch in selected_channels if ch in objects]
 
         # Store the selected pads in local structures
-        self.selected_pads = selected_pads[:]  # Copy so as not to modify original list
+        self.selected_pads = list(selected_pads or [])  # Copy so as not to modify original list
         self.filtered_pads = list(self.selected_pads)
 
         # Current unit for display and editing ("mm" or "mils")
@@ -740,6 +747,14 @@ class PadEditorDialog(QDialog):
         if not data:
             QMessageBox.information(self, "No Data", "There are no pads to export.")
             return
+        try:
+            # pandas is heavy; load it only when an export is requested
+            import pandas as pd
+        except ImportError:
+            QMessageBox.critical(
+                self, "Export Failed", "pandas is required for Excel export."
+            )
+            return
         df = pd.DataFrame(data)
         # Ask the user where to save the file.
         filename, _ = QFileDialog.getSaveFileName(
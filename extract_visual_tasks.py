@@ -2,14 +2,19 @@ import argparse
 import platform
 import subprocess
 import sys
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
 
-import pandas as pd
+# pandas (and pyodbc on Windows) are only needed when an MDB is actually
+# read, so they are imported inside the loaders to keep them off the GUI's
+# cold-start path.
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas as pd
 
 DRIVER = r"{Microsoft Access Driver (*.mdb, *.accdb)}"
 
 
-def _load_with_pyodbc(path: str) -> pd.DataFrame:
+def _load_with_pyodbc(path: str) -> "pd.DataFrame":
+    import pandas as pd
     import pyodbc  # type: ignore
 
     conn_str = f"DRIVER={DRIVER};DBQ={path}"
@@ -21,7 +26,9 @@ def _load_with_pyodbc(path: str) -> pd.DataFrame:
         return pd.read_sql(query, conn)
 
 
-def _load_with_mdbtools(path: str) -> pd.DataFrame:
+def _load_with_mdbtools(path: str) -> "pd.DataFrame":
+    import pandas as pd
+
     try:
         result = subprocess.run(
             ["mdb-export", path, "InitInfo"],
@@ -37,7 +44,7 @@ def _load_with_mdbtools(path: str) -> pd.DataFrame:
     return data[data["Section"] == "Visual Tasks"][["Section", "Key", "Value"]]
 
 
-def extract_visual_tasks(path: str) -> pd.DataFrame:
+def extract_visual_tasks(path: str) -> "pd.DataFrame":
     if platform.system() == "Windows":
         try:
             return _load_with_pyodbc(path)
@@ -7,17 +7,34 @@ from constants.constants import Constants
 
 
 class LogHandler:
+    """
+    LogHandler() is the process-wide default logger. LogHandler(name=...)
+    gives an independent handler (e.g. per board) that writes through the
+    default one's handlers, with every message tagged "<name>".
+    """
+
     _instance = None
 
-    def __new__(cls, output="both"):
+    def __new__(cls, output="both", name=None):
+        if name is not None:
+            return super(LogHandler, cls).__new__(cls)
         if cls._instance is None:
             cls._instance = super(LogHandler, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self, output="both"):
+    def __init__(self, output="both", name=None):
         if hasattr(self, "_initialized") and self._initialized:
             return
         self._initialized = True
+        self.tag = ""
+
+        if name is not None:
+            # Child of the default logger: same handlers and level
+            self.logger = logging.getLogger(f"ProgramLogger.{name}")
+            self.logger.propagate = True
+            self.tag = f"<{name}> "
+            LogHandler(output)
+            return
 
         # Set up the logger early so Constants can use it during loading
         self.logger = logging.getLogger("ProgramLogger")
@@ -77,7 +94,7 @@ class LogHandler:
         if func:
             prefix_parts.append(func)
         prefix = f"[{'.'.join(prefix_parts)}]: " if prefix_parts else ""
-        full_msg = prefix + message
+        full_msg = self.tag + prefix + message
 
         if level.lower() == "info":
             self.logger.info(full_msg)
@@ -0,0 +1,129 @@
+# objects/channel_allocator.py
+
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List
+
+
+class ChannelAllocator:
+    """
+    Hands out tester channel numbers, reusing freed ones.
+
+    Occupancy is kept as a byte-per-channel bitmap so that the lowest free
+    channel, or the lowest run of *n* contiguous free channels, can be found
+    with ``bytearray.find`` (C speed) instead of scanning Python objects.
+
+    A channel is occupied while its reference count is > 0. ObjectLibrary
+    takes one reference for a live pad on that channel and one for every pad
+    whose signal is named ``S<channel>``, so the number of a deleted pad is
+    not reused while its net name is still in use by other pads.
+
+    Channel 0 is never handed out.
+    """
+
+    def __init__(self, used: Iterable[int] = ()):
+        self.reset(used)
+
+    # ------------------------------------------------------------------
+    #  Bulk state
+    # ------------------------------------------------------------------
+    def reset(self, used: Iterable[int] = ()) -> None:
+        """Rebuild the allocator from an iterable of occupied numbers (O(n))."""
+        self._refs: Dict[int, int] = dict(
+            Counter(ch for ch in used if ch is not None and ch > 0)
+        )
+        self._used = bytearray(max(self._refs, default=0) + 1)
+        self._used[0] = 1  # index 0 is reserved
+        for ch in self._refs:
+            self._used[ch] = 1
+        self._hint = 1  # no free channel below this index
+
+    def __contains__(self, channel: int) -> bool:
+        return 0 < channel < len(self._used) and self._used[channel] == 1
+
+    def __len__(self) -> int:
+        """Number of occupied channels."""
+        return len(self._refs)
+
+    @property
+    def high_water(self) -> int:
+        """One past the highest occupied channel."""
+        return len(self._used)
+
+    def used_channels(self) -> Iterator[int]:
+        """Occupied channels in ascending order."""
+        used = self._used
+        ch = used.find(1, 1)
+        while ch != -1:
+            yield ch
+            ch = used.find(1, ch + 1)
+
+    # ------------------------------------------------------------------
+    #  Allocation
+    # ------------------------------------------------------------------
+    def peek(self) -> int:
+        """The channel allocate() would return, without taking it."""
+        ch = self._used.find(0, self._hint)
+        return ch if ch != -1 else len(self._used)
+
+    def allocate(self) -> int:
+        """Take the lowest free channel."""
+        ch = self.peek()
+        self._hint = ch + 1
+        self.acquire(ch)
+        return ch
+
+    def allocate_block(self, count: int) -> List[int]:
+        """
+        Take *count* contiguous channels (the lowest run that fits, else
+        appended after the highest occupied channel) in one call.
+        """
+        if count <= 0:
+            return []
+        if count == 1:
+            return [self.allocate()]
+        start = self._used.find(bytes(count), self._hint)
+        if start == -1:
+            start = len(self._used)
+        block = list(range(start, start + count))
+        for ch in block:
+            self.acquire(ch)
+        return block
+
+    # ------------------------------------------------------------------
+    #  Reference counting
+    # ------------------------------------------------------------------
+    def acquire(self, channel: int) -> None:
+        """Add a reference to *channel*, marking it occupied."""
+        if channel is None or channel <= 0:
+            return
+        count = self._refs.get(channel, 0)
+        self._refs[channel] = count + 1
+        if count:
+            return
+        used = self._used
+        if channel >= len(used):
+            used.extend(bytes(channel + 1 - len(used)))
+        used[channel] = 1
+
+    def release(self, channel: int) -> None:
+        """Drop a reference to *channel*; it becomes free at zero."""
+        if channel is None or channel <= 0:
+            return
+        count = self._refs.get(channel, 0)
+        if count > 1:
+            self._refs[channel] = count - 1
+            return
+        if not count:
+            return
+        del self._refs[channel]
+        used = self._used
+        used[channel] = 0
+        if channel < self._hint:
+            self._hint = channel
+        # Keep no trailing free channels so block appends stay dense
+        end = len(used)
+        while end > 1 and used[end - 1] == 0:
+            end -= 1
+        if end != len(used):
+            del used[end:]
+            self._hint = min(self._hint, end)
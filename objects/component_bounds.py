@@ -0,0 +1,238 @@
+# objects/component_bounds.py
+
+import math
+from typing import Dict, List, Optional, Set, Tuple
+
+from objects.board_object import BoardObject
+
+Rect = Tuple[float, float, float, float]  # x1, y1, x2, y2 in mm
+
+SIDES = ("top", "bottom")
+
+
+def pad_sides(obj: BoardObject) -> Tuple[str, ...]:
+    """
+    Sides on which a pad counts towards its component's outline: through-hole
+    pads on both, other pads on their test side ("both": both sides; hidden
+    pads on none).
+    """
+    if not getattr(obj, "visible", True):
+        return ()
+    if obj.technology.lower() == "through hole":
+        return SIDES
+    tp = obj.test_position.lower()
+    if tp == "both":
+        return SIDES
+    return (tp,) if tp in SIDES else ()
+
+
+def pad_rect(obj: BoardObject) -> Rect:
+    half_w = obj.width_mm / 2.0
+    half_h = obj.height_mm / 2.0
+    return (
+        obj.x_coord_mm - half_w,
+        obj.y_coord_mm - half_h,
+        obj.x_coord_mm + half_w,
+        obj.y_coord_mm + half_h,
+    )
+
+
+class ComponentBounds:
+    """
+    Per-component, per-side bounding boxes kept up to date by ObjectLibrary.
+
+    track()/discard() are O(1); a box that may have shrunk (pad moved or
+    removed) is recomputed from that component's pads only when asked for.
+    rebuild() (a project load) only takes the pads; they are indexed on the
+    first use, so a load does not pay for an overlay that is never shown.
+    Components whose box may have changed are remembered per side so that
+    overlays can redraw just those (see take_changed()); component_at()
+    likewise re-files only those components in its grid.
+    """
+
+    # Grid cell edge (mm) of the index used by component_at()/components_in_rect()
+    GRID_CELL_MM = 10.0
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self._pending: Optional[list] = None  # pads of a rebuild not indexed yet
+        self._pending_old: Dict[str, Set[str]] = {}
+        self._pads: Dict[Tuple[str, str], Dict[int, Rect]] = {}  # (side, comp) -> pads
+        self._boxes: Dict[Tuple[str, str], Optional[Rect]] = {}  # None = recompute
+        self._entries: Dict[int, Tuple[str, Tuple[str, ...], Rect]] = {}  # ch -> state
+        self._changed: Dict[str, Set[str]] = {side: set() for side in SIDES}
+        # component_at() index: side -> {cell: components}, the cells each
+        # component is filed under, and the components to re-file
+        self._grid: Dict[str, Dict[Tuple[int, int], Set[str]]] = {s: {} for s in SIDES}
+        self._cells: Dict[Tuple[str, str], List[Tuple[int, int]]] = {}
+        self._stale: Dict[str, Set[str]] = {side: set() for side in SIDES}
+
+    def rebuild(self, objects) -> None:
+        if self._pending is None:
+            # Components the overlays may still show, reported as changed
+            self._pending_old = {
+                side: {comp for s, comp in self._pads if s == side} for side in SIDES
+            }
+        self._pending = list(objects)
+
+    def _ensure(self) -> None:
+        """Index the pads of a pending rebuild()."""
+        if self._pending is None:
+            return
+        objects, old = self._pending, self._pending_old
+        self._pending = None
+        self.clear()
+        # Boxes are left to box() (None = recompute), so this is one pass
+        for obj in objects:
+            channel = obj.channel
+            if channel in self._entries:
+                self.track(obj)
+                continue
+            comp, sides, rect = entry = (obj.component_name, pad_sides(obj), pad_rect(obj))
+            self._entries[channel] = entry
+            for side in sides:
+                self._pads.setdefault((side, comp), {})[channel] = rect
+        for side in SIDES:
+            self._changed[side] = old[side] | {c for s, c in self._pads if s == side}
+            self._stale[side] = {c for s, c in self._pads if s == side}
+        self._boxes = dict.fromkeys(self._pads)
+
+    # ------------------------------------------------------------------
+    #  Maintenance
+    # ------------------------------------------------------------------
+    def track(self, obj: BoardObject) -> None:
+        self._ensure()
+        channel = obj.channel
+        entry = (obj.component_name, pad_sides(obj), pad_rect(obj))
+        if self._entries.get(channel) == entry:
+            return
+        self.discard(channel)
+        comp, sides, rect = entry
+        self._entries[channel] = entry
+        for side in sides:
+            key = (side, comp)
+            self._pads.setdefault(key, {})[channel] = rect
+            box = self._boxes.get(key, rect)
+            if box is not None:
+                self._boxes[key] = (
+                    min(box[0], rect[0]),
+                    min(box[1], rect[1]),
+                    max(box[2], rect[2]),
+                    max(box[3], rect[3]),
+                )
+            self._touch(side, comp)
+
+    def discard(self, channel: int) -> None:
+        self._ensure()
+        entry = self._entries.pop(channel, None)
+        if entry is None:
+            return
+        comp, sides, _ = entry
+        for side in sides:
+            key = (side, comp)
+            pads = self._pads[key]
+            del pads[channel]
+            if pads:
+                self._boxes[key] = None
+            else:
+                del self._pads[key]
+                self._boxes.pop(key, None)
+            self._touch(side, comp)
+
+    def _touch(self, side: str, comp: str) -> None:
+        self._changed[side].add(comp)
+        self._stale[side].add(comp)
+
+    # ------------------------------------------------------------------
+    #  Queries
+    # ------------------------------------------------------------------
+    def box(self, component: str, side: str = "top") -> Optional[Rect]:
+        """Bounding box (mm) of *component* on *side*, or None."""
+        self._ensure()
+        key = (side, component)
+        pads = self._pads.get(key)
+        if not pads:
+            return None
+        box = self._boxes.get(key)
+        if box is None:
+            rects = pads.values()
+            box = (
+                min(r[0] for r in rects),
+                min(r[1] for r in rects),
+                max(r[2] for r in rects),
+                max(r[3] for r in rects),
+            )
+            self._boxes[key] = box
+        return box
+
+    def boxes(self, side: str = "top") -> Dict[str, Rect]:
+        self._ensure()
+        return {comp: self.box(comp, side) for s, comp in list(self._pads) if s == side}
+
+    def take_changed(self, side: str) -> Set[str]:
+        """Components on *side* whose box may have changed since the last call."""
+        self._ensure()
+        changed = self._changed[side]
+        self._changed[side] = set()
+        return changed
+
+    def component_at(self, x_mm: float, y_mm: float, side: str = "top") -> Optional[str]:
+        """Smallest component box on *side* containing the point."""
+        grid = self._update_grid(side)
+        cell = self.GRID_CELL_MM
+        best, best_area = None, None
+        for comp in grid.get((math.floor(x_mm / cell), math.floor(y_mm / cell)), ()):
+            x1, y1, x2, y2 = self.box(comp, side)
+            if x1 <= x_mm <= x2 and y1 <= y_mm <= y2:
+                area = (x2 - x1) * (y2 - y1)
+                if best is None or area < best_area:
+                    best, best_area = comp, area
+        return best
+
+    def components_in_rect(
+        self, x1: float, y1: float, x2: float, y2: float, side: str = "top"
+    ) -> Set[str]:
+        """Components on *side* whose box overlaps the rectangle (mm)."""
+        grid = self._update_grid(side)
+        cell = self.GRID_CELL_MM
+        xmin, xmax = min(x1, x2), max(x1, x2)
+        ymin, ymax = min(y1, y2), max(y1, y2)
+        found: Set[str] = set()
+        for gx in range(math.floor(xmin / cell), math.floor(xmax / cell) + 1):
+            for gy in range(math.floor(ymin / cell), math.floor(ymax / cell) + 1):
+                for comp in grid.get((gx, gy), ()):
+                    if comp in found:
+                        continue
+                    bx1, by1, bx2, by2 = self.box(comp, side)
+                    if bx1 <= xmax and xmin <= bx2 and by1 <= ymax and ymin <= by2:
+                        found.add(comp)
+        return found
+
+    def _update_grid(self, side: str) -> Dict[Tuple[int, int], Set[str]]:
+        """Re-file the components changed since the last query; returns the grid."""
+        self._ensure()
+        grid = self._grid[side]
+        cell = self.GRID_CELL_MM
+        for comp in self._stale[side]:
+            key = (side, comp)
+            for gxy in self._cells.pop(key, ()):
+                members = grid[gxy]
+                members.discard(comp)
+                if not members:
+                    del grid[gxy]
+            box = self.box(comp, side)
+            if box is None:
+                continue
+            x1, y1, x2, y2 = box
+            cells = [
+                (gx, gy)
+                for gx in range(math.floor(x1 / cell), math.floor(x2 / cell) + 1)
+                for gy in range(math.floor(y1 / cell), math.floor(y2 / cell) + 1)
+            ]
+            for gxy in cells:
+                grid.setdefault(gxy, set()).add(comp)
+            self._cells[key] = cells
+        self._stale[side] = set()
+        return grid
@@ -0,0 +1,122 @@
+# objects/component_registry.py
+
+from typing import Callable, Dict, Iterable, List, Set
+
+from objects.board_object import BoardObject
+from objects.name_registry import NameRegistry
+
+# listener(appeared, vanished): component names that gained their first pad /
+# lost their last pad
+Listener = Callable[[Set[str], Set[str]], None]
+
+
+class ComponentRegistry:
+    """
+    Set of the component names on the board with their pads
+    (component -> channels), plus a case-folded view (``folded``) for
+    case-insensitive collision checks.
+
+    ObjectLibrary calls track()/discard() whenever it stores or removes an
+    object, so a component appears with its first pad and vanishes with its
+    last one. Subscribers (e.g. BOMHandler) are told only about those
+    transitions, never about pads of components that already exist.
+    """
+
+    def __init__(self, objects: Iterable[BoardObject] = ()):
+        self._listeners: List[Listener] = []
+        self._channels: Dict[str, Set[int]] = {}
+        self._name_of: Dict[int, str] = {}
+        self.folded = NameRegistry()
+        self.rebuild(objects)
+
+    # ------------------------------------------------------------------
+    #  Maintenance
+    # ------------------------------------------------------------------
+    def rebuild(self, objects: Iterable[BoardObject] = ()) -> None:
+        """O(n) rebuild; listeners get one notification with the difference."""
+        old = set(self._channels)
+        self._name_of = {obj.channel: obj.component_name for obj in objects}
+        self._channels = {}
+        for channel, name in self._name_of.items():
+            self._channels.setdefault(name, set()).add(channel)
+        self.folded = NameRegistry(self._channels)
+        new = set(self._channels)
+        self._notify(new - old, old - new)
+
+    def track(self, obj: BoardObject) -> None:
+        """Insert or rename the pad on ``obj.channel`` (O(1))."""
+        channel, name = obj.channel, obj.component_name
+        old = self._name_of.get(channel)
+        if old == name:
+            return
+        vanished = self._release(channel, old) if old is not None else set()
+        self._name_of[channel] = name
+        pads = self._channels.get(name)
+        if pads is None:
+            pads = self._channels[name] = set()
+            self.folded.add(name)
+            appeared = {name}
+        else:
+            appeared = set()
+        pads.add(channel)
+        self._notify(appeared - vanished, vanished - appeared)
+
+    def discard(self, channel: int) -> None:
+        """Remove the pad on *channel* (O(1))."""
+        name = self._name_of.pop(channel, None)
+        if name is not None:
+            self._notify(set(), self._release(channel, name))
+
+    def _release(self, channel: int, name: str) -> Set[str]:
+        pads = self._channels[name]
+        pads.discard(channel)
+        if pads:
+            return set()
+        del self._channels[name]
+        self.folded.remove(name)
+        return {name}
+
+    # ------------------------------------------------------------------
+    #  Subscription
+    # ------------------------------------------------------------------
+    def subscribe(self, listener: Listener) -> None:
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Listener) -> None:
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _notify(self, appeared: Set[str], vanished: Set[str]) -> None:
+        if not (appeared or vanished):
+            return
+        for listener in list(self._listeners):
+            listener(appeared, vanished)
+
+    # ------------------------------------------------------------------
+    #  Queries
+    # ------------------------------------------------------------------
+    def __contains__(self, name: str) -> bool:
+        return name in self._channels
+
+    def __len__(self) -> int:
+        """Number of components."""
+        return len(self._channels)
+
+    def names(self) -> Set[str]:
+        return set(self._channels)
+
+    def pad_count(self, name: str) -> int:
+        return len(self._channels.get(name, ()))
+
+    def channels(self, name: str, ignore_case: bool = False) -> Set[int]:
+        """
+        Channels of the pads of *name*; with *ignore_case* those of every
+        component whose name differs from it only in capitalisation.
+        """
+        if not ignore_case:
+            return set(self._channels.get(name, ()))
+        result: Set[int] = set()
+        for spelling in self.folded.spellings(name):
+            result |= self._channels[spelling]
+        return result
@@ -0,0 +1,61 @@
+# objects/library_snapshot.py
+
+from collections.abc import Mapping
+from typing import Dict, Iterator, Optional
+
+from objects.board_object import BoardObject
+
+
+class LibrarySnapshot(Mapping):
+    """
+    Read-only view of an ObjectLibrary at one revision (channel -> pad),
+    returned by ObjectLibrary.snapshot().
+
+    The view shares the library's pad dict; the library copies that dict
+    before its next write (copy-on-write), and replaces pads rather than
+    editing them once a snapshot may hold them, so a snapshot never
+    changes. It can be read from any thread without the library mutex.
+    The pads must not be modified through the view – copy them to edit.
+
+    ``version`` is the library revision the view was taken at;
+    pad_version(channel) is the revision at which that pad last changed,
+    so caches keyed by channel (serialized NOD lines, spatial tiles, ...)
+    can tell which entries are stale.
+    """
+
+    __slots__ = ("_objects", "_versions", "version", "panel")
+
+    def __init__(
+        self,
+        objects: Dict[int, BoardObject],
+        versions: Dict[int, int],
+        version: int,
+        panel=None,
+    ):
+        self._objects = objects
+        self._versions = versions
+        self.version = version
+        self.panel = panel
+
+    def __getitem__(self, channel: int) -> BoardObject:
+        return self._objects[channel]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._objects)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __contains__(self, channel) -> bool:
+        return channel in self._objects
+
+    def pad_version(self, channel: int) -> Optional[int]:
+        """Revision at which the pad on *channel* last changed (None if absent)."""
+        return self._versions.get(channel)
+
+    def changed_since(self, version: int) -> Iterator[int]:
+        """Channels (still present) whose pad changed after revision *version*."""
+        return (ch for ch, v in self._versions.items() if v > version)
+
+    def __repr__(self):
+        return f"LibrarySnapshot(version={self.version}, pads={len(self._objects)})"
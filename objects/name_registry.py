@@ -0,0 +1,86 @@
+# objects/name_registry.py
+
+from typing import Dict, Iterable, List, Set
+
+
+def fold(name: str) -> str:
+    """Key under which component names are compared (case-insensitive)."""
+    return name.casefold()
+
+
+def suffix_letters(index: int) -> str:
+    """0 -> 'A', 25 -> 'Z', 26 -> 'AA', ... (spreadsheet column letters)."""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+class NameRegistry:
+    """
+    Case-folded set of component names: every folded key keeps the exact
+    spellings registered under it, so collision checks are O(1).
+
+    unique_name() hands out ``<name>_A``, ``<name>_B``, ... and remembers per
+    base name where it stopped, so generating many names for one heavily
+    duplicated base does not re-probe the suffixes already used.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._spellings: Dict[str, Set[str]] = {}
+        self._next_suffix: Dict[str, int] = {}
+        for name in names:
+            self.add(name)
+
+    def clear(self) -> None:
+        self._spellings.clear()
+        self._next_suffix.clear()
+
+    def add(self, name: str) -> None:
+        self._spellings.setdefault(fold(name), set()).add(name)
+
+    def remove(self, name: str) -> None:
+        key = fold(name)
+        spellings = self._spellings.get(key)
+        if spellings is None:
+            return
+        spellings.discard(name)
+        if not spellings:
+            del self._spellings[key]
+
+    # ------------------------------------------------------------------
+    #  Queries
+    # ------------------------------------------------------------------
+    def __contains__(self, name: str) -> bool:
+        """True if *name* is registered in any capitalisation."""
+        return fold(name) in self._spellings
+
+    def __len__(self) -> int:
+        """Number of distinct folded names."""
+        return len(self._spellings)
+
+    def spellings(self, name: str) -> Set[str]:
+        """The registered spellings of *name* (empty if unknown)."""
+        return set(self._spellings.get(fold(name), ()))
+
+    def collisions(self) -> List[Set[str]]:
+        """Groups of two or more spellings that fold to the same name."""
+        return [set(s) for s in self._spellings.values() if len(s) > 1]
+
+    def unique_name(self, name: str, *others) -> str:
+        """
+        A new name derived from *name* that is free here and in every
+        registry in *others*; it is registered before being returned.
+        """
+        base = fold(name)
+        index = self._next_suffix.get(base, 0)
+        while True:
+            candidate = f"{name}_{suffix_letters(index)}"
+            index += 1
+            if candidate not in self and not any(candidate in o for o in others):
+                break
+        self._next_suffix[base] = index
+        self.add(candidate)
+        return candidate
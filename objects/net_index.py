@@ -0,0 +1,197 @@
+# objects/net_index.py
+
+import csv
+import re
+import sys
+from typing import Dict, Iterable, List, Optional, Set
+
+from objects.board_object import BoardObject
+
+
+class NetIndex:
+    """
+    Incremental connectivity model: a net is the set of pads sharing a signal.
+
+    ObjectLibrary calls track()/discard() whenever it stores or removes an
+    object, so every query below is O(1) or O(size of the answer) instead of
+    a scan over the whole board.
+    """
+
+    def __init__(self, objects: Iterable[BoardObject] = ()):
+        self.rebuild(objects)
+
+    # ------------------------------------------------------------------
+    #  Maintenance
+    # ------------------------------------------------------------------
+    def rebuild(self, objects: Iterable[BoardObject] = ()) -> None:
+        """O(n) rebuild from scratch."""
+        self._members: Dict[str, Set[int]] = {}  # signal -> channels
+        self._forced: Dict[str, Set[int]] = {}  # signal -> Forced channels
+        self._net_of: Dict[int, str] = {}  # channel -> signal
+        self._is_forced: Set[int] = set()
+        self._unforced: Set[str] = set()  # nets with no Forced pad
+        self._multi_forced: Set[str] = set()  # nets with > 1 Forced pad
+        members, forced, net_of = self._members, self._forced, self._net_of
+        duplicates = []
+        for obj in objects:
+            channel, signal = obj.channel, obj.signal
+            if channel in net_of:
+                duplicates.append(obj)
+                continue
+            net_of[channel] = signal
+            chans = members.get(signal)
+            if chans is None:
+                members[signal] = {channel}
+            else:
+                chans.add(channel)
+            if obj.testability == "Forced":
+                self._is_forced.add(channel)
+                forced.setdefault(signal, set()).add(channel)
+        self._unforced = members.keys() - forced.keys()
+        self._multi_forced = {sig for sig, chans in forced.items() if len(chans) > 1}
+        for obj in duplicates:
+            self.track(obj)  # duplicate channel: let track() replace it
+
+    def track(self, obj: BoardObject) -> None:
+        """Insert or update the net membership of *obj* (O(1))."""
+        channel = obj.channel
+        signal = obj.signal
+        forced = obj.testability == "Forced"
+        if self._net_of.get(channel) == signal and (channel in self._is_forced) == forced:
+            return
+        self.discard(channel)
+
+        self._net_of[channel] = signal
+        self._members.setdefault(signal, set()).add(channel)
+        if forced:
+            self._is_forced.add(channel)
+            self._forced.setdefault(signal, set()).add(channel)
+        self._refresh_status(signal)
+
+    def discard(self, channel: int) -> None:
+        """Remove the pad on *channel* from its net (O(1))."""
+        signal = self._net_of.pop(channel, None)
+        if signal is None:
+            return
+        members = self._members[signal]
+        members.discard(channel)
+        if channel in self._is_forced:
+            self._is_forced.discard(channel)
+            self._forced[signal].discard(channel)
+        if not members:
+            del self._members[signal]
+            self._forced.pop(signal, None)
+        self._refresh_status(signal)
+
+    def _refresh_status(self, signal: str) -> None:
+        forced = len(self._forced.get(signal, ()))
+        if signal in self._members and forced == 0:
+            self._unforced.add(signal)
+        else:
+            self._unforced.discard(signal)
+        if forced > 1:
+            self._multi_forced.add(signal)
+        else:
+            self._multi_forced.discard(signal)
+
+    # ------------------------------------------------------------------
+    #  Queries
+    # ------------------------------------------------------------------
+    def __contains__(self, signal: str) -> bool:
+        return signal in self._members
+
+    def __len__(self) -> int:
+        """Number of nets."""
+        return len(self._members)
+
+    def nets(self) -> List[str]:
+        return list(self._members)
+
+    def pads_in_net(self, signal: str) -> Set[int]:
+        """Channels of the pads using *signal*."""
+        return set(self._members.get(signal, ()))
+
+    def net_of(self, channel: int) -> Optional[str]:
+        """Signal of the pad on *channel* (None if no such pad)."""
+        return self._net_of.get(channel)
+
+    def forced_in_net(self, signal: str) -> Set[int]:
+        """Channels of the Forced pads of *signal*."""
+        return set(self._forced.get(signal, ()))
+
+    def nets_without_forced(self) -> Set[str]:
+        return set(self._unforced)
+
+    def nets_with_multiple_forced(self) -> Set[str]:
+        return set(self._multi_forced)
+
+
+# ----------------------------------------------------------------------
+#  Net report (headless, for the ATE team)
+# ----------------------------------------------------------------------
+NET_REPORT_COLUMNS = ["Net", "Pads", "Forced", "Status", "Forced Pads", "Members"]
+
+
+def _natural_key(text: str):
+    return [int(t) if t.isdigit() else t.lower() for t in re.split(r"(\d+)", str(text))]
+
+
+def _pad_label(obj: BoardObject) -> str:
+    return f"{obj.component_name}.{obj.pin}({obj.channel})"
+
+
+def net_report_rows(object_library) -> List[dict]:
+    """One row per net, sorted naturally by net name."""
+    nets: NetIndex = object_library.nets
+    objects = object_library.objects
+    rows = []
+    for signal in sorted(nets.nets(), key=_natural_key):
+        members = sorted(nets.pads_in_net(signal))
+        forced = sorted(nets.forced_in_net(signal))
+        if not forced:
+            status = "No Forced"
+        elif len(forced) > 1:
+            status = "Multiple Forced"
+        else:
+            status = "OK"
+        rows.append(
+            {
+                "Net": signal,
+                "Pads": len(members),
+                "Forced": len(forced),
+                "Status": status,
+                "Forced Pads": " ".join(_pad_label(objects[ch]) for ch in forced),
+                "Members": " ".join(_pad_label(objects[ch]) for ch in members),
+            }
+        )
+    return rows
+
+
+def export_net_report(object_library, path: str) -> int:
+    """Writes the net report as CSV. Returns the number of nets written."""
+    rows = net_report_rows(object_library)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=NET_REPORT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return len(rows)
+
+
+def main(argv=None) -> int:
+    """python -m objects.net_index <board.nod> <report.csv>"""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 2:
+        print("usage: python -m objects.net_index <board.nod> <report.csv>")
+        return 2
+    from objects.nod_file import BoardNodFile
+    from objects.object_library import ObjectLibrary
+
+    library = ObjectLibrary()
+    BoardNodFile(argv[0], library).load(skip_undo=True)
+    count = export_net_report(library, argv[1])
+    print(f"{count} nets written to {argv[1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
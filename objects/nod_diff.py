@@ -0,0 +1,255 @@
+# objects/nod_diff.py
+
+import math
+import shlex
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from objects.nod_file import (
+    POSITION_CODES,
+    TECHNOLOGY_CODES,
+    TESTABILITY_CODES,
+    get_pad_code,
+    mm_to_mils,
+    parse_pad,
+)
+
+# One pad as it appears in a .nod file:
+# (channel, component, pin, signal, x_mm, y_mm, pad code, POS, TECN, TEST)
+NodRow = Tuple[int, str, str, str, float, float, str, str, str, str]
+
+ADDED = "added"
+REMOVED = "removed"
+MOVED = "moved"
+RESIZED = "resized"
+RESIGNALLED = "re-signalled"
+RETESTED = "re-tested"
+RENAMED = "renamed"
+KINDS = (ADDED, REMOVED, MOVED, RESIZED, RESIGNALLED, RETESTED, RENAMED)
+
+DEFAULT_TOLERANCE_MM = 0.01
+
+def _canonical_pad(code: str, _memo: Dict[str, str] = {}) -> str:
+    """Pad code as get_pad_code() writes it ("X55" -> "X55Y55"); memoised."""
+    canonical = _memo.get(code)
+    if canonical is None:
+        canonical = get_pad_code(*parse_pad(code))
+        _memo[code] = canonical
+    return canonical
+
+
+def parse_nod_line(line: str) -> Optional[NodRow]:
+    """NodRow of one .nod line, None for the header, comments and bad lines."""
+    tokens = line.split()
+    if (
+        len(tokens) < 10
+        or tokens[0][:1] != '"'
+        or tokens[0][-1:] != '"'
+        or tokens[1][:1] != '"'
+        or tokens[1][-1:] != '"'
+    ):
+        # Names with blanks (or unquoted names) need the full tokenizer
+        line = line.strip()
+        if not line or line.startswith("*"):
+            return None
+        try:
+            tokens = shlex.split(line)
+        except ValueError:
+            return None
+        if len(tokens) < 10 or tokens[0].lower() == "signal":
+            return None
+    else:
+        tokens[0] = tokens[0][1:-1]
+        tokens[1] = tokens[1][1:-1]
+    sig, comp, pin, x, y, pad, pos, tecn, test, ch = tokens[:10]
+    try:
+        return (
+            int(ch), comp, pin, sig, float(x), float(y),
+            _canonical_pad(pad), pos, tecn, test,
+        )
+    except ValueError:
+        return None
+
+
+def _rows(lines: Iterable[str]) -> Iterator[NodRow]:
+    for line in lines:
+        row = parse_nod_line(line)
+        if row is not None:
+            yield row
+
+
+def read_nod_rows(path: str) -> Iterator[NodRow]:
+    """Stream the pads of a .nod file as NodRow tuples."""
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        yield from _rows(fh)
+
+
+def _read_lines(path: str) -> Dict[str, None]:
+    """The lines of a .nod file, in order, as an (ordered) dict."""
+    with open(path, "r", encoding="utf-8", errors="replace") as fh:
+        return dict.fromkeys(line.rstrip() for line in fh)
+
+
+def object_row(obj) -> NodRow:
+    """NodRow of a BoardObject, i.e. what BoardNodFile.save() would write."""
+    return (
+        obj.channel,
+        obj.component_name,
+        str(obj.pin),
+        obj.signal or f"S{obj.channel}",
+        getattr(obj, "x_coord_mm_original", obj.x_coord_mm),
+        getattr(obj, "y_coord_mm_original", obj.y_coord_mm),
+        _canonical_pad(
+            get_pad_code(
+                obj.shape_type,
+                mm_to_mils(obj.width_mm),
+                mm_to_mils(obj.height_mm),
+                mm_to_mils(obj.hole_mm or 0.0),
+                obj.angle_deg,
+            )
+        ),
+        POSITION_CODES.get(str(obj.test_position).lower(), "T"),
+        TECHNOLOGY_CODES.get(obj.technology, "S"),
+        TESTABILITY_CODES.get(obj.testability, "N"),
+    )
+
+
+def library_rows(object_library) -> Iterator[NodRow]:
+    """NodRows of the live board, read from a snapshot (safe off the GUI thread)."""
+    for obj in object_library.snapshot().values():
+        yield object_row(obj)
+
+
+class NodDiff:
+    """
+    Pad-level differences between two boards: ``changes[kind]`` lists
+    (old row, new row) pairs, old is None for ADDED and new for REMOVED.
+    Pads are paired by (component, pin) first and by channel second (a pad
+    paired only by channel is RENAMED). A pair can show up under several
+    kinds, e.g. MOVED and RESIZED.
+    """
+
+    def __init__(self, tolerance_mm: float = DEFAULT_TOLERANCE_MM):
+        self.tolerance_mm = tolerance_mm
+        self.changes: Dict[str, List[Tuple[Optional[NodRow], Optional[NodRow]]]] = {
+            kind: [] for kind in KINDS
+        }
+        self.unchanged = 0
+
+    def __bool__(self) -> bool:
+        return any(self.changes.values())
+
+    def counts(self) -> Dict[str, int]:
+        return {kind: len(pairs) for kind, pairs in self.changes.items()}
+
+    def _compare(self, old: NodRow, new: NodRow, renamed: bool) -> None:
+        changes = self.changes
+        before = sum(map(len, changes.values()))
+        if renamed:
+            changes[RENAMED].append((old, new))
+        if math.hypot(new[4] - old[4], new[5] - old[5]) > self.tolerance_mm:
+            changes[MOVED].append((old, new))
+        if new[6] != old[6]:
+            changes[RESIZED].append((old, new))
+        if new[3] != old[3]:
+            changes[RESIGNALLED].append((old, new))
+        if new[7:] != old[7:]:
+            changes[RETESTED].append((old, new))
+        if sum(map(len, changes.values())) == before:
+            self.unchanged += 1
+
+    def summary_rows(self) -> Iterator[Tuple[str, str, str, int, str]]:
+        """(kind, component, pin, channel, detail) for a summary table."""
+        for kind, pairs in self.changes.items():
+            for old, new in pairs:
+                row = new if new is not None else old
+                yield kind, row[1], row[2], row[0], _detail(kind, old, new)
+
+    def __repr__(self):
+        counts = ", ".join(f"{k}={n}" for k, n in self.counts().items() if n)
+        return f"NodDiff({counts or 'identical'}, unchanged={self.unchanged})"
+
+
+def _detail(kind: str, old: Optional[NodRow], new: Optional[NodRow]) -> str:
+    if kind == ADDED:
+        return f"at ({new[4]:.3f}, {new[5]:.3f})"
+    if kind == REMOVED:
+        return f"was at ({old[4]:.3f}, {old[5]:.3f})"
+    if kind == MOVED:
+        return f"{math.hypot(new[4] - old[4], new[5] - old[5]):.3f} mm"
+    if kind == RESIZED:
+        return f"{old[6]} -> {new[6]}"
+    if kind == RESIGNALLED:
+        return f"{old[3]} -> {new[3]}"
+    if kind == RETESTED:
+        return f"{' '.join(old[7:])} -> {' '.join(new[7:])}"
+    return f"{old[1]}.{old[2]} -> {new[1]}.{new[2]}"
+
+
+def diff_rows(
+    old_rows: Iterable[NodRow],
+    new_rows: Iterable[NodRow],
+    tolerance_mm: float = DEFAULT_TOLERANCE_MM,
+) -> NodDiff:
+    """
+    Diff two pad streams in one pass over each: *old_rows* are indexed,
+    *new_rows* are streamed against the index. Positions within
+    *tolerance_mm* count as unchanged.
+    """
+    by_key: Dict[Tuple[str, str], NodRow] = {}
+    by_channel: Dict[int, NodRow] = {}
+    for row in old_rows:
+        by_channel[row[0]] = row
+        by_key.setdefault((row[1], row[2]), row)
+
+    diff = NodDiff(tolerance_mm)
+    used = set()
+    unpaired = []
+    for row in new_rows:
+        old = by_key.pop((row[1], row[2]), None)
+        if old is None:
+            unpaired.append(row)
+            continue
+        used.add(old[0])
+        if old != row:
+            diff._compare(old, row, False)
+        else:
+            diff.unchanged += 1
+
+    added = diff.changes[ADDED]
+    for row in unpaired:
+        old = by_channel.get(row[0])
+        if old is None or old[0] in used:
+            added.append((None, row))
+        else:
+            used.add(old[0])
+            diff._compare(old, row, True)
+
+    diff.changes[REMOVED] = [
+        (row, None) for ch, row in by_channel.items() if ch not in used
+    ]
+    return diff
+
+
+def diff_library_against_nod(
+    object_library, nod_path: str, tolerance_mm: float = DEFAULT_TOLERANCE_MM
+) -> NodDiff:
+    """What changed on the live board since *nod_path* (a backup or any .nod)."""
+    return diff_rows(read_nod_rows(nod_path), library_rows(object_library), tolerance_mm)
+
+
+def diff_nod_files(
+    old_path: str, new_path: str, tolerance_mm: float = DEFAULT_TOLERANCE_MM
+) -> NodDiff:
+    """
+    Diff two .nod files. Lines present verbatim in both are unchanged pads
+    and are never parsed, so the cost is in the lines that differ.
+    """
+    old_lines, new_lines = _read_lines(old_path), _read_lines(new_path)
+    common = old_lines.keys() & new_lines.keys()
+    diff = diff_rows(
+        _rows(line for line in old_lines if line not in common),
+        _rows(line for line in new_lines if line not in common),
+        tolerance_mm,
+    )
+    diff.unchanged += sum(1 for line in common if line and line[0] != "*")
+    return diff
@@ -2,15 +2,25 @@
 
 import re
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from objects.board_object import BoardObject
 from objects.object_library import ObjectLibrary
 from logs.log_handler import LogHandler
-from io import StringIO
 from utils.file_ops import safe_write, rotate_backups
 
 # Helper functions are included here for parsing and formatting
 
+# Single-letter NOD codes of the POS, TECN and TEST columns
+POSITION_CODES = {"top": "T", "bottom": "B", "both": "O"}
+TECHNOLOGY_CODES = {"SMD": "S", "Through Hole": "T", "Mechanical": "M"}
+TESTABILITY_CODES = {
+    "Forced": "F",
+    "Testable": "Y",
+    "Not Testable": "N",
+    "Terminal": "T",
+    "Testable Alternative": "A",
+}
+
 
 def parse_component_nod_file(nod_file_path):
     """
@@ -277,21 +287,11 @@ def obj_to_nod_line(obj: dict, logger: Optional[LogHandler] = None) -> str:
     )
 
     # Map test position (case–insensitive)
-    test_position_lower = obj["test_position"].lower()
-    pos_map = {"top": "T", "bottom": "B", "both": "O"}
-    pos = pos_map.get(test_position_lower, "T")
+    pos = POSITION_CODES.get(obj["test_position"].lower(), "T")
 
     # Map technology and testability.
-    tecn = {"SMD": "S", "Through Hole": "T", "Mechanical": "M"}.get(
-        obj["technology"], "S"
-    )
-    test = {
-        "Forced": "F",
-        "Testable": "Y",
-        "Not Testable": "N",
-        "Terminal": "T",
-        "Testable Alternative": "A",
-    }.get(obj["testability"], "N")
+    tecn = TECHNOLOGY_CODES.get(obj["technology"], "S")
+    test = TESTABILITY_CODES.get(obj["testability"], "N")
 
     # Construct and return the line.
     return f"\"{signal}\" \"{component_name}\" {pin} {x_mm:.3f} {y_mm:.3f} {pad} {pos} {tecn} {test} {obj['channel']}"
@@ -359,26 +359,27 @@ class BoardNodFile:
     def __init__(self, nod_path: str, object_library: Optional[ObjectLibrary] = None):
         self.nod_path = nod_path
         self.object_library = object_library if object_library else ObjectLibrary()
-        self.log = LogHandler(output="both")
+        # Log through the library's handler (per board under a BoardContext)
+        self.log = getattr(self.object_library, "log", None) or LogHandler(output="both")
         self.changed = False
+        # channel -> (pad version, NOD line) of the last save; a line is
+        # re-serialized only when the library has stored a new pad there
+        self._line_cache: Dict[int, Tuple[int, str]] = {}
         # Remove auto-save counters and thresholds completely:
         # self.change_counter = 0
         # self.auto_save_threshold = auto_save_threshold
-        self.next_channel = 1  # Starting channel number set to 1
         self.log.log("debug", f"NOD file writer initialized with path: {self.nod_path}")
 
+    @property
+    def next_channel(self) -> int:
+        """The channel the ObjectLibrary allocator will hand out next."""
+        return self.object_library.channels.peek()
+
     def add_object(self, board_obj: BoardObject):
         """
         Add a single BoardObject in an undoable way.
         """
-        # If channel is unassigned, let ObjectLibrary do it
-        if board_obj.channel is None:
-            board_obj.channel = self.object_library.get_next_channel()
-        else:
-            # Also keep track in self.next_channel
-            self.next_channel = max(self.next_channel, board_obj.channel + 1)
-
-        # Now add to the library
+        # Channel assignment (None or clashing channels) is done by ObjectLibrary
         added = self.object_library.add_object(board_obj)
         if added:
             self.changed = True
@@ -404,12 +405,7 @@ class BoardNodFile:
         Adds multiple BoardObjects to the library in one shot.
         If skip_undo=True, we do NOT push a new state for this batch addition.
         """
-        for obj in objects_list:
-            if obj.channel is None:
-                obj.channel = self.object_library.get_next_channel()
-            else:
-                self.next_channel = max(self.next_channel, obj.channel + 1)
-
+        # ObjectLibrary.bulk_add gives unassigned objects one contiguous channel block.
         # Pass skip_undo to ObjectLibrary.bulk_add
         self.object_library.bulk_add(objects_list, skip_undo=skip_undo)
         self.changed = True
@@ -438,7 +434,7 @@ class BoardNodFile:
             )
 
     def remove_objects_batch(self, objects_to_remove: List[BoardObject]):
-        """Remove multiple BoardObjects WITHOUT pushing a new state (since done externally)."""
+        """Remove multiple BoardObjects in one bulk delete (merged into an open ObjectLibrary transaction)."""
         channels_to_remove = [
             obj.channel for obj in objects_to_remove if obj.channel is not None
         ]
@@ -448,30 +444,13 @@ class BoardNodFile:
             )
             return
 
+        # One bulk delete -> one undo entry and one partial re-render.
+        # No automatic save; a manual save is required if needed.
         self.object_library.bulk_delete(channels_to_remove)
         self.changed = True
         self.log.log(
             "debug", f"remove_objects_batch: Removed {len(channels_to_remove)} objects."
         )
-        # Removed automatic save after deletion.
-        self.log.log(
-            "debug",
-            "remove_objects_batch: Removed objects; manual save is required if needed.",
-        )
-
-        # Remove objects in bulk using ObjectLibrary
-        self.object_library.bulk_delete(channels_to_remove)
-        self.changed = True
-        self.change_counter += len(channels_to_remove)
-        self.log.log(
-            "debug", f"remove_objects_batch: Removed {len(channels_to_remove)} objects."
-        )
-
-        # Save changes immediately after bulk removal
-        self.save()
-        self.log.log(
-            "debug", "remove_objects_batch: Removed objects and saved NOD file."
-        )
 
     def load(self, skip_undo: bool = False):
         """
@@ -514,44 +493,68 @@ class BoardNodFile:
         # Add all loaded objects in one batch, skipping undo if skip_undo=True
         self.add_objects_batch(loaded_objects, skip_undo=skip_undo)
 
-        # Ensure ObjectLibrary's next_channel is at least one higher than any loaded channel
+        # Rebuild the channel allocator from the loaded channels and net names
         self.object_library.refresh_channel_counter()
 
-        if loaded_objects:
-            highest_loaded = max(obj.channel for obj in loaded_objects)
-            self.next_channel = max(self.next_channel, highest_loaded + 1)
-        else:
-            self.next_channel = 1
-
         self.log.log(
             "info",
             f"Loaded {len(loaded_objects)} objects from NOD file. Next channel set to {self.next_channel}.",
         )
 
     def _build_payload(self) -> str:
+        """Return the complete .nod file as a single string."""
+        return "".join(self.iter_lines())
+
+    def iter_lines(self):
         """
-        Return the complete .nod file as a single string.
-        Converts each BoardObject to a dict, then through obj_to_nod_line().
+        Yield the .nod file line by line: the header, every BoardObject
+        (converted to a dict, then through obj_to_nod_line()) and, when the
+        library has a panel, the pads of every board copy, generated one at
+        a time from the master pads.
+
+        Reads a library snapshot when available, so the file is consistent
+        even if the board is edited while it is being written (e.g. a save
+        on a worker thread), and reuses the lines of unchanged pads.
         """
-        buf = StringIO()
-        buf.write("* SIGNAL COMPONENT PIN X Y PAD POS TECN TEST CHANNEL USER\n")
+        yield "* SIGNAL COMPONENT PIN X Y PAD POS TECN TEST CHANNEL USER\n"
 
-        for obj in self.object_library.get_all_objects():
-            # BoardObject → dict (assumes the class has .to_dict())
-            d = obj.to_dict()
+        snapshot = None
+        if hasattr(self.object_library, "snapshot"):
+            snapshot = self.object_library.snapshot()
+            objects, panel = snapshot, snapshot.panel
+        else:
+            objects = self.object_library.objects
+            panel = getattr(self.object_library, "panel", None)
+
+        cache = self._line_cache
+        fresh: Dict[int, Tuple[int, str]] = {}
+        for channel, obj in objects.items():
+            pad_version = snapshot.pad_version(channel) if snapshot is not None else None
+            cached = cache.get(channel)
+            if pad_version is not None and cached is not None and cached[0] == pad_version:
+                line = cached[1]
+            else:
+                line = self._nod_line(obj)
+            if pad_version is not None:
+                fresh[channel] = (pad_version, line)
+            yield line
+        self._line_cache = fresh
 
-            # Ensure original coords & hole are present; fall back if missing
-            d["x_coord_mm"] = getattr(
-                obj, "x_coord_mm_original", d.get("x_coord_mm", 0.0)
-            )
-            d["y_coord_mm"] = getattr(
-                obj, "y_coord_mm_original", d.get("y_coord_mm", 0.0)
-            )
-            d["hole_mm"] = getattr(obj, "hole_mm", 0.0)
+        if panel is not None:
+            for d in panel.iter_expanded(objects):
+                yield obj_to_nod_line(d) + "\n"
+
+    @staticmethod
+    def _nod_line(obj: BoardObject) -> str:
+        # BoardObject → dict (assumes the class has .to_dict())
+        d = obj.to_dict()
 
-            buf.write(obj_to_nod_line(d) + "\n")
+        # Ensure original coords & hole are present; fall back if missing
+        d["x_coord_mm"] = getattr(obj, "x_coord_mm_original", d.get("x_coord_mm", 0.0))
+        d["y_coord_mm"] = getattr(obj, "y_coord_mm_original", d.get("y_coord_mm", 0.0))
+        d["hole_mm"] = getattr(obj, "hole_mm", 0.0)
 
-        return buf.getvalue()
+        return obj_to_nod_line(d) + "\n"
 
     def save(self, backup: bool = False, logger=None, fixed_ts: str | None = None):
         """
@@ -561,10 +564,10 @@ class BoardNodFile:
         """
         log = logger or self.log
         try:
-            payload = self._build_payload()
             if backup:
                 rotate_backups(self.nod_path, fixed_ts=fixed_ts)
-            if not safe_write(self.nod_path, payload):
+            # Streamed: panel copies are expanded while the file is written
+            if not safe_write(self.nod_path, self.iter_lines()):
                 raise RuntimeError("safe_write failed")
             self.changed = False
             log.log(
@@ -583,18 +586,12 @@ class BoardNodFile:
         :param updates: List of BoardObjects to be updated.
         :param changes: Dictionary specifying the changes to apply (e.g., {"test_position": "Top"}).
         """
-        self.object_library.undo_redo_manager.push_state()
-
         for obj in updates:
-            for key, value in changes.items():
-                if hasattr(obj, key):
-                    setattr(obj, key, value)
-                    self.log.log(
-                        "debug",
-                        f"Updated {key} for {obj.component_name}, Pin: {obj.pin} to {value}",
-                    )
-                else:
+            for key in changes:
+                if not hasattr(obj, key):
                     self.log.log("warning", f"{key} is not a valid attribute for {obj}")
+        # Through the library: indexes, pad versions and display stay in step
+        self.object_library.bulk_update_objects(updates, changes)
 
         self.changed = True
         # Removed auto-save call; manual save is now required.
@@ -1,12 +1,91 @@
 # objects/object_library.py
 
-from typing import List, Dict, Optional
+import copy
+import itertools
+import re
+from contextlib import contextmanager, nullcontext
+from typing import Iterable, List, Dict, Optional, Set
 from PyQt5.QtCore import QObject, pyqtSignal, QMutex, QMutexLocker
 from objects.board_object import BoardObject
 from logs.log_handler import LogHandler
 from objects.undo_redo_manager import UndoRedoManager
+from objects.channel_allocator import ChannelAllocator
+from objects.net_index import NetIndex
+from objects.component_bounds import ComponentBounds
+from objects.component_registry import ComponentRegistry
+from objects.library_snapshot import LibrarySnapshot
 from utils.flag_manager import FlagManager
 
+_CHANNEL_SIGNAL_RE = re.compile(r"^S(\d+)$")
+
+
+def signal_channel(signal) -> Optional[int]:
+    """Return k for a default net name 'S<k>', else None."""
+    if type(signal) is str:
+        # Called for every pad on a load: plain string checks before the regex
+        if signal[:1] != "S" or not signal[1:].isdecimal():
+            return None
+        return int(signal[1:])
+    m = _CHANNEL_SIGNAL_RE.match(str(signal or ""))
+    return int(m.group(1)) if m else None
+
+
+def library_transaction(object_library, label: str):
+    """
+    Returns ``object_library.transaction(label)`` so that an edit results in
+    one undo entry and one partial re-render. Falls back to a no-op context
+    for library stand-ins that do not implement transactions.
+    """
+    if hasattr(object_library, "transaction"):
+        return object_library.transaction(label)
+    return nullcontext()
+
+
+class _Transaction:
+    """
+    Book-keeping for an open ObjectLibrary.transaction().
+
+    Only channels are staged; the rendered state is rebuilt from the live
+    ``objects`` dict when the transaction is committed, so repeated edits to
+    the same pad collapse into a single display update.
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.added: Set[int] = set()
+        self.updated: Set[int] = set()
+        self.removed: Set[int] = set()
+        self.undo_pushed = False
+        self.snapshot = None  # undo entry holding the pre-transaction state
+        self.pushed_entry = False  # True if the snapshot is our own undo entry
+        self.changed = False
+
+    def stage_added(self, channels):
+        for ch in channels:
+            if ch in self.removed:
+                # removed then re-added inside the same transaction
+                self.removed.discard(ch)
+                self.updated.add(ch)
+            else:
+                self.added.add(ch)
+        self.changed = True
+
+    def stage_updated(self, channels):
+        for ch in channels:
+            if ch not in self.added:
+                self.updated.add(ch)
+        self.changed = True
+
+    def stage_removed(self, channels):
+        for ch in channels:
+            if ch in self.added:
+                # never rendered, nothing to remove from the scene
+                self.added.discard(ch)
+            else:
+                self.updated.discard(ch)
+                self.removed.add(ch)
+        self.changed = True
+
 
 class ObjectLibrary(QObject):
     object_added = pyqtSignal(BoardObject)
@@ -14,18 +93,21 @@ class ObjectLibrary(QObject):
     object_updated = pyqtSignal(BoardObject)
     bulk_operation_completed = pyqtSignal(str)
 
-    _instance = None  # Singleton instance
+    _instance = None  # Default instance
 
-    def __new__(cls, *args, **kwargs):
+    def __new__(cls, *args, shared: bool = True, **kwargs):
         """
-        Implements the Singleton pattern.
-        Ensures only one instance of ObjectLibrary is created.
+        ObjectLibrary() returns the process-wide default instance (what the
+        single-board UI uses); ObjectLibrary(shared=False) builds an
+        independent library, e.g. one per BoardContext.
         """
+        if not shared:
+            return super(ObjectLibrary, cls).__new__(cls)
         if not cls._instance:
             cls._instance = super(ObjectLibrary, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, shared: bool = True, log=None, constants=None, flags=None):
         super().__init__()
 
         # Check if already initialized
@@ -34,18 +116,46 @@ class ObjectLibrary(QObject):
 
         # Initialize the object
         self.objects: Dict[int, BoardObject] = {}
-        self.log = LogHandler()
-        self.log.log("debug", f"ObjectLibrary initialized. Singleton id={id(self)}")
+        self.log = log if log is not None else LogHandler()
+        self.flags = flags if flags is not None else FlagManager()
+        self.log.log(
+            "debug", f"ObjectLibrary initialized (shared={shared}) id={id(self)}"
+        )
 
         # Initialize mutex for thread safety
         self._mutex = QMutex()
 
         # Initialize UndoRedoManager
-        self.undo_redo_manager = UndoRedoManager(self)
+        self.undo_redo_manager = UndoRedoManager(self, constants=constants, log=self.log)
         self.log.log("debug", "UndoRedoManager initialized within ObjectLibrary.")
 
-        # A simple counter to generate unique channel IDs
-        self._next_channel_id = 1
+        # Channel allocator (free-list bitmap). A channel stays occupied while a
+        # pad uses it or while some pad's signal is named S<channel>.
+        self.channels = ChannelAllocator()
+        self._signal_holds: Dict[int, int] = {}  # channel -> k held for 'S<k>'
+        self._reserved_channels: Set[int] = set()  # handed out, not yet added
+
+        # Connectivity: signal -> channels, maintained on every store/remove
+        self.nets = NetIndex()
+        # Per-component, per-side bounding boxes (digitation overlay, lookups)
+        self.component_bounds = ComponentBounds()
+        # Component name -> pad count (BOM mismatch tracking subscribes to it)
+        self.components = ComponentRegistry()
+        # Bumped on every store/remove; lets derived caches detect changes
+        self.revision = 0
+        # channel -> revision at which that pad was last stored
+        self._versions: Dict[int, int] = {}
+        # The objects dict handed to snapshots; copied before the next write
+        self._shared_objects: Optional[Dict[int, BoardObject]] = None
+        # Revision of the last snapshot: pads stored at or before it may be
+        # held by a snapshot and are replaced, not edited in place
+        self._pinned_revision = -1
+        # Step-and-repeat copies of the board (objects.panel.Panel), or None.
+        # Their channel blocks stay occupied in the allocator.
+        self.panel = None
+
+        # Open transaction (see transaction()); None when not batching
+        self._txn: Optional[_Transaction] = None
 
         # --- Auto-save state removed ---
         # self.change_counter = 0
@@ -53,51 +163,479 @@ class ObjectLibrary(QObject):
 
         self._initialized = True
 
+    # ------------------------------------------------------------------
+    #  Channel allocation
+    # ------------------------------------------------------------------
     def get_next_channel(self) -> int:
         """
-        Retrieves a new unique channel ID and increments the internal counter.
-        Logs the current counter for debugging collisions.
+        Reserves and returns the lowest free channel. The reservation is
+        consumed when an object with that channel is added; a channel that
+        ends up unused must be given back with release_channels().
         """
-        self.log.log(
-            "debug",
-            f"get_next_channel() called. Current _next_channel_id = {self._next_channel_id}",
-        )
-        ch = self._next_channel_id
-        self._next_channel_id += 1
+        ch = self.channels.allocate()
+        self._reserved_channels.add(ch)
         return ch
 
+    def get_channel_block(self, count: int) -> List[int]:
+        """
+        Reserves *count* contiguous channels (e.g. for a whole footprint).
+        Unused ones are given back with release_channels().
+        """
+        block = self.channels.allocate_block(count)
+        self._reserved_channels.update(block)
+        return block
+
+    def release_channels(self, channels: Iterable[int]) -> None:
+        """
+        Frees reserved channels that were not used (e.g. a cancelled
+        placement). Channels already taken by an added object are ignored.
+        A load, undo or redo drops all reservations anyway.
+        """
+        for ch in channels:
+            if ch in self._reserved_channels:
+                self._reserved_channels.discard(ch)
+                self.channels.release(ch)
+
+    @property
+    def _next_channel_id(self) -> int:
+        """Legacy view of the allocator: the channel that would be handed out next."""
+        return self.channels.peek()
+
+    @_next_channel_id.setter
+    def _next_channel_id(self, _value: int) -> None:
+        # Legacy code reset the counter after touching ``objects`` directly;
+        # resynchronise the allocator with the current objects instead.
+        self._resync_channels()
+
     def refresh_channel_counter(self):
         """
-        Ensures _next_channel_id is at least one higher than any channel currently stored in self.objects.
+        Rebuilds the channel allocator from the channels (and S<k> signal
+        names) currently stored in self.objects.
         Call this after loading objects from a .nod file.
         """
         with QMutexLocker(self._mutex):
-            if self.objects:
-                highest_channel = max(self.objects.keys())
-                if highest_channel >= self._next_channel_id:
-                    self._next_channel_id = highest_channel + 1
-                self.log.log(
-                    "debug",
-                    f"refresh_channel_counter: highest_channel={highest_channel}, "
-                    f"next_channel_id set to {self._next_channel_id}",
-                )
+            self._resync_channels()
+        self.log.log(
+            "debug",
+            f"refresh_channel_counter: {len(self.objects)} objects, "
+            f"next free channel {self.channels.peek()}",
+        )
+
+    def _resync_channels(self) -> None:
+        """O(n) rebuild of the allocator and net index from ``objects``."""
+        holds = {}
+        for ch, obj in self.objects.items():
+            k = signal_channel(obj.signal)
+            if k is not None:
+                holds[ch] = k
+        self._signal_holds = holds
+        self._reserved_channels = set()
+        # The panel holds its master channels too: a new pad on the channel of
+        # a deleted master pad would otherwise be copied onto every board
+        panel = self.panel
+        panel_channels = (
+            itertools.chain(panel.master_channels, panel.instance_channels())
+            if panel
+            else ()
+        )
+        self.channels.reset(
+            itertools.chain(self.objects.keys(), holds.values(), panel_channels)
+        )
+        self.nets.rebuild(self.objects.values())
+        self.component_bounds.rebuild(self.objects.values())
+        self.components.rebuild(self.objects.values())
+        self.revision += 1
+        self._versions = dict.fromkeys(self.objects, self.revision)
+        if self._pinned_revision >= 0:
+            # Old and new pads can no longer be told apart: treat all as held
+            self._pinned_revision = self.revision
+
+    def _claim_channels(self, objs: List[BoardObject]) -> None:
+        """
+        Give every object in *objs* a free channel: explicit, unused channels
+        are kept, the rest get one contiguous block from the allocator.
+        """
+        needs_channel = []
+        kept = set()
+        for obj in objs:
+            ch = obj.channel
+            if ch is None or ch in self.objects or ch in kept:
+                needs_channel.append(obj)
+                continue
+            kept.add(ch)
+            if ch in self._reserved_channels:
+                self._reserved_channels.discard(ch)
             else:
-                self.log.log(
-                    "debug", "refresh_channel_counter called, but no objects exist yet."
-                )
+                self.channels.acquire(ch)
+        if not needs_channel:
+            return
+        block = self.channels.allocate_block(len(needs_channel))
+        if any(ch in self.objects or ch in kept for ch in block):
+            # objects was modified without going through the library
+            self._resync_channels()
+            for ch in kept:
+                self.channels.acquire(ch)
+            block = self.channels.allocate_block(len(needs_channel))
+        for obj, ch in zip(needs_channel, block):
+            obj.channel = ch
+
+    def _hold_signal(self, obj: BoardObject) -> None:
+        """Keep channel k occupied while *obj* uses the net name 'S<k>'."""
+        k = signal_channel(obj.signal)
+        old = self._signal_holds.get(obj.channel)
+        if k == old:
+            return
+        if old is not None:
+            self.channels.release(old)
+        if k is None:
+            self._signal_holds.pop(obj.channel, None)
+        else:
+            self.channels.acquire(k)
+            self._signal_holds[obj.channel] = k
+
+    def _track_object(self, obj: BoardObject) -> None:
+        """Book-keeping after *obj* was stored in ``objects``."""
+        self._writable()
+        self._hold_signal(obj)
+        self.nets.track(obj)
+        self.component_bounds.track(obj)
+        self.components.track(obj)
+        self.revision += 1
+        self._versions[obj.channel] = self.revision
+
+    def _untrack_channel(self, channel: int) -> None:
+        """Book-keeping after the object on *channel* left ``objects``."""
+        self.channels.release(channel)
+        held = self._signal_holds.pop(channel, None)
+        if held is not None:
+            self.channels.release(held)
+        self.nets.discard(channel)
+        self.component_bounds.discard(channel)
+        self.components.discard(channel)
+        self.revision += 1
+        self._versions.pop(channel, None)
+
+    def set_panel(self, panel) -> None:
+        """
+        Install (or with None remove) the step-and-repeat panel. Copies keep
+        the channel blocks stored in ``panel.channel_bases`` when those are
+        free; otherwise every copy gets a new contiguous block. Pads still in
+        ``objects`` on a copy's channels (a NOD written with the panel
+        expanded) are dropped, as the panel regenerates them. Not undoable.
+        """
+        with QMutexLocker(self._mutex):
+            self._writable()
+            self.panel = None
+            if panel is not None:
+                master = set(panel.master_channels)
+                stale = [
+                    ch for ch in panel.instance_channels()
+                    if ch in self.objects and ch not in master
+                ]
+                for ch in stale:
+                    self.objects.pop(ch)
+                self._render_removed(stale)
+                self._resync_channels()
+                self._place_panel(panel)
+                self.panel = panel
+            self._resync_channels()
+
+            display_library = getattr(self, "display_library", None)
+            if display_library:
+                display_library.refresh_panel()
+            self.log.log(
+                "info",
+                f"set_panel: {panel.board_count if panel else 1} board(s) on the panel.",
+            )
+        self._emit_bulk_completed("Panel")
+
+    def _place_panel(self, panel) -> None:
+        """Give every copy of *panel* a free block of ``block_size`` channels."""
+        size = panel.block_size
+        bases = panel.channel_bases
+        free = len(bases) == len(panel.steps) and not any(
+            ch in self.channels for ch in panel.instance_channels()
+        )
+        if not free:
+            bases = []
+            for _ in panel.steps:
+                block = self.channels.allocate_block(size)
+                bases.append(block[0] if block else self.channels.peek())
+        panel.channel_bases = bases
+
+    def pads_in_net(self, signal: str) -> List[BoardObject]:
+        """The BoardObjects using *signal*, in channel order (O(k))."""
+        objects = self.objects
+        return [objects[ch] for ch in sorted(self.nets.pads_in_net(signal)) if ch in objects]
+
+    def compact_channels(self) -> Dict[int, int]:
+        """
+        Renumbers the board into the dense range 1..n (keeping the current
+        order) and renames default nets 'S<old>' to 'S<new>' to match, as one
+        undoable step. Nets still named after a channel that no longer exists
+        are moved just above the dense range so they cannot merge with a
+        renumbered pad. Returns the {old: new} mapping of the moved pads.
+        Not available while a panel is installed: undo does not restore the
+        panel, so its master channels must not move.
+        """
+        if self.panel is not None:
+            self.log.log("warning", "compact_channels: remove the panel first.")
+            return {}
+        with self.transaction("Compact Channels"):
+            with QMutexLocker(self._mutex):
+                # Ascending order straight from the bitmap: O(max channel)
+                live = [ch for ch in self.channels.used_channels() if ch in self.objects]
+                mapping = {old: new for new, old in enumerate(live, start=1) if old != new}
+
+                # Orphan default nets: S<k> with no pad on channel k
+                orphan_map = {}
+                next_free = len(live) + 1
+                for k in sorted(set(self._signal_holds.values())):
+                    if k not in self.objects:
+                        orphan_map[k] = next_free
+                        next_free += 1
+                if not mapping and all(k == v for k, v in orphan_map.items()):
+                    return {}
+
+                self._push_undo()
+                net_map = {old: mapping.get(old, old) for old in live}
+                net_map.update(orphan_map)
+
+                moved = []
+                renamed = []
+                new_objects: Dict[int, BoardObject] = {}
+                for old, obj in self.objects.items():
+                    new = mapping.get(old, old)
+                    k = signal_channel(obj.signal)
+                    renumber = k is not None and net_map.get(k, k) != k
+                    if new != old or renumber:
+                        obj = self._own(obj)
+                    if new != old:
+                        obj.channel = new
+                        moved.append(obj)
+                    if renumber:
+                        obj.signal = f"S{net_map[k]}"
+                        if new == old:
+                            renamed.append(obj)
+                    new_objects[new] = obj
+                self.objects = new_objects
+                self._resync_channels()
+
+                self._render_removed(list(mapping.keys()))
+                self._render_added(moved)
+                self._render_updated(renamed)
 
-    def add_object(self, board_object: BoardObject) -> bool:
+            self.log.log(
+                "info",
+                f"compact_channels: renumbered {len(mapping)} pads, "
+                f"{len(self.objects)} channels now dense.",
+            )
+        return mapping
+
+    # ------------------------------------------------------------------
+    #  Snapshots (copy-on-write)
+    # ------------------------------------------------------------------
+    def snapshot(self) -> LibrarySnapshot:
+        """
+        O(1) read-only view of the current pads for background readers
+        (saving, DRC, exports, reports). It stays consistent while the
+        library keeps changing and is read without the mutex; compare
+        ``snapshot.version`` with ``revision`` to see whether it is stale.
+        """
+        with QMutexLocker(self._mutex):
+            self._shared_objects = self.objects
+            self._pinned_revision = self.revision
+            return LibrarySnapshot(self.objects, self._versions, self.revision, self.panel)
+
+    def _writable(self) -> None:
+        """Un-share the pad and version dicts before the first write after a snapshot."""
+        if self._shared_objects is not None:
+            if self.objects is self._shared_objects:
+                self.objects = dict(self.objects)
+            self._versions = dict(self._versions)
+            self._shared_objects = None
+
+    def _own(self, obj: BoardObject) -> BoardObject:
+        """*obj* if it may be edited in place, else a copy (a snapshot may hold it)."""
+        if self._versions.get(obj.channel, self._pinned_revision + 1) > self._pinned_revision:
+            return obj
+        return copy.copy(obj)
+
+    # ------------------------------------------------------------------
+    #  Transactions
+    # ------------------------------------------------------------------
+    @contextmanager
+    def transaction(self, label: str = "Transaction"):
+        """
+        Group several mutations into one undoable, one-render operation::
+
+            with object_library.transaction("Paste 400 pads"):
+                object_library.bulk_delete(old_channels)
+                object_library.bulk_add(new_pads)
+
+        While the transaction is open every mutating call (add/remove/update,
+        bulk_* and modify_objects) only stages its changes:
+          - a single undo state (objects + BOM) is pushed on the first mutation,
+          - per-object signals and DisplayLibrary calls are suppressed,
+          - ``bulk_operation_completed`` is not emitted.
+        On exit the staged channels are sent to the DisplayLibrary as one batch
+        of partial updates and ``bulk_operation_completed(label)`` is emitted
+        once. Nested transactions merge into the outermost one.
+        If the block raises, the library (and BOM) is restored to its
+        pre-transaction state and the exception is propagated.
+        """
+        if self._txn is not None:
+            # Nested: everything is merged into the outer transaction
+            yield self
+            return
+
+        txn = _Transaction(label)
+        self._txn = txn
+        try:
+            yield self
+        except BaseException:
+            self._txn = None
+            self._rollback_transaction(txn)
+            raise
+        self._txn = None
+        self._commit_transaction(txn)
+
+    def in_transaction(self) -> bool:
+        """True while a transaction() block is open."""
+        return self._txn is not None
+
+    def checkpoint(self) -> None:
+        """
+        Record the current state for undo ahead of an edit that does not go
+        through the pad API (e.g. a BOM change). Inside a transaction this is
+        the transaction's single undo entry and later calls are no-ops.
+        """
         with QMutexLocker(self._mutex):
+            self._push_undo()
+
+    def _push_undo(self) -> None:
+        """
+        Push an undo state for a mutation. Inside a transaction only the first
+        mutation pushes, and the BOM is captured too so that the whole
+        transaction undoes in one step.
+        """
+        txn = self._txn
+        if txn is None:
             self.undo_redo_manager.push_state()
+            return
+        if txn.undo_pushed:
+            return
+
+        extra_state = None
+        bom_handler = getattr(self, "bom_handler", None)
+        if bom_handler is not None:
+            extra_state = {"bom": copy.deepcopy(bom_handler.bom)}
+
+        stack = self.undo_redo_manager.undo_stack
+        top_before = stack[-1] if stack else None
+        self.undo_redo_manager.push_state(extra_state)
+        txn.undo_pushed = True
+        txn.snapshot = stack[-1] if stack else None
+        txn.pushed_entry = txn.snapshot is not None and txn.snapshot is not top_before
 
-            # If channel is None OR already in use, assign a new unique channel
-            if board_object.channel is None or board_object.channel in self.objects:
-                assigned_channel = self.get_next_channel()
+    def _render_added(self, objs: List[BoardObject]) -> None:
+        if not objs:
+            return
+        if self._txn is not None:
+            self._txn.stage_added(obj.channel for obj in objs)
+            return
+        display_library = getattr(self, "display_library", None)
+        if display_library:
+            display_library.add_rendered_objects(objs)
+
+    def _render_updated(self, objs: List[BoardObject]) -> None:
+        if not objs:
+            return
+        if self._txn is not None:
+            self._txn.stage_updated(obj.channel for obj in objs)
+            return
+        display_library = getattr(self, "display_library", None)
+        if display_library:
+            display_library.update_rendered_objects_for_updates(objs)
+
+    def _render_removed(self, channels: List[int]) -> None:
+        if not channels:
+            return
+        if self._txn is not None:
+            self._txn.stage_removed(channels)
+            return
+        display_library = getattr(self, "display_library", None)
+        if display_library:
+            display_library.remove_rendered_objects(channels)
+
+    def _emit_bulk_completed(self, operation: str) -> None:
+        """Emit bulk_operation_completed unless a transaction will do it."""
+        if self._txn is not None:
+            self._txn.changed = True
+            return
+        self.bulk_operation_completed.emit(operation)
+
+    def _commit_transaction(self, txn: _Transaction) -> None:
+        """Flush the staged channels to the display and notify listeners once."""
+        if not txn.changed:
+            return
+
+        display_library = getattr(self, "display_library", None)
+        if display_library:
+            if txn.removed:
+                display_library.remove_rendered_objects(sorted(txn.removed))
+            updated = [self.objects[ch] for ch in txn.updated if ch in self.objects]
+            if updated:
+                display_library.update_rendered_objects_for_updates(updated)
+            added = [self.objects[ch] for ch in txn.added if ch in self.objects]
+            if added:
+                display_library.add_rendered_objects(added)
+
+        self.log.log(
+            "info",
+            f"transaction '{txn.label}': added={len(txn.added)}, "
+            f"updated={len(txn.updated)}, removed={len(txn.removed)}",
+            module="ObjectLibrary",
+            func="transaction",
+        )
+        self.bulk_operation_completed.emit(txn.label)
+
+    def _rollback_transaction(self, txn: _Transaction) -> None:
+        """
+        Restore the pre-transaction state. Nothing staged has reached the
+        scene yet, so only the data needs to be put back.
+        """
+        if not txn.undo_pushed or txn.snapshot is None:
+            return
+        with QMutexLocker(self._mutex):
+            self.objects = copy.deepcopy(txn.snapshot["objects"])
+            bom_handler = getattr(self, "bom_handler", None)
+            if bom_handler is not None and "bom" in txn.snapshot:
+                bom_handler.bom = copy.deepcopy(txn.snapshot["bom"])
+            self._resync_channels()
+            stack = self.undo_redo_manager.undo_stack
+            if txn.pushed_entry and stack and stack[-1] is txn.snapshot:
+                stack.pop()
+        self.log.log(
+            "warning",
+            f"transaction '{txn.label}' failed; changes rolled back.",
+            module="ObjectLibrary",
+            func="transaction",
+        )
+
+    def add_object(self, board_object: BoardObject) -> bool:
+        with QMutexLocker(self._mutex):
+            self._writable()
+            self._push_undo()
+
+            # If channel is None OR already in use, assign a free channel
+            requested = board_object.channel
+            self._claim_channels([board_object])
+            if board_object.channel != requested:
                 self.log.log(
                     "debug",
-                    f"add_object: Reassigning channel from {board_object.channel} to {assigned_channel}.",
+                    f"add_object: Reassigning channel from {requested} to {board_object.channel}.",
                 )
-                board_object.channel = assigned_channel
 
             # Ensure the signal name matches the assigned channel if the
             # incoming signal is missing or a library placeholder (e.g.
@@ -111,6 +649,7 @@ class ObjectLibrary(QObject):
 
             # Store the object
             self.objects[board_object.channel] = board_object
+            self._track_object(board_object)
 
             self.log.log(
                 "debug",
@@ -118,6 +657,9 @@ class ObjectLibrary(QObject):
                 f"Channel: {board_object.channel}, "
                 f"Test Position: {board_object.test_position}",
             )
+            if self._txn is not None:
+                self._render_added([board_object])
+                return True
             self.log.log(
                 "debug",
                 f"Emitting object_added signal for Channel {board_object.channel}",
@@ -127,17 +669,22 @@ class ObjectLibrary(QObject):
 
     def remove_object(self, channel: int) -> bool:
         with QMutexLocker(self._mutex):
-            self.undo_redo_manager.push_state()
+            self._writable()
+            self._push_undo()
             if channel not in self.objects:
                 self.log.log("warning", f"Channel {channel} does not exist.")
                 return False
             removed_object = self.objects.pop(channel)
+            self._untrack_channel(channel)
             self.log.log(
                 "debug",
                 f"Removed object: {removed_object.component_name}, "
                 f"Channel: {removed_object.channel}, "
                 f"Test Position: {removed_object.test_position}",
             )
+            if self._txn is not None:
+                self._render_removed([removed_object.channel])
+                return True
             self.log.log(
                 "debug",
                 f"Emitting object_removed signal for Channel {removed_object.channel}",
@@ -147,7 +694,8 @@ class ObjectLibrary(QObject):
 
     def update_object(self, board_object: BoardObject) -> bool:
         with QMutexLocker(self._mutex):
-            self.undo_redo_manager.push_state()
+            self._writable()
+            self._push_undo()
             if board_object.channel not in self.objects:
                 self.log.log(
                     "warning",
@@ -155,6 +703,7 @@ class ObjectLibrary(QObject):
                 )
                 return False
             self.objects[board_object.channel] = board_object
+            self._track_object(board_object)
             self.log.log(
                 "debug",
                 f"Updated BoardObject: {board_object.component_name}, "
@@ -165,8 +714,7 @@ class ObjectLibrary(QObject):
                 "debug",
                 f"Emitting object_updated signal for Channel {board_object.channel}",
             )
-            if self.display_library:
-                self.display_library.update_rendered_objects_for_updates([board_object])
+            self._render_updated([board_object])
             return True
 
     def bulk_add(
@@ -178,23 +726,23 @@ class ObjectLibrary(QObject):
         skip_render: bool = False,
     ) -> None:
         with QMutexLocker(self._mutex):
+            self._writable()
 
             if not board_objects:
                 self.log.log("warning", "bulk_add called with an empty list.")
                 return
 
             if not skip_undo:
-                self.undo_redo_manager.push_state()
+                self._push_undo()
 
             if skip_render:
-                FlagManager().set_flag("bulk_in_progress", True)
+                self.flags.set_flag("bulk_in_progress", True)
+
+            # assign free channels (one contiguous block for the new ones)
+            self._claim_channels(board_objects)
 
             added_objects: list[BoardObject] = []
             for obj in board_objects:
-                # assign a free channel if needed
-                if (obj.channel is None) or (obj.channel in self.objects):
-                    obj.channel = self.get_next_channel()
-
                 # Normalize placeholder signals (missing or library defaults)
                 if (
                     not obj.signal
@@ -204,23 +752,50 @@ class ObjectLibrary(QObject):
                     obj.signal = f"S{obj.channel}"
 
                 self.objects[obj.channel] = obj
+                self._track_object(obj)
                 added_objects.append(obj)
 
                 # ⬅️  NO per‑object signal here
                 # self.object_added.emit(obj)
 
-            # one shot partial render
-            if (
-                not skip_render
-                and hasattr(self, "display_library")
-                and self.display_library
-            ):
-                self.display_library.add_rendered_objects(added_objects)
+            # one shot partial render (staged when inside a transaction)
+            if not skip_render:
+                self._render_added(added_objects)
 
             self.log.log("info", f"bulk_add: Added {len(added_objects)} objects.")
 
         # Emit after releasing the mutex to avoid deadlocks during auto-save
-        self.bulk_operation_completed.emit("Bulk Add")
+        self._emit_bulk_completed("Bulk Add")
+
+    def load_objects(self, board_objects: List[BoardObject]) -> None:
+        """
+        Replace the whole library with *board_objects* (a project load).
+        Not undoable: the caller resets the undo history afterwards. The
+        objects must carry unique channels; the indexes are rebuilt in one
+        pass instead of being updated per object as in bulk_add().
+        """
+        with QMutexLocker(self._mutex):
+            objects = {}
+            for obj in board_objects:
+                if obj.channel is None or obj.channel in objects:
+                    raise ValueError(f"load_objects: bad channel {obj.channel!r}")
+                if (
+                    not obj.signal
+                    or obj.signal == "S0"
+                    or str(obj.signal).startswith("$")
+                ):
+                    obj.signal = f"S{obj.channel}"
+                objects[obj.channel] = obj
+            self.objects = objects
+            self._resync_channels()
+
+            display_library = getattr(self, "display_library", None)
+            if display_library:
+                display_library.clear_all_rendered_objects()
+                display_library.add_rendered_objects(board_objects)
+            self.log.log("info", f"load_objects: Loaded {len(objects)} objects.")
+
+        self._emit_bulk_completed("Load")
 
     # Remove or leave a no-op save() method since auto-save is not desired.
     def save(self):
@@ -247,17 +822,27 @@ class ObjectLibrary(QObject):
     def undo(self) -> bool:
         """Undoes the last operation."""
         with QMutexLocker(self._mutex):
-            return self.undo_redo_manager.undo()
+            ok = self.undo_redo_manager.undo()
+            if ok:
+                self._resync_channels()
+            return ok
 
     def redo(self) -> bool:
         """Redoes the last undone operation."""
         with QMutexLocker(self._mutex):
-            return self.undo_redo_manager.redo()
+            ok = self.undo_redo_manager.redo()
+            if ok:
+                self._resync_channels()
+            return ok
 
     def clear_all(self) -> None:
+        """Removes every object and the panel (only the objects are undoable)."""
         with QMutexLocker(self._mutex):
-            self.undo_redo_manager.push_state()
+            self._writable()
+            self._push_undo()
             self.objects.clear()
+            self.panel = None
+            self._resync_channels()
             self.log.log("info", "Cleared all BoardObjects from ObjectLibrary.")
 
     def clear(self):
@@ -295,38 +880,37 @@ class ObjectLibrary(QObject):
         updates in the DisplayLibrary all at once.
         """
         with QMutexLocker(self._mutex):
-            self.undo_redo_manager.push_state()
+            self._writable()
+            self._push_undo()
 
             added = added or []
             updated = updated or []
             deleted = deleted or []
 
             # 1) Add
+            self._claim_channels(added)
             for obj in added:
-                if obj.channel is None or obj.channel in self.objects:
-                    obj.channel = self.get_next_channel()
                 self.objects[obj.channel] = obj
+                self._track_object(obj)
 
             # 2) Update
             for obj in updated:
                 if obj.channel in self.objects:
                     self.objects[obj.channel] = obj
+                    self._track_object(obj)
 
             # 3) Delete
             deleted_channels = []
             for obj in deleted:
                 if obj.channel in self.objects:
                     del self.objects[obj.channel]
+                    self._untrack_channel(obj.channel)
                     deleted_channels.append(obj.channel)
 
             # 4) Partial rendering calls
-            if self.display_library:
-                if added:
-                    self.display_library.add_rendered_objects(added)
-                if updated:
-                    self.display_library.update_rendered_objects_for_updates(updated)
-                if deleted_channels:
-                    self.display_library.remove_rendered_objects(deleted_channels)
+            self._render_added(added)
+            self._render_updated([obj for obj in updated if obj.channel in self.objects])
+            self._render_removed(deleted_channels)
 
             self.log.log(
                 "info",
@@ -335,7 +919,7 @@ class ObjectLibrary(QObject):
             )
 
         # Emit after releasing the mutex to avoid deadlocks during auto-save
-        self.bulk_operation_completed.emit("Bulk Modify")
+        self._emit_bulk_completed("Bulk Modify")
 
     def bulk_delete(self, channels_to_remove: List[int]) -> None:
         """
@@ -343,45 +927,84 @@ class ObjectLibrary(QObject):
         Then removes them from the display in a partial update.
         """
         with QMutexLocker(self._mutex):
-            self.undo_redo_manager.push_state()
+            self._writable()
+            self._push_undo()
 
             removed_channels = []
             for ch in channels_to_remove:
                 if ch in self.objects:
                     self.objects.pop(ch)
+                    self._untrack_channel(ch)
                     removed_channels.append(ch)
 
             # Partially remove from display
-            if self.display_library:
-                self.display_library.remove_rendered_objects(removed_channels)
+            self._render_removed(removed_channels)
 
             self.log.log(
                 "info", f"bulk_delete: Deleted {len(removed_channels)} objects."
             )
 
         # Emit after releasing the mutex to avoid deadlocks during auto-save
-        self.bulk_operation_completed.emit("Bulk Delete")
+        self._emit_bulk_completed("Bulk Delete")
 
     def bulk_update_objects(self, updates: List[BoardObject], changes: dict) -> None:
         """
         Updates multiple BoardObjects in one undoable step, then does a partial re-render.
         """
         with QMutexLocker(self._mutex):
-            self.undo_redo_manager.push_state()
+            self._writable()
+            self._push_undo()
 
+            stored = []
             for obj in updates:
+                if changes and self.objects.get(obj.channel) is obj:
+                    obj = self._own(obj)
                 for key, value in changes.items():
                     if hasattr(obj, key):
                         setattr(obj, key, value)
                 self.objects[obj.channel] = obj
+                self._track_object(obj)
+                stored.append(obj)
 
             # Partial update display for only these objects
-            if self.display_library:
-                self.display_library.update_rendered_objects_for_updates(updates)
+            self._render_updated(stored)
 
             self.log.log(
                 "info", f"bulk_update_objects: Updated {len(updates)} objects."
             )
 
         # Emit after releasing the mutex to avoid deadlocks during auto-save
-        self.bulk_operation_completed.emit("Bulk Update")
+        self._emit_bulk_completed("Bulk Update")
+
+    def rename_components(self, renames: Dict[str, str]) -> int:
+        """
+        Renames whole components ({old name: new name}, exact names) in one
+        undoable step. Pads are found through the component index, so the
+        cost is proportional to the pads renamed, not to the board.
+        Returns the number of pads renamed.
+        """
+        with QMutexLocker(self._mutex):
+            self._writable()
+            channels = [ch for old in renames for ch in self.components.channels(old)]
+            if not channels:
+                return 0
+            self._push_undo()
+
+            renamed = []
+            for ch in channels:
+                obj = self._own(self.objects[ch])
+                obj.component_name = renames[obj.component_name]
+                self.objects[ch] = obj
+                self._track_object(obj)
+                renamed.append(obj)
+
+            self._render_updated(renamed)
+
+            self.log.log(
+                "info",
+                f"rename_components: Renamed {len(renames)} components "
+                f"({len(renamed)} pads).",
+            )
+
+        self._emit_bulk_completed("Rename Components")
+        return len(renamed)
@@ -0,0 +1,185 @@
+# objects/panel.py
+
+import math
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from objects.board_object import BoardObject
+from objects.object_library import signal_channel
+
+
+class PanelStep:
+    """Placement of one board copy: rotation about the panel pivot, then offset."""
+
+    def __init__(self, dx_mm: float, dy_mm: float, angle_deg: float = 0.0):
+        self.dx_mm = float(dx_mm)
+        self.dy_mm = float(dy_mm)
+        self.angle_deg = float(angle_deg)
+
+    def to_dict(self) -> dict:
+        return {"dx_mm": self.dx_mm, "dy_mm": self.dy_mm, "angle_deg": self.angle_deg}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PanelStep":
+        return cls(data["dx_mm"], data["dy_mm"], data.get("angle_deg", 0.0))
+
+
+class Panel:
+    """
+    Step-and-repeat definition of a panel: the pads on ``master_channels``
+    form board 1, and every PanelStep adds a copy of it.
+
+    Copies are not stored as BoardObjects. Copy *k* (1-based) owns the
+    channel block starting at ``channel_bases[k - 1]``; the i-th master
+    channel maps to ``base + i``. ObjectLibrary keeps those blocks and the
+    master channels (even of deleted master pads) occupied, DisplayLibrary
+    draws the copies as transformed pictures of the master, and
+    BoardNodFile streams the expanded pads only when the NOD is written.
+    """
+
+    COMPONENT_SUFFIX = "_B{board}"
+
+    def __init__(
+        self,
+        master_channels: Iterable[int],
+        steps: Iterable[PanelStep],
+        pivot_mm: Tuple[float, float] = (0.0, 0.0),
+        channel_bases: Optional[List[int]] = None,
+    ):
+        self.master_channels: List[int] = sorted(master_channels)
+        self.steps: List[PanelStep] = list(steps)
+        self.pivot_mm = (float(pivot_mm[0]), float(pivot_mm[1]))
+        self.channel_bases: List[int] = list(channel_bases or [])
+        self._rank = {ch: i for i, ch in enumerate(self.master_channels)}
+
+    @classmethod
+    def grid(
+        cls,
+        objects: Iterable[BoardObject],
+        columns: int,
+        rows: int,
+        pitch_x_mm: float,
+        pitch_y_mm: float,
+        rotate_alternate_rows: bool = False,
+    ) -> "Panel":
+        """A columns x rows array of the given master pads (board 1 at 0/0)."""
+        objs = list(objects)
+        if objs:
+            xs = [o.x_coord_mm for o in objs]
+            ys = [o.y_coord_mm for o in objs]
+            pivot = ((min(xs) + max(xs)) / 2.0, (min(ys) + max(ys)) / 2.0)
+        else:
+            pivot = (0.0, 0.0)
+        steps = [
+            PanelStep(
+                col * pitch_x_mm,
+                row * pitch_y_mm,
+                180.0 if rotate_alternate_rows and row % 2 else 0.0,
+            )
+            for row in range(rows)
+            for col in range(columns)
+            if row or col
+        ]
+        return cls((o.channel for o in objs), steps, pivot_mm=pivot)
+
+    # ------------------------------------------------------------------
+    #  Channels
+    # ------------------------------------------------------------------
+    @property
+    def block_size(self) -> int:
+        return len(self.master_channels)
+
+    @property
+    def board_count(self) -> int:
+        """Boards on the panel, the master included."""
+        return len(self.steps) + 1
+
+    def instance_channels(self) -> Iterator[int]:
+        size = self.block_size
+        for base in self.channel_bases:
+            yield from range(base, base + size)
+
+    def channel_map(self, copy_index: int) -> Dict[int, int]:
+        """{master channel: channel on copy *copy_index* (1-based)}."""
+        base = self.channel_bases[copy_index - 1]
+        return {ch: base + i for ch, i in self._rank.items()}
+
+    # ------------------------------------------------------------------
+    #  Geometry
+    # ------------------------------------------------------------------
+    def step_matrix(self, copy_index: int) -> Tuple[float, float, float, float, float, float]:
+        """
+        Affine map (a, b, c, d, tx, ty) of copy *copy_index* in board mm:
+        x' = a*x + c*y + tx, y' = b*x + d*y + ty.
+        """
+        step = self.steps[copy_index - 1]
+        rad = math.radians(step.angle_deg)
+        cos, sin = math.cos(rad), math.sin(rad)
+        px, py = self.pivot_mm
+        tx = px + step.dx_mm - cos * px + sin * py
+        ty = py + step.dy_mm - sin * px - cos * py
+        return cos, sin, -sin, cos, tx, ty
+
+    # ------------------------------------------------------------------
+    #  Expansion
+    # ------------------------------------------------------------------
+    def iter_copy_dicts(
+        self, objects: Dict[int, BoardObject], copy_index: int
+    ) -> Iterator[dict]:
+        """
+        The pads of copy *copy_index* as BoardObject-style dicts, generated on
+        the fly from the live master pads (deleted master pads are skipped).
+        Component names get COMPONENT_SUFFIX; default nets 'S<ch>' follow the
+        channel map and other nets get the same suffix, so copies stay
+        electrically separate.
+        """
+        a, b, c, d, tx, ty = self.step_matrix(copy_index)
+        angle = self.steps[copy_index - 1].angle_deg
+        chan_map = self.channel_map(copy_index)
+        suffix = self.COMPONENT_SUFFIX.format(board=copy_index + 1)
+        for master_ch in self.master_channels:
+            obj = objects.get(master_ch)
+            if obj is None:
+                continue
+            k = signal_channel(obj.signal)
+            if k is not None and k in chan_map:
+                signal = f"S{chan_map[k]}"
+            else:
+                signal = f"{obj.signal}{suffix}"
+            # Copies are placed from the mechanical (as-saved) coordinates
+            x = getattr(obj, "x_coord_mm_original", obj.x_coord_mm)
+            y = getattr(obj, "y_coord_mm_original", obj.y_coord_mm)
+            pad = obj.to_dict()
+            pad.update(
+                component_name=f"{obj.component_name}{suffix}",
+                channel=chan_map[master_ch],
+                signal=signal,
+                x_coord_mm=a * x + c * y + tx,
+                y_coord_mm=b * x + d * y + ty,
+                angle_deg=(obj.angle_deg + angle) % 360,
+            )
+            yield pad
+
+    def iter_expanded(self, objects: Dict[int, BoardObject]) -> Iterator[dict]:
+        """All copies (not the master), one pad at a time."""
+        for copy_index in range(1, len(self.steps) + 1):
+            yield from self.iter_copy_dicts(objects, copy_index)
+
+    # ------------------------------------------------------------------
+    #  Persistence
+    # ------------------------------------------------------------------
+    def to_dict(self) -> dict:
+        return {
+            "master_channels": self.master_channels,
+            "steps": [step.to_dict() for step in self.steps],
+            "pivot_mm": list(self.pivot_mm),
+            "channel_bases": self.channel_bases,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Panel":
+        return cls(
+            data["master_channels"],
+            [PanelStep.from_dict(step) for step in data.get("steps", [])],
+            pivot_mm=tuple(data.get("pivot_mm", (0.0, 0.0))),
+            channel_bases=data.get("channel_bases"),
+        )
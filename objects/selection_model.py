@@ -0,0 +1,160 @@
+# objects/selection_model.py
+
+from typing import Iterable, List, Optional, Set
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from objects.board_object import BoardObject
+from objects.component_bounds import SIDES
+
+
+class SelectionModel(QObject):
+    """
+    The pad selection, held as a set of channels.
+
+    BoardView keeps it in sync with the scene and DisplayLibrary draws the
+    highlight from it, but the set itself does not depend on graphics items:
+    actions and dialogs receive channels. Every change emits one
+    ``selection_changed(added, removed)`` with the channel sets that differ.
+
+    Component and spatial lookups query the indexes the ObjectLibrary keeps
+    up to date on every edit (``components`` and ``component_bounds``).
+    """
+
+    selection_changed = pyqtSignal(object, object)  # added, removed (sets)
+
+    def __init__(self, object_library, parent=None):
+        super().__init__(parent)
+        self.object_library = object_library
+        self._channels: Set[int] = set()
+
+        self._pruned_revision = None
+
+    # ------------------------------------------------------------------
+    #  Read access
+    # ------------------------------------------------------------------
+    def __contains__(self, channel) -> bool:
+        return channel in self._channels
+
+    def __len__(self) -> int:
+        return len(self._channels)
+
+    def __bool__(self) -> bool:
+        return bool(self._channels)
+
+    def channels(self) -> List[int]:
+        """Selected channels that still exist in the library, ascending."""
+        self._prune()
+        return sorted(self._channels)
+
+    def objects(self) -> List[BoardObject]:
+        objects = self.object_library.objects
+        return [objects[ch] for ch in self.channels()]
+
+    # ------------------------------------------------------------------
+    #  Set operations
+    # ------------------------------------------------------------------
+    def set_channels(self, channels: Iterable[int]) -> None:
+        self._apply(set(channels))
+
+    def add(self, channels: Iterable[int]) -> None:
+        self._apply(self._channels | set(channels))
+
+    def discard(self, channels: Iterable[int]) -> None:
+        self._apply(self._channels - set(channels))
+
+    def clear(self) -> None:
+        self._apply(set())
+
+    def invert(self) -> None:
+        self._apply(set(self.object_library.objects.keys()) - self._channels)
+
+    def select_component(self, component_name: str, extend: bool = False) -> None:
+        chans = self.object_library.components.channels(component_name)
+        self._apply(self._channels | chans if extend else chans)
+
+    def select_net(self, signal: str, extend: bool = False) -> None:
+        chans = self.object_library.nets.pads_in_net(signal)
+        self._apply(self._channels | chans if extend else chans)
+
+    def select_rect(
+        self,
+        x0: float,
+        y0: float,
+        x1: float,
+        y1: float,
+        side: Optional[str] = None,
+        extend: bool = False,
+    ) -> None:
+        """Select pads with their centre (mm) in the rectangle (see channels_in_rect())."""
+        self._apply(
+            self._channels | self.channels_in_rect(x0, y0, x1, y1, side)
+            if extend
+            else self.channels_in_rect(x0, y0, x1, y1, side)
+        )
+
+    def grow_to_components(self) -> None:
+        """Extend the selection to every pad of the components it touches."""
+        objects = self.object_library.objects
+        components = self.object_library.components
+        names = {objects[ch].component_name for ch in self._channels if ch in objects}
+        grown = set(self._channels)
+        for name in names:
+            grown |= components.channels(name)
+        self._apply(grown)
+
+    # ------------------------------------------------------------------
+    #  Queries
+    # ------------------------------------------------------------------
+    def channels_in_rect(
+        self, x0: float, y0: float, x1: float, y1: float, side: Optional[str] = None
+    ) -> Set[int]:
+        """
+        Visible pads with their centre in the rectangle; *side* filters by
+        test position. Only the pads of components whose outline overlaps
+        the rectangle (component_bounds) are looked at.
+        """
+        xmin, xmax = min(x0, x1), max(x0, x1)
+        ymin, ymax = min(y0, y1), max(y0, y1)
+        objects = self.object_library.objects
+        components = self.object_library.components
+        bounds = self.object_library.component_bounds
+        side = side.lower() if side else None
+        names = set()
+        for s in (side,) if side in SIDES else SIDES:
+            names |= bounds.components_in_rect(xmin, ymin, xmax, ymax, s)
+        found = set()
+        for name in names:
+            for ch in components.channels(name):
+                obj = objects[ch]
+                x, y = obj.x_coord_mm, obj.y_coord_mm
+                if not (xmin <= x <= xmax and ymin <= y <= ymax) or not obj.visible:
+                    continue
+                if side and obj.test_position.lower() not in (side, "both"):
+                    continue
+                found.add(ch)
+        return found
+
+    # ------------------------------------------------------------------
+    #  Internals
+    # ------------------------------------------------------------------
+    def _apply(self, new: Set[int]) -> None:
+        objects = self.object_library.objects
+        new = {ch for ch in new if ch in objects}
+        added = new - self._channels
+        removed = self._channels - new
+        if not added and not removed:
+            return
+        self._channels = new
+        self.selection_changed.emit(added, removed)
+
+    def _prune(self) -> None:
+        """Drop channels deleted from the library since the last change."""
+        revision = self.object_library.revision
+        if self._pruned_revision == revision:
+            return
+        self._pruned_revision = revision
+        gone = {ch for ch in self._channels if ch not in self.object_library.objects}
+        if gone:
+            self._channels -= gone
+            self.selection_changed.emit(set(), gone)
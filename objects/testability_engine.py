@@ -0,0 +1,203 @@
+# objects/testability_engine.py
+
+import copy
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from objects.board_object import BoardObject
+
+# Default assignment rules; override per installation with the
+# "testability_rules" setting or per call.
+DEFAULT_RULES = {
+    "prefer_through_hole": True,  # TH pads are reachable from both sides
+    "preferred_side": "Top",  # "Top", "Bottom" or None (no preference)
+    "min_pad_mm": 0.5,  # smaller pad dimension a probe can hit
+    "min_spacing_mm": 1.27,  # centre-to-centre distance between probes on one side
+    "max_probes_per_net": 1,
+}
+
+FORCED = "Forced"
+TERMINAL = "Terminal"
+NOT_TESTABLE = "Not Testable"
+ALTERNATIVE = "Testable Alternative"
+_STATES = np.array([FORCED, TERMINAL, NOT_TESTABLE, ALTERNATIVE], dtype=object)
+_S_FORCED, _S_TERMINAL, _S_NOT_TESTABLE, _S_ALTERNATIVE = range(4)
+
+# Rule that decided a pad's testability, in report order
+RULES = (
+    "selected",
+    "probe_cap",
+    "probe_spacing",
+    "min_pad_size",
+    "mechanical",
+    "fallback",
+)
+_R_SELECTED, _R_CAP, _R_SPACING, _R_MIN_SIZE, _R_MECHANICAL, _R_FALLBACK = range(6)
+
+
+def load_rules(overrides: Optional[dict] = None, constants=None) -> dict:
+    """
+    DEFAULT_RULES, updated from the "testability_rules" of *constants* (the
+    board's settings; the process-wide Constants() when omitted) and then
+    from *overrides*.
+    """
+    if constants is None:
+        from constants.constants import Constants
+
+        constants = Constants()
+    rules = dict(DEFAULT_RULES)
+    rules.update(constants.get("testability_rules", {}) or {})
+    rules.update(overrides or {})
+    return rules
+
+
+class AssignmentReport:
+    """Result of assign_testability(): the new value of every pad and why."""
+
+    def __init__(
+        self,
+        testability: Dict[int, str],
+        previous: Dict[int, str],
+        changes: Dict[str, List[int]],
+    ):
+        self.testability = testability  # channel -> new testability
+        self.previous = previous  # channel -> old testability (changed pads only)
+        self.changes = changes  # rule -> channels it changed
+
+    def changed_channels(self) -> List[int]:
+        return sorted(self.previous)
+
+    def summary(self) -> str:
+        lines = [f"{len(self.previous)} of {len(self.testability)} pads changed."]
+        for rule in RULES:
+            if self.changes.get(rule):
+                lines.append(f"  {rule}: {len(self.changes[rule])}")
+        return "\n".join(lines)
+
+
+def assign_testability(
+    objects: Iterable[BoardObject], rules: Optional[dict] = None, constants=None
+) -> AssignmentReport:
+    """
+    Computes the testability of every pad, one net (signal) at a time but in a
+    single vectorised pass over the board:
+
+    - Mechanical pads and pads smaller than ``min_pad_mm`` are Not Testable.
+    - The remaining pads of a net are ranked: through-hole first (if
+      ``prefer_through_hole``), then pads reachable from ``preferred_side``,
+      then by area. Up to ``max_probes_per_net`` of them become Forced,
+      skipping pads closer than ``min_spacing_mm`` to a probe already placed
+      on the same side. The other pads are Terminal.
+    - A net left without a Forced pad gets its best non-mechanical pad as
+      Testable Alternative.
+
+    *rules* override the settings of *constants* (see load_rules()). The
+    objects are not modified; see apply_testability_rules().
+    """
+    rules = load_rules(rules, constants)
+    objs = list(objects)
+    n = len(objs)
+    if not n:
+        return AssignmentReport({}, {}, {})
+
+    channels = np.fromiter((o.channel for o in objs), dtype=np.int64, count=n)
+    width = np.fromiter((o.width_mm for o in objs), dtype=float, count=n)
+    height = np.fromiter((o.height_mm for o in objs), dtype=float, count=n)
+    tech = np.array([o.technology for o in objs], dtype=object)
+    position = np.array([o.test_position for o in objs], dtype=object)
+    _, net_id = np.unique(np.array([str(o.signal) for o in objs]), return_inverse=True)
+    net_id = net_id.ravel()
+
+    through_hole = tech == "Through Hole"
+    mechanical = tech == "Mechanical"
+    too_small = np.minimum(width, height) < float(rules["min_pad_mm"])
+    eligible = ~mechanical & ~too_small
+
+    side = rules.get("preferred_side")
+    both_sides = through_hole | (position == "Both")
+    on_side = both_sides | (position == side) if side else np.ones(n, dtype=bool)
+    prefer_th = (
+        through_hole if rules.get("prefer_through_hole") else np.zeros(n, dtype=bool)
+    )
+
+    # Rank inside each net; np.lexsort uses the LAST key as the primary one
+    order = np.lexsort(
+        (channels, -(width * height), ~on_side, ~prefer_th, ~eligible, net_id)
+    )
+
+    state = np.full(n, _S_TERMINAL, dtype=np.int8)
+    reason = np.full(n, _R_CAP, dtype=np.int8)
+    state[too_small] = _S_NOT_TESTABLE
+    reason[too_small] = _R_MIN_SIZE
+    state[mechanical] = _S_NOT_TESTABLE
+    reason[mechanical] = _R_MECHANICAL
+
+    # Greedy probe placement over the eligible pads in rank order. Only this
+    # loop is sequential: the spacing rule depends on the probes placed so far.
+    cap = int(rules["max_probes_per_net"])
+    spacing = float(rules["min_spacing_mm"])
+    probe_side = np.where(both_sides, side or "Top", position).tolist()
+    xs = np.fromiter((o.x_coord_mm for o in objs), dtype=float, count=n).tolist()
+    ys = np.fromiter((o.y_coord_mm for o in objs), dtype=float, count=n).tolist()
+    nets = net_id.tolist()
+    probes = [0] * (int(net_id.max()) + 1)
+    grid: Dict[tuple, list] = {}  # (side, cell x, cell y) -> probe positions
+    spacing_sq = spacing * spacing
+    for i in order[eligible[order]].tolist():
+        net = nets[i]
+        if probes[net] >= cap:
+            continue
+        if spacing > 0:
+            x, y, s = xs[i], ys[i], probe_side[i]
+            gx, gy = int(x // spacing), int(y // spacing)
+            if any(
+                (px - x) ** 2 + (py - y) ** 2 < spacing_sq
+                for dx in (-1, 0, 1)
+                for dy in (-1, 0, 1)
+                for px, py in grid.get((s, gx + dx, gy + dy), ())
+            ):
+                reason[i] = _R_SPACING
+                continue
+            grid.setdefault((s, gx, gy), []).append((x, y))
+        probes[net] += 1
+        state[i] = _S_FORCED
+        reason[i] = _R_SELECTED
+
+    # Fallback: best non-mechanical pad of every net without a probe
+    candidates = order[~mechanical[order]]
+    if candidates.size:
+        cand_nets = net_id[candidates]
+        first = candidates[np.r_[True, cand_nets[1:] != cand_nets[:-1]]]
+        first = first[np.asarray(probes)[net_id[first]] == 0]
+        state[first] = _S_ALTERNATIVE
+        reason[first] = _R_FALLBACK
+
+    new = _STATES[state]
+    old = np.array([o.testability for o in objs], dtype=object)
+    changed = np.flatnonzero(new != old)
+
+    ch_list = channels.tolist()
+    testability = dict(zip(ch_list, new.tolist()))
+    previous = {ch_list[i]: old[i] for i in changed.tolist()}
+    changes: Dict[str, List[int]] = {}
+    for i in changed.tolist():
+        changes.setdefault(RULES[reason[i]], []).append(ch_list[i])
+    return AssignmentReport(testability, previous, changes)
+
+
+def apply_testability_rules(
+    object_library, rules: Optional[dict] = None, constants=None
+) -> AssignmentReport:
+    """Runs assign_testability() on the whole board as one undoable bulk update."""
+    report = assign_testability(object_library.get_all_objects(), rules, constants)
+    updates = []
+    for ch in report.changed_channels():
+        # Shallow copy is enough: only a string attribute changes
+        obj = copy.copy(object_library.objects[ch])
+        obj.testability = report.testability[ch]
+        updates.append(obj)
+    if updates:
+        with object_library.transaction("Assign Testability"):
+            object_library.bulk_update_objects(updates, {})
+    return report
@@ -6,13 +6,13 @@ from logs.log_handler import LogHandler
 from constants.constants import Constants
 
 class UndoRedoManager:
-    def __init__(self, object_library):
-        self.constants = Constants()
+    def __init__(self, object_library, constants=None, log=None):
+        self.constants = constants if constants is not None else Constants()
         self.max_undo_steps = self.constants.get("max_undo_steps", 10)
         self.object_library = object_library
         self.undo_stack = []
         self.redo_stack = []
-        self.log = LogHandler(output="both")
+        self.log = log if log is not None else LogHandler(output="both")
         self.log.log("debug", f"UndoRedoManager initialized with max_undo_steps={self.max_undo_steps}.")
 
     def push_state(self, extra_state: dict = None):
@@ -1,5 +1,6 @@
 # For example, in project_manager/alf_handler.py
 
+import itertools
 import os
 from collections import defaultdict
 from utils.file_ops import safe_write, rotate_backups
@@ -19,14 +20,18 @@ def save_alf_file(project_folder, object_library, logger=None,
 
     # 1) gather entries
     grouped = defaultdict(list)
-    for obj in object_library.get_all_objects():
-        prefix = (getattr(obj, "prefix", "") or "").strip()
+    pads = [obj.to_dict() for obj in object_library.get_all_objects()]
+    panel = getattr(object_library, "panel", None)
+    if panel is not None:
+        pads = itertools.chain(pads, panel.iter_expanded(object_library.objects))
+    for pad in pads:
+        prefix = (pad.get("prefix") or "").strip()
         if prefix:
             try:
-                pin_num = int(obj.pin)
+                pin_num = int(pad["pin"])
             except Exception:
                 pin_num = 0
-            grouped[obj.component_name].append((pin_num, prefix))
+            grouped[pad["component_name"]].append((pin_num, prefix))
 
     # 2) build payload
     lines = []
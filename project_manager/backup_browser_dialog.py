@@ -4,10 +4,13 @@ from PyQt5.QtWidgets import (
     QDialog, QTableWidget, QTableWidgetItem, QAbstractItemView,
     QPushButton, QVBoxLayout, QHBoxLayout, QMessageBox, QHeaderView
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, pyqtSignal
 import re, os, glob, shutil, datetime
 
 class BackupBrowserDialog(QDialog):
+    # path of the selected backup's .nod, to be diffed against the live board
+    compare_requested = pyqtSignal(str)
+
     def __init__(self, project_dir, backup_dir, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Restore Backup")
@@ -22,11 +25,15 @@ class BackupBrowserDialog(QDialog):
 
         self.restore_btn = QPushButton("Restore", self)
         self.restore_btn.clicked.connect(self._restore_selected)
+        self.compare_btn = QPushButton("Compare with Current", self)
+        self.compare_btn.setToolTip("Show what changed on the board since this backup")
+        self.compare_btn.clicked.connect(self._compare_selected)
 
         lay = QVBoxLayout(self)
         lay.addWidget(self.table)
         btn_row = QHBoxLayout()
         btn_row.addStretch(1)
+        btn_row.addWidget(self.compare_btn)
         btn_row.addWidget(self.restore_btn)
         lay.addLayout(btn_row)
 
@@ -122,6 +129,19 @@ class BackupBrowserDialog(QDialog):
             hdr.setSectionResizeMode(col, QHeaderView.ResizeToContents)
             self.table.setMinimumWidth(700)                   # keep dialog wide
 
+# ------------------------------------------------------------------
+#  Diff the selected backup against the board before restoring it
+# ------------------------------------------------------------------
+    def _compare_selected(self):
+        row = self.table.currentRow()
+        if row < 0:
+            return
+        nod = self.versions[self.sorted_ts[row]].get("nod")
+        if not nod:
+            QMessageBox.information(self, "Compare", "This backup has no NOD file.")
+            return
+        self.compare_requested.emit(nod)
+
 # ------------------------------------------------------------------
 #  Restore every file that belongs to the selected timestamp
 # ------------------------------------------------------------------
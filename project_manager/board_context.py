@@ -0,0 +1,98 @@
+# project_manager/board_context.py
+
+import itertools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence, TypeVar
+
+from constants.constants import Constants
+from display.coord_converter import CoordinateConverter
+from logs.log_handler import LogHandler
+from objects.object_library import ObjectLibrary
+from utils.flag_manager import FlagManager
+
+T = TypeVar("T")
+
+_names = itertools.count(1)
+
+
+class BoardContext:
+    """
+    The services one board works with, passed explicitly instead of being
+    reached through the process-wide singletons: constants, log, flags
+    (including the current side), ObjectLibrary and CoordinateConverter.
+
+    BoardContext() builds independent instances, so several boards can be
+    open side by side or processed on worker threads. BoardContext.default()
+    wraps the default instances the single-board UI uses (ObjectLibrary(),
+    Constants(), ...).
+    """
+
+    def __init__(
+        self,
+        name: Optional[str] = None,
+        constants: Optional[Constants] = None,
+        log: Optional[LogHandler] = None,
+        flags: Optional[FlagManager] = None,
+        object_library: Optional[ObjectLibrary] = None,
+        converter: Optional[CoordinateConverter] = None,
+    ):
+        self.name = name or f"board{next(_names)}"
+        self.constants = constants if constants is not None else Constants(shared=False)
+        self.log = log if log is not None else LogHandler(name=self.name)
+        self.flags = flags if flags is not None else FlagManager(shared=False)
+        self.object_library = (
+            object_library
+            if object_library is not None
+            else ObjectLibrary(
+                shared=False, log=self.log, constants=self.constants, flags=self.flags
+            )
+        )
+        self.converter = (
+            converter
+            if converter is not None
+            else CoordinateConverter(constants=self.constants, flags=self.flags, log=self.log)
+        )
+
+    @classmethod
+    def default(cls) -> "BoardContext":
+        """Context over the process-wide default instances."""
+        return cls(
+            name="default",
+            constants=Constants(),
+            log=LogHandler(),
+            flags=FlagManager(),
+            object_library=ObjectLibrary(),
+            converter=CoordinateConverter(),
+        )
+
+    @property
+    def side(self) -> str:
+        return self.flags.get_flag("side", "top")
+
+    @side.setter
+    def side(self, side: str) -> None:
+        self.flags.set_flag("side", side.lower())
+
+
+def process_projects(
+    project_dirs: Sequence[str],
+    job: Callable[[BoardContext, str], T],
+    max_workers: Optional[int] = None,
+) -> List[T]:
+    """
+    Run ``job(context, project_dir)`` for every project on a thread pool,
+    each with its own BoardContext (named after the project folder).
+    Returns the job results in the order of *project_dirs*; the first job
+    exception is re-raised.
+
+    Threads suit the I/O-bound parts (reading/writing project files and
+    containers); pure-Python processing is still serialised by the GIL.
+    """
+    def run(project_dir: str) -> T:
+        name = os.path.basename(os.path.normpath(project_dir)) or project_dir
+        return job(BoardContext(name=name), project_dir)
+
+    workers = max_workers or min(32, len(project_dirs) or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run, project_dirs))
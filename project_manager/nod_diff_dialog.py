@@ -0,0 +1,72 @@
+# project_manager/nod_diff_dialog.py
+
+from PyQt5.QtGui import QBrush
+from PyQt5.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from display.diff_layer import DIFF_COLOURS
+from objects.nod_diff import NodDiff
+
+MAX_TABLE_ROWS = 5000  # the overlay still shows every change
+
+
+class NodDiffDialog(QDialog):
+    """
+    Non-modal summary of a NodDiff: the count per kind of change and a
+    table of the changed pads. The board overlay (DiffLayer) is shown while
+    the dialog is open; the caller clears it on finished().
+    """
+
+    def __init__(self, diff: NodDiff, title: str, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Differences: {title}")
+        self.resize(640, 420)
+        self.diff = diff
+
+        counts = diff.counts()
+        summary = ", ".join(
+            f'<span style="color:{DIFF_COLOURS[kind].name()}">■</span> {kind}: {n}'
+            for kind, n in counts.items()
+            if n
+        )
+        self.summary_label = QLabel(
+            f"{summary or 'No differences.'} &nbsp; (unchanged: {diff.unchanged})", self
+        )
+
+        rows = list(diff.summary_rows())
+        self.table = QTableWidget(min(len(rows), MAX_TABLE_ROWS), 5, self)
+        self.table.setHorizontalHeaderLabels(["Change", "Component", "Pin", "Channel", "Detail"])
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        for r, (kind, comp, pin, channel, detail) in enumerate(rows[:MAX_TABLE_ROWS]):
+            kind_item = QTableWidgetItem(kind)
+            kind_item.setForeground(QBrush(DIFF_COLOURS[kind].darker(130)))
+            self.table.setItem(r, 0, kind_item)
+            self.table.setItem(r, 1, QTableWidgetItem(comp))
+            self.table.setItem(r, 2, QTableWidgetItem(pin))
+            self.table.setItem(r, 3, QTableWidgetItem(str(channel)))
+            self.table.setItem(r, 4, QTableWidgetItem(detail))
+        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Stretch)
+
+        close_btn = QPushButton("Close", self)
+        close_btn.clicked.connect(self.accept)
+
+        lay = QVBoxLayout(self)
+        lay.addWidget(self.summary_label)
+        lay.addWidget(self.table)
+        if len(rows) > MAX_TABLE_ROWS:
+            lay.addWidget(QLabel(f"Showing the first {MAX_TABLE_ROWS} of {len(rows)} changes."))
+        btn_row = QHBoxLayout()
+        btn_row.addStretch(1)
+        btn_row.addWidget(close_btn)
+        lay.addLayout(btn_row)
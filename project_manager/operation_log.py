@@ -0,0 +1,245 @@
+# project_manager/operation_log.py
+
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from logs.log_handler import LogHandler
+from project_manager.project_container import PadRow, pad_row, row_to_object
+
+OPLOG_FILE = "project.oplog"
+RECOVER_SUFFIX = ".recover"  # a log set aside until its recovery is settled
+OPLOG_VERSION = 1
+FLUSH_INTERVAL_S = 0.25
+
+# Record tags, one JSON array per line
+PUT = "P"  # ["P", <pad row in PAD_COLUMNS order>]
+DELETE = "D"  # ["D", channel, ...]
+RESET = "R"  # ["R"]: pads not put after this record are gone
+
+
+def _plain(value):
+    """json.dumps fallback for numpy scalars and other odd values in a pad."""
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+def _dumps(record) -> str:
+    return json.dumps(record, separators=(",", ":"), default=_plain)
+
+
+def read_operations(
+    path: str,
+) -> Tuple[Optional[str], bool, Dict[int, Optional[PadRow]]]:
+    """
+    Read an operation log.
+
+    Returns ``(base, reset, changes)``: the base the log was written on top
+    of, whether the log holds the complete pad set (pads of the base that
+    are not in *changes* were deleted) and {channel: pad row, or None if
+    deleted}, the last record per channel winning. A torn last line (crash
+    during a write) ends the log.
+    """
+    base, reset, changes = None, False, {}
+    if not os.path.exists(path):
+        return base, reset, changes
+    with open(path, "r", encoding="utf-8") as fh:
+        for n, line in enumerate(fh):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            if n == 0:
+                if not isinstance(record, dict) or record.get("oplog") != OPLOG_VERSION:
+                    break
+                base = record.get("base")
+                continue
+            tag = record[0]
+            if tag == PUT:
+                row = tuple(record[1:])
+                changes[row[0]] = row
+            elif tag == DELETE:
+                for ch in record[1:]:
+                    changes[ch] = None
+            elif tag == RESET:
+                reset, changes = True, {}
+    return base, reset, changes
+
+
+def set_aside(path: str) -> str:
+    """
+    Move the log at *path* out of the way of a new OperationLog and return
+    where it now is. A log set aside earlier and never settled (e.g. the
+    app was killed at the recovery prompt) is kept instead; the caller
+    deletes the returned file once the recovery is replayed or declined.
+    """
+    recover_path = path + RECOVER_SUFFIX
+    if not os.path.exists(recover_path) and os.path.exists(path):
+        os.replace(path, recover_path)
+    return recover_path
+
+
+def replay_operations(
+    object_library, reset: bool, changes: Dict[int, Optional[PadRow]]
+) -> int:
+    """
+    Apply logged changes (see read_operations) to the freshly loaded
+    *object_library* as one undoable step. Returns the number of pads
+    added, updated or deleted.
+    """
+    objects = object_library.objects
+    added, updated, deleted = [], [], []
+    for ch, row in changes.items():
+        if row is None:
+            if ch in objects:
+                deleted.append(objects[ch])
+        elif ch in objects:
+            updated.append(row_to_object(row))
+        else:
+            added.append(row_to_object(row))
+    if reset:
+        deleted += [obj for ch, obj in objects.items() if ch not in changes]
+    if added or updated or deleted:
+        object_library.modify_objects(added=added, updated=updated, deleted=deleted)
+    return len(added) + len(updated) + len(deleted)
+
+
+class OperationLog:
+    """
+    Append-only write-ahead log of the pad changes made since the last hard
+    save, kept next to the project files for crash recovery.
+
+    Nothing is recorded on the GUI thread: a background thread wakes every
+    *interval* seconds, takes an O(1) ObjectLibrary.snapshot() if the
+    library revision moved, and appends one compact record per pad that
+    changed (its pad version is newer than the last flush) or disappeared,
+    followed by a single fsync. A flush that finds every pad changed (load,
+    undo/redo rebuild the library) rewrites the file as one full dump
+    instead, so the log never grows past a few copies of the board.
+
+    *base* identifies the saved state the log applies to (see
+    ProjectManager._op_log_base); truncate() starts a new log after a hard
+    save. The panel is not logged; it is saved with its own file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        object_library,
+        base: str = "",
+        interval: float = FLUSH_INTERVAL_S,
+        logger: Optional[LogHandler] = None,
+    ):
+        self.path = path
+        self.object_library = object_library
+        self.base = base
+        self.interval = interval
+        self.log = logger or LogHandler()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._fh = None
+        self._revision = -1
+        self._version = -1
+        self._channels = set()
+        self.records_written = 0
+
+    # ------------------------------------------------------------------
+    #  Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        """Start a fresh log over the current library state and the writer thread."""
+        self.truncate(self.base)
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="OperationLog", daemon=True
+            )
+            self._thread.start()
+
+    def close(self, discard: bool = False) -> None:
+        """Stop the writer thread after a last flush; *discard* deletes the file."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            if not discard:
+                self._flush_locked()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+            if discard and os.path.exists(self.path):
+                os.remove(self.path)
+
+    def truncate(self, base: Optional[str] = None) -> None:
+        """Empty the log: the library as it is now is the saved state *base*."""
+        with self._lock:
+            if base is not None:
+                self.base = base
+            self._rewrite([])
+            snap = self.object_library.snapshot()
+            self._revision = self.object_library.revision
+            self._version = snap.version
+            self._channels = set(snap)
+
+    # ------------------------------------------------------------------
+    #  Writing
+    # ------------------------------------------------------------------
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as e:  # keep logging; a failed batch is retried
+                self.log.log(
+                    "error",
+                    f"Operation log flush failed: {e}",
+                    module="OperationLog",
+                    func="_run",
+                )
+
+    def flush(self) -> int:
+        """Write the changes since the last flush; returns the records written."""
+        with self._lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> int:
+        if self._fh is None or self.object_library.revision == self._revision:
+            return 0
+        revision = self.object_library.revision
+        snap = self.object_library.snapshot()
+        changed = list(snap.changed_since(self._version))
+        removed = self._channels.difference(snap)
+
+        lines = [_dumps([PUT, *pad_row(snap[ch])]) for ch in changed]
+        if changed and len(changed) == len(snap):
+            lines.insert(0, _dumps([RESET]))
+            self._rewrite(lines)
+        else:
+            if removed:
+                lines.append(_dumps([DELETE, *sorted(removed)]))
+            if lines:
+                self._fh.write("\n".join(lines) + "\n")
+                self._fh.flush()
+                os.fsync(self._fh.fileno())
+                self.records_written += len(lines)
+        # Only now: a batch that failed to write is retried by the next flush
+        self._revision = revision
+        self._version = snap.version
+        self._channels = set(snap)
+        return len(lines)
+
+    def _rewrite(self, lines) -> None:
+        """Replace the file by header + *lines* (atomic), keep it open for appends."""
+        if self._fh is not None:
+            self._fh.close()
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(_dumps({"oplog": OPLOG_VERSION, "base": self.base}) + "\n")
+            if lines:
+                fh.write("\n".join(lines) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self.path)
+        self._fh = open(self.path, "a", encoding="utf-8")
+        self.records_written += len(lines)
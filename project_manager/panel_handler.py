@@ -0,0 +1,62 @@
+# project_manager/panel_handler.py
+
+import json
+import os
+
+from logs.log_handler import LogHandler
+from objects.panel import Panel
+from utils.file_ops import safe_write
+
+PANEL_FILE = "project_panel.json"
+
+
+def save_panel_file(project_folder, object_library, logger=None):
+    """
+    Writes the step-and-repeat definition of the current panel to
+    'project_panel.json', or removes that file when no panel is set.
+    """
+    if logger is None:
+        logger = LogHandler()
+
+    panel_path = os.path.join(project_folder, PANEL_FILE)
+    panel = getattr(object_library, "panel", None)
+    try:
+        if panel is None:
+            if os.path.exists(panel_path):
+                os.remove(panel_path)
+                logger.log("info", f"Panel removed; deleted {panel_path}.")
+            return
+        payload = json.dumps(panel.to_dict(), indent=4)
+        if safe_write(panel_path, payload, encoding="utf-8"):
+            logger.log(
+                "info",
+                f"Panel saved at {panel_path} ({panel.board_count} boards).",
+            )
+    except Exception as e:
+        logger.log("error", f"Panel handler: Error saving {panel_path}: {e}")
+
+
+def load_panel_file(project_folder, object_library, logger=None):
+    """
+    If 'project_panel.json' exists, installs the panel on the object_library.
+    Call after the NOD is loaded: the expanded copies written into the NOD
+    are dropped again, as the panel regenerates them.
+    """
+    if logger is None:
+        logger = LogHandler()
+
+    panel_path = os.path.join(project_folder, PANEL_FILE)
+    if not os.path.exists(panel_path):
+        object_library.set_panel(None)
+        return
+    try:
+        with open(panel_path, "r") as f:
+            panel = Panel.from_dict(json.load(f))
+    except Exception as e:
+        logger.log("error", f"Error reading panel file '{panel_path}': {e}")
+        object_library.set_panel(None)
+        return
+    object_library.set_panel(panel)
+    logger.log(
+        "info", f"Loaded panel from '{panel_path}' ({panel.board_count} boards)."
+    )
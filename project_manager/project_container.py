@@ -0,0 +1,356 @@
+# project_manager/project_container.py
+
+import gc
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, List, Optional, Tuple
+
+from logs.log_handler import LogHandler
+from objects.board_object import BoardObject
+from project_manager.project_settings import PROJECT_KEYS
+
+CONTAINER_FILE = "project.db"
+SCHEMA_VERSION = 1
+
+# Column order of the pads table; also the order of BoardObject attributes in
+# the row tuples used to diff against the saved state.
+PAD_COLUMNS = (
+    "channel",
+    "component_name",
+    "pin",
+    "signal",
+    "test_position",
+    "testability",
+    "x_coord_mm",
+    "y_coord_mm",
+    "x_coord_mm_original",
+    "y_coord_mm_original",
+    "technology",
+    "shape_type",
+    "width_mm",
+    "height_mm",
+    "hole_mm",
+    "angle_deg",
+    "prefix",
+    "visible",
+)
+BOM_COLUMNS = ("component_name", "function", "value", "package", "part_number")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS pads (
+    channel INTEGER NOT NULL UNIQUE,  -- not the rowid: rowid keeps pad order
+    component_name TEXT NOT NULL,
+    pin,
+    signal TEXT,
+    test_position TEXT,
+    testability TEXT,
+    x_coord_mm REAL,
+    y_coord_mm REAL,
+    x_coord_mm_original REAL,
+    y_coord_mm_original REAL,
+    technology TEXT,
+    shape_type TEXT,
+    width_mm REAL,
+    height_mm REAL,
+    hole_mm REAL,
+    angle_deg REAL,
+    prefix TEXT,
+    visible INTEGER
+);
+CREATE TABLE IF NOT EXISTS bom (
+    component_name TEXT PRIMARY KEY,
+    function TEXT,
+    value TEXT,
+    package TEXT,
+    part_number TEXT
+);
+CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+PadRow = Tuple
+
+
+def _upsert(table: str, columns: Tuple[str, ...]) -> str:
+    """INSERT that updates an existing row in place (keeping its rowid/order)."""
+    key, rest = columns[0], columns[1:]
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))}) "
+        f"ON CONFLICT({key}) DO UPDATE SET "
+        + ", ".join(f"{col} = excluded.{col}" for col in rest)
+    )
+
+
+def pad_row(obj: BoardObject) -> PadRow:
+    return (
+        obj.channel,
+        obj.component_name,
+        obj.pin,
+        obj.signal,
+        obj.test_position,
+        obj.testability,
+        obj.x_coord_mm,
+        obj.y_coord_mm,
+        getattr(obj, "x_coord_mm_original", obj.x_coord_mm),
+        getattr(obj, "y_coord_mm_original", obj.y_coord_mm),
+        obj.technology,
+        obj.shape_type,
+        obj.width_mm,
+        obj.height_mm,
+        obj.hole_mm,
+        obj.angle_deg,
+        obj.prefix,
+        1 if getattr(obj, "visible", True) else 0,
+    )
+
+
+def row_to_object(row: PadRow) -> BoardObject:
+    # Project loads build every pad through here: the attributes are set in
+    # one go instead of through BoardObject.__init__ (same result, as
+    # pad_row() stores every attribute but graphic_item)
+    attrs = dict(zip(PAD_COLUMNS, row))
+    attrs["signal"] = attrs["signal"] or f"S{attrs['channel']}"
+    attrs["visible"] = bool(attrs["visible"])
+    attrs["graphic_item"] = None
+    obj = BoardObject.__new__(BoardObject)
+    obj.__dict__ = attrs
+    return obj
+
+
+class ProjectContainer:
+    """
+    Single-file project store (sqlite, WAL journal) holding the pads, BOM,
+    ALF prefixes and project settings that otherwise live in project.nod,
+    project_bom.csv, project.alf and project_settings.json.
+
+    The container remembers the rows it last loaded or saved, so save() only
+    writes pads, BOM entries and settings that changed, in one transaction.
+    The legacy text files are produced on demand by export_legacy().
+    """
+
+    def __init__(self, path: str, logger: Optional[LogHandler] = None):
+        self.path = path
+        self.log = logger or LogHandler()
+        self._conn: Optional[sqlite3.Connection] = None
+        # Last state known to be on disk; None until read from the file
+        self._saved_pads: Optional[Dict[int, PadRow]] = None
+        self._saved_bom: Optional[Dict[str, tuple]] = None
+        self._saved_settings: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def for_folder(cls, project_dir: str, logger: Optional[LogHandler] = None):
+        return cls(os.path.join(project_dir, CONTAINER_FILE), logger=logger)
+
+    @staticmethod
+    def exists_in(project_dir: str) -> bool:
+        return os.path.exists(os.path.join(project_dir, CONTAINER_FILE))
+
+    # ------------------------------------------------------------------
+    #  Connection
+    # ------------------------------------------------------------------
+    def connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.executescript(_SCHEMA)
+                conn.execute(
+                    "INSERT OR IGNORE INTO meta VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def saved_at(self) -> float:
+        """Time of the last save() (epoch seconds), 0.0 if never saved."""
+        row = (
+            self.connect()
+            .execute("SELECT value FROM meta WHERE key = 'saved_at'")
+            .fetchone()
+        )
+        return float(row[0]) if row else 0.0
+
+    def is_current(self, project_dir: str) -> bool:
+        """
+        True if the container was saved after project.nod was last written,
+        i.e. it holds the newest copy of the board.
+        """
+        nod_path = os.path.join(project_dir, "project.nod")
+        if not os.path.exists(nod_path):
+            return True
+        return self.saved_at() >= os.path.getmtime(nod_path)
+
+    # ------------------------------------------------------------------
+    #  Load
+    # ------------------------------------------------------------------
+    def read_objects(self) -> List[BoardObject]:
+        rows = self.connect().execute(
+            f"SELECT {', '.join(PAD_COLUMNS)} FROM pads ORDER BY rowid"
+        ).fetchall()
+        self._saved_pads = {row[0]: row for row in rows}
+        return [row_to_object(row) for row in rows]
+
+    def read_bom(self) -> Dict[str, Dict[str, str]]:
+        rows = self.connect().execute(
+            f"SELECT {', '.join(BOM_COLUMNS)} FROM bom ORDER BY rowid"
+        ).fetchall()
+        self._saved_bom = {row[0]: row for row in rows}
+        return {row[0]: dict(zip(BOM_COLUMNS[1:], row[1:])) for row in rows}
+
+    def read_settings(self) -> dict:
+        rows = self.connect().execute("SELECT key, value FROM settings").fetchall()
+        self._saved_settings = dict(rows)
+        return {key: json.loads(value) for key, value in rows}
+
+    def load(self, object_library, bom_handler=None, constants=None) -> int:
+        """
+        Replace the library contents (and BOM / project settings when given)
+        with the container's. The load is not undoable. Returns the pad count.
+        """
+        t0 = time.perf_counter()
+        # Building every pad only allocates: the collector's passes over the
+        # growing heap would cost more than the load itself
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            objects = self.read_objects()
+            object_library.load_objects(objects)
+        finally:
+            if collecting:
+                gc.enable()
+
+        if bom_handler is not None:
+            bom_handler.bom = self.read_bom()
+        if constants is not None:
+            for key, value in self.read_settings().items():
+                constants.set(key, value)
+
+        self.log.log(
+            "info",
+            f"Loaded {len(objects)} pads from '{self.path}' "
+            f"in {time.perf_counter() - t0:.3f} s.",
+            module="ProjectContainer",
+            func="load",
+        )
+        return len(objects)
+
+    # ------------------------------------------------------------------
+    #  Save
+    # ------------------------------------------------------------------
+    def save(self, object_library, bom_handler=None, constants=None) -> dict:
+        """
+        Write what changed since the last load/save in one transaction.
+        Returns the number of rows written or deleted per table.
+        """
+        conn = self.connect()
+        if self._saved_pads is None:
+            self._saved_pads = {
+                row[0]: row
+                for row in conn.execute(f"SELECT {', '.join(PAD_COLUMNS)} FROM pads")
+            }
+        if self._saved_bom is None:
+            self._saved_bom = {
+                row[0]: row
+                for row in conn.execute(f"SELECT {', '.join(BOM_COLUMNS)} FROM bom")
+            }
+        if self._saved_settings is None:
+            self._saved_settings = dict(conn.execute("SELECT key, value FROM settings"))
+
+        pads = {obj.channel: pad_row(obj) for obj in object_library.get_all_objects()}
+        pad_upserts = [
+            row for ch, row in pads.items() if self._saved_pads.get(ch) != row
+        ]
+        pad_deletes = [(ch,) for ch in self._saved_pads.keys() - pads.keys()]
+
+        bom = self._saved_bom
+        bom_upserts, bom_deletes = [], []
+        if bom_handler is not None:
+            bom = {
+                name: (name,) + tuple(attrs.get(col, "") for col in BOM_COLUMNS[1:])
+                for name, attrs in bom_handler.bom.items()
+            }
+            bom_upserts = [
+                row for name, row in bom.items() if self._saved_bom.get(name) != row
+            ]
+            bom_deletes = [(name,) for name in self._saved_bom.keys() - bom.keys()]
+
+        settings = self._saved_settings
+        setting_upserts = []
+        if constants is not None:
+            settings = {key: json.dumps(constants.get(key)) for key in PROJECT_KEYS}
+            setting_upserts = [
+                item
+                for item in settings.items()
+                if self._saved_settings.get(item[0]) != item[1]
+            ]
+
+        with conn:
+            conn.executemany("DELETE FROM pads WHERE channel = ?", pad_deletes)
+            conn.executemany(_upsert("pads", PAD_COLUMNS), pad_upserts)
+            conn.executemany("DELETE FROM bom WHERE component_name = ?", bom_deletes)
+            conn.executemany(_upsert("bom", BOM_COLUMNS), bom_upserts)
+            conn.executemany(
+                "INSERT OR REPLACE INTO settings VALUES (?, ?)", setting_upserts
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('saved_at', ?)",
+                (repr(time.time()),),
+            )
+
+        self._saved_pads = pads
+        self._saved_bom = bom
+        self._saved_settings = settings
+        written = {
+            "pads": len(pad_upserts) + len(pad_deletes),
+            "bom": len(bom_upserts) + len(bom_deletes),
+            "settings": len(setting_upserts),
+        }
+        self.log.log(
+            "info",
+            f"Project container saved to '{self.path}': {written}",
+            module="ProjectContainer",
+            func="save",
+        )
+        return written
+
+
+def export_legacy(
+    project_dir: str,
+    object_library,
+    bom_handler=None,
+    constants=None,
+    logger: Optional[LogHandler] = None,
+    fixed_ts: Optional[str] = None,
+) -> bool:
+    """
+    Write project.nod, project_bom.csv, project.alf and project_settings.json
+    for the ATE from the given (loaded) state. The files end up newer than
+    project.db, so ProjectContainer.is_current() then prefers them, which is
+    harmless as they hold the same data.
+    """
+    from objects.nod_file import BoardNodFile
+    from project_manager.alf_handler import save_alf_file
+    from project_manager.panel_handler import save_panel_file
+    from project_manager.project_settings import save_settings
+
+    log = logger or LogHandler()
+    nod_path = os.path.join(project_dir, "project.nod")
+    nod_file = BoardNodFile(nod_path, object_library=object_library)
+    ok = nod_file.save(backup=True, logger=log, fixed_ts=fixed_ts)
+    if bom_handler is not None:
+        bom_path = os.path.join(project_dir, "project_bom.csv")
+        ok = bom_handler.save_bom(bom_path, fixed_ts=fixed_ts) and ok
+    save_alf_file(project_dir, object_library, logger=log, fixed_ts=fixed_ts)
+    save_panel_file(project_dir, object_library, logger=log)
+    if constants is not None:
+        save_settings(project_dir, constants, logger=log)
+    return ok
@@ -14,10 +14,21 @@ from objects.nod_file import BoardNodFile
 from project_manager.nod_handler import NODHandler
 from project_manager.image_handler import ImageHandler
 from project_manager.alf_handler import save_alf_file
+from project_manager.panel_handler import load_panel_file, save_panel_file
 from project_manager.project_settings import load_settings, save_settings
+from constants.constants import PROJECT
+from project_manager.project_container import ProjectContainer, export_legacy
+from project_manager.operation_log import (
+    OPLOG_FILE,
+    OperationLog,
+    read_operations,
+    replay_operations,
+    set_aside,
+)
 from component_placer.bom_handler.bom_handler import BOMHandler
 from project_manager.backup_browser_dialog import BackupBrowserDialog
-from extract_visual_tasks import extract_visual_task_dict
+from project_manager.nod_diff_dialog import NodDiffDialog
+from objects.nod_diff import diff_library_against_nod
 
 
 class ProjectManager(QObject):
@@ -34,10 +45,16 @@ class ProjectManager(QObject):
         self.constants = main_window.constants
         # self.auto_save_threshold = self.constants.get("auto_save_threshold", 20)
         self.project_loaded = False  # Set to True after project load
-        # Auto-save feature disabled for now
-        # self.object_library.bulk_operation_completed.connect(
-        #     self.handle_bulk_operation_completed
-        # )
+        # sqlite project container of the current folder (optional, see
+        # the "use_project_container" constant); kept open between saves so
+        # that it can write only the rows that changed
+        self.container: ProjectContainer | None = None
+        # Crash recovery: write-ahead log of the edits since the last hard
+        # save (project.oplog), replaces the old full-file auto-save
+        self.op_log: OperationLog | None = None
+        # Board vs. .nod diff overlay and its summary dialog (created on use)
+        self.diff_layer = None
+        self._diff_dialog: NodDiffDialog | None = None
 
         # Use the shared BOMHandler instance provided from MainWindow.
         self.bom_handler = bom_handler
@@ -104,31 +121,191 @@ class ProjectManager(QObject):
         consts = self.constants
         save_settings(folder, consts, logger=self.log)
 
-    # def handle_bulk_operation_completed(self, operation: str):
-    #     """Auto-save callback (currently disabled)."""
-    #     if not self.project_loaded:
-    #         return
-    #     self.auto_save_counter += 1
-    #     self.log.log(
-    #         "debug",
-    #         f"Auto-save counter increased to {self.auto_save_counter} after operation: {operation}",
-    #     )
-    #     if self.auto_save_counter >= self.auto_save_threshold:
-    #         self.auto_save()
-
-    # def auto_save(self):
-    #     folder = self.main_window.current_project_path
-    #     if folder and folder.strip() and not folder.strip().lower().endswith("[none]"):
-    #         nod_path = os.path.join(folder, "project.nod")
-    #         self.log.log(
-    #             "info",
-    #             f"Auto-saving project to {nod_path} after {self.auto_save_counter} bulk actions.",
-    #         )
-    #         nod_file = BoardNodFile(nod_path, object_library=self.object_library)
-    #         nod_file.save(backup=True, logger=self.log)
-    #         self.auto_save_counter = 0
-    #     else:
-    #         self.log.log("warning", "Auto-save skipped: No valid project folder.")
+    def apply_image_registration(self):
+        """Hand the stored bottom-image registration (if any) to the converter."""
+        self.main_window.board_view.converter.set_registration(
+            "bottom", self.constants.get("BottomImageAffine")
+        )
+
+    def set_image_registration(self, matrix, mm_per_pixel: float | None = None):
+        """
+        Store a fitted bottom-image affine (None clears it) and apply it. The
+        mean scale of the fit, when given, becomes mm_per_pixels_bot so that
+        pad sizes on the bottom side match the registered image.
+        """
+        converter = self.main_window.board_view.converter
+        self.constants.set(
+            "BottomImageAffine", list(matrix) if matrix else None, layer=PROJECT
+        )
+        if mm_per_pixel is not None:
+            self.constants.set("mm_per_pixels_bot", mm_per_pixel, layer=PROJECT)
+            converter.set_mm_per_pixels_bot(mm_per_pixel)
+        converter.set_registration("bottom", matrix)
+        self.save_project_settings()
+
+    # ------------------------------------------------------------------
+    #  Operation log (crash recovery)
+    # ------------------------------------------------------------------
+    def _op_log_base(self, folder: str) -> str:
+        """Identity of the saved state in *folder* the operation log applies to."""
+        if self.container is not None and os.path.dirname(self.container.path) == folder:
+            return f"db:{self.container.saved_at()}"
+        nod_path = os.path.join(folder, "project.nod")
+        if not os.path.exists(nod_path):
+            return "nod:"
+        st = os.stat(nod_path)
+        return f"nod:{st.st_size}:{st.st_mtime_ns}"
+
+    def _start_op_log(self, folder: str) -> None:
+        """Log the edits made from now on into *folder*/project.oplog."""
+        self.close_op_log()
+        self.op_log = OperationLog(
+            os.path.join(folder, OPLOG_FILE),
+            self.object_library,
+            base=self._op_log_base(folder),
+            logger=self.log,
+        )
+        self.op_log.start()
+
+    def _op_log_saved(self, folder: str) -> None:
+        """After a hard save the logged edits are on disk: start an empty log."""
+        if self.op_log is not None and os.path.dirname(self.op_log.path) == folder:
+            self.op_log.truncate(self._op_log_base(folder))
+        else:
+            self._start_op_log(folder)
+
+    def close_op_log(self, discard: bool = False) -> None:
+        """Flush and close the operation log; *discard* drops the unsaved edits."""
+        if self.op_log is not None:
+            self.op_log.close(discard=discard)
+            self.op_log = None
+
+    def _open_op_log(self, folder: str) -> None:
+        """
+        Start logging the freshly loaded project; edits left in project.oplog
+        by a session that crashed are offered for replay first (and are
+        logged again, so they survive another crash until saved). The old
+        log is only deleted once it is replayed or declined.
+        """
+        recover_path = set_aside(os.path.join(folder, OPLOG_FILE))
+        base, reset, changes = read_operations(recover_path)
+        self._start_op_log(folder)
+        if not changes and not reset:
+            self._discard_recovery(recover_path)
+            return
+        if base != self.op_log.base:
+            self.log.log(
+                "warning",
+                "Operation log does not belong to the saved project files; ignored.",
+            )
+            self._discard_recovery(recover_path)
+            return
+        response = QMessageBox.question(
+            self.main_window,
+            "Recover Unsaved Changes",
+            f"The last session ended without saving {len(changes)} pad change(s).\n"
+            "Recover them?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes,
+        )
+        if response != QMessageBox.Yes:
+            self.log.log("info", "User discarded the operation log.")
+            self._discard_recovery(recover_path)
+            return
+        try:
+            count = replay_operations(self.object_library, reset, changes)
+        except Exception as e:
+            self.log.log(
+                "error",
+                f"Replaying the operation log failed: {e}; kept in {recover_path}.",
+            )
+            return
+        self.op_log.flush()  # the replayed edits are in the new log now
+        self._discard_recovery(recover_path)
+        self.log.log("info", f"Recovered {count} pad change(s) from the operation log.")
+
+    def _discard_recovery(self, recover_path: str) -> None:
+        if os.path.exists(recover_path):
+            os.remove(recover_path)
+
+    # ------------------------------------------------------------------
+    #  Project container (project.db)
+    # ------------------------------------------------------------------
+    def _container_enabled(self) -> bool:
+        return bool(self.constants.get("use_project_container", False))
+
+    def _open_container(self, project_dir: str) -> ProjectContainer | None:
+        """
+        Container to load *project_dir* from, or None to use the text files:
+        it must exist and be newer than project.nod.
+        """
+        if self.container is not None:
+            self.container.close()
+            self.container = None
+        if not ProjectContainer.exists_in(project_dir):
+            return None
+        container = ProjectContainer.for_folder(project_dir, logger=self.log)
+        if not container.is_current(project_dir):
+            self.log.log(
+                "info",
+                "project.nod is newer than project.db; loading the text files.",
+            )
+            container.close()
+            return None
+        self.container = container
+        return container
+
+    def _save_container(self, folder: str, started: float) -> None:
+        """Partial save into project.db; the text files are left untouched."""
+        if self.container is None or os.path.dirname(self.container.path) != folder:
+            self.container = ProjectContainer.for_folder(folder, logger=self.log)
+        written = self.container.save(
+            self.object_library, bom_handler=self.bom_handler, constants=self.constants
+        )
+        save_panel_file(folder, self.object_library, logger=self.log)
+        self.object_library.undo_redo_manager.clear()
+        self._op_log_saved(folder)
+        total_time = time.perf_counter() - started
+        self.log.log(
+            "info", f"Project container saved in {total_time:.4f} seconds: {written}"
+        )
+        QMessageBox.information(
+            self.main_window,
+            "Project Saved",
+            f"Project saved to {self.container.path}\n"
+            f"Changed pads: {written['pads']}\n"
+            f"Total save time: {total_time:.4f} seconds.\n\n"
+            "Use File > Export Legacy Files to update the .nod/.csv/.alf files.",
+        )
+
+    def export_legacy_files(self):
+        """Write project.nod, project_bom.csv and project.alf for the ATE."""
+        folder = self.main_window.current_project_path
+        if not folder or folder.strip().lower().endswith("[none]"):
+            QMessageBox.warning(
+                self.main_window, "Export Legacy Files", "Save the project first."
+            )
+            return
+        ok = export_legacy(
+            folder,
+            self.object_library,
+            bom_handler=self.bom_handler,
+            constants=self.constants,
+            logger=self.log,
+            fixed_ts=time.strftime("%Y%m%d_%H%M%S"),
+        )
+        if ok:
+            QMessageBox.information(
+                self.main_window,
+                "Export Legacy Files",
+                f"project.nod, project_bom.csv and project.alf written to {folder}.",
+            )
+        else:
+            QMessageBox.critical(
+                self.main_window,
+                "Export Legacy Files",
+                "Failed to write the legacy project files; see the log.",
+            )
 
     def open_project_dialog(self):
         try:
@@ -160,14 +337,18 @@ class ProjectManager(QObject):
     def load_existing_project(self, project_dir: str):
         try:
             self.log.log("info", f"Loading existing project from: {project_dir}")
+            self.close_op_log()
 
             top_img = os.path.join(project_dir, "top_image.png")
             bottom_img = os.path.join(project_dir, "bottom_image.png")
             nod_path = os.path.join(project_dir, "project.nod")
             bom_path = os.path.join(project_dir, "project_bom.csv")
 
+            container = self._open_container(project_dir)
+
             missing = []
-            for f in [top_img, bottom_img, nod_path]:
+            required = [top_img, bottom_img] + ([] if container else [nod_path])
+            for f in required:
                 if not os.path.exists(f):
                     missing.append(os.path.basename(f))
 
@@ -184,7 +365,12 @@ class ProjectManager(QObject):
 
             # Load any project-specific settings before manipulating the view
             consts = self.constants
-            load_settings(project_dir, consts, logger=self.log)
+            consts.clear_layer(PROJECT)
+            if container:
+                for key, value in container.read_settings().items():
+                    consts.set(key, value, layer=PROJECT)
+            else:
+                load_settings(project_dir, consts, logger=self.log)
 
             mm_top = consts.get("mm_per_pixels_top", 0.0333)
             mm_bot = consts.get("mm_per_pixels_bot", 0.0333)
@@ -203,6 +389,7 @@ class ProjectManager(QObject):
             self.main_window.board_view.converter.set_mm_per_pixels_bot(mm_bot)
             self.main_window.board_view.converter.set_origin_mm(tx, ty, side="top")
             self.main_window.board_view.converter.set_origin_mm(bx, by, side="bottom")
+            self.apply_image_registration()
 
             self.log.log("info", "Clearing previous project objects.")
             self.object_library.clear()
@@ -221,29 +408,40 @@ class ProjectManager(QObject):
             self.image_handler.load_image(file_path=top_img, side="top")
             self.image_handler.load_image(file_path=bottom_img, side="bottom")
 
-            # Load the NOD file (populates ObjectLibrary)
-            self.nod_handler.load_nod_file(file_path=nod_path)
-
-            # Load BOM from CSV
-            if self.bom_handler.load_bom(bom_path):
-                self.log.log("info", f"BOM loaded from: {bom_path}")
+            if container:
+                # Pads, prefixes and BOM come from the container in one read
+                container.load(self.object_library, bom_handler=self.bom_handler)
+                self.object_library.undo_redo_manager.clear()
+                self.object_library.undo_redo_manager.push_state()
             else:
-                self.log.log(
-                    "info",
-                    "No BOM file found or BOM empty; starting with an empty BOM.",
-                )
+                # Load the NOD file (populates ObjectLibrary)
+                self.nod_handler.load_nod_file(file_path=nod_path)
+
+                # Load BOM from CSV
+                if self.bom_handler.load_bom(bom_path):
+                    self.log.log("info", f"BOM loaded from: {bom_path}")
+                else:
+                    self.log.log(
+                        "info",
+                        "No BOM file found or BOM empty; starting with an empty BOM.",
+                    )
 
             # Now delegate mismatch checking and fixing to BOMHandler
-            board_comps = [
-                obj.component_name for obj in self.object_library.get_all_objects()
-            ]
-            self.bom_handler.check_and_fix_mismatch(
-                board_comps, self.main_window, bom_path
-            )
+            # Missing/extra sets are kept live against object_library.components
+            self.bom_handler.check_and_fix_mismatch(None, self.main_window, bom_path)
+
+            if not container:
+                from project_manager.alf_handler import load_project_alf
+
+                load_project_alf(project_dir, self.object_library, logger=self.log)
 
-            from project_manager.alf_handler import load_project_alf
+            # Panel copies are regenerated from the master, not kept as pads
+            load_panel_file(project_dir, self.object_library, logger=self.log)
+            if self.object_library.panel is not None:
+                self.object_library.undo_redo_manager.clear()
+                self.object_library.undo_redo_manager.push_state()
 
-            load_project_alf(project_dir, self.object_library, logger=self.log)
+            self._open_op_log(project_dir)
 
             folder_name = os.path.basename(project_dir)
             self.main_window.update_project_name(folder_name)
@@ -280,6 +478,7 @@ class ProjectManager(QObject):
         self.log.log(
             "debug", "[create_project_manual] current_project_path set to None."
         )
+        self.close_op_log()
         self.object_library.clear()
         self.log.log(
             "debug",
@@ -297,9 +496,9 @@ class ProjectManager(QObject):
         if dlg.exec_() == dlg.Accepted:
             settings = dlg.get_settings()
             consts = self.main_window.constants
+            consts.clear_layer(PROJECT)
             for k, v in settings.items():
-                consts.set(k, v)
-            consts.save()
+                consts.set(k, v, layer=PROJECT)
             self.main_window.board_view.converter.set_mm_per_pixels_top(
                 settings["mm_per_pixels_top"]
             )
@@ -314,6 +513,7 @@ class ProjectManager(QObject):
                 settings["BottomImageYCoord"],
                 side="bottom",
             )
+            self.set_image_registration(None)
             self.save_project_settings()
 
         QSettings("MyCompany", "PCB Digitization Tool").setValue("last_numbers", "{}")
@@ -359,6 +559,7 @@ class ProjectManager(QObject):
         )
         self.main_window.current_project_path = None
         self.main_window.update_project_name("[None]")
+        self.close_op_log()
         self.object_library.clear()
 
         mdb_path, _ = QFileDialog.getOpenFileName(
@@ -381,6 +582,9 @@ class ProjectManager(QObject):
         QApplication.processEvents()
 
         try:
+            # Imported here so pandas/pyodbc are only loaded when an MDB is used
+            from extract_visual_tasks import extract_visual_task_dict
+
             data = extract_visual_task_dict(mdb_path)
         except Exception as exc:
             progress.close()
@@ -397,13 +601,17 @@ class ProjectManager(QObject):
             self.image_handler.load_image(file_path=bottom_img, side="bottom")
 
         consts = self.main_window.constants
-        consts.set("mm_per_pixels_top", float(data.get("ImagePxMmX", 0.0)))
-        consts.set("mm_per_pixels_bot", float(data.get("BottomImagePxMmX", 0.0)))
-        consts.set("TopImageXCoord", float(data.get("ImageXCoord", 0.0)))
-        consts.set("TopImageYCoord", float(data.get("ImageYCoord", 0.0)))
-        consts.set("BottomImageXCoord", float(data.get("BottomImageXCoord", 0.0)))
-        consts.set("BottomImageYCoord", float(data.get("BottomImageYCoord", 0.0)))
-        consts.save()
+        consts.clear_layer(PROJECT)
+        mdb_keys = {
+            "mm_per_pixels_top": "ImagePxMmX",
+            "mm_per_pixels_bot": "BottomImagePxMmX",
+            "TopImageXCoord": "ImageXCoord",
+            "TopImageYCoord": "ImageYCoord",
+            "BottomImageXCoord": "BottomImageXCoord",
+            "BottomImageYCoord": "BottomImageYCoord",
+        }
+        for key, mdb_key in mdb_keys.items():
+            consts.set(key, float(data.get(mdb_key, 0.0)), layer=PROJECT)
 
         self.main_window.board_view.converter.set_mm_per_pixels_top(
             consts.get("mm_per_pixels_top")
@@ -419,6 +627,7 @@ class ProjectManager(QObject):
             consts.get("BottomImageYCoord"),
             side="bottom",
         )
+        self.set_image_registration(None)
         self.save_project_settings()
 
         progress.close()
@@ -462,18 +671,19 @@ class ProjectManager(QObject):
                     "Duplicate Names Fixed",
                     "Duplicate component names were detected and renamed:\n" + rename_msg,
                 )
-                board_set = set(
-                    [obj.component_name for obj in self.object_library.get_all_objects()]
-                )
                 from component_placer.bom_handler.bom_editor_dialog import BOMEditorDialog
                 dlg = BOMEditorDialog(
                     bom_handler=self.bom_handler,
-                    board_component_names=board_set,
+                    board_component_names=None,
                     parent=self.main_window,
                 )
                 if dlg.exec_() != dlg.Accepted:
                     return
 
+            if self._container_enabled():
+                self._save_container(folder, overall_start)
+                return
+
             # NOD ----------------------------------------------------------------
             t0 = time.perf_counter()
             nod_file = BoardNodFile(nod_path, object_library=self.object_library)
@@ -492,13 +702,8 @@ class ProjectManager(QObject):
             else:
                 self.log.log("warning", "Failed to save BOM.")
 
-            # mismatch check unchanged …
-            board_comps = [
-                obj.component_name for obj in self.object_library.get_all_objects()
-            ]
-            self.bom_handler.check_and_fix_mismatch(
-                board_comps, self.main_window, bom_path
-            )
+            # Missing/extra sets are kept live against object_library.components
+            self.bom_handler.check_and_fix_mismatch(None, self.main_window, bom_path)
 
             # ALF ----------------------------------------------------------------
             t0 = time.perf_counter()
@@ -506,6 +711,7 @@ class ProjectManager(QObject):
                 folder, self.object_library, logger=self.log, fixed_ts=ts_stamp
             )
             alf_time = time.perf_counter() - t0
+            save_panel_file(folder, self.object_library, logger=self.log)
             self.log.log("info", f"ALF file saved in {alf_time:.4f} seconds.")
 
             total_time = time.perf_counter() - overall_start
@@ -520,7 +726,7 @@ class ProjectManager(QObject):
             self.log.log("info", report)
 
             self.object_library.undo_redo_manager.clear()
-            # self.auto_save_counter = 0  # Auto-save disabled
+            self._op_log_saved(folder)
 
             # Save project specific settings
             self.save_project_settings(folder)
@@ -617,13 +823,10 @@ class ProjectManager(QObject):
                 "Duplicate Names Fixed",
                 "Duplicate component names were detected and renamed:\n" + rename_msg,
             )
-            board_set = set(
-                [obj.component_name for obj in self.object_library.get_all_objects()]
-            )
             from component_placer.bom_handler.bom_editor_dialog import BOMEditorDialog
             dlg = BOMEditorDialog(
                 bom_handler=self.bom_handler,
-                board_component_names=board_set,
+                board_component_names=None,
                 parent=self.main_window,
             )
             if dlg.exec_() != dlg.Accepted:
@@ -649,10 +852,17 @@ class ProjectManager(QObject):
         from project_manager.alf_handler import save_alf_file
 
         save_alf_file(new_proj_dir, self.object_library, logger=self.log)
+        save_panel_file(new_proj_dir, self.object_library, logger=self.log)
 
         # save project specific settings
         self.save_project_settings(new_proj_dir)
 
+        if self._container_enabled():
+            self.container = ProjectContainer.for_folder(new_proj_dir, logger=self.log)
+            self.container.save(
+                self.object_library, bom_handler=self.bom_handler, constants=self.constants
+            )
+
         # ── 9. wrap‑up UI / state  ────────────────────────────────
         QMessageBox.information(
             self.main_window,
@@ -663,7 +873,7 @@ class ProjectManager(QObject):
 
         self.main_window.current_project_path = new_proj_dir
         self.main_window.update_project_name(project_name)
-        # self.auto_save_counter = 0  # Auto-save disabled
+        self._op_log_saved(new_proj_dir)
         self.project_loaded = True
 
         self.ensure_backup_dir(new_proj_dir)
@@ -893,6 +1103,64 @@ class ProjectManager(QObject):
             consts.save()
 
         dlg = BackupBrowserDialog(proj_dir, b_dir, parent=self.main_window)
-        if dlg.exec_() == dlg.Accepted:
+        # The diff dialog is a child of the (modal) browser so it stays usable
+        dlg.compare_requested.connect(lambda path: self.show_nod_diff(path, parent=dlg))
+        accepted = dlg.exec_() == dlg.Accepted
+        if self._diff_dialog is not None:
+            self._diff_dialog.close()
+        if accepted:
             # re‑load to reflect restored files
             self.load_existing_project(self.main_window.current_project_path)
+
+    # ------------------------------------------------------------------
+    #  Board vs. backup / external .nod diff
+    # ------------------------------------------------------------------
+    def compare_nod_dialog(self):
+        """Diff the live board against a .nod file picked by the user."""
+        nod_path, _ = QFileDialog.getOpenFileName(
+            self.main_window,
+            "Compare with NOD File",
+            self.main_window.current_project_path or "",
+            "NOD Files (*.nod *.bak);;All Files (*)",
+        )
+        if nod_path:
+            self.show_nod_diff(nod_path)
+
+    def show_nod_diff(self, nod_path: str, parent=None):
+        """
+        Diff the live board against *nod_path*: colour-coded overlay on the
+        board plus a summary dialog; closing the dialog removes the overlay.
+        """
+        started = time.perf_counter()
+        try:
+            diff = diff_library_against_nod(self.object_library, nod_path)
+        except OSError as e:
+            self.log.log("error", f"Failed to read {nod_path} for the diff: {e}")
+            QMessageBox.critical(self.main_window, "Compare", f"Cannot read {nod_path}:\n{e}")
+            return
+        self.log.log(
+            "info",
+            f"Diff against {nod_path} in {time.perf_counter() - started:.4f} seconds: {diff}",
+        )
+
+        if self._diff_dialog is not None:
+            self._diff_dialog.close()  # also clears the previous overlay
+        board_view = self.main_window.board_view
+        if self.diff_layer is None:
+            from display.diff_layer import DiffLayer
+
+            self.diff_layer = DiffLayer(board_view.scene)
+        self.diff_layer.set_diff(
+            diff, board_view.converter, board_view.display_library.current_side
+        )
+
+        dialog = NodDiffDialog(
+            diff, os.path.basename(nod_path), parent=parent or self.main_window
+        )
+        dialog.finished.connect(self._nod_diff_closed)
+        dialog.show()
+        self._diff_dialog = dialog
+
+    def _nod_diff_closed(self, _result=None):
+        self.diff_layer.clear()
+        self._diff_dialog = None
@@ -1,7 +1,7 @@
 import os
 import json
 from logs.log_handler import LogHandler
-from constants.constants import Constants
+from constants.constants import PROJECT, Constants
 
 PROJECT_KEYS = [
     "mm_per_pixels_top",
@@ -10,8 +10,13 @@ PROJECT_KEYS = [
     "BottomImageYCoord",
     "TopImageXCoord",
     "TopImageYCoord",
+    "BottomImageAffine",
 ]
 
+# Keys reset when a project's settings file does not have them, so that a
+# value from the previously opened project is not carried over
+PROJECT_DEFAULTS = {"BottomImageAffine": None}
+
 
 def load_settings(project_dir: str, constants: Constants, logger: LogHandler | None = None) -> None:
     """Load project specific constants into ``constants`` from ``project_dir``."""
@@ -24,10 +29,13 @@ def load_settings(project_dir: str, constants: Constants, logger: LogHandler | N
     try:
         with open(settings_path, "r") as f:
             data = json.load(f)
+        # Project values live in the constants' project layer only; the
+        # global/user settings files are not rewritten by opening a project.
         for key in PROJECT_KEYS:
             if key in data:
-                constants.set(key, data[key])
-        constants.save()
+                constants.set(key, data[key], layer=PROJECT)
+            elif key in PROJECT_DEFAULTS:
+                constants.set(key, PROJECT_DEFAULTS[key], layer=PROJECT)
         logger.log("info", f"Loaded project settings from {settings_path}")
     except Exception as e:
         logger.log("error", f"Failed to load project settings: {e}")
@@ -0,0 +1,9 @@
+import pytest
+
+from objects.object_library import ObjectLibrary
+
+
+@pytest.fixture
+def lib():
+    """A fresh, independent ObjectLibrary (not the process-wide default)."""
+    return ObjectLibrary(shared=False)
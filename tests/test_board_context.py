@@ -0,0 +1,120 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import threading  # noqa: E402
+import time  # noqa: E402
+
+from constants.constants import Constants  # noqa: E402
+from logs.log_handler import LogHandler  # noqa: E402
+from objects.board_object import BoardObject  # noqa: E402
+from objects.nod_file import BoardNodFile  # noqa: E402
+from objects.object_library import ObjectLibrary  # noqa: E402
+from project_manager.board_context import BoardContext, process_projects  # noqa: E402
+from project_manager.project_container import ProjectContainer  # noqa: E402
+from utils.flag_manager import FlagManager  # noqa: E402
+
+PROJECTS = 8
+PADS = 1000
+
+
+def test_default_instances_are_kept_as_a_shim():
+    assert ObjectLibrary() is ObjectLibrary()
+    assert FlagManager() is FlagManager() and Constants() is Constants()
+    assert LogHandler() is LogHandler()
+    default = BoardContext.default()
+    assert default.object_library is ObjectLibrary()
+    assert default.flags is FlagManager()
+
+
+def test_contexts_are_independent():
+    a, b = BoardContext(), BoardContext()
+    assert a.object_library is not b.object_library is not ObjectLibrary()
+    a.object_library.bulk_add([BoardObject("U1", 1), BoardObject("U1", 2)], skip_undo=True)
+    b.object_library.bulk_add([BoardObject("J1", 1)], skip_undo=True)
+    assert sorted(a.object_library.objects) == [1, 2]
+    assert sorted(b.object_library.objects) == [1]
+    assert b.object_library.components.names() == {"J1"}
+
+    a.converter.set_image_size((1000, 800))
+    b.converter.set_image_size((1000, 800))
+    a.side, b.side = "top", "Bottom"
+    assert (a.side, b.side) == ("top", "bottom")
+    assert b.flags is not FlagManager()
+    # Same pixel, different side -> mirrored x
+    assert a.converter.pixels_to_mm(100, 100)[0] != b.converter.pixels_to_mm(100, 100)[0]
+    assert a.log is not b.log and a.log.tag != b.log.tag
+
+
+def _write_projects(root, count):
+    dirs = []
+    for i in range(count):
+        folder = root / f"project{i}"
+        folder.mkdir()
+        lines = ["* SIGNAL COMPONENT PIN X Y PAD POS TECN TEST CHANNEL USER\n"]
+        lines += [
+            f'"S{k}" "U{i}" {k} {k:.3f} 0.000 R40 T S F {k}\n'
+            for k in range(1, PADS + 1)
+        ]
+        (folder / "project.nod").write_text("".join(lines))
+        dirs.append(str(folder))
+    return dirs
+
+
+class _Overlap:
+    """Counts how many jobs were running at the same time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.running = self.peak = 0
+
+    def __enter__(self):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+    def __exit__(self, *exc):
+        with self._lock:
+            self.running -= 1
+
+
+def _converter(overlap):
+    def convert(context, project_dir):
+        """Text project -> container, the way a headless batch job would."""
+        with overlap:
+            BoardNodFile(
+                os.path.join(project_dir, "project.nod"), context.object_library
+            ).load(skip_undo=True)
+            container = ProjectContainer.for_folder(project_dir, logger=context.log)
+            counts = container.save(context.object_library)
+            container.close()
+        return context.object_library.components.names(), counts["pads"]
+
+    return convert
+
+
+def test_projects_processed_concurrently(tmp_path):
+    dirs = _write_projects(tmp_path, PROJECTS)
+
+    overlap = _Overlap()
+    start = time.perf_counter()
+    results = process_projects(dirs, _converter(overlap))
+    parallel = time.perf_counter() - start
+
+    assert results == [({f"U{i}"}, PADS) for i in range(PROJECTS)]
+    for folder in dirs:
+        assert len(ProjectContainer.for_folder(folder).read_objects()) == PADS
+    assert overlap.peak > 1
+
+    for folder in dirs:
+        os.remove(os.path.join(folder, "project.db"))
+    serial = _Overlap()
+    start = time.perf_counter()
+    process_projects(dirs, _converter(serial), max_workers=1)
+    sequential = time.perf_counter() - start
+    assert serial.peak == 1
+
+    # Parsing is serialised by the GIL and local files sit in the page cache,
+    # so real file work overlaps little; the pool must at least not cost more
+    # than its bookkeeping
+    assert sequential / parallel > 0.75, (sequential, parallel)
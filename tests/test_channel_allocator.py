@@ -0,0 +1,76 @@
+
+from objects.board_object import BoardObject
+from objects.channel_allocator import ChannelAllocator
+
+
+def _pads(n, comp="U1"):
+    return [BoardObject(component_name=comp, pin=i + 1) for i in range(n)]
+
+
+def test_allocator_reuses_lowest_free_and_finds_blocks():
+    alloc = ChannelAllocator([1, 2, 3, 5, 9])
+    assert alloc.allocate() == 4
+    assert alloc.allocate_block(3) == [6, 7, 8]
+    alloc.release(2)
+    assert alloc.peek() == 2
+    assert alloc.allocate_block(2) == [10, 11]
+    alloc.release(11)
+    alloc.release(10)
+    assert alloc.high_water == 10
+
+
+def test_deleted_channels_are_reused(lib):
+    lib.bulk_add(_pads(5))
+    lib.bulk_delete([2, 3])
+    lib.bulk_add(_pads(2, comp="U2"))
+    assert sorted(lib.objects) == [1, 2, 3, 4, 5]
+    assert {lib.objects[2].component_name, lib.objects[3].component_name} == {"U2"}
+
+
+def test_orphan_net_name_blocks_reuse(lib):
+    lib.bulk_add(_pads(3))
+    lib.objects[3].signal = "S1"
+    lib.refresh_channel_counter()
+    lib.bulk_delete([1])
+
+    # Pad 3 still uses net "S1": channel 1 must not come back as a new pad
+    lib.bulk_add(_pads(1, comp="U2"))
+    assert 1 not in lib.objects
+    assert lib.objects[4].signal == "S4"
+
+
+def test_compact_channels_is_one_undo_step(lib):
+    lib.bulk_add(_pads(6))
+    lib.objects[6].signal = "S2"
+    lib.refresh_channel_counter()
+    lib.bulk_delete([1, 2, 4])
+    undo_depth = len(lib.undo_redo_manager.undo_stack)
+
+    mapping = lib.compact_channels()
+
+    assert mapping == {3: 1, 5: 2, 6: 3}
+    assert sorted(lib.objects) == [1, 2, 3]
+    assert lib.objects[1].signal == "S1"
+    assert lib.objects[2].signal == "S2"
+    # The orphan net S2 was moved above the dense range instead of merging
+    assert lib.objects[3].signal == "S4"
+    assert len(lib.undo_redo_manager.undo_stack) == undo_depth + 1
+
+    assert lib.undo()
+    assert sorted(lib.objects) == [3, 5, 6]
+    assert lib.get_next_channel() == 1
+
+
+def test_unused_reservations_can_be_released(lib):
+    lib.bulk_add(_pads(2))
+    block = lib.get_channel_block(3)
+    assert block == [3, 4, 5]
+
+    # Only the first reserved channel is used; the rest are given back
+    pad = _pads(1, comp="U2")[0]
+    pad.channel = block[0]
+    lib.bulk_add([pad])
+    lib.release_channels(block)
+
+    assert 3 in lib.channels and 4 not in lib.channels
+    assert lib.get_next_channel() == 4
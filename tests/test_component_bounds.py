@@ -0,0 +1,94 @@
+import copy
+
+from objects.board_object import BoardObject
+from objects.component_bounds import ComponentBounds
+
+
+def pad(channel, comp, x, y, size=1.0, **kwargs):
+    obj = BoardObject(comp, channel, x_coord_mm=x, y_coord_mm=y, **kwargs)
+    obj.channel = channel
+    obj.width_mm = obj.height_mm = size
+    return obj
+
+
+def test_box_grows_and_shrinks_incrementally():
+    bounds = ComponentBounds()
+    bounds.track(pad(1, "U1", 0, 0))
+    bounds.track(pad(2, "U1", 10, 4))
+    assert bounds.box("U1") == (-0.5, -0.5, 10.5, 4.5)
+
+    bounds.track(pad(2, "U1", 2, 2))  # moved inwards
+    assert bounds.box("U1") == (-0.5, -0.5, 2.5, 2.5)
+    bounds.discard(1)
+    assert bounds.box("U1") == (1.5, 1.5, 2.5, 2.5)
+    bounds.discard(2)
+    assert bounds.box("U1") is None
+
+
+def test_sides_and_change_tracking():
+    bounds = ComponentBounds()
+    bounds.rebuild(
+        [
+            pad(1, "J1", 0, 0, technology="Through Hole"),
+            pad(2, "R1", 5, 5, test_position="Bottom"),
+            pad(3, "C1", 8, 8),
+        ]
+    )
+    assert set(bounds.boxes("top")) == {"J1", "C1"}
+    assert set(bounds.boxes("bottom")) == {"J1", "R1"}
+    assert bounds.take_changed("top") == {"J1", "C1"}
+    assert bounds.take_changed("top") == set()
+
+    bounds.track(pad(3, "C1", 9, 9))
+    assert bounds.take_changed("top") == {"C1"}
+    assert bounds.take_changed("bottom") == {"J1", "R1"}
+
+
+def test_component_at_prefers_smallest_box():
+    bounds = ComponentBounds()
+    bounds.rebuild(
+        [
+            pad(1, "BIG", 0, 0),
+            pad(2, "BIG", 30, 30),
+            pad(3, "SMALL", 15, 15),
+        ]
+    )
+    assert bounds.component_at(15, 15) == "SMALL"
+    assert bounds.component_at(25, 5) == "BIG"
+    assert bounds.component_at(50, 50) is None
+
+
+def test_library_keeps_bounds_current(lib):
+    lib.bulk_add([pad(1, "U1", 0, 0), pad(2, "U1", 4, 0)])
+    bounds = lib.component_bounds
+    assert bounds.box("U1") == (-0.5, -0.5, 4.5, 0.5)
+
+    moved = copy.copy(lib.objects[2])
+    moved.x_coord_mm = 1
+    lib.bulk_update_objects([moved], {})
+    assert bounds.box("U1") == (-0.5, -0.5, 1.5, 0.5)
+
+    lib.undo()
+    assert bounds.box("U1") == (-0.5, -0.5, 4.5, 0.5)
+    lib.bulk_delete([1, 2])
+    assert bounds.boxes("top") == {}
+
+
+def test_component_at_refiles_only_changed_components():
+    bounds = ComponentBounds()
+    bounds.rebuild(
+        [pad(ch, f"R{ch}", (ch % 50) * 5.0, (ch // 50) * 5.0) for ch in range(1, 2001)]
+    )
+    assert bounds.component_at(5, 0) == "R1"
+    cells = dict(bounds._cells)
+
+    bounds.track(pad(1, "R1", 300, 300))  # one pad moved far away
+    assert bounds._stale["top"] == {"R1"}
+    assert bounds.component_at(5, 0) is None
+    assert bounds.component_at(300, 300) == "R1"
+    changed = {key for key in cells if bounds._cells.get(key) is not cells[key]}
+    assert changed == {("top", "R1")}
+
+    bounds.discard(1)
+    assert bounds.component_at(300, 300) is None
+    assert ("top", "R1") not in bounds._cells
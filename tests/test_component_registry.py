@@ -0,0 +1,68 @@
+import copy
+
+import pytest
+
+from component_placer.bom_handler.bom_handler import BOMHandler
+from objects.board_object import BoardObject
+
+
+@pytest.fixture
+def lib(lib):
+    lib.bulk_add(
+        [
+            BoardObject("U1", 1),
+            BoardObject("U1", 2),
+            BoardObject("R1", 1),
+        ]
+    )
+    return lib
+
+
+@pytest.fixture
+def bom(lib):
+    bom = BOMHandler()
+    bom.add_component("U1", "IC", "", "SO8", "")
+    bom.add_component("C9", "CAP", "1u", "0603", "")
+    bom.attach_board(lib.components)
+    yield bom
+    bom.detach_board()
+
+
+def test_registry_counts_pads_per_component(lib):
+    reg = lib.components
+    assert reg.names() == {"U1", "R1"}
+    assert reg.pad_count("U1") == 2
+
+    events = []
+    reg.subscribe(lambda a, v: events.append((a, v)))
+    try:
+        lib.bulk_delete([1])  # U1 keeps a pad: no transition
+        renamed = copy.deepcopy(lib.objects[3])
+        renamed.component_name = "R2"
+        lib.bulk_update_objects([renamed], {})
+        assert events == [({"R2"}, {"R1"})]
+        assert reg.pad_count("U1") == 1 and "R1" not in reg
+    finally:
+        reg._listeners.clear()
+
+
+def test_bom_mismatch_follows_board_and_bom(lib, bom):
+    assert bom.check_mismatch() == ({"R1"}, {"C9"})
+
+    lib.add_object(BoardObject("C9", 1))
+    lib.bulk_delete([1, 2])  # last U1 pads
+    assert bom.check_mismatch() == ({"R1"}, {"U1"})
+
+    bom.add_component("R1", "RES", "1k", "0402", "")
+    bom.remove_component("U1")
+    assert bom.check_mismatch() == (set(), set())
+
+    lib.undo()  # U1 pads come back (BOM untouched by undo)
+    assert bom.check_mismatch() == ({"U1"}, set())
+
+    bom.bom = {}  # whole-BOM replacement (load, undo, editor)
+    assert bom.check_mismatch() == (lib.components.names(), set())
+
+
+def test_explicit_component_list_still_supported(bom):
+    assert bom.check_mismatch(["U1", "X1"]) == ({"X1"}, {"C9"})
@@ -0,0 +1,62 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+from PyQt5.QtCore import QPointF  # noqa: E402
+
+from display.coord_converter import CoordinateConverter  # noqa: E402
+from utils.flag_manager import FlagManager  # noqa: E402
+
+POINTS_MM = [(0.0, 0.0), (12.5, -3.25), (-7.0, 40.0), (101.3, 55.55)]
+
+
+@pytest.fixture
+def conv():
+    conv = CoordinateConverter((1200, 800))
+    conv.set_mm_per_pixels_top(0.05)
+    conv.set_mm_per_pixels_bot(0.04)
+    conv.set_origin_mm(3.0, -2.0, "top")
+    conv.set_origin_mm(-5.5, 7.25, "bottom")
+    return conv
+
+
+@pytest.mark.parametrize("side", ["top", "bottom"])
+def test_arrays_match_scalar_conversions(conv, side):
+    px = conv.mm_to_pixels_array(POINTS_MM, side)
+    assert px.shape == (len(POINTS_MM), 2)
+    expected = [conv.mm_to_pixels(x, y, side) for x, y in POINTS_MM]
+    np.testing.assert_allclose(px, expected)
+
+    mm = conv.pixels_to_mm_array(px, side)
+    np.testing.assert_allclose(mm, [conv.pixels_to_mm(x, y, side) for x, y in px])
+    np.testing.assert_allclose(mm, POINTS_MM, atol=1e-9)
+
+
+@pytest.mark.parametrize("side", ["top", "bottom"])
+def test_scene_transform_matches_scalar(conv, side):
+    to_scene = conv.mm_to_scene_transform(side)
+    to_mm = conv.scene_to_mm_transform(side)
+    for x, y in POINTS_MM:
+        p = to_scene.map(QPointF(x, y))
+        assert (p.x(), p.y()) == pytest.approx(conv.mm_to_pixels(x, y, side))
+        back = to_mm.map(p)
+        assert (back.x(), back.y()) == pytest.approx((x, y))
+
+
+def test_side_defaults_to_flag_and_transform_cache(conv):
+    flags = FlagManager()
+    old = flags.get_flag("side", "top")
+    try:
+        flags.set_flag("side", "bottom")
+        assert conv.mm_to_pixels(1, 2) == conv.mm_to_pixels(1, 2, "bottom")
+    finally:
+        flags.set_flag("side", old)
+
+    first = conv.mm_to_scene_transform("top")
+    assert conv.mm_to_scene_transform("top") is first
+    conv.set_image_size((1000, 1000))
+    moved = conv.mm_to_scene_transform("top")
+    assert moved is not first
+    assert moved.map(QPointF(3.0, -2.0)).y() == pytest.approx(1000)
@@ -0,0 +1,132 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import math  # noqa: E402
+import shutil  # noqa: E402
+import time  # noqa: E402
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from component_placer.footprint_index import (  # noqa: E402
+    FootprintIndex,
+    replace_with_footprint,
+    signature,
+)
+from objects.board_object import BoardObject  # noqa: E402
+from objects.nod_diff import read_nod_rows  # noqa: E402
+
+app = QApplication.instance() or QApplication([])
+
+LIBRARIES = os.path.join(os.path.dirname(os.path.dirname(__file__)), "component_libraries")
+FOOTPRINTS = 10_000
+QUERY_BUDGET_S = 1.0
+
+
+@pytest.fixture
+def library(tmp_path):
+    root = tmp_path / "component_libraries"
+    for folder in ("SOIC", "QFP"):
+        shutil.copytree(os.path.join(LIBRARIES, folder), str(root / folder))
+    return str(root)
+
+
+def _hand_drawn(points, angle_deg, mirrored, offset, noise=0.02, seed=0):
+    """Library pad positions as somebody would digitize them on the board."""
+    pts = np.asarray(points, dtype=float)
+    pts = pts - pts.mean(axis=0)
+    if mirrored:
+        pts = pts * (-1.0, 1.0)
+    a = math.radians(angle_deg)
+    rot = np.array([[math.cos(a), math.sin(a)], [-math.sin(a), math.cos(a)]])
+    pts = pts @ rot + offset
+    rng = np.random.default_rng(seed)
+    pts = pts + rng.normal(0.0, noise, pts.shape)
+    return pts[rng.permutation(len(pts))]
+
+
+def test_recognizes_rotated_mirrored_noisy_footprint(library):
+    index = FootprintIndex(library)
+    assert index.refresh() == len(index.entries) > 0
+    for name, angle, mirrored in (("SOIC8", 37.0, False), ("TEST_10_Asym", 123.0, True)):
+        path = next(p for p in index.entries if os.path.basename(p) == f"{name}.nod")
+        drawn = _hand_drawn(index.entries[path]["points"], angle, mirrored, (120.0, 80.0))
+        best = index.query(drawn.tolist())[0]
+        assert best.name == name
+        assert best.pose.mirrored == mirrored
+        assert best.pose.rms_mm < 0.05
+
+
+def test_refresh_is_incremental_and_cached(library):
+    cache = os.path.join(library, ".footprint_index.json")
+    index = FootprintIndex(library, cache_path=cache)
+    total = index.refresh()
+    assert index.refresh() == 0
+
+    soic8 = os.path.join(library, "SOIC", "SOIC8.nod")
+    with open(soic8, "a") as fh:
+        fh.write('"S9" "COMP_0" 9 0.000 9.000 R40 T S F 0\n')
+    os.remove(os.path.join(library, "SOIC", "SOIC14.nod"))
+    shutil.copy(soic8, os.path.join(library, "SOIC", "SOIC8_COPY.NOD"))
+    assert index.refresh() == 2
+    assert len(index.entries) == total
+    assert len(index.entries[soic8]["points"]) == 9
+
+    reloaded = FootprintIndex(library, cache_path=cache)
+    assert reloaded.refresh() == 0
+    assert reloaded.entries.keys() == index.entries.keys()
+
+
+def test_query_against_10k_footprints_is_sub_second(tmp_path):
+    rng = np.random.default_rng(1)
+    index = FootprintIndex(str(tmp_path))
+    target = None
+    for k in range(FOOTPRINTS):
+        pads = 8 + k % 40
+        points = rng.uniform(0.0, 10.0, (pads, 2)).round(3)
+        entry = {"stamp": [0, 0], "points": points.tolist()}
+        index.entries[f"fp{k}.nod"] = entry
+        if k == FOOTPRINTS // 2:
+            target = (f"fp{k}", points)
+    for entry in index.entries.values():
+        entry["sig"] = signature(entry["points"]).tolist()
+
+    name, points = target
+    drawn = _hand_drawn(points, 200.0, True, (50.0, 50.0), noise=0.01)
+    start = time.perf_counter()
+    best = index.query(drawn.tolist())[0]
+    elapsed = time.perf_counter() - start
+    assert best.name == name
+    assert elapsed < QUERY_BUDGET_S, f"query took {elapsed:.2f} s"
+
+
+def test_replace_keeps_channels_and_signals(lib, library):
+    nod = os.path.join(library, "SOIC", "SOIC8.nod")
+    with open(os.path.join(library, "SOIC", "SOIC8.alf"), "w") as fh:
+        fh.writelines(f"COMP_0.P{pin} COMP_0.{pin}\n" for pin in range(1, 9))
+    rows = list(read_nod_rows(nod))
+    drawn = _hand_drawn([(r[4], r[5]) for r in rows], 90.0, False, (40.0, 30.0), seed=3)
+    lib.bulk_add(
+        [
+            BoardObject("U7", 100 + k, channel=50 + k, signal=f"NET{k}",
+                        x_coord_mm=x, y_coord_mm=y, testability="Forced")
+            for k, (x, y) in enumerate(drawn.tolist())
+        ]
+    )
+    lib.undo_redo_manager.clear()
+
+    pose = replace_with_footprint(lib, list(lib.objects.values()), nod)
+    assert pose is not None and pose.rms_mm < 0.05
+    pads = list(lib.objects.values())
+    assert sorted(p.channel for p in pads) == list(range(50, 58))
+    assert {p.signal for p in pads} == {f"NET{k}" for k in range(8)}
+    assert {p.component_name for p in pads} == {"U7"}
+    assert sorted(int(p.pin) for p in pads) == list(range(1, 9))
+    assert all(p.prefix == f"P{p.pin}" and p.testability == "Forced" for p in pads)
+    for p, (x, y) in zip(sorted(pads, key=lambda p: p.channel), drawn.tolist()):
+        assert math.hypot(p.x_coord_mm - x, p.y_coord_mm - y) < 0.1  # landed on its pad
+
+    assert lib.undo()
+    assert sorted(int(p.pin) for p in lib.objects.values()) == list(range(100, 108))
@@ -0,0 +1,119 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import math  # noqa: E402
+import time  # noqa: E402
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QGraphicsScene  # noqa: E402
+
+from component_placer.grid_inference import complete_lattice, infer_lattice  # noqa: E402
+from display.coord_converter import CoordinateConverter  # noqa: E402
+from display.proposal_layer import ProposalLayer  # noqa: E402
+from objects.board_object import BoardObject  # noqa: E402
+
+app = QApplication.instance() or QApplication([])
+
+INFER_BUDGET_S = 1.0
+
+
+def _grid(rows, cols, row_pitch, col_pitch, angle_deg, noise, keep, seed=0):
+    """(points, cells) of a noisy rows x cols grid with a random subset kept."""
+    rng = np.random.default_rng(seed)
+    r, c = (a.ravel() for a in np.mgrid[0:rows, 0:cols])
+    a = math.radians(angle_deg)
+    col_vec = np.array([math.cos(a), math.sin(a)]) * col_pitch
+    row_vec = np.array([-math.sin(a), math.cos(a)]) * row_pitch
+    pts = (25.0, 40.0) + c[:, None] * col_vec + r[:, None] * row_vec
+    pts = pts + rng.normal(0.0, noise, pts.shape)
+    chosen = rng.random(len(pts)) < keep
+    chosen[[0, -1]] = True  # the corners fix the extent
+    return pts[chosen], np.column_stack([r, c])[chosen]
+
+
+def _pads(points, pins):
+    return [
+        BoardObject("J1", pin, x_coord_mm=x, y_coord_mm=y, width_mm=0.6, height_mm=0.6)
+        for pin, (x, y) in zip(pins, points.tolist())
+    ]
+
+
+def test_infers_large_noisy_partial_grid():
+    pts, cells = _grid(40, 60, 1.0, 1.27, 23.0, noise=0.04, keep=0.6)
+    assert len(pts) > 1000
+
+    start = time.perf_counter()
+    lattice = infer_lattice(pts)
+    elapsed = time.perf_counter() - start
+
+    assert (lattice.rows, lattice.cols) == (40, 60)
+    assert lattice.on_lattice.all()
+    assert lattice.row_pitch == pytest.approx(1.0, abs=0.005)
+    assert lattice.col_pitch == pytest.approx(1.27, abs=0.005)
+    assert lattice.angle_deg == pytest.approx(23.0, abs=0.1)
+    assert elapsed < INFER_BUDGET_S, f"inference took {elapsed:.2f} s"
+
+    added = complete_lattice(_pads(pts, range(1, len(pts) + 1)), lattice)
+    assert len(added) == 40 * 60 - len(pts)
+    # The proposed pads sit exactly on the grid cells that were not selected
+    full, _ = _grid(40, 60, 1.0, 1.27, 23.0, noise=0.0, keep=1.0)
+    selected = {tuple(cell) for cell in cells.tolist()}
+    r, c = (a.ravel() for a in np.mgrid[0:40, 0:60])
+    truth = full[[(rc not in selected) for rc in zip(r.tolist(), c.tolist())]]
+    got = np.array([(o.x_coord_mm, o.y_coord_mm) for o in added])
+    d = np.hypot(*(got[:, None, :] - truth[None, :, :]).transpose(2, 0, 1))
+    assert d.min(axis=1).max() < 0.05 and len(set(d.argmin(axis=1).tolist())) == len(truth)
+    # Sequential pins after the selection's highest pin
+    assert [o.pin for o in added] == list(range(len(pts) + 1, 40 * 60 + 1))
+
+
+def test_header_rows_far_apart_follow_existing_numbering():
+    # 2 x 10 header, rows 5 mm apart, pin 1/2 across (odd top row, even bottom)
+    pts, cells = _grid(2, 10, 5.0, 1.27, 90.0, noise=0.02, keep=0.5, seed=4)
+    pins = (cells[:, 1] * 2 + cells[:, 0] + 1).tolist()
+    lattice = infer_lattice(pts)
+    pitches = sorted((lattice.row_pitch, lattice.col_pitch))
+    assert pitches == pytest.approx([1.27, 5.0], abs=0.05)
+
+    pads = _pads(pts, pins)
+    added = complete_lattice(pads, lattice, lattice.rows, lattice.cols)
+    assert sorted(pins + [o.pin for o in added]) == list(range(1, 21))
+    assert all(o.component_name == "J1" and o.width_mm == 0.6 for o in added)
+    by_pin = {p.pin: (p.x_coord_mm, p.y_coord_mm) for p in pads + added}
+    pitch_along = math.dist(by_pin[1], by_pin[3])
+    assert pitch_along == pytest.approx(1.27, abs=0.05)
+    assert math.dist(by_pin[1], by_pin[2]) == pytest.approx(5.0, abs=0.05)
+
+
+def test_single_row_and_outliers():
+    pts, _ = _grid(1, 30, 0.0, 2.54, -60.0, noise=0.03, keep=0.7, seed=2)
+    strays = np.array([[pts[0, 0] + 0.9, pts[0, 1] + 0.4], [pts[1, 0] - 1.1, pts[1, 1]]])
+    lattice = infer_lattice(np.vstack([pts, strays]))
+    assert (lattice.rows, lattice.cols) == (1, 30)
+    assert lattice.on_lattice.tolist() == [True] * len(pts) + [False, False]
+    assert lattice.col_pitch == pytest.approx(2.54, abs=0.01)
+    assert infer_lattice(pts[:1]) is None
+
+
+def test_proposal_ghost_accepts_in_one_undo_step(lib):
+    pts, cells = _grid(3, 8, 2.0, 2.0, 0.0, noise=0.01, keep=0.5, seed=1)
+    pads = _pads(pts, range(1, len(pts) + 1))
+    lib.bulk_add(pads)
+    lib.undo_redo_manager.clear()
+
+    lattice = infer_lattice(pts)
+    proposed = complete_lattice(pads, lattice)
+    scene = QGraphicsScene()
+    conv = CoordinateConverter()
+    conv.set_image_size((1000, 1000))
+    layer = ProposalLayer(scene)
+    layer.set_objects(proposed, conv, "top")
+    assert len(scene.items()) == 1
+
+    assert layer.accept(lib) == 24 - len(pts)
+    assert scene.items() == [] and layer.objects == []
+    assert len(lib.objects) == 24
+    assert lib.undo()
+    assert len(lib.objects) == len(pts)
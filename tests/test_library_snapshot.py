@@ -0,0 +1,88 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import threading  # noqa: E402
+
+from objects.board_object import BoardObject  # noqa: E402
+from objects.nod_file import BoardNodFile  # noqa: E402
+
+
+def _state(mapping):
+    return {ch: (o.component_name, o.pin, o.testability) for ch, o in mapping.items()}
+
+
+def test_snapshot_is_unaffected_by_later_edits(lib):
+    lib.bulk_add([BoardObject("R1", pin, channel=pin) for pin in range(1, 6)])
+    snap = lib.snapshot()
+    assert snap._objects is lib.objects  # O(1): nothing copied yet
+    before = _state(snap)
+
+    stored = lib.objects[1]
+    lib.bulk_update_objects([stored], {"testability": "Forced"})
+    lib.rename_components({"R1": "R9"})
+    lib.bulk_delete([2])
+    lib.bulk_add([BoardObject("C1", 1, channel=10)])
+
+    assert _state(snap) == before
+    assert stored.testability != "Forced"  # replaced, not edited in place
+    assert lib.objects[1].testability == "Forced"
+    assert lib.objects[1].component_name == "R9"
+    assert 2 not in lib.objects and 10 in lib.objects
+    assert snap.version < lib.revision
+
+    fresh = lib.snapshot()
+    assert fresh.pad_version(3) > snap.pad_version(3)  # renamed
+    assert set(fresh.changed_since(snap.version)) == {1, 3, 4, 5, 10}
+    assert snap.pad_version(10) is None
+
+    lib.undo()
+    assert fresh[10].component_name == "C1" and 10 not in lib.objects
+
+
+def test_worker_thread_reads_snapshot_while_gui_edits(lib):
+    lib.bulk_add([BoardObject("U1", pin, channel=pin) for pin in range(1, 2001)], skip_undo=True)
+    snap = lib.snapshot()
+    errors, sums = [], []
+
+    def reader():
+        try:
+            for _ in range(20):
+                sums.append(sum(int(o.pin) for o in snap.values()))
+        except Exception as exc:  # e.g. "dictionary changed size during iteration"
+            errors.append(exc)
+
+    worker = threading.Thread(target=reader)
+    worker.start()
+    for step in range(50):
+        lib.bulk_delete([step + 1])
+        lib.bulk_add([BoardObject("U2", step, channel=5000 + step)], skip_undo=True)
+    worker.join()
+
+    assert errors == []
+    assert set(sums) == {sum(range(1, 2001))}
+    assert len(lib.objects) == 2000 and len(snap) == 2000
+
+
+def test_nod_save_reserializes_only_changed_pads(lib, tmp_path, monkeypatch):
+    lib.bulk_add([BoardObject("U1", pin, channel=pin, x_coord_mm=pin) for pin in range(1, 51)])
+    nod = BoardNodFile(str(tmp_path / "board.nod"), object_library=lib)
+    calls = []
+    original = BoardNodFile._nod_line
+    monkeypatch.setattr(
+        BoardNodFile, "_nod_line", staticmethod(lambda obj: calls.append(obj) or original(obj))
+    )
+
+    assert nod.save()
+    first = (tmp_path / "board.nod").read_text()
+    assert len(calls) == 50
+
+    calls.clear()
+    edited = dict(vars(lib.objects[7]))
+    lib.bulk_update_objects([lib.objects[7]], {"testability": "Forced"})
+    assert nod.save()
+    assert [o.channel for o in calls] == [7]
+
+    text = (tmp_path / "board.nod").read_text()
+    assert text.count("\n") == first.count("\n")
+    assert text != first and edited["testability"] != "Forced"
@@ -0,0 +1,80 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import time  # noqa: E402
+
+from component_placer.bom_handler.bom_handler import BOMHandler  # noqa: E402
+from objects.board_object import BoardObject  # noqa: E402
+from objects.name_registry import NameRegistry, suffix_letters  # noqa: E402
+
+# 20k components, a third of them case-variants of 500 base names
+BENCH_COMPONENTS = 20_000
+BENCH_BUDGET_S = 5.0
+
+
+def test_name_registry_folds_case_and_generates_unique_names():
+    assert [suffix_letters(i) for i in (0, 25, 26, 701, 702)] == [
+        "A", "Z", "AA", "ZZ", "AAA",
+    ]
+    names = NameRegistry(["R1", "r1", "U1", "R1_A"])
+    assert "u1" in names and "U2" not in names
+    assert names.spellings("R1") == {"R1", "r1"}
+    assert names.collisions() == [{"R1", "r1"}]
+
+    board = NameRegistry(["r1_b"])
+    assert names.unique_name("r1", board) == "r1_C"  # R1_A and r1_b taken
+    assert names.unique_name("R1") == "R1_D"  # counter kept per base name
+    names.remove("r1")
+    names.remove("R1")
+    assert names.spellings("R1") == set()
+
+
+def test_fix_duplicate_names_renames_pads_in_one_undo_step(lib):
+    lib.bulk_add(
+        [BoardObject("R1", 1), BoardObject("r1", 1), BoardObject("r1", 2), BoardObject("C1", 1)]
+    )
+    assert lib.components.channels("R1", ignore_case=True) == {1, 2, 3}
+    bom = BOMHandler()
+    bom.bom = {
+        "R1": {"function": "RES"},
+        "r1": {"function": "CAP"},
+        "C1": {"function": "CAP"},
+    }
+    bom.attach_board(lib.components)
+    try:
+        depth = len(lib.undo_redo_manager.undo_stack)
+        assert bom.fix_duplicate_names(lib) == [("r1", "r1_A")]
+        assert list(bom.bom) == ["R1", "r1_A", "C1"]
+        assert {o.channel: o.component_name for o in lib.get_all_objects()} == {
+            1: "R1", 2: "r1_A", 3: "r1_A", 4: "C1",
+        }
+        assert len(lib.undo_redo_manager.undo_stack) == depth + 1
+        assert bom.check_mismatch() == (set(), set())
+        assert bom.fix_duplicate_names(lib) == []
+
+        lib.undo()
+        assert lib.components.names() == {"R1", "r1", "C1"}
+    finally:
+        bom.detach_board()
+
+
+def test_fix_duplicate_names_benchmark(lib):
+    names = [f"C{i}" for i in range(BENCH_COMPONENTS * 2 // 3)]
+    names += [f"r{i % 500}" if i % 2 else f"R{i % 500}" for i in range(BENCH_COMPONENTS // 3)]
+    names = list(dict.fromkeys(names))
+    names += [f"c{i}" for i in range(BENCH_COMPONENTS - len(names))]
+    assert len(names) == BENCH_COMPONENTS
+    lib.bulk_add([BoardObject(name, 1) for name in names])
+    bom = BOMHandler()
+    bom.bom = {name: {"function": "RES"} for name in names}
+
+    start = time.perf_counter()
+    renames = bom.fix_duplicate_names(lib)
+    elapsed = time.perf_counter() - start
+
+    assert len(bom.bom) == BENCH_COMPONENTS
+    assert len(NameRegistry(bom.bom).collisions()) == 0
+    assert lib.components.names() == set(bom.bom)
+    assert len(renames) == BENCH_COMPONENTS - len(NameRegistry(names))
+    assert elapsed < BENCH_BUDGET_S, f"fix_duplicate_names took {elapsed:.2f}s"
@@ -0,0 +1,81 @@
+import copy
+import csv
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import edit_pads.actions as actions  # noqa: E402
+from objects.board_object import BoardObject  # noqa: E402
+from objects.net_index import export_net_report  # noqa: E402
+
+
+class FakePadItem:
+    def __init__(self, board_object):
+        self.board_object = board_object
+
+    def scene(self):
+        return None
+
+
+def _pad(signal, testability="Terminal", size=1):
+    return BoardObject(
+        "U1", 1, signal=signal, testability=testability, width_mm=size, height_mm=size
+    )
+
+
+def test_index_follows_library_mutations(lib):
+    lib.bulk_add(
+        [
+            _pad("GND", "Forced"),
+            _pad("GND"),
+            _pad("VCC"),
+            _pad("CLK", "Forced"),
+            _pad("CLK", "Forced"),
+        ]
+    )
+    nets = lib.nets
+    assert nets.pads_in_net("GND") == {1, 2}
+    assert nets.net_of(3) == "VCC"
+    assert nets.nets_without_forced() == {"VCC"}
+    assert nets.nets_with_multiple_forced() == {"CLK"}
+
+    moved = copy.deepcopy(lib.objects[2])
+    moved.signal = "VCC"
+    lib.bulk_update_objects([moved], {})
+    lib.bulk_delete([5])
+    assert nets.pads_in_net("VCC") == {2, 3}
+    assert nets.nets_with_multiple_forced() == set()
+
+    assert lib.undo()
+    assert lib.undo()
+    assert nets.pads_in_net("GND") == {1, 2}
+    assert nets.nets_with_multiple_forced() == {"CLK"}
+
+
+def test_disconnect_pads_splits_net_and_keeps_a_forced_pad(lib, monkeypatch):
+    lib.bulk_add([_pad("S1", "Forced", size=3), _pad("S1"), _pad("S1", size=2)])
+    monkeypatch.setattr(actions, "_update_scene", lambda *args, **kwargs: None)
+
+    actions.disconnect_pads(lib, [FakePadItem(lib.objects[1])])
+
+    # "S1" is still used by pads 2 and 3, so pad 1 gets the next free S<k>
+    assert lib.nets.pads_in_net("S1") == {2, 3}
+    assert lib.objects[1].signal == "S4"
+    assert lib.objects[1].testability == "Forced"
+    assert lib.objects[3].testability == "Forced"  # largest remaining pad
+    assert lib.nets.nets_without_forced() == set()
+    assert len(lib.undo_redo_manager.undo_stack) == 2
+
+
+def test_export_net_report(lib, tmp_path):
+    lib.bulk_add([_pad("GND", "Forced"), _pad("GND"), _pad("VCC")])
+    out = tmp_path / "nets.csv"
+
+    assert export_net_report(lib, str(out)) == 2
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [(r["Net"], r["Pads"], r["Status"]) for r in rows] == [
+        ("GND", "2", "OK"),
+        ("VCC", "1", "No Forced"),
+    ]
+    assert rows[0]["Members"] == "U1.1(1) U1.1(2)"
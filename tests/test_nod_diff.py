@@ -0,0 +1,136 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import copy  # noqa: E402
+import random  # noqa: E402
+import time  # noqa: E402
+
+from PyQt5.QtWidgets import QApplication, QGraphicsScene  # noqa: E402
+
+from display.coord_converter import CoordinateConverter  # noqa: E402
+from display.diff_layer import DiffLayer  # noqa: E402
+from objects.board_object import BoardObject  # noqa: E402
+from objects.nod_diff import (  # noqa: E402
+    ADDED,
+    MOVED,
+    REMOVED,
+    RENAMED,
+    RESIGNALLED,
+    RESIZED,
+    RETESTED,
+    diff_library_against_nod,
+    diff_nod_files,
+)
+from objects.nod_file import BoardNodFile  # noqa: E402
+
+app = QApplication.instance() or QApplication([])
+
+PADS = 100_000
+DIFF_BUDGET_S = 1.0
+
+
+def _edited(lib, channel, **changes):
+    obj = copy.copy(lib.objects[channel])
+    for key, value in changes.items():
+        setattr(obj, key, value)
+    return obj
+
+
+def test_board_against_backup_classifies_pads(lib, tmp_path):
+    pads = [
+        BoardObject("U1", pin, channel=pin, x_coord_mm=pin * 1.27, width_mm=1.0, height_mm=1.0)
+        for pin in range(1, 11)
+    ]
+    lib.bulk_add(pads)
+    backup = str(tmp_path / "project.nod.20250101_120000.bak")
+    assert BoardNodFile(backup, object_library=lib).save()
+
+    same = diff_library_against_nod(lib, backup)
+    assert not same and same.unchanged == 10
+
+    lib.bulk_update_objects(
+        [
+            _edited(lib, 1, x_coord_mm_original=1.27 + 0.005),  # within tolerance
+            _edited(lib, 2, x_coord_mm_original=5.0),
+            _edited(lib, 3, width_mm=2.0),
+            _edited(lib, 4, signal="GND"),
+            _edited(lib, 5, testability="Forced", test_position="Bottom"),
+            _edited(lib, 6, pin=99, y_coord_mm_original=3.0),
+        ],
+        {},
+    )
+    lib.bulk_delete([7])
+    lib.bulk_add([BoardObject("C1", 1, channel=20)])
+
+    diff = diff_library_against_nod(lib, backup)
+    channels = {
+        kind: [(new or old)[0] for old, new in pairs] for kind, pairs in diff.changes.items()
+    }
+    assert channels == {
+        ADDED: [20],
+        REMOVED: [7],
+        MOVED: [2, 6],
+        RESIZED: [3],
+        RESIGNALLED: [4],
+        RETESTED: [5],
+        RENAMED: [6],
+    }
+    assert diff.unchanged == 4  # pads 1, 8, 9, 10
+    details = {(kind, ch): detail for kind, _c, _p, ch, detail in diff.summary_rows()}
+    assert details[(RESIGNALLED, 4)] == "S4 -> GND"
+    assert details[(RENAMED, 6)] == "U1.6 -> U1.99"
+
+
+def _write_nod(path, count, seed, changed=0.02):
+    rnd = random.Random(seed)
+    lines = ["* SIGNAL COMPONENT PIN X Y PAD POS TECN TEST CHANNEL USER\n"]
+    for k in range(1, count + 1):
+        x, pad, test = (k % 400) * 0.5, "R40", "F"
+        if seed and rnd.random() < changed:
+            x, pad, test = x + 0.25, "X40Y20", "N"
+        if seed and k % 1000 == 0:
+            continue  # removed
+        lines.append(
+            f'"S{k}" "U{k // 100}" {k % 100 + 1} {x:.3f} {k / 400:.3f} {pad} T S {test} {k}\n'
+        )
+    if seed:
+        lines.append(f'"S0" "NEW1" 1 0.000 0.000 R40 T S F {count + 1}\n')
+    with open(path, "w") as fh:
+        fh.writelines(lines)
+
+
+def test_diff_two_100k_pad_files(tmp_path):
+    old, new = str(tmp_path / "old.nod"), str(tmp_path / "new.nod")
+    _write_nod(old, PADS, 0)
+    _write_nod(new, PADS, 1)
+
+    start = time.perf_counter()
+    diff = diff_nod_files(old, new)
+    elapsed = time.perf_counter() - start
+
+    counts = diff.counts()
+    assert counts[REMOVED] == PADS // 1000 and counts[ADDED] == 1
+    assert counts[MOVED] == counts[RESIZED] == counts[RETESTED] > PADS // 100
+    assert diff.unchanged + counts[MOVED] + counts[REMOVED] == PADS
+    assert elapsed < DIFF_BUDGET_S, f"diff took {elapsed:.2f} s"
+
+
+def test_overlay_layer_draws_per_kind(lib, tmp_path):
+    lib.bulk_add([BoardObject("U1", pin, channel=pin, x_coord_mm=pin) for pin in range(1, 4)])
+    backup = str(tmp_path / "backup.nod")
+    assert BoardNodFile(backup, object_library=lib).save()
+    lib.bulk_update_objects([_edited(lib, 1, x_coord_mm_original=9.0)], {})
+    lib.bulk_delete([2])
+
+    scene = QGraphicsScene()
+    conv = CoordinateConverter()
+    conv.set_image_size((1000, 1000))
+    layer = DiffLayer(scene)
+    layer.set_diff(diff_library_against_nod(lib, backup), conv, "top")
+    assert sorted(layer.kinds_shown()) == sorted([MOVED, REMOVED])
+    assert len(scene.items()) == 2
+    layer.set_diff(diff_library_against_nod(lib, backup), conv, "bottom")
+    assert layer.kinds_shown() == []  # all pads are top-side
+    layer.clear()
+    assert scene.items() == []
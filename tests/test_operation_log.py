@@ -0,0 +1,159 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import copy  # noqa: E402
+import time  # noqa: E402
+
+from objects.board_object import BoardObject  # noqa: E402
+from objects.object_library import ObjectLibrary  # noqa: E402
+from project_manager.operation_log import (  # noqa: E402
+    OperationLog,
+    read_operations,
+    replay_operations,
+    set_aside,
+)
+from project_manager.project_container import pad_row  # noqa: E402
+
+OP_BUDGET_MS = 1.0
+
+
+def _pads(count, name="U1"):
+    return [
+        BoardObject(name, pin, channel=pin, x_coord_mm=float(pin))
+        for pin in range(1, count + 1)
+    ]
+
+
+def _recovered(path, saved_pads):
+    """Fresh library loaded from the 'saved' pads with the log replayed on top."""
+    other = ObjectLibrary(shared=False)
+    other.load_objects(copy.deepcopy(saved_pads))
+    base, reset, changes = read_operations(path)
+    replay_operations(other, reset, changes)
+    return base, {ch: pad_row(o) for ch, o in other.objects.items()}
+
+
+def _rows(lib):
+    return {ch: pad_row(o) for ch, o in lib.objects.items()}
+
+
+def test_replay_restores_unsaved_edits(lib, tmp_path):
+    saved = _pads(20)
+    lib.load_objects(copy.deepcopy(saved))
+    path = str(tmp_path / "project.oplog")
+    oplog = OperationLog(path, lib, base="nod:1", interval=3600)
+    oplog.start()
+
+    moved = [copy.copy(lib.objects[ch]) for ch in (3, 4)]
+    for obj in moved:
+        obj.x_coord_mm += 0.5
+    lib.bulk_update_objects(moved, {})
+    assert oplog.flush() == 2
+    lib.bulk_delete([7, 8])
+    lib.bulk_add([BoardObject("C1", 1, channel=50)])
+    lib.rename_components({"C1": "C2"})
+    oplog.flush()
+    oplog.close()  # the "crash": nothing is saved, the log stays
+
+    base, rows = _recovered(path, saved)
+    assert base == "nod:1"
+    assert rows == _rows(lib)
+    assert 7 not in rows and rows[50][1] == "C2" and rows[3][6] == 3.5
+
+    # Torn last line (crash during the write) is ignored
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write('["P",51,"C9"')
+    assert _recovered(path, saved)[1] == _rows(lib)
+
+
+def test_set_aside_log_survives_the_next_start(lib, tmp_path):
+    lib.load_objects(_pads(5))
+    path = str(tmp_path / "project.oplog")
+    oplog = OperationLog(path, lib, base="nod:1", interval=3600)
+    oplog.start()
+    lib.bulk_delete([2])
+    oplog.close()
+    logged = read_operations(path)
+
+    recover_path = set_aside(path)
+    # Reopening starts a new log before the user answers the recovery prompt
+    fresh = OperationLog(path, lib, base="nod:1", interval=3600)
+    fresh.start()
+    fresh.close()
+    assert read_operations(path) == ("nod:1", False, {})
+    assert read_operations(recover_path) == logged == ("nod:1", False, {2: None})
+    # Killed at the prompt: the next open finds the same unsettled log
+    assert set_aside(path) == recover_path
+    assert read_operations(recover_path) == logged
+
+
+def test_undo_rewrites_a_full_dump_and_save_truncates(lib, tmp_path):
+    saved = _pads(10)
+    lib.load_objects(copy.deepcopy(saved))
+    path = str(tmp_path / "project.oplog")
+    oplog = OperationLog(path, lib, base="nod:1", interval=3600)
+    oplog.start()
+
+    lib.bulk_delete([1, 2])
+    lib.bulk_add([BoardObject("J1", 1, channel=30)])
+    oplog.flush()
+    lib.undo()  # back to "1, 2 deleted"; the rebuild marks every pad as changed
+    oplog.flush()
+    base, reset, changes = read_operations(path)
+    assert reset and set(changes) == set(range(3, 11))
+    assert _recovered(path, saved)[1] == _rows(lib)
+
+    oplog.truncate("nod:2")
+    assert read_operations(path) == ("nod:2", False, {})
+    oplog.close(discard=True)
+    assert not os.path.exists(path)
+
+
+def test_background_thread_fsyncs_batches(lib, tmp_path):
+    lib.load_objects(_pads(5))
+    path = str(tmp_path / "project.oplog")
+    oplog = OperationLog(path, lib, interval=0.05)
+    oplog.start()
+    try:
+        lib.bulk_delete([5])
+        deadline = time.monotonic() + 5.0
+        while read_operations(path)[2] != {5: None} and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert read_operations(path)[2] == {5: None}
+    finally:
+        oplog.close()
+
+
+def test_logging_overhead_per_operation(lib, tmp_path):
+    lib.load_objects(_pads(10000))
+    oplog = OperationLog(str(tmp_path / "project.oplog"), lib, interval=3600)
+
+    def op_ms(flush):
+        best = float("inf")
+        for i in range(15):
+            if flush:
+                oplog.flush()  # next write pays the copy-on-write of the pad dict
+            start = time.perf_counter()
+            lib.bulk_add([BoardObject("T1", i, channel=20000 + i)], skip_undo=True)
+            best = min(best, time.perf_counter() - start)
+            lib.objects.pop(20000 + i)
+            lib._untrack_channel(20000 + i)
+        return best * 1000.0
+
+    plain = op_ms(False)
+    oplog.start()
+    try:
+        logged = op_ms(True)
+    finally:
+        oplog.close()
+    assert logged - plain < OP_BUDGET_MS, (plain, logged)
+
+    # A 10k-pad edit costs the GUI thread nothing per pad; the flush writes it
+    edited = [copy.copy(o) for o in lib.objects.values()]
+    for obj in edited:
+        obj.testability = "Forced"
+    oplog.start()
+    lib.bulk_update_objects(edited, {})
+    assert oplog.flush() == 1 + len(edited)  # full dump: every pad changed
+    oplog.close()
@@ -0,0 +1,104 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import time  # noqa: E402
+
+from PyQt5.QtCore import QMimeData  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from component_placer.pad_clipboard import (  # noqa: E402
+    PAD_MIME,
+    Clipboard,
+    PadPayload,
+    decode_pads,
+    encode_pads,
+)
+
+app = QApplication.instance() or QApplication([])
+
+PADS = 10_000
+COPY_PASTE_BUDGET_S = 0.5
+
+
+def _pads(count):
+    return [
+        {
+            "pin": k + 1,
+            "x_coord_mm": (k % 100) * 1.27,
+            "y_coord_mm": (k // 100) * 1.27,
+            "angle_deg": 90.0 if k % 7 == 0 else 0.0,
+            "shape_type": "Round" if k % 2 else "Square/rectangle",
+            "width_mm": 0.6,
+            "height_mm": 0.6 if k % 2 else 0.4,
+            "hole_mm": 0.0,
+            "testability": "Forced",
+            "technology": "SMD",
+            "prefix": f"A{k + 1}" if k % 3 else None,
+            "order": k,
+        }
+        for k in range(count)
+    ]
+
+
+def _from_other_instance(payload):
+    """The clipboard as another running instance would leave it."""
+    mime = QMimeData()
+    mime.setData(PAD_MIME, encode_pads(payload))
+    app.clipboard().setMimeData(mime)
+
+
+def test_10k_pads_copy_and_paste_between_instances():
+    pads = _pads(PADS)
+    start = time.perf_counter()
+    payload = Clipboard().copy(pads)
+    _from_other_instance(payload)
+    footprint = Clipboard().payload().footprint()
+    elapsed = time.perf_counter() - start
+
+    assert footprint["pads"] == pads
+    assert (footprint["center_x"], footprint["center_y"]) == (99 * 1.27 / 2, 99 * 1.27 / 2)
+    assert elapsed < COPY_PASTE_BUDGET_S, f"copy + paste took {elapsed:.3f} s"
+    assert len(encode_pads(payload)) < 40 * PADS  # a compact payload
+
+
+def test_same_instance_paste_skips_decoding():
+    board = Clipboard()
+    payload = board.copy(_pads(3))
+    assert board.has_pads()
+    assert board.payload() is payload
+
+    other = Clipboard()  # e.g. the second window's clipboard helper
+    assert other.payload() is payload
+    assert [p["pin"] for p in other.paste()] == [1, 2, 3]
+
+
+def test_text_fallback_round_trip():
+    pads = _pads(4)
+    for pad in pads:
+        pad["pin"] = str(pad["pin"])
+    Clipboard().copy(pads)
+    text = app.clipboard().text()
+    assert text.splitlines()[1].startswith('"S0" "CLIPBOARD" 1 0.000 0.000 X24Y16')
+
+    app.clipboard().setText(text)  # e.g. pasted back from a text editor
+    clip = Clipboard()
+    assert clip.has_pads()
+    got = clip.paste()
+    assert [p["pin"] for p in got] == [1, 2, 3, 4]
+    assert [p["shape_type"] for p in got] == [p["shape_type"] for p in pads]
+    assert all(abs(g["width_mm"] - 0.6) < 0.01 for g in got)
+
+
+def test_foreign_or_damaged_clipboard_has_no_pads():
+    clip = Clipboard()
+    app.clipboard().setText("hello world")
+    assert not clip.has_pads() and clip.paste() == []
+
+    data = encode_pads(PadPayload.from_pads(_pads(5)))
+    assert decode_pads(data[:-10]) is None
+    assert decode_pads(b"not a payload") is None
+    mime = QMimeData()
+    mime.setData(PAD_MIME, data[:-10])
+    app.clipboard().setMimeData(mime)
+    assert clip.payload() is None
@@ -0,0 +1,108 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+from PyQt5.QtCore import QRectF  # noqa: E402
+from PyQt5.QtGui import QImage  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QGraphicsScene  # noqa: E402
+
+from component_placer.pad_detector import (  # noqa: E402
+    SHAPE_RECT,
+    SHAPE_ROUND,
+    detect_pads,
+    find_blobs,
+    qimage_to_gray,
+)
+from display.candidate_layer import CandidateLayer  # noqa: E402
+from display.coord_converter import CoordinateConverter  # noqa: E402
+from objects.object_library import ObjectLibrary  # noqa: E402
+
+app = QApplication.instance() or QApplication([])
+
+MM_PER_PX = 0.05
+
+
+def render_board(width=1500, height=1000):
+    """Dark board with bright rect and round pads and one long trace."""
+    img = np.full((height, width), 40, dtype=np.uint8)
+    yy, xx = np.mgrid[0:height, 0:width]
+    pads = []
+    # Rect pads 30x16 px on a 100 px pitch; some straddle the 256 px tiles
+    for cx in range(120, width - 100, 100):
+        img[230:246, cx - 15 : cx + 15] = 220
+        pads.append((SHAPE_RECT, cx, 238, 30, 16))
+    # Round pads, 24 px diameter
+    for cx in range(150, width - 100, 150):
+        img[(xx - cx) ** 2 + (yy - 512) ** 2 <= 12**2] = 210
+        pads.append((SHAPE_ROUND, cx, 512, 24, 24))
+    # A trace is long and thin: rejected by the size and fill tests
+    img[800:804, 100:1400] = 220
+    return img, pads
+
+
+@pytest.fixture
+def conv():
+    conv = CoordinateConverter((1500, 1000))
+    conv.set_mm_per_pixels_top(MM_PER_PX)
+    conv.set_mm_per_pixels_bot(MM_PER_PX)
+    return conv
+
+
+@pytest.mark.parametrize("side", ["top", "bottom"])
+def test_detects_synthetic_pads_across_tiles(conv, side):
+    img, pads = render_board()
+    found = detect_pads(img, conv, side, tile_px=256, workers=3)
+    assert len(found) == len(pads)
+
+    by_pos = {(round(c.x_px), round(c.y_px)): c for c in found}
+    for shape, cx, cy, w, h in pads:
+        c = by_pos[(cx, cy)]
+        assert c.shape_type == shape
+        x_mm, y_mm = conv.pixels_to_mm(c.x_px, c.y_px, side)
+        assert (c.x_mm, c.y_mm) == pytest.approx((x_mm, y_mm))
+        assert c.width_mm == pytest.approx(w * MM_PER_PX, abs=MM_PER_PX)
+        assert c.height_mm == pytest.approx(h * MM_PER_PX, abs=MM_PER_PX)
+
+
+def test_blob_labelling_handles_u_shapes():
+    mask = np.zeros((6, 7), dtype=bool)
+    mask[0:5, 0] = mask[0:5, 4] = mask[4, 0:5] = True  # one "U"
+    mask[0, 6] = True  # separate dot
+    blobs = find_blobs(mask)
+    assert sorted(blobs[:, 0].tolist()) == [1.0, 13.0]
+
+
+def test_gray_conversion_from_qimage():
+    image = QImage(13, 5, QImage.Format_RGB32)  # odd width: padded scanlines
+    image.fill(0xFFFFFF)
+    gray = qimage_to_gray(image)
+    assert gray.shape == (5, 13)
+    assert (gray == 255).all()
+
+
+def test_layer_accepts_candidates_in_area(conv):
+    lib = ObjectLibrary()
+    lib.objects.clear()
+    lib._next_channel_id = 1
+    lib.undo_redo_manager.clear()
+    try:
+        img, _ = render_board()
+        layer = CandidateLayer(QGraphicsScene())
+        layer.set_candidates(detect_pads(img, conv, "top"), "top")
+        total = len(layer.candidates)
+
+        added = layer.accept(lib, "J1", QRectF(0, 200, 1500, 100))  # rect row only
+        assert added == 13
+        assert len(layer.candidates) == total - 13
+        pins = sorted(lib.get_all_objects(), key=lambda o: o.pin)
+        assert [o.component_name for o in pins] == ["J1"] * 13
+        assert pins[0].x_coord_mm < pins[1].x_coord_mm
+
+        assert layer.discard() == total - 13
+        assert layer._item is None
+    finally:
+        lib.objects.clear()
+        lib._next_channel_id = 1
+        lib.undo_redo_manager.clear()
@@ -0,0 +1,125 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from types import SimpleNamespace  # noqa: E402
+
+from PyQt5.QtCore import QPointF, QRectF  # noqa: E402
+from PyQt5.QtGui import QColor, QImage, QPainter, QTransform  # noqa: E402
+from PyQt5.QtWidgets import (  # noqa: E402
+    QApplication,
+    QGraphicsItem,
+    QGraphicsScene,
+    QGraphicsView,
+)
+
+from display.coord_converter import CoordinateConverter  # noqa: E402
+from display.display_library import DisplayLibrary, SelectablePadItem  # noqa: E402
+from ui.zoom_manager import ZoomManager  # noqa: E402
+from utils.render_benchmark import _StaticLibrary, run_benchmark, synthetic_pads  # noqa: E402
+
+app = QApplication.instance() or QApplication([])
+
+
+def _make_display(count=64):
+    scene = QGraphicsScene()
+    pads = synthetic_pads(count)
+    for pad in pads:
+        pad.testability = "Testable"  # one colour: dark green
+    display = DisplayLibrary(scene, _StaticLibrary(pads), CoordinateConverter((0, 0)))
+    return scene, display
+
+
+def _render(scene, scale, center):
+    image = QImage(200, 200, QImage.Format_ARGB32_Premultiplied)
+    image.fill(0xFFFFFFFF)
+    painter = QPainter(image)
+    side = 200 / scale
+    source = QRectF(center.x() - side / 2, center.y() - side / 2, side, side)
+    scene.render(painter, QRectF(image.rect()), source)
+    painter.end()
+    return image
+
+
+def test_small_pads_are_batched_by_the_pad_group():
+    scene, display = _make_display()
+    item = display.displayed_objects[1]
+
+    display.set_view_scale(0.05)  # pads ~1 px wide
+    assert all(
+        i.flags() & QGraphicsItem.ItemHasNoContents for i in display.displayed_objects.values()
+    )
+    # Still hit by clicks and selectable
+    assert scene.itemAt(item.pos(), QTransform()) is item
+
+    display.set_view_scale(2.0)
+    assert not any(
+        i.flags() & QGraphicsItem.ItemHasNoContents for i in display.displayed_objects.values()
+    )
+
+
+def test_coarse_frame_draws_pad_colour(monkeypatch):
+    scene, display = _make_display()
+    item = display.displayed_objects[1]
+    painted = []
+    monkeypatch.setattr(SelectablePadItem, "paint", lambda *a: painted.append(a[0]))
+
+    display.set_view_scale(0.1)
+    image = _render(scene, 0.1, item.pos())
+
+    assert painted == []  # no pad painted itself
+    assert QColor(image.pixel(100, 100)) == display.get_pad_color("Y")
+
+
+def test_pin_labels_only_when_zoomed_in(monkeypatch):
+    scene, display = _make_display(4)
+    labels = []
+    monkeypatch.setattr(SelectablePadItem, "_paint_label", lambda self, p: labels.append(self))
+    center = display.displayed_objects[1].pos()
+
+    _render(scene, 0.5, center)  # ~13 px pads
+    assert labels == []
+    _render(scene, 3.0, center)  # ~80 px pads
+    assert display.displayed_objects[1] in labels
+
+
+class _View(QGraphicsView):
+    def __init__(self, scene, converter):
+        super().__init__(scene)
+        self.resize(400, 300)
+        self.user_has_zoomed_yet = False
+        self.converter = converter
+        self.marker_manager = SimpleNamespace(get_marker_board_coords=lambda: (20.0, -20.0))
+
+
+def test_animated_zoom_ends_where_a_jump_zoom_would():
+    constants = {"zoom_center_mode": "marker", "max_zoom": 10.0, "smooth_zoom": True}
+    scene = QGraphicsScene(QRectF(0, 0, 4000, 4000))
+    converter = CoordinateConverter((0, 0))
+    views = []
+    for _ in range(2):
+        view = _View(scene, converter)
+        view.centerOn(1000, 1000)
+        views.append((view, ZoomManager(view, constants, SimpleNamespace(log=lambda *a: None))))
+
+    (jump_view, jump), (smooth_view, smooth) = views
+    jump._apply_zoom(1.15)
+    jump._apply_zoom(1.15)
+
+    smooth.zoom_in()
+    smooth.zoom_in()  # retargets the running animation
+    assert smooth._anim[1] == jump.user_scale
+    smooth._animation.setCurrentTime(smooth._animation.duration())
+
+    assert smooth._anim is None
+    assert abs(smooth.user_scale - jump.user_scale) < 1e-9
+    assert abs(smooth_view.transform().m11() - jump_view.transform().m11()) < 1e-9
+    center = smooth_view.mapToScene(smooth_view.viewport().rect().center())
+    marker = QPointF(*converter.mm_to_pixels(20.0, -20.0))
+    assert (center - marker).manhattanLength() < 2.0
+
+
+def test_frame_benchmark_lod_beats_full_detail_when_zoomed_out():
+    result = run_benchmark(pad_count=20_000, frames=1)
+    assert len(result["zoom_frames_ms"]) == 8
+    assert result["static_ms"][(1.0, True)] < result["static_ms"][(1.0, False)]
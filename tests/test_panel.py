@@ -0,0 +1,131 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest  # noqa: E402
+from PyQt5.QtCore import QPointF  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QGraphicsScene  # noqa: E402
+
+from display.coord_converter import CoordinateConverter  # noqa: E402
+from display.display_library import DisplayLibrary  # noqa: E402
+from objects.board_object import BoardObject  # noqa: E402
+from objects.nod_file import BoardNodFile  # noqa: E402
+from objects.panel import Panel, PanelStep  # noqa: E402
+from project_manager.panel_handler import load_panel_file, save_panel_file  # noqa: E402
+
+app = QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def lib(lib):
+    lib.bulk_add(
+        [
+            BoardObject("U1", 1, channel=1, signal="GND", x_coord_mm=0, y_coord_mm=0),
+            BoardObject("U1", 2, channel=2, x_coord_mm=10, y_coord_mm=0),
+        ]
+    )
+    return lib
+
+
+def test_copies_own_channel_blocks(lib):
+    lib.set_panel(Panel([1, 2], [PanelStep(50, 0), PanelStep(100, 0)]))
+    assert lib.panel.channel_bases == [3, 5]
+    assert list(lib.panel.instance_channels()) == [3, 4, 5, 6]
+
+    lib.add_object(BoardObject("R1", 1))
+    assert lib.objects[7].component_name == "R1"
+    lib.refresh_channel_counter()  # blocks survive a resync
+    assert lib.channels.peek() == 8
+
+
+def test_deleted_master_channel_is_not_reused(lib):
+    lib.bulk_add([BoardObject("U1", 3, channel=3, x_coord_mm=20, y_coord_mm=0)])
+    lib.set_panel(Panel([1, 2, 3], [PanelStep(50, 0)]))
+    lib.bulk_delete([2])
+    lib.bulk_add([BoardObject("R99", 1)])
+    assert lib.objects[7].component_name == "R99"  # not on master channel 2
+    expanded = lib.panel.iter_expanded(lib.objects)
+    assert [(p["component_name"], p["channel"]) for p in expanded] == [
+        ("U1_B2", 4),
+        ("U1_B2", 6),
+    ]
+
+    lib.undo()
+    lib.undo()  # the master pad comes back on its channel
+    assert lib.objects[2].component_name == "U1"
+
+
+def test_nod_streams_expanded_copies(lib, tmp_path):
+    lib.set_panel(Panel([1, 2], [PanelStep(0, 20, 180)], pivot_mm=(5, 0)))
+    path = tmp_path / "panel.nod"
+    assert BoardNodFile(str(path), object_library=lib).save()
+    lines = path.read_text().splitlines()[1:]
+    assert lines[2:] == [
+        '"GND_B2" "U1_B2" 1 10.000 20.000 X787Y787A180 T S N 3',
+        '"S4" "U1_B2" 2 0.000 20.000 X787Y787A180 T S N 4',
+    ]
+
+
+def test_reload_drops_materialized_copies(lib, tmp_path):
+    lib.set_panel(Panel([1, 2], [PanelStep(50, 0)]))
+    BoardNodFile(str(tmp_path / "project.nod"), object_library=lib).save()
+    save_panel_file(str(tmp_path), lib)
+
+    lib.clear()
+    BoardNodFile(str(tmp_path / "project.nod"), object_library=lib).load(skip_undo=True)
+    assert sorted(lib.objects) == [1, 2, 3, 4]
+    load_panel_file(str(tmp_path), lib)
+    assert sorted(lib.objects) == [1, 2]
+    assert lib.panel.channel_bases == [3]
+
+
+def test_copies_render_as_one_item_each(lib):
+    scene = QGraphicsScene()
+    converter = CoordinateConverter((1000, 1000))
+    display = DisplayLibrary(scene, lib, converter)
+    lib.display_library = display
+    try:
+        lib.set_panel(Panel([1, 2], [PanelStep(30, 0), PanelStep(0, 30)]))
+        assert len(display._panel_items) == 2
+
+        # Master pad 2 (10, 0) lands at (40, 0) mm on the first copy
+        master_px = QPointF(*converter.mm_to_pixels(10, 0))
+        copy_px = display._panel_items[0].transform().map(master_px)
+        expected = QPointF(*converter.mm_to_pixels(40, 0))
+        assert abs(copy_px.x() - expected.x()) < 1e-6
+        assert abs(copy_px.y() - expected.y()) < 1e-6
+
+        lib.set_panel(None)
+        assert display._panel_items == []
+    finally:
+        del lib.display_library
+
+
+def test_flush_redraws_copies_only_for_master_edits(lib):
+    lib.bulk_add([BoardObject("R1", 1, channel=20, x_coord_mm=0, y_coord_mm=40)])
+    scene = QGraphicsScene()
+    display = DisplayLibrary(scene, lib, CoordinateConverter((1000, 1000)))
+    lib.display_library = display
+    try:
+        display.render_initial_objects()
+        lib.set_panel(Panel([1, 2], [PanelStep(30, 0)]))
+        refreshes = []
+        refresh = display.refresh_panel
+        display.refresh_panel = lambda: (refreshes.append(1), refresh())
+
+        moved = BoardObject("R1", 1, channel=20, x_coord_mm=5, y_coord_mm=40)
+        display.update_rendered_objects_for_updates([moved])
+        display.flush_pending()
+        assert refreshes == []
+
+        moved = BoardObject("U1", 2, channel=2, x_coord_mm=12, y_coord_mm=0)
+        display.update_rendered_objects_for_updates([moved])
+        display.flush_pending()
+        assert refreshes == [1]
+
+        lib.panel = None  # e.g. clear_all(): the next flush drops the copies
+        display.update_rendered_objects_for_updates([moved])
+        display.flush_pending()
+        assert refreshes == [1, 1] and display._panel_items == []
+    finally:
+        del lib.display_library
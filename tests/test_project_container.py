@@ -0,0 +1,106 @@
+import time
+
+from component_placer.bom_handler.bom_handler import BOMHandler
+from objects.board_object import BoardObject
+from objects.nod_file import BoardNodFile
+from objects.object_library import ObjectLibrary
+from project_manager.alf_handler import load_project_alf, save_alf_file
+from project_manager.project_container import ProjectContainer
+
+NOD_TEXT = """* SIGNAL COMPONENT PIN X Y PAD POS TECN TEST CHANNEL USER
+"GND" "U1" 1 1.000 2.000 X40Y20 T S F 3
+"VCC" "U1" 2 3.540 2.000 X40Y20A90 T S T 1
+"GND" "J1" 1 -10.250 7.125 R60H35 O T N 7
+"S9" "TP1" 1 20.000 -4.000 R40 B S A 9
+"""
+
+ALF_TEXT = "U1.IN\tU1.1\nU1.OUT\tU1.2\n"
+
+BOM_TEXT = """component_name,function,value,package,part_number
+U1,IC,LM358,SOIC8,PN-1
+J1,CONNECTOR,,THT,
+TP1,TEST POINT,,,
+"""
+
+
+def _legacy_project(folder):
+    (folder / "project.nod").write_text(NOD_TEXT)
+    (folder / "project.alf").write_text(ALF_TEXT)
+    (folder / "project_bom.csv").write_text(BOM_TEXT)
+
+
+def test_round_trip_matches_legacy_files(lib, tmp_path):
+    src, out = tmp_path / "src", tmp_path / "out"
+    src.mkdir()
+    out.mkdir()
+    _legacy_project(src)
+
+    # Text files -> library -> container
+    BoardNodFile(str(src / "project.nod"), object_library=lib).load(skip_undo=True)
+    load_project_alf(str(src), lib)
+    bom = BOMHandler()
+    assert bom.load_bom(str(src / "project_bom.csv"))
+    container = ProjectContainer.for_folder(str(src))
+    container.save(lib, bom_handler=bom)
+    container.close()
+
+    # Container -> fresh library -> text files
+    lib.clear()
+    bom2 = BOMHandler()
+    container = ProjectContainer.for_folder(str(src))
+    assert container.load(lib, bom_handler=bom2) == 4
+    container.close()
+    BoardNodFile(str(out / "project.nod"), object_library=lib).save()
+    save_alf_file(str(out), lib)
+    assert bom2.save_bom(str(out / "project_bom.csv"))
+
+    assert (out / "project.nod").read_text() == NOD_TEXT
+    assert (out / "project.alf").read_text() == ALF_TEXT
+    assert (out / "project_bom.csv").read_text() == BOM_TEXT
+    assert lib.nets.pads_in_net("GND") == {3, 7}
+
+
+def test_save_writes_only_changed_rows(lib, tmp_path):
+    lib.bulk_add([BoardObject("R1", pin, channel=pin) for pin in range(1, 101)])
+    bom = BOMHandler()
+    bom.add_component("R1", "RESISTOR", "10k", "0603", "")
+    container = ProjectContainer.for_folder(str(tmp_path))
+    assert container.save(lib, bom_handler=bom) == {"pads": 100, "bom": 1, "settings": 0}
+    assert container.save(lib, bom_handler=bom) == {"pads": 0, "bom": 0, "settings": 0}
+
+    lib.objects[5].testability = "Forced"
+    lib.bulk_delete([6, 7])
+    bom.update_component("R1", value="22k")
+    assert container.save(lib, bom_handler=bom) == {"pads": 3, "bom": 1, "settings": 0}
+    container.close()
+
+    reopened = ProjectContainer.for_folder(str(tmp_path))
+    objects = reopened.read_objects()
+    assert len(objects) == 98
+    assert next(o for o in objects if o.channel == 5).testability == "Forced"
+    assert reopened.read_bom()["R1"]["value"] == "22k"
+    reopened.close()
+
+
+def test_large_project_opens_quickly(lib, tmp_path):
+    n = 100_000
+    lib.bulk_add(
+        [
+            BoardObject(f"U{i // 100}", i % 100 + 1, channel=i + 1, x_coord_mm=i * 0.01)
+            for i in range(n)
+        ],
+        skip_undo=True,
+    )
+    container = ProjectContainer.for_folder(str(tmp_path))
+    container.save(lib)
+    container.close()
+
+    opened = ObjectLibrary(shared=False)  # opening into an empty window
+    container = ProjectContainer.for_folder(str(tmp_path))
+    start = time.perf_counter()
+    assert container.load(opened) == n
+    elapsed = time.perf_counter() - start
+    container.close()
+    assert len(opened.objects) == n
+    # Well under a second on a desktop; the margin is for slow single-core runners
+    assert elapsed < 1.5, f"open took {elapsed:.2f}s"
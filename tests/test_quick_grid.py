@@ -0,0 +1,74 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from component_placer.quick_grid import QuickGrid, parse_ball_names, snake_order  # noqa: E402
+from utils.quick_grid_benchmark import run_benchmark  # noqa: E402
+
+ANCHORS = {"A": (0.0, 0.0), "B": (3.0, -2.0)}  # 4 columns x 3 rows, 1 mm pitch
+BENCH_BUDGET_MS = (250.0, 50.0)  # 100x100: full build, anchor move
+
+
+def _cells(fp):
+    return [(round(-p["y_coord_mm"]), round(p["x_coord_mm"])) for p in fp["pads"]]
+
+
+def test_numbering_schemes_match_the_classic_orders():
+    grid = QuickGrid()
+    params = {"x_pins": 4, "y_pins": 3}
+    for scheme in (0, 1, 2):
+        fp = grid.footprint(ANCHORS, dict(params, number_scheme=scheme))
+        assert [p["pin"] for p in fp["pads"]] == list(range(1, 13))
+        if scheme == 0:
+            # cols > rows: across row 0, back along row 1, ...
+            assert _cells(fp) == [(0, c) for c in range(4)] + [
+                (1, c) for c in reversed(range(4))
+            ] + [(2, c) for c in range(4)]
+        elif scheme == 1:
+            assert _cells(fp) == [(r, c) for r in range(3) for c in range(4)]
+        else:
+            assert _cells(fp) == [(r, c) for c in range(4) for r in range(3)]
+    assert snake_order(2, 3).tolist() == [0, 2, 4, 5, 3, 1]  # down column 0, up column 1
+
+
+def test_depopulation_and_prefix_lookups():
+    grid = QuickGrid()
+    params = {
+        "x_pins": 5,
+        "y_pins": 5,
+        "number_scheme": 1,
+        "create_prefix": True,
+        "center_void": (1, 1),
+        "missing_balls": "a1, E5 Z9 C",  # unknown and half-typed names are skipped
+    }
+    fp = grid.footprint({"A": (0.0, 0.0), "B": (4.0, -4.0)}, params)
+    prefixes = [p["prefix"] for p in fp["pads"]]
+    assert len(fp["pads"]) == 22
+    assert {"A1", "C3", "E5"}.isdisjoint(prefixes)
+    assert prefixes[:3] == ["A2", "A3", "A4"]
+    assert grid.pin_at(0, 0) == 0 and grid.pin_at(0, 1) == 1
+    assert grid.pin_of_prefix("B1") == 5 and grid.cell_of(5) == (1, 0)
+    assert parse_ball_names("B3", ["A", "B", "C"], letter_is_column=True) == {(2, 1)}
+
+
+def test_anchor_move_reuses_the_pads():
+    grid = QuickGrid()
+    params = {"x_pins": 4, "y_pins": 3, "number_scheme": 2, "create_prefix": True}
+    first = grid.footprint(ANCHORS, params)
+    moved = grid.footprint({"A": (1.0, 1.0), "B": (7.0, -3.0)}, dict(params))
+    assert all(a is b for a, b in zip(first["pads"], moved["pads"]))
+    last = moved["pads"][-1]
+    assert (last["prefix"], last["x_coord_mm"], last["y_coord_mm"]) == ("D3", 7.0, -3.0)
+    assert moved["center_x"] == 4.0
+
+    resized = grid.footprint(ANCHORS, dict(params, width=0.3))
+    assert resized["pads"][0] is not first["pads"][0]
+    assert resized["pads"][0]["width_mm"] == 0.3
+
+
+def test_quick_grid_benchmark_up_to_100x100():
+    results = run_benchmark(sizes=(40, 100), moves=3)
+    for scheme in (0, 1, 2):
+        build_ms, move_ms = results[(100, scheme)]
+        assert build_ms < BENCH_BUDGET_MS[0], f"build took {build_ms:.1f} ms"
+        assert move_ms < BENCH_BUDGET_MS[1], f"anchor move took {move_ms:.1f} ms"
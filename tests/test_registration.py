@@ -0,0 +1,87 @@
+import json
+import math
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+import pytest  # noqa: E402
+
+from display.coord_converter import CoordinateConverter  # noqa: E402
+from display.registration import apply_affine, register_points, register_side  # noqa: E402
+from objects.board_object import BoardObject  # noqa: E402
+from project_manager.project_settings import load_settings  # noqa: E402
+
+
+def true_affine(scale=20.0, angle_deg=0.7, mirror=True, offset=(1510.0, 980.0)):
+    rad = math.radians(angle_deg)
+    sx = -scale if mirror else scale
+    a, b = sx * math.cos(rad), -scale * math.sin(rad)
+    c, d = sx * -math.sin(rad), -scale * math.cos(rad)
+    return np.array([a, b, c, d, offset[0], offset[1]])
+
+
+def test_ransac_recovers_affine_with_outliers():
+    rng = np.random.default_rng(1)
+    src = rng.uniform(0, 100, size=(5000, 2))
+    matrix = true_affine()
+    dst = apply_affine(matrix, src) + rng.normal(0, 0.3, size=src.shape)
+    outliers = rng.choice(len(src), 1000, replace=False)
+    dst[outliers] += rng.uniform(20, 200, size=(1000, 2))
+
+    t0 = time.perf_counter()
+    result = register_points(src, dst, threshold=2.0)
+    assert time.perf_counter() - t0 < 2.0
+
+    np.testing.assert_allclose(result.matrix, matrix, rtol=1e-3, atol=0.2)
+    assert not result.inliers[outliers].any()
+    assert result.inliers.sum() >= 3950
+    assert result.rms < 0.6
+    assert result.mirrored
+    assert 1.0 / result.scale == pytest.approx(0.05, rel=1e-3)
+
+
+def test_register_side_applies_to_converter():
+    conv = CoordinateConverter((2000, 1500))
+    conv.set_mm_per_pixels_bot(0.05)
+    conv.set_origin_mm(0.0, 0.0, "bottom")
+    # The real bottom image is slightly rotated and offset against the model
+    matrix = true_affine(scale=1 / 0.0502, angle_deg=0.4, offset=(2008.0, 1493.0))
+
+    pads = [
+        BoardObject("J1", i, channel=i, technology="Through Hole",
+                    x_coord_mm=5 + (i % 10) * 8.0, y_coord_mm=5 + (i // 10) * 6.0)
+        for i in range(1, 101)
+    ]
+    pads.append(BoardObject("R1", 1, channel=200, x_coord_mm=40, y_coord_mm=40))  # SMD
+    mm = np.array([(p.x_coord_mm, p.y_coord_mm) for p in pads[:100]])
+    observed = apply_affine(matrix, mm)
+    observed = np.vstack((observed, [[10.0, 10.0], [1900.0, 50.0]]))  # stray blobs
+
+    result = register_side(pads, conv, observed, "bottom")
+    assert len(result.keys) == 100 and 200 not in result.keys
+    assert max(result.residuals_by_key().values()) < 1e-6
+
+    conv.set_registration("bottom", result.matrix)
+    x_px, y_px = conv.mm_to_pixels(37.0, 23.0, "bottom")
+    assert (x_px, y_px) == pytest.approx(tuple(apply_affine(matrix, np.array([37.0, 23.0]))))
+    assert conv.pixels_to_mm(x_px, y_px, "bottom") == pytest.approx((37.0, 23.0))
+    np.testing.assert_allclose(conv.mm_to_pixels_array(mm, "bottom"), observed[:100])
+
+    conv.set_registration("bottom", None)
+    assert conv.mm_to_pixels(0.0, 0.0, "bottom") == (2000.0, 1500.0)
+
+
+def test_missing_registration_is_reset_on_load(tmp_path):
+    class Consts(dict):
+        # No save(): loading a project must not rewrite the global settings
+        def set(self, key, value, layer=None):
+            assert layer == "project"
+            self[key] = value
+
+    consts = Consts(BottomImageAffine=[1, 0, 0, 1, 0, 0])
+    (tmp_path / "project_settings.json").write_text(json.dumps({"mm_per_pixels_bot": 0.04}))
+    load_settings(str(tmp_path), consts)
+    assert consts["BottomImageAffine"] is None
+    assert consts["mm_per_pixels_bot"] == 0.04
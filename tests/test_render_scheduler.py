@@ -0,0 +1,102 @@
+import copy
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QGraphicsScene  # noqa: E402
+
+from display.coord_converter import CoordinateConverter  # noqa: E402
+from display.display_library import (  # noqa: E402
+    DIRTY_GEOMETRY,
+    DIRTY_STYLE,
+    DIRTY_VISIBILITY,
+    DisplayLibrary,
+)
+from objects.board_object import BoardObject  # noqa: E402
+
+app = QApplication.instance() or QApplication([])
+
+
+class FakeLibrary:
+    def __init__(self, objs=()):
+        self.objects = {o.channel: o for o in objs}
+
+    def get_all_objects(self):
+        return list(self.objects.values())
+
+
+def _make_display(objs=()):
+    scene = QGraphicsScene()
+    display = DisplayLibrary(scene, FakeLibrary(objs), CoordinateConverter((1000, 1000)))
+    return scene, display
+
+
+def _pad(ch, **kw):
+    params = dict(component_name="U1", pin=ch, channel=ch, x_coord_mm=5, y_coord_mm=5)
+    params.update(kw)
+    return BoardObject(**params)
+
+
+def test_updates_are_deferred_and_coalesced_until_next_tick():
+    scene, display = _make_display([_pad(1)])
+    item = display.displayed_objects[1]
+
+    for x in (6, 7, 8):
+        moved = copy.deepcopy(display.object_library.objects[1])
+        moved.x_coord_mm = x
+        display.update_rendered_objects_for_updates([moved])
+
+    assert display.has_pending_updates()
+    x_before = item.pos().x()
+    app.processEvents()  # zero-delay timer flushes once
+
+    assert not display.has_pending_updates()
+    assert display.displayed_objects[1] is item
+    assert item.pos().x() != x_before
+    assert item.board_object.x_coord_mm == 8
+
+
+def test_style_change_mutates_brush_in_place():
+    scene, display = _make_display([_pad(1, testability="Not Testable")])
+    item = display.displayed_objects[1]
+    updated = copy.deepcopy(item.board_object)
+    updated.testability = "Forced"
+
+    assert display.classify_change(updated) == DIRTY_STYLE
+    display.update_rendered_objects_for_updates([updated])
+    display.flush_pending()
+
+    assert display.displayed_objects[1] is item
+    assert item._brush.color() == display.get_pad_color("F")
+
+
+def test_geometry_change_swaps_cached_path():
+    scene, display = _make_display([_pad(1, width_mm=1, height_mm=1), _pad(2, width_mm=2, height_mm=2)])
+    item = display.displayed_objects[1]
+    updated = copy.deepcopy(item.board_object)
+    updated.width_mm = updated.height_mm = 2
+
+    assert display.classify_change(updated) == DIRTY_GEOMETRY
+    display.update_rendered_objects_for_updates([updated])
+    display.flush_pending()
+
+    assert display.displayed_objects[1] is item
+    assert item.path.boundingRect() == display.displayed_objects[2].path.boundingRect()
+
+
+def test_visibility_change_and_removal():
+    scene, display = _make_display([_pad(1), _pad(2)])
+    moved = copy.deepcopy(display.displayed_objects[1].board_object)
+    moved.test_position = "Bottom"
+
+    assert display.classify_change(moved) & DIRTY_VISIBILITY
+    display.update_rendered_objects_for_updates([moved])
+    display.remove_rendered_objects([2])
+    display.add_rendered_objects([_pad(3)])
+    assert 2 in display.displayed_objects  # nothing touched before the flush
+    display.flush_pending()
+
+    assert 1 not in display.displayed_objects
+    assert 2 not in display.displayed_objects
+    assert 3 in display.displayed_objects
+    assert len(scene.items()) == 2  # pad group + pad 3
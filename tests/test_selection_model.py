@@ -0,0 +1,113 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QGraphicsScene  # noqa: E402
+
+import edit_pads.actions as actions  # noqa: E402
+from display.coord_converter import CoordinateConverter  # noqa: E402
+from constants.constants import Constants  # noqa: E402
+from display.display_library import SELECTED_PEN, DisplayLibrary  # noqa: E402
+from objects.board_object import BoardObject  # noqa: E402
+from objects.selection_model import SelectionModel  # noqa: E402
+from ui.board_view.board_view import BoardView  # noqa: E402
+
+app = QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def lib(lib):
+    lib.bulk_add(
+        [
+            BoardObject("U1", 1, signal="GND", x_coord_mm=1, y_coord_mm=1),
+            BoardObject("U1", 2, signal="VCC", x_coord_mm=2, y_coord_mm=1),
+            BoardObject("U2", 1, signal="GND", x_coord_mm=20, y_coord_mm=20),
+            BoardObject("U2", 2, x_coord_mm=21, y_coord_mm=20, test_position="Bottom"),
+        ]
+    )
+    return lib
+
+
+def test_set_operations_emit_one_diff(lib):
+    model = SelectionModel(lib)
+    changes = []
+    model.selection_changed.connect(lambda a, r: changes.append((a, r)))
+
+    model.select_component("U1")
+    model.select_net("GND", extend=True)
+    model.select_net("GND", extend=True)  # no-op, no signal
+    assert model.channels() == [1, 2, 3]
+    assert changes == [({1, 2}, set()), ({3}, set())]
+
+    model.invert()
+    assert model.channels() == [4]
+    model.grow_to_components()
+    assert model.channels() == [3, 4]
+
+
+def test_rect_selection_uses_side_filter(lib):
+    model = SelectionModel(lib)
+    model.select_rect(0, 0, 25, 25, side="top")
+    assert model.channels() == [1, 2, 3]
+    model.select_rect(15, 15, 25, 25)
+    assert model.channels() == [3, 4]
+
+
+def test_rect_selection_follows_edits(lib):
+    model = SelectionModel(lib)
+    moved = BoardObject("U1", 2, channel=2, signal="VCC", x_coord_mm=40, y_coord_mm=40)
+    lib.bulk_update_objects([moved], {})
+    model.select_rect(35, 35, 45, 45)
+    assert model.channels() == [2]
+
+    hidden = BoardObject("U1", 2, channel=2, x_coord_mm=40, y_coord_mm=40)
+    hidden.visible = False
+    lib.bulk_update_objects([hidden], {})
+    model.select_rect(0, 0, 45, 45)
+    assert model.channels() == [1, 3, 4]
+
+
+def test_deleted_pads_leave_the_selection(lib):
+    model = SelectionModel(lib)
+    model.set_channels([1, 2])
+    lib.bulk_delete([2])
+    assert model.channels() == [1]
+
+
+def test_display_highlight_follows_model(lib):
+    scene = QGraphicsScene()
+    display = DisplayLibrary(scene, lib, CoordinateConverter((1000, 1000)))
+    model = SelectionModel(lib)
+    display.selection_model = model
+    model.selection_changed.connect(display.apply_selection)
+
+    model.set_channels([1, 3])
+    assert {i.board_object.channel for i in scene.selectedItems()} == {1, 3}
+    assert display.displayed_objects[1]._pen == SELECTED_PEN
+
+    # Re-created items (e.g. after a side switch) pick up the highlight
+    display.update_display_side()
+    assert display.displayed_objects[3].isSelected()
+
+
+def test_actions_accept_channels(lib, monkeypatch):
+    monkeypatch.setattr(actions, "_update_scene", lambda *args, **kwargs: None)
+    actions.connect_pads(lib, [2, 4])
+    assert lib.objects[2].signal == lib.objects[4].signal
+
+
+def test_click_replaces_selection_of_hidden_pads(lib):
+    view = BoardView(object_library=lib, constants=Constants())
+    view.display_library.render_initial_objects()
+    view.selection.select_component("U2")  # pad 4 is on the bottom side
+    assert view.selected_channels() == [3, 4]
+
+    view.display_library.update_display_side()  # re-rendering is not a click
+    assert view.selected_channels() == [3, 4]
+
+    view.scene.clearSelection()  # the user clicks pad 1
+    view.display_library.displayed_objects[1].setSelected(True)
+    assert view.selected_channels() == [1]
+    view.scene.clearSelection()  # ... then empty space
+    assert view.selected_channels() == []
@@ -0,0 +1,136 @@
+import json
+import threading
+import time
+
+import pytest
+
+from constants.constants import GLOBAL, PROJECT, USER, Constants
+from logs.log_handler import LogHandler
+from project_manager.project_settings import load_settings
+
+
+@pytest.fixture
+def files(tmp_path):
+    global_path = tmp_path / "constants.txt"
+    user_path = tmp_path / "user" / "settings.json"
+    global_path.write_text(json.dumps({"max_zoom": 20.0, "pins_font_size": 14}))
+    return global_path, user_path
+
+
+def _store(files, **kwargs):
+    global_path, user_path = files
+    return Constants(
+        str(global_path), logger=LogHandler(), user_path=str(user_path), **kwargs
+    )
+
+
+def test_lookup_order_and_set_routing(files):
+    global_path, user_path = files
+    user_path.parent.mkdir()
+    user_path.write_text(json.dumps({"pins_font_size": 16}))
+    consts = _store(files)
+
+    assert consts.get("max_backups") == 5  # defaults
+    assert consts.get("max_zoom") == 20.0 and consts.layer_of("max_zoom") == GLOBAL
+    assert consts.get("pins_font_size") == 16 and consts.layer_of("pins_font_size") == USER
+    assert consts.get("missing", "x") == "x" and consts.layer_of("missing") is None
+
+    consts.set("mm_per_pixels_top", 0.05, layer=PROJECT)
+    consts.set("mm_per_pixels_top", 0.06)  # the project defines it -> project layer
+    consts.set("max_zoom", 12.0)  # anything else -> user layer
+    assert consts.layers[PROJECT] == {"mm_per_pixels_top": 0.06}
+    assert consts.layers[USER] == {"pins_font_size": 16, "max_zoom": 12.0}
+    assert consts.layers[GLOBAL]["max_zoom"] == 20.0
+
+    consts.clear_layer(PROJECT)
+    assert consts.get("mm_per_pixels_top") is None
+    consts.flush()
+    assert json.loads(global_path.read_text()) == {"max_zoom": 20.0, "pins_font_size": 14}
+    assert json.loads(user_path.read_text()) == {"pins_font_size": 16, "max_zoom": 12.0}
+
+
+def test_burst_of_saves_is_one_background_write(files):
+    _, user_path = files
+    consts = _store(files)
+    consts.flush_delay_s = 0.05
+
+    for size in range(8, 40):  # e.g. a font size spin box being scrolled
+        consts.set("pins_font_size", size)
+        consts.save()
+    assert consts.writes == 0 and not user_path.exists()
+
+    deadline = time.monotonic() + 5.0
+    while consts.writes == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert consts.writes == 1
+    assert json.loads(user_path.read_text()) == {"pins_font_size": 39}
+    assert consts.flush() == 0  # nothing left to write
+
+
+def test_loading_a_project_writes_nothing(files, tmp_path):
+    global_path, user_path = files
+    consts = _store(files)
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "project_settings.json").write_text(
+        json.dumps({"mm_per_pixels_top": 0.04, "TopImageXCoord": 1.5})
+    )
+
+    load_settings(str(project), consts, logger=LogHandler())
+
+    assert consts.get("mm_per_pixels_top") == 0.04
+    assert consts.layer_of("TopImageXCoord") == PROJECT
+    assert consts.flush() == 0 and consts.writes == 0
+    assert not user_path.exists()
+    assert json.loads(global_path.read_text()) == {"max_zoom": 20.0, "pins_font_size": 14}
+
+
+def test_malformed_global_file_is_never_overwritten(files):
+    global_path, _ = files
+    global_path.write_text('{"max_zoom": 20.0,}')
+    consts = _store(files)
+
+    assert consts.get("max_zoom") == 10.0  # falls back to the defaults
+    consts.set("max_zoom", 30.0, layer=GLOBAL)
+    assert consts.flush() == 0
+    assert global_path.read_text() == '{"max_zoom": 20.0,}'
+
+
+def test_without_user_file_changes_go_to_the_global_file(tmp_path):
+    path = tmp_path / "board_constants.txt"
+    path.write_text(json.dumps({"max_zoom": 20.0}))
+    consts = Constants(file_path=str(path), logger=LogHandler())
+
+    consts.set("max_zoom", 8.0)
+    assert consts.layer_of("max_zoom") == GLOBAL
+    consts.save()
+    assert consts.flush() == 1
+    assert json.loads(path.read_text()) == {"max_zoom": 8.0}
+
+
+def test_flush_waits_for_a_write_in_progress(files):
+    _, user_path = files
+    consts = _store(files)
+    writing, release = threading.Event(), threading.Event()
+    write = consts._write
+
+    def slow_write(path, values):
+        writing.set()
+        release.wait(5.0)
+        return write(path, values)
+
+    consts._write = slow_write
+    consts.set("pins_font_size", 30)
+    timer_flush = threading.Thread(target=consts.flush)  # stands in for the timer
+    timer_flush.start()
+    assert writing.wait(5.0)
+
+    exit_flush = threading.Thread(target=consts.flush)  # e.g. atexit
+    exit_flush.start()
+    time.sleep(0.05)
+    assert exit_flush.is_alive()  # blocked until the running write is done
+    release.set()
+    exit_flush.join(5.0)
+    timer_flush.join(5.0)
+    assert json.loads(user_path.read_text()) == {"pins_font_size": 30}
+    assert consts.writes == 1
@@ -0,0 +1,28 @@
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from utils.startup_benchmark import (  # noqa: E402
+    HEAVY_MODULES,
+    STARTUP_BUDGET_S,
+    parse_importtime,
+    run_benchmark,
+)
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _io\n"
+        "import time:      3000 |       5000 | main\n"
+    )
+    rows = parse_importtime(stderr)
+    assert rows == [("_io", 120, 120), ("main", 3000, 5000)]
+
+
+def test_startup_skips_heavy_modules_and_meets_budget():
+    result = run_benchmark("main")
+    assert result["total_s"] > 0
+    for mod in HEAVY_MODULES:
+        assert mod not in result["heavy_loaded"]
+    assert result["total_s"] < STARTUP_BUDGET_S
@@ -0,0 +1,88 @@
+import random
+import time
+
+from constants.constants import PROJECT, Constants
+from objects.board_object import BoardObject
+from objects.testability_engine import (
+    DEFAULT_RULES,
+    apply_testability_rules,
+    assign_testability,
+    load_rules,
+)
+
+
+def _pad(ch, signal, x=0.0, size=1.0, **kw):
+    return BoardObject(
+        "U1", ch, channel=ch, signal=signal, x_coord_mm=x, width_mm=size, height_mm=size,
+        **kw,
+    )
+
+
+def test_rules_rank_and_fall_back():
+    pads = [
+        # Net A: the through-hole pad wins over the larger SMD pad
+        _pad(1, "A", x=0, size=2.0),
+        _pad(2, "A", x=10, size=1.0, technology="Through Hole"),
+        # Net B: the bottom-only pad loses against the requested side
+        _pad(3, "B", x=20, size=3.0, test_position="Bottom"),
+        _pad(4, "B", x=30, size=1.0),
+        # Net C: only pad too small -> Not Testable, then fallback
+        _pad(5, "C", x=40, size=0.2),
+        # Net D: its best pad sits next to the probe of net A
+        _pad(6, "D", x=10.5, size=1.0),
+        _pad(7, "D", x=50, size=0.8),
+        _pad(8, "E", x=60, technology="Mechanical"),
+    ]
+    report = assign_testability(pads, {"preferred_side": "Top", "min_pad_mm": 0.5})
+    t = report.testability
+
+    assert (t[1], t[2]) == ("Terminal", "Forced")
+    assert (t[3], t[4]) == ("Terminal", "Forced")
+    assert t[5] == "Testable Alternative"
+    assert (t[6], t[7]) == ("Terminal", "Forced")
+    assert t[8] == "Not Testable"
+    assert 6 in report.changes["probe_spacing"]
+    assert report.changes["fallback"] == [5]
+    assert 8 not in report.previous  # already Not Testable
+
+
+def test_rules_come_from_the_given_settings():
+    board = Constants(shared=False)
+    board.set("testability_rules", {"min_pad_mm": 0.8, "preferred_side": None}, PROJECT)
+
+    rules = load_rules({"preferred_side": "Bottom"}, constants=board)
+
+    assert rules["min_pad_mm"] == 0.8
+    assert rules["preferred_side"] == "Bottom"
+    assert rules["max_probes_per_net"] == DEFAULT_RULES["max_probes_per_net"]
+    assert Constants().get("testability_rules") != board.get("testability_rules")
+    report = assign_testability([_pad(1, "A", size=0.6), _pad(2, "A", x=5)], constants=board)
+    assert report.testability == {1: "Not Testable", 2: "Forced"}
+
+
+def test_apply_is_one_undo_step(lib):
+    lib.bulk_add([_pad(1, "A", size=2.0), _pad(2, "A"), _pad(3, "B", x=5)])
+    depth = len(lib.undo_redo_manager.undo_stack)
+
+    report = apply_testability_rules(lib, {"max_probes_per_net": 1})
+
+    assert report.changed_channels() == [1, 2, 3]
+    assert lib.nets.forced_in_net("A") == {1}
+    assert lib.nets.nets_without_forced() == set()
+    assert len(lib.undo_redo_manager.undo_stack) == depth + 1
+    assert lib.undo()
+    assert lib.objects[1].testability == "Not Testable"
+
+
+def test_large_board_is_assigned_quickly():
+    rng = random.Random(0)
+    pads = [
+        _pad(ch, f"N{ch % 10000}", x=rng.uniform(0, 400), y_coord_mm=rng.uniform(0, 300))
+        for ch in range(1, 50001)
+    ]
+    start = time.perf_counter()
+    report = assign_testability(pads)
+    elapsed = time.perf_counter() - start
+
+    assert len(report.testability) == 50000
+    assert elapsed < 1.0
@@ -0,0 +1,78 @@
+import copy
+
+import pytest
+
+from objects.board_object import BoardObject
+
+
+class RecordingDisplay:
+    def __init__(self):
+        self.calls = []
+
+    def add_rendered_objects(self, objs):
+        self.calls.append(("add", sorted(o.channel for o in objs)))
+
+    def update_rendered_objects_for_updates(self, objs):
+        self.calls.append(("update", sorted(o.channel for o in objs)))
+
+    def remove_rendered_objects(self, channels):
+        self.calls.append(("remove", sorted(channels)))
+
+
+@pytest.fixture
+def lib(lib):
+    lib.display_library = RecordingDisplay()
+    return lib
+
+
+def _pads(n, comp="U1"):
+    return [BoardObject(component_name=comp, pin=i + 1) for i in range(n)]
+
+
+def test_transaction_coalesces_undo_render_and_signal(lib):
+    lib.bulk_add(_pads(3))
+    lib.display_library.calls.clear()
+    undo_depth = len(lib.undo_redo_manager.undo_stack)
+
+    emitted = []
+    lib.bulk_operation_completed.connect(emitted.append)
+    try:
+        with lib.transaction("Edit"):
+            lib.bulk_delete([1])
+            moved = copy.deepcopy(lib.objects[2])
+            moved.x_coord_mm = 5.0
+            lib.bulk_update_objects([moved], {})
+            with lib.transaction("Nested"):
+                lib.bulk_add(_pads(2, comp="U2"))
+                lib.bulk_delete([5])
+            assert lib.display_library.calls == []
+            assert emitted == []
+    finally:
+        lib.bulk_operation_completed.disconnect(emitted.append)
+
+    assert emitted == ["Edit"]
+    assert len(lib.undo_redo_manager.undo_stack) == undo_depth + 1
+    assert lib.display_library.calls == [
+        ("remove", [1]),
+        ("update", [2]),
+        ("add", [4]),
+    ]
+
+    assert lib.undo()
+    assert sorted(lib.objects) == [1, 2, 3]
+
+
+def test_transaction_rolls_back_on_error(lib):
+    lib.bulk_add(_pads(2))
+    lib.display_library.calls.clear()
+    undo_depth = len(lib.undo_redo_manager.undo_stack)
+
+    with pytest.raises(RuntimeError):
+        with lib.transaction("Broken"):
+            lib.bulk_delete([1, 2])
+            raise RuntimeError("boom")
+
+    assert sorted(lib.objects) == [1, 2]
+    assert len(lib.undo_redo_manager.undo_stack) == undo_depth
+    assert lib.display_library.calls == []
+    assert not lib.in_transaction()
@@ -10,11 +10,13 @@ from PyQt5.QtWidgets import (
     QAction,
     QShortcut,
     QGraphicsRectItem,
+    QGraphicsPathItem,
     QInputDialog,
     QFileDialog,
+    QStyleOptionGraphicsItem,
 )
-from PyQt5.QtCore import Qt, QPointF, pyqtSignal, QEvent, QTimer
-from PyQt5.QtGui import QCursor, QKeySequence, QPen
+from PyQt5.QtCore import Qt, QPointF, QRectF, pyqtSignal, QEvent, QTimer
+from PyQt5.QtGui import QBrush, QCursor, QKeySequence, QPainterPath, QPen
 from logs.log_handler import LogHandler
 from utils.flag_manager import FlagManager
 from ui.marker_manager import MarkerManager
@@ -22,6 +24,7 @@ from ui.zoom_manager import ZoomManager
 from constants.constants import Constants
 from display.display_library import DisplayLibrary, SelectablePadItem
 from display.coord_converter import CoordinateConverter
+from objects.selection_model import SelectionModel
 from inputs.input_handler import InputHandler
 import edit_pads.actions as actions
 from objects.alf_file import export_alf_file
@@ -43,13 +46,18 @@ class BoardView(QGraphicsView):
         component_placer=None,
         object_library=None,
         constants=None,
+        context=None,
     ):
         super().__init__(parent)
         self.log = LogHandler(output="both")
-        self.flags = FlagManager()
+        # A BoardContext supplies the board's own flags, converter and
+        # library; without one the process-wide defaults are used
+        self.flags = context.flags if context is not None else FlagManager()
+        if object_library is None and context is not None:
+            object_library = context.object_library
 
         # --- Keep the side-aware converter (new approach) ---
-        self.converter = CoordinateConverter()
+        self.converter = context.converter if context is not None else CoordinateConverter()
         bx = constants.get("BottomImageXCoord", 0.0)
         by = constants.get("BottomImageYCoord", 0.0)
         tx = constants.get("TopImageXCoord", 0.0)
@@ -103,7 +111,11 @@ class BoardView(QGraphicsView):
         self.scene.addItem(self.display_group)
         self.scene.addItem(self.marker_group)
         self.scene.addItem(self.cutout_group)
-        self.cutout_items = []
+        # Digitation-holes overlay: one path item for all components, and
+        # per side the projected pixel rect of every component box
+        self._holes_item = None
+        self._hole_rects = {}  # side -> (converter key, {component: QRectF})
+        self._holes_side = None
 
         self.setCacheMode(QGraphicsView.CacheBackground)
         self.scene.selectionChanged.connect(self.on_scene_selection_changed)
@@ -134,6 +146,12 @@ class BoardView(QGraphicsView):
             current_side="top",
         )
 
+        # Pad selection as a set of channels; the scene highlight follows it
+        self.selection = SelectionModel(self.object_library, self)
+        self.display_library.selection_model = self.selection
+        self.selection.selection_changed.connect(self._on_selection_model_changed)
+        self._scene_selection_dirty = False
+
         # Focus + shortcuts
         self.setFocusPolicy(Qt.StrongFocus)
         self.viewport().setFocusPolicy(Qt.StrongFocus)
@@ -169,6 +187,14 @@ class BoardView(QGraphicsView):
         self.image_hidden_by_filter = False
         self.pads_hidden_by_filter = False
         self.digitation_holes_enabled = False
+        # The holes overlay follows library edits incrementally
+        for signal in (
+            self.object_library.object_added,
+            self.object_library.object_removed,
+            self.object_library.object_updated,
+            self.object_library.bulk_operation_completed,
+        ):
+            signal.connect(self._on_library_changed)
 
     # --------------------------------------------------------------------------
     #  SELECTION CHANGED HANDLER
@@ -177,7 +203,18 @@ class BoardView(QGraphicsView):
         """
         Called when the scene selection changes.
         To reduce lag when many items are selected, we throttle the update to the main window.
+        The SelectionModel is synced from the scene once the timer fires (or
+        earlier, when selected_channels() is asked for).
         """
+        self._scene_selection_dirty = True
+        self._schedule_selection_info()
+
+    def _on_selection_model_changed(self, added, removed):
+        """Mirror programmatic selection changes onto the pad items."""
+        self.display_library.apply_selection(added, removed)
+        self._schedule_selection_info()
+
+    def _schedule_selection_info(self):
         # Use a single-shot timer to debounce selection updates.
         if hasattr(self, "_selection_update_timer"):
             self._selection_update_timer.stop()
@@ -207,7 +244,30 @@ class BoardView(QGraphicsView):
                 return
         super().keyPressEvent(event)
 
+    def _sync_selection_from_scene(self):
+        """
+        Pull user (click / rubber band) selection from the scene into the
+        SelectionModel. It replaces the selection: pads that are not drawn
+        (e.g. the other side's pads of a selected component) are dropped, so
+        actions never reach pads the user cannot see. DisplayLibrary adds and
+        removes items without marking the scene selection as changed.
+        """
+        if not self._scene_selection_dirty:
+            return
+        self._scene_selection_dirty = False
+        self.selection.set_channels(
+            item.board_object.channel
+            for item in self.scene.selectedItems()
+            if isinstance(item, SelectablePadItem)
+        )
+
+    def selected_channels(self) -> list:
+        """Channels of the selected pads (ascending)."""
+        self._sync_selection_from_scene()
+        return self.selection.channels()
+
     def _update_selected_info(self):
+        self._sync_selection_from_scene()
         selected_items = self._get_selected_pads()
         main_win = self.parent()  # or use self.window()
         if hasattr(main_win, "update_selected_pins_info"):
@@ -222,12 +282,9 @@ class BoardView(QGraphicsView):
         return super().eventFilter(obj, event)
 
     def _get_selected_pads(self):
-        """Returns currently selected pads."""
-        return [
-            item
-            for item in self.scene.selectedItems()
-            if isinstance(item, SelectablePadItem)
-        ]
+        """Returns the pad items of the selected channels that are rendered."""
+        displayed = self.display_library.displayed_objects
+        return [displayed[ch] for ch in self.selected_channels() if ch in displayed]
 
     def connect_signals(self):
         """
@@ -262,16 +319,20 @@ class BoardView(QGraphicsView):
             return
         super().wheelEvent(event)
 
+    def paintEvent(self, event):
+        # Every zoom, fit and resize ends up here: hand the current scale to
+        # the pad level-of-detail before the pads are drawn (no-op if unchanged)
+        self.display_library.set_view_scale(
+            QStyleOptionGraphicsItem.levelOfDetailFromTransform(self.transform())
+        )
+        super().paintEvent(event)
+
     def load_image(self, file_path: str, side: str):
         image_manager.load_image(self, file_path, side)
 
     def _get_currently_selected_pad_items(self) -> list:
         """Helper to get all selected pad items in the scene"""
-        return [
-            item
-            for item in self.scene.selectedItems()
-            if isinstance(item, SelectablePadItem)
-        ]
+        return self._get_selected_pads()
 
     def switch_side(self):
         """
@@ -338,6 +399,13 @@ class BoardView(QGraphicsView):
         self.display_library.update_display_side()
         self.log.log("info", f"Switched board side to '{new_side}'")
 
+        # Pads that are not shown on the new side drop out of the selection
+        displayed = self.display_library.displayed_objects
+        self._sync_selection_from_scene()
+        self.selection.set_channels(
+            ch for ch in self.selection.channels() if ch in displayed
+        )
+
         # Reapply pad visibility state after re-rendering
         if getattr(self, "pads_hidden_by_filter", False):
             for item in self.display_library.displayed_objects.values():
@@ -499,8 +567,9 @@ class BoardView(QGraphicsView):
         """
         Displays the context menu for the selected pads at the specified global position.
         """
-        if not selected_pads:
-            self.log.log("warning", "show_context_menu called with no pad items.")
+        if not any(hasattr(p, "board_object") for p in selected_pads):
+            # Right-click beside the pads (e.g. on the board image): offer the component under the cursor
+            self.show_component_menu(global_pos or QCursor.pos())
             return
 
         self.log.log(
@@ -510,6 +579,12 @@ class BoardView(QGraphicsView):
 
         menu = QMenu(self)
 
+        # Actions work on channels; the given items only matter if the
+        # selection model is empty (e.g. a right-click on an unselected pad).
+        channels = self.selected_channels() or [
+            p.board_object.channel for p in selected_pads if hasattr(p, "board_object")
+        ]
+
         # Existing actions
         copy_action = QAction("Copy", self)
         paste_action = QAction("Paste", self)
@@ -518,29 +593,39 @@ class BoardView(QGraphicsView):
         cut_action = QAction("Cut", self)
         move_action = QAction("Move", self)
         connect_action = QAction("Connect", self)
+        disconnect_action = QAction("Disconnect", self)
 
         copy_action.triggered.connect(
-            lambda: actions.copy_pads(self.object_library, selected_pads)
+            lambda: actions.copy_pads(self.object_library, channels, board_view=self)
         )
         paste_action.triggered.connect(
             lambda: actions.paste_pads(self.object_library, self.component_placer)
         )
         delete_action.triggered.connect(
-            lambda: actions.delete_pads(self.object_library, selected_pads)
+            lambda: actions.delete_pads(
+                self.object_library, channels, board_view=self
+            )
         )
         edit_action.triggered.connect(
-            lambda: actions.edit_pads(self.object_library, selected_pads)
+            lambda: actions.edit_pads(self.object_library, channels, board_view=self)
         )
         cut_action.triggered.connect(
-            lambda: actions.cut_pads(self.object_library, selected_pads)
+            lambda: actions.cut_pads(self.object_library, channels, board_view=self)
         )
         move_action.triggered.connect(
             lambda: actions.move_pads(
-                self.object_library, selected_pads, self.component_placer
+                self.object_library, channels, self.component_placer, board_view=self
             )
         )
         connect_action.triggered.connect(
-            lambda: actions.connect_pads(self.object_library, selected_pads)
+            lambda: actions.connect_pads(
+                self.object_library, channels, board_view=self
+            )
+        )
+        disconnect_action.triggered.connect(
+            lambda: actions.disconnect_pads(
+                self.object_library, channels, board_view=self
+            )
         )
 
         # NEW: "Export Footprint"
@@ -555,6 +640,7 @@ class BoardView(QGraphicsView):
         menu.addAction(paste_action)
         menu.addAction(move_action)
         menu.addAction(connect_action)
+        menu.addAction(disconnect_action)
         menu.addAction(delete_action)
         menu.addAction(edit_action)
         menu.addSeparator()
@@ -574,6 +660,24 @@ class BoardView(QGraphicsView):
         except Exception as e:
             self.log.log("error", f"Error executing context menu: {e}")
 
+    def show_component_menu(self, global_pos):
+        """Context menu for the component whose outline is under *global_pos*."""
+        scene_pos = self.mapToScene(self.mapFromGlobal(global_pos))
+        component = self.component_at(scene_pos)
+        if component is None:
+            self.log.log("debug", "Context menu: no component under the cursor.")
+            return
+        channels = self.object_library.components.channels(component)
+
+        menu = QMenu(self)
+        select_action = QAction(f"Select {component}", self)
+        select_action.triggered.connect(lambda: self.selection.set_channels(channels))
+        zoom_action = QAction(f"Zoom to {component}", self)
+        zoom_action.triggered.connect(lambda: self.zoom_to_component(component))
+        menu.addAction(select_action)
+        menu.addAction(zoom_action)
+        menu.exec_(global_pos)
+
     def export_footprint(self, pad_items):
         """
         Exports the selected pads as a footprint (.nod file) and, if any pad
@@ -729,11 +833,11 @@ class BoardView(QGraphicsView):
     # --------------------------------------------------------------------------
     def copy_selected_pads(self):
         """Handles Ctrl+C (Copy)"""
-        selected_pads = self._get_selected_pads()
-        if not selected_pads:
+        selected = self.selected_channels()
+        if not selected:
             self.log.log("warning", "No pads selected to copy.")
             return
-        actions.copy_pads(self.object_library, selected_pads)
+        actions.copy_pads(self.object_library, selected, board_view=self)
 
     def paste_selected_pads(self):
         """Handles Ctrl+V (Paste)"""
@@ -742,68 +846,75 @@ class BoardView(QGraphicsView):
 
     def delete_selected_pads(self):
         """Handles Delete key"""
-        selected_pads = self._get_selected_pads()
-        if not selected_pads:
+        selected = self.selected_channels()
+        if not selected:
             self.log.log("warning", "No pads selected to delete.")
             return
-        actions.delete_pads(self.object_library, selected_pads)
+        actions.delete_pads(self.object_library, selected, board_view=self)
 
     def edit_selected_pads(self):
         """Handles Ctrl+E (Edit)"""
-        selected_pads = self._get_selected_pads()
-        if not selected_pads:
+        selected = self.selected_channels()
+        if not selected:
             self.log.log("warning", "No pads selected to edit.")
             return
-        actions.edit_pads(self.object_library, selected_pads)
+        actions.edit_pads(self.object_library, selected, board_view=self)
 
     def cut_selected_pads(self):
         """Handles Ctrl+X (Cut)"""
-        selected = self._get_selected_pads()
+        selected = self.selected_channels()
         if not selected:
             self.log.log("warning", "No pads selected to cut.")
             return
         try:
-            actions.cut_pads(self.object_library, selected)
+            actions.cut_pads(self.object_library, selected, board_view=self)
         except Exception as e:
             self.log.log("error", f"Error in cut_selected_pads: {e}")
 
     def move_selected_pads(self):
         """Handles Ctrl+M (Move)"""
-        selected = self._get_selected_pads()
+        selected = self.selected_channels()
         if not selected:
             self.log.log("warning", "No pads selected to move.")
             return
         try:
-            actions.move_pads(self.object_library, selected, self.component_placer)
+            actions.move_pads(
+                self.object_library, selected, self.component_placer, board_view=self
+            )
         except Exception as e:
             self.log.log("error", f"Error in move_selected_pads: {e}")
 
     def connect_selected_pads(self):
         """Connects multiple pads to share one signal."""
-        selected = self._get_selected_pads()
+        selected = self.selected_channels()
         if not selected:
             self.log.log("warning", "No pads selected to connect.")
             return
         try:
-            actions.connect_pads(self.object_library, selected)
+            actions.connect_pads(self.object_library, selected, board_view=self)
         except Exception as e:
             self.log.log("error", f"Error in connect_selected_pads: {e}")
 
-    def open_pad_editor_dialog(self, pad_items):
+    def open_pad_editor_dialog(self, selection):
         """
-        Opens the PadEditorDialog for the currently selected pad items.
+        Opens the PadEditorDialog for the given channels (or pad items).
         """
-        if not pad_items:
+        if not selection:
             self.log.log("info", "No pad items selected. Nothing to edit.")
             return
 
-        # Convert pad_items (SelectablePadItem) -> BoardObject
-        selected_pads = [p.board_object for p in pad_items]
+        channels = [
+            p.board_object.channel if hasattr(p, "board_object") else p
+            for p in selection
+        ]
 
         from edit_pads.pad_editor_dialog import PadEditorDialog
 
         dialog = PadEditorDialog(
-            selected_pads, object_library=self.object_library, parent=self
+            selected_channels=channels,
+            object_library=self.object_library,
+            board_view=self,
+            parent=self,
         )
 
         # Optionally connect the dialog's signal so we can refresh if needed
@@ -826,6 +937,7 @@ class BoardView(QGraphicsView):
         if self.object_library.undo():
             self.display_library.clear_all_rendered_objects()
             self.display_library.render_initial_objects()
+            self._on_library_changed()
             self.log.log("info", "Undo performed.")
         else:
             self.log.log("warning", "[BoardView.perform_undo]: Nothing to undo.")
@@ -834,6 +946,7 @@ class BoardView(QGraphicsView):
         if self.object_library.redo():
             self.display_library.clear_all_rendered_objects()
             self.display_library.render_initial_objects()
+            self._on_library_changed()
             self.log.log("info", "Redo performed.")
         else:
             self.log.log("warning", "[BoardView.perform_redo]: Nothing to redo.")
@@ -906,19 +1019,16 @@ class BoardView(QGraphicsView):
     def mouseDoubleClickEvent(self, event):
         """Select all pads and open the Pad Editor when Alt+double-click."""
         if event.modifiers() & Qt.AltModifier:
-            all_pad_items = [
-                item
-                for key, item in self.display_library.displayed_objects.items()
-                if isinstance(item, SelectablePadItem)
-                and not str(key).endswith("_secondary")
+            all_channels = [
+                key
+                for key in self.display_library.displayed_objects
+                if isinstance(key, int)
             ]
 
-            if all_pad_items:
-                self.scene.clearSelection()
-                for pad in all_pad_items:
-                    pad.setSelected(True)
-
-                actions.edit_pads(self.object_library, all_pad_items)
+            if all_channels:
+                self._sync_selection_from_scene()
+                self.selection.set_channels(all_channels)
+                actions.edit_pads(self.object_library, all_channels, board_view=self)
                 event.accept()
                 return
 
@@ -928,40 +1038,10 @@ class BoardView(QGraphicsView):
     #  Digitation Holes Handling
     # ------------------------------------------------------------------
     def calculate_component_rects(self):
-        """Return bounding rectangles for visible components on the current side."""
-        comp_rects = {}
-        current_side = self.display_library.current_side
-        for obj in self.object_library.get_all_objects():
-            if not getattr(obj, "visible", True):
-                continue
-
-            tech = obj.technology.lower()
-            tp = obj.test_position.lower()
-            if tech == "through hole":
-                include = True
-            elif tech == "smd" and tp == current_side:
-                include = True
-            else:
-                include = False
-            if not include:
-                continue
-
-            comp = obj.component_name
-            half_w = obj.width_mm / 2.0
-            half_h = obj.height_mm / 2.0
-            x1 = obj.x_coord_mm - half_w
-            x2 = obj.x_coord_mm + half_w
-            y1 = obj.y_coord_mm - half_h
-            y2 = obj.y_coord_mm + half_h
-            if comp not in comp_rects:
-                comp_rects[comp] = [x1, y1, x2, y2]
-            else:
-                r = comp_rects[comp]
-                r[0] = min(r[0], x1)
-                r[1] = min(r[1], y1)
-                r[2] = max(r[2], x2)
-                r[3] = max(r[3], y2)
-        return comp_rects
+        """Return bounding rectangles (mm) for visible components on the current side."""
+        side = self.display_library.current_side
+        bounds = self.object_library.component_bounds
+        return {comp: list(box) for comp, box in bounds.boxes(side).items()}
 
     def show_digitation_holes(self, enable: bool):
         """Overlay rectangles to simulate holes where digitation was made."""
@@ -971,41 +1051,107 @@ class BoardView(QGraphicsView):
             module="BoardView",
             func="show_digitation_holes",
         )
-        for item in list(self.cutout_items):
-            self.cutout_group.removeFromGroup(item)
-            self.scene.removeItem(item)
-        self.cutout_items.clear()
-
         if not enable:
+            if self._holes_item is not None:
+                self._holes_item.setVisible(False)
             self.log.debug(
-                "Digitation holes disabled; cleared existing items.",
+                "Digitation holes disabled; overlay hidden.",
                 module="BoardView",
                 func="show_digitation_holes",
             )
             return
+        self._refresh_digitation_holes()
 
-        from PyQt5.QtCore import QRectF
-        from PyQt5.QtGui import QBrush, QPen
+    def _on_library_changed(self, *_):
+        if self.digitation_holes_enabled:
+            self._refresh_digitation_holes()
 
-        rects = self.calculate_component_rects()
-        self.log.debug(
-            f"Creating {len(rects)} digitation hole rectangles.",
-            module="BoardView",
-            func="show_digitation_holes",
-        )
-        for rect in rects.values():
-            x1, y1, x2, y2 = rect
-            x1_px, y1_px = self.converter.mm_to_pixels(x1, y1)
-            x2_px, y2_px = self.converter.mm_to_pixels(x2, y2)
-            qrect = QRectF(x1_px, y1_px, x2_px - x1_px, y2_px - y1_px)
-            item = QGraphicsRectItem(qrect)
-            item.setBrush(QBrush(Qt.white))
-            item.setPen(QPen(Qt.NoPen))
-            item.setZValue(self.z_value_cutouts)
-            self.cutout_group.addToGroup(item)
-            self.cutout_items.append(item)
+    def _refresh_digitation_holes(self):
+        """
+        Redraw the holes overlay from ObjectLibrary.component_bounds. Only the
+        components whose box changed are re-projected to pixels; everything
+        is re-projected when the side, scale, origin or image size changed.
+        New components are appended to the overlay path; a box that moved,
+        shrank or disappeared means rebuilding the path from the cached
+        rects (QPainterPath has no way to drop one rect).
+        """
+        bounds = self.object_library.component_bounds
+        side = self.display_library.current_side
+        conv = self.converter
+        key = conv.mm_to_scene_transform(side)
+        cached = self._hole_rects.get(side)
+        if cached is None or cached[0] != key:
+            bounds.take_changed(side)
+            rects = {}
+            changed = set(bounds.boxes(side))
+            appended = False
+        else:
+            rects = cached[1]
+            changed = bounds.take_changed(side)
+            # Only components the overlay does not show yet
+            appended = bool(changed) and not (changed & rects.keys())
+
+        boxes = {}
+        for comp in changed:
+            box = bounds.box(comp, side)
+            if box is None:
+                rects.pop(comp, None)
+            else:
+                boxes[comp] = box
+        if boxes:
+            # Both corners of every changed box in one batched conversion
+            corners = conv.mm_to_pixels_array(list(boxes.values()), side)
+            corners = corners.reshape(-1, 4).tolist()
+            for comp, (x1_px, y1_px, x2_px, y2_px) in zip(boxes, corners):
+                rects[comp] = QRectF(
+                    QPointF(x1_px, y1_px), QPointF(x2_px, y2_px)
+                ).normalized()
+        self._hole_rects[side] = (key, rects)
+
+        if self._holes_item is None:
+            self._holes_item = QGraphicsPathItem()
+            self._holes_item.setBrush(QBrush(Qt.white))
+            self._holes_item.setPen(QPen(Qt.NoPen))
+            self._holes_item.setZValue(self.z_value_cutouts)
+            self.cutout_group.addToGroup(self._holes_item)
+        redraw = self._holes_side != side or not self._holes_item.isVisible()
+        if appended and not redraw:
+            path = self._holes_item.path()
+            for comp in boxes:
+                path.addRect(rects[comp])
+            self._holes_item.setPath(path)
+        elif changed or redraw:
+            path = QPainterPath()
+            path.setFillRule(Qt.WindingFill)
+            for rect in rects.values():
+                path.addRect(rect)
+            self._holes_item.setPath(path)
+            self._holes_side = side
+        self._holes_item.setVisible(True)
         self.log.debug(
-            f"Added {len(self.cutout_items)} hole items to the scene.",
+            f"Digitation holes: {len(rects)} components, {len(changed)} re-projected.",
             module="BoardView",
             func="show_digitation_holes",
         )
+
+    # ------------------------------------------------------------------
+    #  Component-level queries (served by ObjectLibrary.component_bounds)
+    # ------------------------------------------------------------------
+    def component_at(self, scene_pos: QPointF):
+        """Name of the component whose outline contains *scene_pos*, or None."""
+        side = self.display_library.current_side
+        x_mm, y_mm = self.converter.pixels_to_mm(scene_pos.x(), scene_pos.y(), side)
+        return self.object_library.component_bounds.component_at(x_mm, y_mm, side)
+
+    def zoom_to_component(self, component_name: str, margin: float = 0.25) -> bool:
+        """Fit the view to a component's outline on the current side."""
+        side = self.display_library.current_side
+        box = self.object_library.component_bounds.box(component_name, side)
+        if box is None:
+            return False
+        x1_px, y1_px = self.converter.mm_to_pixels(box[0], box[1], side)
+        x2_px, y2_px = self.converter.mm_to_pixels(box[2], box[3], side)
+        rect = QRectF(QPointF(x1_px, y1_px), QPointF(x2_px, y2_px)).normalized()
+        dx, dy = rect.width() * margin, rect.height() * margin
+        self.fitInView(rect.adjusted(-dx, -dy, dx, dy), Qt.KeepAspectRatio)
+        return True
@@ -3,7 +3,7 @@
 import os
 import shutil
 import copy
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont, QDoubleValidator
 from PyQt5.QtWidgets import (
     QMainWindow,
@@ -25,10 +25,12 @@ from PyQt5.QtWidgets import (
     QHBoxLayout,
     QLineEdit,
     QStyle,
+    QApplication,
 )
 from logs.log_handler import LogHandler
 from constants.constants import Constants
 from ui.board_view.board_view import BoardView
+from display.pad_lod import LOD
 from objects.nod_file import get_footprint_for_placer
 from component_placer.component_placer import ComponentPlacer
 from inputs.input_handler import InputHandler
@@ -72,6 +74,7 @@ class MainWindow(QMainWindow):
         # Link BOM ↔ undo/redo
         self.bom_handler.undo_redo_manager = self.object_library.undo_redo_manager
         self.object_library.bom_handler = self.bom_handler
+        self.bom_handler.attach_board(self.object_library.components)
 
         # ─── Project Manager ───────────────────────────────────────────────
         # Must exist before wiring up input_handler, etc.
@@ -399,6 +402,12 @@ class MainWindow(QMainWindow):
             self.project_manager.create_project_dialog
         )
         file_menu.addAction(create_project_action)
+        net_report_action = QAction("Export Net Report…", self)
+        net_report_action.triggered.connect(self.export_net_report)
+        file_menu.addAction(net_report_action)
+        legacy_action = QAction("Export Legacy Files (NOD/BOM/ALF)", self)
+        legacy_action.triggered.connect(self.project_manager.export_legacy_files)
+        file_menu.addAction(legacy_action)
 
         # ── NEW: Restore Backup … ───────────────────────────────────────────
         restore_action = QAction("Restore Backup…", self)
@@ -408,6 +417,10 @@ class MainWindow(QMainWindow):
         # Disabled until a project is loaded
         self.restore_backup_action = restore_action
         self.restore_backup_action.setEnabled(False)
+        compare_nod_action = QAction("Compare with NOD File…", self)
+        compare_nod_action.setToolTip("Show what differs between the board and a .nod file")
+        compare_nod_action.triggered.connect(self.project_manager.compare_nod_dialog)
+        file_menu.addAction(compare_nod_action)
 
         # ------------------- EDIT Menu ------------------
         edit_menu = menubar.addMenu("Edit")
@@ -421,6 +434,36 @@ class MainWindow(QMainWindow):
         bom_action = QAction("BOM", self)
         bom_action.triggered.connect(self.open_bom_editor)
         edit_menu.addAction(bom_action)
+        selection_menu = edit_menu.addMenu("Selection")
+        for label, handler in (
+            ("Invert", self.invert_selection),
+            ("Grow to Components", self.grow_selection_to_components),
+            ("Grow to Nets", self.grow_selection_to_nets),
+        ):
+            act = QAction(label, self)
+            act.triggered.connect(handler)
+            selection_menu.addAction(act)
+        assign_action = QAction("Auto-Assign Testability…", self)
+        assign_action.triggered.connect(self.auto_assign_testability)
+        edit_menu.addAction(assign_action)
+        compact_action = QAction("Compact Channels", self)
+        compact_action.triggered.connect(self.compact_channels)
+        edit_menu.addAction(compact_action)
+        panel_action = QAction("Panel Step-and-Repeat…", self)
+        panel_action.triggered.connect(self.edit_panel)
+        edit_menu.addAction(panel_action)
+        recognize_action = QAction("Recognize Footprint…", self)
+        recognize_action.setToolTip(
+            "Replace the selected pads by the best-fitting library footprint"
+        )
+        recognize_action.triggered.connect(self.recognize_footprint)
+        edit_menu.addAction(recognize_action)
+        complete_grid_action = QAction("Complete Grid from Selection…", self)
+        complete_grid_action.setToolTip(
+            "Infer pitch and orientation of the selected pads and add the missing ones"
+        )
+        complete_grid_action.triggered.connect(self.complete_grid_from_selection)
+        edit_menu.addAction(complete_grid_action)
 
         # ------------------- PROJECT Menu ------------------
         project_menu = menubar.addMenu("Project")
@@ -437,6 +480,17 @@ class MainWindow(QMainWindow):
         load_nod_action = QAction("Load NOD", self)
         load_nod_action.triggered.connect(self.project_manager.load_nod_advanced)
         project_menu.addAction(load_nod_action)
+        detect_menu = project_menu.addMenu("Pad Detection")
+        for label, handler in (
+            ("Detect Pad Candidates on Image", self.detect_pad_candidates),
+            ("Accept Candidates in View…", lambda: self.accept_pad_candidates(True)),
+            ("Accept All Candidates…", lambda: self.accept_pad_candidates(False)),
+            ("Discard Candidates in View", lambda: self.discard_pad_candidates(True)),
+            ("Discard All Candidates", lambda: self.discard_pad_candidates(False)),
+        ):
+            act = QAction(label, self)
+            act.triggered.connect(handler)
+            detect_menu.addAction(act)
 
         # ------------------- VIEW Menu ------------------
         view_menu = menubar.addMenu("View")
@@ -488,6 +542,12 @@ class MainWindow(QMainWindow):
         set_origin_action = QAction("Set Board Origin (mm)", self)
         set_origin_action.triggered.connect(self.set_board_origin)
         board_menu.addAction(set_origin_action)
+        register_action = QAction("Register Bottom Image to Through-Hole Pads…", self)
+        register_action.triggered.connect(self.register_bottom_image)
+        board_menu.addAction(register_action)
+        clear_register_action = QAction("Clear Bottom Image Registration", self)
+        clear_register_action.triggered.connect(self.clear_bottom_registration)
+        board_menu.addAction(clear_register_action)
 
         # ----- Controls submenu -----
         controls_menu = properties_menu.addMenu("Controls")
@@ -541,6 +601,8 @@ class MainWindow(QMainWindow):
 
         old_tx = self.constants.get("TopImageXCoord", 0.0)
         old_ty = self.constants.get("TopImageYCoord", 0.0)
+        old_bx = self.constants.get("BottomImageXCoord", 0.0)
+        old_by = self.constants.get("BottomImageYCoord", 0.0)
         dx = tx - old_tx
         dy = ty - old_ty
 
@@ -569,6 +631,9 @@ class MainWindow(QMainWindow):
         self.project_manager.save_project_settings()
         self.board_view.converter.set_origin_mm(tx, ty, side="top")
         self.board_view.converter.set_origin_mm(bx, by, side="bottom")
+        if self.constants.get("BottomImageAffine") and (bx, by) != (old_bx, old_by):
+            # A hand-entered bottom origin replaces the fitted registration
+            self.project_manager.set_image_registration(None)
 
         # -- shift pads if requested -----------------------------------------
         if shift_pads and (abs(dx) > 1e-9 or abs(dy) > 1e-9):
@@ -589,6 +654,71 @@ class MainWindow(QMainWindow):
             f"Origin updated. Top=({tx:.3f}, {ty:.3f}) mm, Bottom=({bx:.3f}, {by:.3f}) mm ; pads shifted={shift_pads}.",
         )
 
+    # ------------------------------------------------------------------
+    #  Bottom image registration (display/registration.py)
+    # ------------------------------------------------------------------
+    def register_bottom_image(self):
+        """
+        Fit the bottom image to the through-hole pads: pads are detected on
+        the bottom image, paired with the projected through-hole pads and an
+        affine is fitted with outlier rejection. The residuals are shown
+        before the fit is applied to the converter.
+        """
+        from component_placer.pad_detector import detect_pads, qimage_to_gray
+        from display.registration import register_side
+
+        view = self.board_view
+        if view.display_library.current_side != "bottom" or view.bottom_pixmap_item is None:
+            QMessageBox.information(
+                self, "Register Bottom Image", "Show the bottom image first (switch side)."
+            )
+            return
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            gray = qimage_to_gray(view.bottom_pixmap_item.pixmap())
+            candidates = detect_pads(gray, view.converter, "bottom")
+            observed = [(c.x_px, c.y_px) for c in candidates]
+            result = register_side(
+                self.object_library.get_all_objects(), view.converter, observed
+            )
+        finally:
+            QApplication.restoreOverrideCursor()
+        if result is None or result.inliers.sum() < 3:
+            QMessageBox.warning(
+                self,
+                "Register Bottom Image",
+                "Not enough through-hole pads could be matched on the bottom image.",
+            )
+            return
+
+        self.log.log(
+            "info",
+            f"Bottom registration: {result.summary(worst=0)}",
+            module="MainWindow",
+            func="register_bottom_image",
+        )
+        box = QMessageBox(self)
+        box.setWindowTitle("Register Bottom Image")
+        box.setText(result.summary() + "\n\nApply this registration?")
+        box.setDetailedText(
+            "\n".join(
+                f"ch {ch}: {r:.2f} px" for ch, r in sorted(result.residuals_by_key().items())
+            )
+        )
+        box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        if box.exec_() != QMessageBox.Yes:
+            return
+        self.project_manager.set_image_registration(result.matrix, 1.0 / result.scale)
+        view.display_library.update_display_side()
+        view.update_scene()
+
+    def clear_bottom_registration(self):
+        if not self.constants.get("BottomImageAffine"):
+            return
+        self.project_manager.set_image_registration(None)
+        self.board_view.display_library.update_display_side()
+        self.board_view.update_scene()
+
     def _shift_all_pads(self, dx: float, dy: float):
         """Bulk-translate every BoardObject by dx,dy millimetres."""
         if abs(dx) < 1e-9 and abs(dy) < 1e-9:
@@ -606,6 +736,321 @@ class MainWindow(QMainWindow):
             updates.append(obj_copy)
         self.object_library.bulk_update_objects(updates, {})
 
+    def export_net_report(self):
+        """Write one CSV row per net (members, Forced pads, status) for the ATE team."""
+        from objects.net_index import export_net_report
+
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Net Report", "nets.csv", "CSV Files (*.csv)"
+        )
+        if not path:
+            return
+        try:
+            count = export_net_report(self.object_library, path)
+        except OSError as e:
+            QMessageBox.critical(self, "Export Net Report", f"Could not write report:\n{e}")
+            return
+        nets = self.object_library.nets
+        QMessageBox.information(
+            self,
+            "Export Net Report",
+            f"{count} nets written.\n"
+            f"Without Forced pad: {len(nets.nets_without_forced())}\n"
+            f"With multiple Forced pads: {len(nets.nets_with_multiple_forced())}",
+        )
+
+    # ---- Selection (channel-based SelectionModel) -------------------------
+    def invert_selection(self):
+        self.board_view.selected_channels()  # sync pending scene clicks first
+        self.board_view.selection.invert()
+
+    def grow_selection_to_components(self):
+        self.board_view.selected_channels()
+        self.board_view.selection.grow_to_components()
+
+    def grow_selection_to_nets(self):
+        selection = self.board_view.selection
+        nets = self.object_library.nets
+        grown = set(self.board_view.selected_channels())
+        for signal in {nets.net_of(ch) for ch in grown}:
+            grown |= nets.pads_in_net(signal)
+        selection.set_channels(grown)
+
+    def auto_assign_testability(self):
+        """Assign Forced/Terminal/... to every net using the configured rules."""
+        from objects.testability_engine import apply_testability_rules, load_rules
+
+        if not self.object_library.objects:
+            return
+        rules = load_rules(constants=self.constants)
+        reply = QMessageBox.question(
+            self,
+            "Auto-Assign Testability",
+            "Reassign the testability of every pad?\n\n"
+            + "\n".join(f"{k}: {v}" for k, v in rules.items()),
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No,
+        )
+        if reply != QMessageBox.Yes:
+            return
+        report = apply_testability_rules(self.object_library, rules, self.constants)
+        self.log.log(
+            "info",
+            f"Auto-Assign Testability: {len(report.previous)} pads changed.",
+            module="MainWindow",
+            func="auto_assign_testability",
+        )
+        QMessageBox.information(self, "Auto-Assign Testability", report.summary())
+
+    def compact_channels(self):
+        """Renumber all pads into the dense channel range 1..n (one undo step)."""
+        if not self.object_library.objects:
+            return
+        if self.object_library.panel is not None:
+            QMessageBox.information(
+                self,
+                "Compact Channels",
+                "Remove the panel (Edit > Panel) before compacting channels.",
+            )
+            return
+        reply = QMessageBox.question(
+            self,
+            "Compact Channels",
+            "Renumber all pads to channels 1..n?\n"
+            "Default net names (S<channel>) are renamed to match.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No,
+        )
+        if reply != QMessageBox.Yes:
+            return
+        mapping = self.object_library.compact_channels()
+        self.log.log(
+            "info",
+            f"Compact Channels: {len(mapping)} pads renumbered.",
+            module="MainWindow",
+            func="compact_channels",
+        )
+        QMessageBox.information(
+            self,
+            "Compact Channels",
+            f"{len(mapping)} pads renumbered."
+            if mapping
+            else "Channels are already dense.",
+        )
+
+    def edit_panel(self):
+        """Define the panel as an array of copies of the current board."""
+        from objects.panel import Panel
+        from ui.panel_dialog import PanelDialog
+
+        current = self.object_library.panel
+        dlg = PanelDialog(current, parent=self)
+        if dlg.exec_() != dlg.Accepted:
+            return
+        if dlg.remove_requested:
+            self.object_library.set_panel(None)
+            self.log.log("info", "Panel removed.", module="MainWindow", func="edit_panel")
+            return
+        if not self.object_library.objects:
+            QMessageBox.information(self, "Panel", "Digitize the master board first.")
+            return
+        panel = Panel.grid(self.object_library.get_all_objects(), **dlg.get_values())
+        if current is not None:
+            panel.channel_bases = list(current.channel_bases)
+        self.object_library.set_panel(panel)
+        self.log.log(
+            "info",
+            f"Panel set: {panel.board_count} boards, channel blocks at {panel.channel_bases}.",
+            module="MainWindow",
+            func="edit_panel",
+        )
+
+    def recognize_footprint(self):
+        """Look the selected pads up in component_libraries and swap in the best fit."""
+        from component_placer.footprint_index import FootprintIndex, replace_with_footprint
+
+        objects = self.object_library.objects
+        pads = [objects[ch] for ch in self.board_view.selected_channels() if ch in objects]
+        if len(pads) < 2:
+            QMessageBox.information(
+                self, "Recognize Footprint", "Select the pads of one component."
+            )
+            return
+        if getattr(self, "footprint_index", None) is None:
+            self.footprint_index = FootprintIndex(
+                self.libraries_dir,
+                cache_path=os.path.join(self.libraries_dir, ".footprint_index.json"),
+                logger=self.log,
+            )
+        self.footprint_index.refresh()
+        points = [
+            (
+                getattr(p, "x_coord_mm_original", p.x_coord_mm),
+                getattr(p, "y_coord_mm_original", p.y_coord_mm),
+            )
+            for p in pads
+        ]
+        matches = self.footprint_index.query(points)
+        if not matches:
+            QMessageBox.information(
+                self,
+                "Recognize Footprint",
+                f"No library footprint with {len(pads)} pads.",
+            )
+            return
+        labels = [
+            f"{m.name}  (rms {m.pose.rms_mm:.3f} mm, {m.pose.angle_deg:.1f}°"
+            f"{', mirrored' if m.pose.mirrored else ''})"
+            for m in matches
+        ]
+        choice, ok = QInputDialog.getItem(
+            self, "Recognize Footprint", "Replace the selected pads by:", labels, 0, False
+        )
+        if not ok:
+            return
+        match = matches[labels.index(choice)]
+        pose = replace_with_footprint(self.object_library, pads, match.path)
+        if pose is None:
+            QMessageBox.warning(self, "Recognize Footprint", f"Could not read {match.path}.")
+            return
+        self.log.log(
+            "info",
+            f"Recognize Footprint: {len(pads)} pads replaced by {match.name} "
+            f"(rms {pose.rms_mm:.3f} mm, angle {pose.angle_deg:.1f}, mirrored={pose.mirrored}).",
+            module="MainWindow",
+            func="recognize_footprint",
+        )
+
+    def complete_grid_from_selection(self):
+        """Fit a lattice to the selected pads and add its missing pads (one undo step)."""
+        from component_placer.grid_inference import complete_lattice, infer_lattice
+        from display.proposal_layer import ProposalLayer
+
+        title = "Complete Grid"
+        objects = self.object_library.objects
+        pads = [objects[ch] for ch in self.board_view.selected_channels() if ch in objects]
+        lattice = infer_lattice(
+            [
+                (
+                    getattr(p, "x_coord_mm_original", p.x_coord_mm),
+                    getattr(p, "y_coord_mm_original", p.y_coord_mm),
+                )
+                for p in pads
+            ]
+        )
+        if lattice is None:
+            QMessageBox.information(
+                self, title, "Select at least two pads of a regular grid."
+            )
+            return
+        text, ok = QInputDialog.getText(
+            self,
+            title,
+            f"Pitch {lattice.row_pitch:.3f} x {lattice.col_pitch:.3f} mm at "
+            f"{lattice.angle_deg:.2f}°, fit rms {lattice.rms_mm:.3f} mm.\n"
+            "Grid size (rows x columns), counted from the first selected row/column:",
+            text=f"{lattice.rows} x {lattice.cols}",
+        )
+        if not ok:
+            return
+        try:
+            rows, cols = (int(v) for v in text.lower().replace("×", "x").split("x"))
+        except ValueError:
+            QMessageBox.warning(self, title, f"Invalid grid size: {text}")
+            return
+        proposed = complete_lattice(pads, lattice, rows, cols)
+        if not proposed:
+            self.statusBar().showMessage("The grid has no missing pads.", 5000)
+            return
+
+        layer = getattr(self, "proposal_layer", None)
+        if layer is None:
+            layer = self.proposal_layer = ProposalLayer(
+                self.board_view.scene, self.constants.get("z_value_ghost", 3)
+            )
+        layer.set_objects(
+            proposed, self.board_view.converter, self.board_view.display_library.current_side
+        )
+        try:
+            reply = QMessageBox.question(
+                self,
+                title,
+                f"Add the {len(proposed)} missing pads (shown dashed) to "
+                f"{proposed[0].component_name}?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes,
+            )
+            count = layer.accept(self.object_library) if reply == QMessageBox.Yes else 0
+        finally:
+            layer.clear()
+        if count:
+            self.log.log(
+                "info",
+                f"Complete Grid: {count} pads added to {proposed[0].component_name} "
+                f"({lattice!r}).",
+                module="MainWindow",
+                func="complete_grid_from_selection",
+            )
+
+    # --------------------------------------------------------------------------
+    #  Pad detection (candidates reviewed on a CandidateLayer overlay)
+    # --------------------------------------------------------------------------
+    def _candidate_layer(self):
+        if getattr(self, "candidate_layer", None) is None:
+            from display.candidate_layer import CandidateLayer
+
+            self.candidate_layer = CandidateLayer(
+                self.board_view.scene, self.constants.get("z_value_ghost", 3)
+            )
+        return self.candidate_layer
+
+    def _view_scene_rect(self):
+        view = self.board_view
+        return view.mapToScene(view.viewport().rect()).boundingRect()
+
+    def detect_pad_candidates(self):
+        """Propose pads on the current side's image."""
+        from component_placer.pad_detector import detect_pads, qimage_to_gray
+
+        side = self.board_view.display_library.current_side
+        pixmap_item = self.board_view.current_pixmap_item
+        if pixmap_item is None or pixmap_item.pixmap().isNull():
+            QMessageBox.information(self, "Pad Detection", f"Load the {side} image first.")
+            return
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            gray = qimage_to_gray(pixmap_item.pixmap())
+            candidates = detect_pads(gray, self.board_view.converter, side)
+        finally:
+            QApplication.restoreOverrideCursor()
+        self._candidate_layer().set_candidates(candidates, side)
+        self.log.log(
+            "info",
+            f"Pad detection: {len(candidates)} candidates on {side} image "
+            f"{gray.shape[1]}x{gray.shape[0]}.",
+            module="MainWindow",
+            func="detect_pad_candidates",
+        )
+        self.statusBar().showMessage(f"{len(candidates)} pad candidates detected.", 5000)
+
+    def accept_pad_candidates(self, in_view: bool):
+        layer = self._candidate_layer()
+        if not layer.candidates:
+            return
+        name, ok = QInputDialog.getText(
+            self, "Accept Pad Candidates", "Component name:", text="DET1"
+        )
+        if not ok or not name.strip():
+            return
+        rect = self._view_scene_rect() if in_view else None
+        count = layer.accept(self.object_library, name.strip(), rect)
+        self.statusBar().showMessage(f"{count} pads added to {name.strip()}.", 5000)
+
+    def discard_pad_candidates(self, in_view: bool):
+        layer = self._candidate_layer()
+        count = layer.discard(self._view_scene_rect() if in_view else None)
+        self.statusBar().showMessage(f"{count} pad candidates discarded.", 5000)
+
     # --------------------------------------------------------------------------
     #  "Components" Dock  – now with refresh button **and** live filter
     # --------------------------------------------------------------------------
@@ -679,7 +1124,9 @@ class MainWindow(QMainWindow):
         self.components_dock.setTitleBarWidget(title)
 
         # ---------- initial populate -------------------------------------------
-        self.refresh_component_tree()
+        # The folder scan can be slow on large libraries / network drives, so
+        # run it from the event loop once the main window has been painted.
+        QTimer.singleShot(0, self.refresh_component_tree)
 
     def refresh_component_tree(self):
         """
@@ -812,6 +1259,9 @@ class MainWindow(QMainWindow):
             fs += 1
         self.constants.set("pins_font_size", fs)
         self.constants.save()
+        LOD.set_font_size(fs)  # pin labels on the board
+        if self.board_view:
+            self.board_view.viewport().update()
         # Refresh display using the stored selection (or empty list if none)
         self.update_selected_pins_info(
             self.current_selected_pads if hasattr(self, "current_selected_pads") else []
@@ -823,6 +1273,9 @@ class MainWindow(QMainWindow):
             fs -= 1
         self.constants.set("pins_font_size", fs)
         self.constants.save()
+        LOD.set_font_size(fs)  # pin labels on the board
+        if self.board_view:
+            self.board_view.viewport().update()
         # Refresh display using the stored selection (or empty list if none)
         self.update_selected_pins_info(
             self.current_selected_pads if hasattr(self, "current_selected_pads") else []
@@ -852,12 +1305,16 @@ class MainWindow(QMainWindow):
                 event.accept()
             elif response == QMessageBox.No:
                 event.accept()  # user discards changes
+                self.project_manager.close_op_log(discard=True)
             else:
                 # response == QMessageBox.Cancel
                 event.ignore()  # Do not close the app
         else:
             # Undo stack is empty => no unsaved changes
             event.accept()
+        if event.isAccepted():
+            self.project_manager.close_op_log()
+            self.constants.flush()
 
     def open_ui_customization_dialog(self):
         dialog = UICustomizationDialog(self.constants, parent=self)
@@ -1027,15 +1484,18 @@ class MainWindow(QMainWindow):
         Called when the user selects "Align Pads" from the Edit menu.
         It retrieves the selected pads from the BoardView and calls align_selected_pads.
         """
-        selected_pads = self.board_view._get_selected_pads()
-        if not selected_pads:
+        selected = self.board_view.selected_channels()
+        if not selected:
             QMessageBox.information(
                 self, "Align Pads", "No pads selected for alignment."
             )
             return
         try:
             actions.align_selected_pads(
-                self.object_library, selected_pads, self.component_placer
+                self.object_library,
+                selected,
+                self.component_placer,
+                board_view=self.board_view,
             )
         except Exception as e:
             self.log.log("error", f"Error during Align Pads action: {e}")
@@ -1066,16 +1526,12 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-        # Retrieve the current board component names from the ObjectLibrary.
-        board_set = set(
-            [obj.component_name for obj in self.object_library.get_all_objects()]
-        )
-
-        # Open the BOMEditorDialog directly, regardless of mismatches.
+        # Open the BOMEditorDialog directly, regardless of mismatches. The
+        # mismatch sets come from the BOMHandler (kept live against the board).
         from component_placer.bom_handler.bom_editor_dialog import BOMEditorDialog
 
         dialog = BOMEditorDialog(
-            bom_handler=self.bom_handler, board_component_names=board_set, parent=self
+            bom_handler=self.bom_handler, board_component_names=None, parent=self
         )
         if dialog.exec_() == dialog.Accepted:
             # If accepted, save the updated BOM.
@@ -1191,6 +1647,9 @@ class MainWindow(QMainWindow):
             self.project_manager.save_project_settings()
             if hasattr(self.board_view.converter, "set_mm_per_pixels_bot"):
                 self.board_view.converter.set_mm_per_pixels_bot(new_value)
+            if self.constants.get("BottomImageAffine"):
+                # A hand-entered scale replaces the fitted registration
+                self.project_manager.set_image_registration(None)
             self.board_view.update_scene()
             self.log.log(
                 "info", f"mm_per_pixels_bot updated to {new_value:.10g} (user input)."
@@ -0,0 +1,83 @@
+# ui/panel_dialog.py
+
+from PyQt5.QtWidgets import (
+    QCheckBox,
+    QDialog,
+    QDoubleSpinBox,
+    QFormLayout,
+    QHBoxLayout,
+    QPushButton,
+    QSpinBox,
+    QVBoxLayout,
+)
+
+
+class PanelDialog(QDialog):
+    """Step-and-repeat parameters: a columns x rows array of the board."""
+
+    def __init__(self, panel=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Panel Step-and-Repeat")
+        self.remove_requested = False
+        self._init_ui(panel)
+
+    def _init_ui(self, panel):
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+
+        self.columns_spin = QSpinBox()
+        self.columns_spin.setRange(1, 64)
+        self.rows_spin = QSpinBox()
+        self.rows_spin.setRange(1, 64)
+        self.pitch_x_spin = QDoubleSpinBox()
+        self.pitch_y_spin = QDoubleSpinBox()
+        for spin in (self.pitch_x_spin, self.pitch_y_spin):
+            spin.setRange(-10000.0, 10000.0)
+            spin.setDecimals(3)
+            spin.setSuffix(" mm")
+        self.rotate_check = QCheckBox("Rotate every other row by 180°")
+
+        if panel is not None and panel.steps:
+            xs = sorted({step.dx_mm for step in panel.steps} | {0.0})
+            ys = sorted({step.dy_mm for step in panel.steps} | {0.0})
+            self.columns_spin.setValue(len(xs))
+            self.rows_spin.setValue(len(ys))
+            self.pitch_x_spin.setValue(xs[1] - xs[0] if len(xs) > 1 else 0.0)
+            self.pitch_y_spin.setValue(ys[1] - ys[0] if len(ys) > 1 else 0.0)
+            self.rotate_check.setChecked(any(step.angle_deg for step in panel.steps))
+        else:
+            self.columns_spin.setValue(2)
+
+        form.addRow("Columns", self.columns_spin)
+        form.addRow("Rows", self.rows_spin)
+        form.addRow("Pitch X", self.pitch_x_spin)
+        form.addRow("Pitch Y", self.pitch_y_spin)
+        form.addRow(self.rotate_check)
+        layout.addLayout(form)
+
+        buttons = QHBoxLayout()
+        remove_btn = QPushButton("Remove Panel")
+        remove_btn.setEnabled(panel is not None)
+        remove_btn.clicked.connect(self._remove)
+        ok_btn = QPushButton("OK")
+        cancel_btn = QPushButton("Cancel")
+        ok_btn.clicked.connect(self.accept)
+        cancel_btn.clicked.connect(self.reject)
+        buttons.addWidget(remove_btn)
+        buttons.addStretch()
+        buttons.addWidget(ok_btn)
+        buttons.addWidget(cancel_btn)
+        layout.addLayout(buttons)
+
+    def _remove(self):
+        self.remove_requested = True
+        self.accept()
+
+    def get_values(self) -> dict:
+        return {
+            "columns": self.columns_spin.value(),
+            "rows": self.rows_spin.value(),
+            "pitch_x_mm": self.pitch_x_spin.value(),
+            "pitch_y_mm": self.pitch_y_spin.value(),
+            "rotate_alternate_rows": self.rotate_check.isChecked(),
+        }
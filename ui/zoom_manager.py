@@ -1,6 +1,6 @@
 # zoom_manager.py
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QEasingCurve, QObject, QPointF, QVariantAnimation, pyqtSignal
 from PyQt5.QtGui import QCursor
 from PyQt5.QtWidgets import QGraphicsView
 from logs.log_handler import LogHandler
@@ -9,9 +9,13 @@ from constants.constants import Constants
 
 class ZoomManager(QObject):
     """
-    A simpler ZoomManager that performs single-step ("jump") zooms
-    around the chosen anchor. Doesn't reset the transform or call fitInView
-    after each zoom, so the anchor remains stable.
+    Zooms around the chosen anchor (cursor or marker). Doesn't reset the
+    transform or call fitInView after each zoom, so the anchor remains stable.
+
+    With ``smooth_zoom`` on, zoom_in()/zoom_out() animate over
+    ``zoom_animation_ms`` towards the same scale and centre a single-step
+    ("jump") zoom would reach; steps arriving during the animation (fast
+    wheel turns) extend its target instead of queueing.
     """
 
     scale_factor_changed = pyqtSignal(float)
@@ -27,11 +31,91 @@ class ZoomManager(QObject):
         self.min_user_scale = 1.0
         self.max_user_scale = float(self.constants.get("max_zoom", 10.0))
 
+        self.smooth = bool(self.constants.get("smooth_zoom", True))
+        self._animation = QVariantAnimation(self)
+        self._animation.setDuration(int(self.constants.get("zoom_animation_ms", 120)))
+        self._animation.setEasingCurve(QEasingCurve.OutCubic)
+        self._animation.setStartValue(0.0)
+        self._animation.setEndValue(1.0)
+        self._animation.valueChanged.connect(self._on_animation_step)
+        # (start scale, target scale, start centre, target centre) of the
+        # running animation
+        self._anim = None
+
     def zoom_in(self, factor: float = 1.15):
-        self._apply_zoom(factor)
+        self._zoom(factor)
 
     def zoom_out(self, factor: float = 0.85):
-        self._apply_zoom(factor)
+        self._zoom(factor)
+
+    def _zoom(self, factor: float):
+        if self.smooth:
+            self.animate_zoom(factor)
+        else:
+            self._apply_zoom(factor)
+
+    def _clamp(self, scale: float) -> float:
+        return min(max(scale, self.min_user_scale), self.max_user_scale)
+
+    def _zoom_target_center(self, zoom_mode: str):
+        """Scene point the view ends up centred on after a zoom (None = keep)."""
+        if zoom_mode == "marker":
+            marker_coords = self.board_view.marker_manager.get_marker_board_coords()
+            if not marker_coords:
+                self.log.log(
+                    "warning", "Zoom mode 'marker' active but no marker available."
+                )
+                return None
+            return QPointF(*self.board_view.converter.mm_to_pixels(*marker_coords))
+        return self.board_view.mapToScene(
+            self.board_view.mapFromGlobal(QCursor.pos())
+        )
+
+    def animate_zoom(self, factor: float):
+        """
+        Animated version of _apply_zoom(): interpolates the scale
+        geometrically and the view centre linearly, one frame per animation
+        tick.
+        """
+        self.board_view.user_has_zoomed_yet = True
+        target = self._anim[1] if self._anim is not None else self.user_scale
+        target = self._clamp(target * factor)
+        if target == self.user_scale and self._anim is None:
+            return
+
+        zoom_mode = self.constants.get("zoom_center_mode", "cursor").lower()
+        viewport = self.board_view.viewport().rect()
+        start_center = self.board_view.mapToScene(viewport.center())
+        target_center = self._zoom_target_center(zoom_mode)
+        if target_center is None:
+            target_center = start_center
+
+        self._animation.stop()
+        self._anim = (self.user_scale, target, start_center, target_center)
+        self._animation.start()
+
+    def stop_animation(self):
+        """Stop a running zoom animation where it is."""
+        self._animation.stop()
+        self._anim = None
+
+    def _on_animation_step(self, progress):
+        if self._anim is None:
+            return
+        start_scale, target, start_center, target_center = self._anim
+        t = float(progress)
+        new_scale = start_scale * (target / start_scale) ** t
+        factor = new_scale / self.user_scale
+        self.user_scale = new_scale
+        self.board_view.scale(factor, factor)
+        self.board_view.centerOn(start_center + (target_center - start_center) * t)
+        if t >= 1.0:
+            self._anim = None
+            self.log.log(
+                "debug",
+                f"Animated zoom finished: scale={self.user_scale:.3f}.",
+            )
+        self.scale_factor_changed.emit(self.user_scale)
 
     def _apply_zoom(self, factor: float):
         """
@@ -113,4 +197,5 @@ class ZoomManager(QObject):
         elif self.user_scale > self.max_user_scale:
             self.user_scale = self.max_user_scale
 
+        self.stop_animation()
         self.log.log("debug", f"update_zoom_limits => user_scale={self.user_scale:.3f}")
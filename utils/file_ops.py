@@ -1,19 +1,23 @@
 # utils/file_ops.py
 import os, pathlib, shutil, tempfile
 import time
-from typing import Optional
+from typing import Iterable, Optional, Union
 from logs.log_handler import LogHandler
 from constants.constants import Constants
 
 log = LogHandler()
 
-def safe_write(target_path: str, data: str, encoding: str = "utf-8") -> bool:
+def safe_write(target_path: str, data: Union[str, Iterable[str]],
+               encoding: str = "utf-8") -> bool:
     """
     Atomically write *data* to *target_path*.
+    *data* is a string or an iterable of strings; an iterable is written
+    chunk by chunk, so large files need not be built in memory first.
     Returns True on success, False on failure (and leaves the old file intact).
     """
     target_path = os.path.abspath(target_path)
     dir_ = os.path.dirname(target_path)
+    temp_name = None
     try:
         # 1) write to a tmp file in the same dir
         with tempfile.NamedTemporaryFile("w",
@@ -22,17 +26,20 @@ def safe_write(target_path: str, data: str, encoding: str = "utf-8") -> bool:
                                          delete=False,
                                          prefix=".tmp_",
                                          suffix=".nod") as tmp:
-            tmp.write(data)
+            temp_name = tmp.name
+            if isinstance(data, str):
+                tmp.write(data)
+            else:
+                tmp.writelines(data)
             tmp.flush()
             os.fsync(tmp.fileno())      # force to disk
-            temp_name = tmp.name
         # 2) atomic replace
         os.replace(temp_name, target_path)      # atomic on Win / POSIX
         return True
     except Exception as e:
         log.error(f"safe_write() failed for {target_path}: {e}")
         try:
-            if os.path.exists(temp_name):
+            if temp_name and os.path.exists(temp_name):
                 os.remove(temp_name)
         except Exception:
             pass
@@ -2,12 +2,18 @@
 
 class FlagManager:
     """
-    A singleton class to manage dynamic flags for the application.
-    Provides a centralized location for setting and retrieving global state flags.
+    A class to manage dynamic flags for the application.
+    FlagManager() returns the process-wide default instance; a
+    FlagManager(shared=False) keeps its own flags (one per BoardContext, so
+    e.g. the current "side" is per board).
     """
     _instance = None
 
-    def __new__(cls, *args, **kwargs):
+    def __new__(cls, *args, shared=True, **kwargs):
+        if not shared:
+            inst = super(FlagManager, cls).__new__(cls, *args, **kwargs)
+            inst.flags = {}
+            return inst
         if not cls._instance:
             cls._instance = super(FlagManager, cls).__new__(cls, *args, **kwargs)
             cls._instance.flags = {}
@@ -0,0 +1,71 @@
+# utils/quick_grid_benchmark.py
+"""
+Timing benchmark for the Quick-Creation grid builder.
+
+For square grids up to 100x100 balls it times a full build (new dialog
+parameters) and an anchor move (layout cached, positions only), in every
+numbering scheme and with a centre void.
+
+Usage::
+
+    python -m utils.quick_grid_benchmark
+    python -m utils.quick_grid_benchmark --sizes 40 60 100
+"""
+
+import argparse
+import time
+from typing import Dict, Sequence
+
+from component_placer.quick_grid import QuickGrid
+
+SIZES = (10, 40, 60, 100)
+SCHEMES = (0, 1, 2)
+
+
+def _params(size: int, scheme: int) -> Dict:
+    return {
+        "x_pins": size,
+        "y_pins": size,
+        "number_scheme": scheme,
+        "create_prefix": True,
+        "center_void": (size // 3, size // 3),
+        "missing_balls": "A1 B2",
+    }
+
+
+def run_benchmark(sizes: Sequence[int] = SIZES, moves: int = 10) -> Dict:
+    """
+    Returns ``{(size, scheme): (build_ms, move_ms)}``; move_ms is the mean
+    of *moves* anchor nudges.
+    """
+    results = {}
+    for size in sizes:
+        for scheme in SCHEMES:
+            grid = QuickGrid()
+            anchors = {"A": (0.0, 0.0), "B": (size * 1.0, -size * 1.0)}
+            start = time.perf_counter()
+            grid.footprint(anchors, _params(size, scheme))
+            build = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for step in range(1, moves + 1):
+                anchors["B"] = (size * 1.0 + 0.01 * step, -size * 1.0)
+                grid.footprint(anchors, _params(size, scheme))
+            move = (time.perf_counter() - start) / moves
+            results[(size, scheme)] = (build * 1000.0, move * 1000.0)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    args = parser.parse_args(argv)
+
+    print(f"{'grid':>9} {'scheme':>6} {'build':>10} {'move':>10}")
+    for (size, scheme), (build, move) in run_benchmark(args.sizes).items():
+        print(f"{size:>4}x{size:<4} {scheme:>6} {build:>8.2f}ms {move:>8.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
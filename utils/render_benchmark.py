@@ -0,0 +1,165 @@
+# utils/render_benchmark.py
+"""
+Offscreen frame-time benchmark for the board view.
+
+Lays out a synthetic board of through-hole and SMD pads, renders it through
+a QGraphicsView into an image at several zoom levels (with level-of-detail
+drawing on and off) and then plays one animated zoom, timing every frame.
+
+Usage::
+
+    python -m utils.render_benchmark                 # 50k pads
+    python -m utils.render_benchmark --pads 200000
+"""
+
+import argparse
+import math
+import os
+import time
+from typing import Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QPointF  # noqa: E402
+from PyQt5.QtGui import QImage, QPainter  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QGraphicsScene, QGraphicsView  # noqa: E402
+
+VIEW_SIZE = (1280, 800)
+ZOOM_LEVELS = (1.0, 4.0, 16.0)  # relative to the whole board fitting the view
+
+
+class _StaticLibrary:
+    """The part of ObjectLibrary that DisplayLibrary reads."""
+
+    def __init__(self, objects):
+        self.objects = {obj.channel: obj for obj in objects}
+
+    def get_all_objects(self):
+        return list(self.objects.values())
+
+
+def synthetic_pads(count: int, pitch_mm: float = 2.54) -> List:
+    """*count* pads on a square grid, in components of 16 pins."""
+    from objects.board_object import BoardObject
+
+    columns = max(1, int(math.sqrt(count)))
+    pads = []
+    for i in range(count):
+        through_hole = (i // 16) % 4 == 0
+        pads.append(
+            BoardObject(
+                component_name=f"U{i // 16 + 1}",
+                pin=i % 16 + 1,
+                channel=i + 1,
+                test_position="Top",
+                technology="Through Hole" if through_hole else "SMD",
+                shape_type="Round with hole" if through_hole else "Square/rectangle",
+                x_coord_mm=(i % columns) * pitch_mm,
+                y_coord_mm=-(i // columns) * pitch_mm,
+                width_mm=0.9,
+                height_mm=0.9 if through_hole else 0.6,
+                hole_mm=0.5 if through_hole else 0.0,
+            )
+        )
+    return pads
+
+
+def _frame_ms(view: QGraphicsView, image: QImage, frames: int, warm_up: bool = True) -> float:
+    """Median render time; the first frame (index and cache set-up) is not timed."""
+    times = []
+    for frame in range(frames + (1 if warm_up else 0)):
+        image.fill(0xFFFFFFFF)
+        painter = QPainter(image)
+        start = time.perf_counter()
+        view.render(painter)
+        painter.end()
+        if frame or not warm_up:
+            times.append(time.perf_counter() - start)
+    times.sort()
+    return times[len(times) // 2] * 1000.0  # median
+
+
+def run_benchmark(pad_count: int = 50_000, frames: int = 3) -> Dict:
+    """
+    Returns::
+
+        {
+            "pads": pad_count,
+            "static_ms": {(zoom, lod_enabled): median frame time in ms},
+            "zoom_frames_ms": frame times of one animated zoom-in (LOD on),
+        }
+    """
+    from display.coord_converter import CoordinateConverter
+    from display.display_library import DisplayLibrary
+    from display.pad_lod import LOD
+
+    app = QApplication.instance() or QApplication([])
+    pads = synthetic_pads(pad_count)
+    converter = CoordinateConverter((0, 0))
+    scene = QGraphicsScene()
+    display = DisplayLibrary(scene, _StaticLibrary(pads), converter)
+    bounds = scene.itemsBoundingRect()
+    scene.setSceneRect(bounds)
+
+    view = QGraphicsView(scene)
+    view.resize(*VIEW_SIZE)
+    view.setHorizontalScrollBarPolicy(1)  # Qt.ScrollBarAlwaysOff
+    view.setVerticalScrollBarPolicy(1)
+    image = QImage(view.viewport().size(), QImage.Format_ARGB32_Premultiplied)
+    fit = min(VIEW_SIZE[0] / bounds.width(), VIEW_SIZE[1] / bounds.height())
+
+    enabled_before = LOD.enabled
+    static = {}
+    try:
+        for zoom in ZOOM_LEVELS:
+            view.resetTransform()
+            view.scale(fit * zoom, fit * zoom)
+            view.centerOn(bounds.center())
+            for lod in (True, False):
+                LOD.enabled = lod
+                display.set_view_scale(fit * zoom)  # as BoardView.paintEvent
+                static[(zoom, lod)] = _frame_ms(view, image, frames)
+    finally:
+        LOD.enabled = enabled_before
+
+    # One animated zoom (x4 towards the board centre), frame by frame
+    view.resetTransform()
+    view.scale(fit, fit)
+    view.centerOn(bounds.center())
+    zoom_frames = []
+    steps = 8
+    center = QPointF(bounds.center())
+    for step in range(1, steps + 1):
+        t = step / steps
+        view.resetTransform()
+        view.scale(fit * 4.0**t, fit * 4.0**t)
+        view.centerOn(center)
+        display.set_view_scale(fit * 4.0**t)
+        zoom_frames.append(_frame_ms(view, image, 1, warm_up=False))
+    app.processEvents()
+    return {"pads": pad_count, "static_ms": static, "zoom_frames_ms": zoom_frames}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pads", type=int, default=50_000)
+    parser.add_argument("--frames", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(args.pads, args.frames)
+    print(f"{result['pads']} pads, {VIEW_SIZE[0]}x{VIEW_SIZE[1]} view")
+    print(f"{'zoom':>6} {'LOD on':>10} {'LOD off':>10}")
+    for zoom in ZOOM_LEVELS:
+        on = result["static_ms"][(zoom, True)]
+        off = result["static_ms"][(zoom, False)]
+        print(f"{zoom:>6g} {on:>8.1f}ms {off:>8.1f}ms")
+    frames = result["zoom_frames_ms"]
+    print(
+        f"Animated zoom: {len(frames)} frames, worst {max(frames):.1f} ms, "
+        f"mean {sum(frames) / len(frames):.1f} ms"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
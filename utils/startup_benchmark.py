@@ -0,0 +1,115 @@
+# utils/startup_benchmark.py
+"""
+Cold-start import benchmark.
+
+Runs ``python -X importtime -c "import main"`` in a fresh interpreter and
+parses the report Python writes to stderr. The result tells us how long the
+GUI entry point takes to import and which modules ended up loaded, so we can
+keep heavy optional dependencies (pandas, openpyxl, pyodbc) off the start-up
+path.
+
+Usage::
+
+    python -m utils.startup_benchmark            # report + budget check
+    python -m utils.startup_benchmark --top 25   # show more modules
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Default cold-start budget (seconds) for importing the GUI entry point.
+STARTUP_BUDGET_S = 2.0
+
+# Modules that must only be imported when their feature is used.
+HEAVY_MODULES = ("pandas", "openpyxl", "pyodbc")
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int]]:
+    """
+    Parse ``-X importtime`` output into a list of
+    ``(module_name, self_us, cumulative_us)`` tuples, in report order.
+    Nested modules keep their leading indentation stripped.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, name = parts
+        try:
+            rows.append((name.strip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            # Header line ("self [us] | cumulative | imported package")
+            continue
+    return rows
+
+
+def run_benchmark(target: str = "main") -> Dict:
+    """
+    Import *target* in a fresh interpreter with ``-X importtime`` and return
+    a summary dict:
+
+        {
+            "total_s":  cumulative import time of *target* in seconds,
+            "modules":  list of (name, self_us, cumulative_us),
+            "heavy_loaded": heavy modules that were imported,
+        }
+    """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    code = (
+        f"import {target}, sys; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = parse_importtime(proc.stderr)
+    total_us = next((cum for name, _, cum in modules if name == target), 0)
+    loaded = proc.stdout.strip().splitlines()[-1] if proc.stdout.strip() else ""
+    return {
+        "total_s": total_us / 1e6,
+        "modules": modules,
+        "heavy_loaded": [m for m in loaded.split(",") if m],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure GUI cold-start import time")
+    parser.add_argument("--target", default="main", help="Module to import (default: main)")
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_S, help="Budget in seconds")
+    parser.add_argument("--top", type=int, default=15, help="How many slow modules to list")
+    args = parser.parse_args()
+
+    result = run_benchmark(args.target)
+
+    print(f"import {args.target}: {result['total_s']:.3f}s (budget {args.budget:.3f}s)")
+    print("Slowest modules (cumulative):")
+    slowest = sorted(result["modules"], key=lambda r: r[2], reverse=True)[: args.top]
+    for name, self_us, cum_us in slowest:
+        print(f"  {cum_us / 1000:9.1f} ms  {self_us / 1000:8.1f} ms self  {name}")
+
+    failed = False
+    if result["heavy_loaded"]:
+        print(f"FAIL: heavy modules imported at start-up: {', '.join(result['heavy_loaded'])}")
+        failed = True
+    if result["total_s"] > args.budget:
+        print("FAIL: start-up import time exceeds budget")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()